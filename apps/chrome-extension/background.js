@@ -1,6 +1,13 @@
 (() => {
   const HOST_NAME = "com.lexishift.helper";
   const BRIDGE_KIND = "lexishift_helper_request_v1";
+  const JOB_EVENT_KIND = "lexishift_helper_job_event_v1";
+
+  // One long-lived host behind a connectNative port, so its caches stay warm,
+  // background jobs outlive the request that queued them and job_progress
+  // messages have somewhere to go. An open port also keeps this worker alive.
+  let nativePort = null;
+  const pendingRequests = new Map();
 
   function normalizeTimeoutMs(timeoutMs) {
     const parsed = Number(timeoutMs);
@@ -14,9 +21,89 @@
     return { ok: false, error: { code: "invalid_request", message } };
   }
 
+  function broadcastJobEvent(job) {
+    try {
+      const sent = chrome.runtime.sendMessage({ kind: JOB_EVENT_KIND, job });
+      if (sent && typeof sent.catch === "function") {
+        sent.catch(() => {});
+      }
+    } catch (_error) {
+      // No extension page is listening.
+    }
+  }
+
+  function handlePortMessage(message) {
+    if (!message || typeof message !== "object") {
+      return;
+    }
+    if (message.type === "job_progress") {
+      broadcastJobEvent(message.data);
+      return;
+    }
+    const requestId = String(message.id || "");
+    const pending = pendingRequests.get(requestId);
+    if (!pending) {
+      return;
+    }
+    pendingRequests.delete(requestId);
+    pending.resolve(message);
+  }
+
+  function getNativePort() {
+    if (nativePort) {
+      return nativePort;
+    }
+    const port = chrome.runtime.connectNative(HOST_NAME);
+    port.onMessage.addListener(handlePortMessage);
+    port.onDisconnect.addListener(() => {
+      const message = chrome.runtime.lastError && chrome.runtime.lastError.message
+        ? chrome.runtime.lastError.message
+        : "Helper disconnected.";
+      if (nativePort === port) {
+        nativePort = null;
+      }
+      for (const [requestId, pending] of pendingRequests) {
+        if (pending.port !== port) {
+          continue;
+        }
+        pendingRequests.delete(requestId);
+        pending.resolve({ ok: false, error: { code: "native_error", message } });
+      }
+    });
+    nativePort = port;
+    return port;
+  }
+
+  function sendOverPort(request, resolve) {
+    const port = getNativePort();
+    pendingRequests.set(request.id, { port, resolve });
+    port.postMessage(request);
+  }
+
+  function sendOneShot(request, resolve) {
+    // A one-shot host exits after its reply, so it cannot run jobs in the
+    // background; drop "async" and let the command answer inline.
+    const { async: _async, ...payload } = request.payload;
+    chrome.runtime.sendNativeMessage(HOST_NAME, { ...request, payload }, (response) => {
+      if (chrome.runtime.lastError) {
+        resolve({
+          ok: false,
+          error: {
+            code: "native_error",
+            message: chrome.runtime.lastError.message
+          }
+        });
+        return;
+      }
+      resolve(response || { ok: false, error: { code: "empty_response", message: "No response." } });
+    });
+  }
+
   function sendNativeMessage(type, payload = {}, timeoutMs = 4000) {
     return new Promise((resolve) => {
-      if (!chrome || !chrome.runtime || typeof chrome.runtime.sendNativeMessage !== "function") {
+      const runtime = chrome && chrome.runtime;
+      const canConnect = Boolean(runtime && typeof runtime.connectNative === "function");
+      if (!canConnect && !(runtime && typeof runtime.sendNativeMessage === "function")) {
         resolve({ ok: false, error: { code: "native_unavailable", message: "Native messaging not available." } });
         return;
       }
@@ -32,39 +119,26 @@
         payload: payload && typeof payload === "object" ? payload : {}
       };
       let finished = false;
-      const timer = setTimeout(() => {
+      const finish = (response) => {
         if (finished) {
           return;
         }
         finished = true;
-        resolve({ ok: false, error: { code: "timeout", message: "Helper request timed out." } });
+        clearTimeout(timer);
+        pendingRequests.delete(request.id);
+        resolve(response);
+      };
+      const timer = setTimeout(() => {
+        finish({ ok: false, error: { code: "timeout", message: "Helper request timed out." } });
       }, normalizeTimeoutMs(timeoutMs));
       try {
-        chrome.runtime.sendNativeMessage(HOST_NAME, request, (response) => {
-          if (finished) {
-            return;
-          }
-          finished = true;
-          clearTimeout(timer);
-          if (chrome.runtime.lastError) {
-            resolve({
-              ok: false,
-              error: {
-                code: "native_error",
-                message: chrome.runtime.lastError.message
-              }
-            });
-            return;
-          }
-          resolve(response || { ok: false, error: { code: "empty_response", message: "No response." } });
-        });
-      } catch (error) {
-        if (finished) {
-          return;
+        if (canConnect) {
+          sendOverPort(request, finish);
+        } else {
+          sendOneShot(request, finish);
         }
-        finished = true;
-        clearTimeout(timer);
-        resolve({
+      } catch (error) {
+        finish({
           ok: false,
           error: {
             code: "native_exception",
@@ -55,6 +55,10 @@
       return this.send("record_exposure", payload);
     }
 
+    recordSignalsBatch(payload, timeoutMs) {
+      return this.send("record_signals_batch", payload, timeoutMs);
+    }
+
     triggerRulegen(payload, timeoutMs) {
       return this.send("trigger_rulegen", payload, timeoutMs);
     }
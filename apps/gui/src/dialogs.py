@@ -39,6 +39,7 @@ from lexishift_core import (
     VocabSettings,
 )
 from lexishift_core.helper.lp_capabilities import selectable_srs_pairs
+from lexishift_core.resources.embedding_ann import DEFAULT_NPROBE
 from i18n import available_locales, t
 from settings_language_packs import LanguagePackPanel
 from helper_installer import install_helper, is_helper_installed
@@ -219,6 +220,7 @@ class SettingsDialog(QDialog):
             use_embeddings=self.use_embeddings_check.isChecked(),
             embedding_threshold=embedding_threshold,
             embedding_fallback=self.embedding_fallback_check.isChecked(),
+            embedding_nprobe=_parse_int(self.embedding_nprobe_edit.text(), default=0),
             language_packs=language_pack_paths,
             frequency_packs=frequency_pack_paths,
             embedding_packs=embedding_pack_paths,
@@ -318,6 +320,9 @@ class SettingsDialog(QDialog):
         self.embedding_fallback_check.setToolTip(
             t("settings.embedding_fallback_tip")
         )
+        self.embedding_nprobe_edit = QLineEdit()
+        self.embedding_nprobe_edit.setPlaceholderText(str(DEFAULT_NPROBE))
+        self.embedding_nprobe_edit.setToolTip(t("settings.embedding_nprobe_tip"))
         self.embedding_threshold_slider.valueChanged.connect(self._update_embedding_threshold_label)
         self.use_embeddings_check.toggled.connect(self._toggle_embedding_fields)
 
@@ -344,6 +349,7 @@ class SettingsDialog(QDialog):
         form.addRow("", self.use_embeddings_check)
         form.addRow(t("settings.similarity_threshold"), threshold_widget)
         form.addRow("", self.embedding_fallback_check)
+        form.addRow(t("settings.embedding_nprobe"), self.embedding_nprobe_edit)
 
         panel = QWidget()
         panel.setLayout(form)
@@ -632,6 +638,8 @@ class SettingsDialog(QDialog):
         self.embedding_threshold_slider.setValue(max(0, min(100, threshold)))
         self._update_embedding_threshold_label(self.embedding_threshold_slider.value())
         self.embedding_fallback_check.setChecked(synonym_settings.embedding_fallback)
+        nprobe = synonym_settings.embedding_nprobe
+        self.embedding_nprobe_edit.setText(str(nprobe) if nprobe > 0 else "")
         self._toggle_embedding_fields(self.use_embeddings_check.isChecked())
         self.language_pack_panel.apply_synonym_settings(synonym_settings)
 
@@ -642,6 +650,7 @@ class SettingsDialog(QDialog):
         self.embedding_threshold_slider.setEnabled(enabled)
         self.embedding_threshold_value.setEnabled(enabled)
         self.embedding_fallback_check.setEnabled(enabled)
+        self.embedding_nprobe_edit.setEnabled(enabled)
 
     def _apply_inflections(self, settings: InflectionSettings) -> None:
         self.inflections_enabled_check.setChecked(settings.enabled)
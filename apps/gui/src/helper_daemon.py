@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Optional
 
 from lexishift_core.helper.engine import RulegenJobConfig, run_rulegen_job
-from lexishift_core.helper.paths import build_helper_paths
+from lexishift_core.helper.resident import HelperEngine
 from lexishift_core.helper.status import HelperStatus, load_status, save_status
 from lexishift_core.helper.lp_capabilities import (
     default_freedict_de_en_path,
@@ -86,7 +86,8 @@ def _update_status_error(paths, error: str) -> None:
 
 
 def run_daemon(config: DaemonConfig) -> None:
-    paths = build_helper_paths()
+    engine = HelperEngine()
+    paths = engine.paths
     save_status(
         HelperStatus(last_run_at=now_utc().isoformat(), last_error=None),
         paths.srs_status_path,
@@ -101,7 +102,8 @@ def run_daemon(config: DaemonConfig) -> None:
                 job = _build_job_config(pair, paths, config)
                 if not job:
                     continue
-                run_rulegen_job(paths, config=job)
+                with engine.jobs.profile_lock(paths.normalize_profile_id(job.profile_id)):
+                    run_rulegen_job(paths, config=job, state=engine.state)
         except Exception as exc:  # noqa: BLE001
             _update_status_error(paths, str(exc))
         time.sleep(max(10, int(config.interval_seconds)))
@@ -1076,6 +1076,11 @@ class MainWindow(QMainWindow):
                 embedding_pair=pair_key,
                 embedding_threshold=settings.embedding_threshold,
                 embedding_fallback=settings.embedding_fallback,
+                embedding_nprobe=settings.embedding_nprobe,
+                store_path=_app_data_dir() / "synonym_store.sqlite",
+                # Parse in-process: the one-file build has no freeze_support(),
+                # so spawned pool workers would re-run the app's entry point.
+                load_workers=1,
             )
             generator = SynonymGenerator(sources, options=options)
             self._log_source_stats(pack_ids, generator.stats())
@@ -1099,8 +1104,8 @@ class MainWindow(QMainWindow):
                 )
                 continue
 
-            for target in targets:
-                synonyms, used_fallback = generator.synonyms_for_detail(target)
+            details = generator.synonyms_for_details(targets)
+            for target, (synonyms, used_fallback) in zip(targets, details):
                 if not synonyms:
                     self._append_log(
                         t("logs.no_synonyms_for", target=target),
@@ -1541,6 +1546,7 @@ class MainWindow(QMainWindow):
             self.state.dataset,
             self.input_edit.toPlainText(),
             practice_gate=practice_gate,
+            dataset_path=None if self.state.dirty else self.state.dataset_path,
         )
 
     def _apply_preview(self, output: str, spans) -> None:
@@ -1949,13 +1955,14 @@ class MainWindow(QMainWindow):
         scope = self._replacement_filter_scope(replacement)
         if scope == "none":
             return
+        matching = [
+            (row, rule)
+            for row, rule in enumerate(self.rules_model.rules())
+            if rule.replacement == replacement and (scope != "synonyms" or "synonym" in rule.tags)
+        ]
+        scores = index.similarities(replacement, [rule.source_phrase for _row, rule in matching])
         updates: list[tuple[int, VocabRule]] = []
-        for row, rule in enumerate(self.rules_model.rules()):
-            if rule.replacement != replacement:
-                continue
-            if scope == "synonyms" and "synonym" not in rule.tags:
-                continue
-            score = index.similarity(rule.source_phrase, replacement)
+        for (row, rule), score in zip(matching, scores):
             if score is None:
                 enabled = threshold <= 0.0
             else:
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Iterable, List, Optional, Sequence
 
 from PySide6.QtCore import QObject, QThread, Signal
 from PySide6.QtGui import QColor, QTextCharFormat, QSyntaxHighlighter
 
-from lexishift_core import Match, PracticeGate, Replacer, VocabDataset, build_vocab_pool_from_dataset
+from lexishift_core import (
+    Match,
+    PracticeGate,
+    Replacer,
+    VocabDataset,
+    VocabPool,
+    build_vocab_pool_from_dataset,
+    load_compiled_vocab_pool,
+)
 
 
 @dataclass(frozen=True)
@@ -25,19 +34,31 @@ class PreviewWorker(QThread):
         dataset: VocabDataset,
         text: str,
         practice_gate: Optional[PracticeGate] = None,
+        dataset_path: Optional[Path] = None,
     ) -> None:
         super().__init__()
         self._job_id = job_id
         self._dataset = dataset
         self._text = text
         self._practice_gate = practice_gate
+        self._dataset_path = dataset_path
 
     def run(self) -> None:
-        pool = build_vocab_pool_from_dataset(self._dataset, practice_gate=self._practice_gate)
-        replacer = Replacer(pool)
+        replacer = Replacer(self._load_pool())
         output, spans = apply_replacements_with_spans(replacer, self._text)
         self.previewReady.emit(self._job_id, output, spans)
 
+    def _load_pool(self) -> VocabPool:
+        # The compiled artifact mirrors the saved file, so it only stands in
+        # for an unedited dataset. The practice gate filters unexpanded rules
+        # and always needs a fresh build.
+        if self._dataset_path is not None and self._practice_gate is None:
+            try:
+                return load_compiled_vocab_pool(self._dataset_path)
+            except (OSError, ValueError):
+                pass
+        return build_vocab_pool_from_dataset(self._dataset, practice_gate=self._practice_gate)
+
 
 class PreviewController(QObject):
     previewReady = Signal(str, object)
@@ -47,9 +68,22 @@ class PreviewController(QObject):
         self._job_id = 0
         self._workers: List[PreviewWorker] = []
 
-    def request(self, dataset: VocabDataset, text: str, *, practice_gate: Optional[PracticeGate] = None) -> None:
+    def request(
+        self,
+        dataset: VocabDataset,
+        text: str,
+        *,
+        practice_gate: Optional[PracticeGate] = None,
+        dataset_path: Optional[Path] = None,
+    ) -> None:
         self._job_id += 1
-        worker = PreviewWorker(self._job_id, dataset, text, practice_gate=practice_gate)
+        worker = PreviewWorker(
+            self._job_id,
+            dataset,
+            text,
+            practice_gate=practice_gate,
+            dataset_path=dataset_path,
+        )
         worker.previewReady.connect(self._handle_preview)
         worker.finished.connect(lambda: self._cleanup(worker))
         self._workers.append(worker)
@@ -39,6 +39,8 @@ from language_packs import (
     download_log_path,
 )
 from lexishift_core import SynonymSourceSettings
+from lexishift_core.resources.embedding_ann import embedding_ann_path
+from lexishift_core.resources.embedding_matrix import MATRIX_SUFFIX, embedding_vocab_path, numpy_available
 from i18n import t
 from theme_manager import resolve_current_theme
 from utils_paths import reveal_path
@@ -81,6 +83,11 @@ def _is_sqlite_db_file(path: str | Path) -> bool:
     return header.startswith(b"SQLite format 3")
 
 
+def _embedding_matrix_files(sqlite_path: str | Path) -> list[Path]:
+    matrix_path = Path(sqlite_path).with_suffix(MATRIX_SUFFIX)
+    return [matrix_path, embedding_vocab_path(matrix_path), embedding_ann_path(matrix_path)]
+
+
 def _resolve_embedding_converter_script() -> Path:
     this_file = Path(__file__).resolve()
     candidates = (
@@ -114,38 +121,49 @@ class EmbeddingConversionThread(QThread):
         try:
             if not self._source_path.exists():
                 raise FileNotFoundError(f"Embedding file not found: {self._source_path}")
+            # With NumPy, a float32 matrix (and its IVF index) is written next
+            # to the SQLite file; EmbeddingIndex memory-maps it when present.
+            matrix_path = self._output_path.with_suffix(MATRIX_SUFFIX)
+            want_matrix = numpy_available() and not matrix_path.exists()
             if _is_sqlite_db_file(self._output_path):
+                if want_matrix:
+                    # Packs converted before matrices existed: build from the SQLite file.
+                    self._run_converter(self._output_path, matrix_path)
                 self.completed.emit(self._pack_id, str(self._output_path))
                 return
-            script = _resolve_embedding_converter_script()
-            command = [
-                sys.executable,
-                str(script),
-                "--input",
-                str(self._source_path),
-                "--output",
-                str(self._output_path),
-                "--overwrite",
-                "--progress",
-                "0",
-            ]
-            result = subprocess.run(
-                command,
-                check=False,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode != 0:
-                detail = (result.stderr or result.stdout or "").strip()
-                if not detail:
-                    detail = f"embedding conversion failed with exit code {result.returncode}"
-                raise RuntimeError(detail)
+            self._run_converter(self._source_path, self._output_path, "--matrix" if want_matrix else None)
             if not _is_sqlite_db_file(self._output_path):
                 raise RuntimeError("embedding conversion did not produce a valid SQLite file")
             self.completed.emit(self._pack_id, str(self._output_path))
         except Exception as exc:  # noqa: BLE001
             self.failed.emit(self._pack_id, str(exc))
 
+    def _run_converter(self, input_path: Path, output_path: Path, *extra: Optional[str]) -> None:
+        script = _resolve_embedding_converter_script()
+        command = [
+            sys.executable,
+            str(script),
+            "--input",
+            str(input_path),
+            "--output",
+            str(output_path),
+            "--overwrite",
+            "--progress",
+            "0",
+            *[item for item in extra if item],
+        ]
+        result = subprocess.run(
+            command,
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            detail = (result.stderr or result.stdout or "").strip()
+            if not detail:
+                detail = f"embedding conversion failed with exit code {result.returncode}"
+            raise RuntimeError(detail)
+
 
 class LanguagePackPanel(QWidget):
 
@@ -1066,6 +1084,12 @@ class LanguagePackPanel(QWidget):
         if resolved_optimized_path and resolved_optimized_path != resolved_path:
             if os.path.exists(resolved_optimized_path) and self._is_app_data_path(resolved_optimized_path, embeddings=True):
                 delete_paths.append(resolved_optimized_path)
+        for optimized_path in (local_optimized_path, archive_optimized_path, resolved_optimized_path):
+            if not optimized_path:
+                continue
+            for companion in _embedding_matrix_files(optimized_path):
+                if companion.exists() and self._is_app_data_path(str(companion), embeddings=True):
+                    delete_paths.append(str(companion))
         delete_paths = list(dict.fromkeys(delete_paths))
         unlink_only = local_path and not delete_paths
         if not delete_paths and not unlink_only:
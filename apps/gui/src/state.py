@@ -19,6 +19,7 @@ from lexishift_core import (
     save_srs_store,
     save_vocab_dataset,
 )
+from lexishift_core.helper.paths import build_helper_paths
 
 
 def _normalize_profile_path(path: Optional[str], *, base_dir: Path) -> Optional[str]:
@@ -111,7 +112,10 @@ class AppState(QObject):
     def __init__(self, settings_path: Path) -> None:
         super().__init__()
         self._settings_path = settings_path
-        self._srs_store_path = settings_path.parent / "srs" / "srs_store.json"
+        # The app data dir is the helper's data root, so both sides resolve the
+        # same per-profile store, SQLite once the profile has been migrated.
+        self._helper_paths = build_helper_paths(settings_path.parent)
+        self._legacy_srs_store_path = settings_path.parent / "srs" / "srs_store.json"
         self._settings = AppSettings()
         self._dataset = VocabDataset()
         self._dataset_path: Optional[Path] = None
@@ -160,22 +164,35 @@ class AppState(QObject):
         self._settings_path.parent.mkdir(parents=True, exist_ok=True)
         save_app_settings(self._settings, self._settings_path)
 
+    @property
+    def srs_store_path(self) -> Path:
+        return self._helper_paths.srs_store_path_for(self._settings.active_profile_id)
+
     def _load_srs_store(self) -> None:
-        if self._srs_store_path.exists():
-            self._srs_store = load_srs_store(self._srs_store_path)
+        store_path = self.srs_store_path
+        if store_path.exists():
+            self._srs_store = load_srs_store(store_path)
+        elif self._legacy_srs_store_path.exists():
+            # Older builds kept one app-wide store outside the profile dirs;
+            # hand it to the first profile loaded and retire the file.
+            self._srs_store = load_srs_store(self._legacy_srs_store_path)
+            self.save_srs_store()
+            self._legacy_srs_store_path.replace(
+                self._legacy_srs_store_path.with_name(self._legacy_srs_store_path.name + ".migrated")
+            )
         else:
             self._srs_store = SrsStore()
             self.save_srs_store()
 
     def save_srs_store(self) -> None:
-        self._srs_store_path.parent.mkdir(parents=True, exist_ok=True)
-        save_srs_store(self._srs_store, self._srs_store_path)
+        save_srs_store(self._srs_store, self.srs_store_path)
 
     def update_srs_store(self, store: SrsStore) -> None:
         self._srs_store = store
         self.save_srs_store()
 
     def set_profiles(self, profiles: tuple[Profile, ...], *, active_profile_id: Optional[str]) -> None:
+        previous_active = self._settings.active_profile_id
         normalized_profiles, normalized_active = _normalize_profiles(
             tuple(profiles),
             active_profile_id=active_profile_id,
@@ -187,10 +204,13 @@ class AppState(QObject):
             active_profile_id=normalized_active,
         )
         self.save_settings()
+        if normalized_active != previous_active:
+            self._load_srs_store()
         self.profilesChanged.emit(self._settings.profiles)
         self.activeProfileChanged.emit(self._settings.active_profile_id)
 
     def update_settings(self, settings: AppSettings) -> None:
+        previous_active = self._settings.active_profile_id
         normalized_profiles, normalized_active = _normalize_profiles(
             tuple(settings.profiles),
             active_profile_id=settings.active_profile_id,
@@ -202,6 +222,8 @@ class AppState(QObject):
             active_profile_id=normalized_active,
         )
         self.save_settings()
+        if normalized_active != previous_active:
+            self._load_srs_store()
         self.profilesChanged.emit(self._settings.profiles)
         self.activeProfileChanged.emit(self._settings.active_profile_id)
 
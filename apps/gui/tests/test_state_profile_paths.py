@@ -90,3 +90,34 @@ def test_normalize_profiles_rewrites_duplicate_and_empty_profile_ids() -> None:
     assert normalized_profiles[0].name == "dup"
     assert normalized_profiles[2].name == "profile"
     assert active_profile_id == "dup"
+
+
+def test_app_and_helper_share_the_profile_srs_store(tmp_path: Path) -> None:
+    from lexishift_core import SrsItem, SrsStore, load_srs_store, save_srs_store
+    from lexishift_core.helper.paths import build_helper_paths
+    from lexishift_core.srs.sqlite_store import migrate_json_srs_store
+    from state import AppState
+
+    state = AppState(settings_path=tmp_path / "settings.json")
+    state.load_settings()
+    profile_id = state.settings.active_profile_id
+    paths = build_helper_paths(tmp_path)
+
+    state.update_srs_store(SrsStore(items=(SrsItem(item_id="en-ja:cat", lemma="cat", language_pair="en-ja", source_type="initial_set"),)))
+    json_path = paths.srs_store_path_for(profile_id)
+    assert json_path == state.srs_store_path
+    assert [item.lemma for item in load_srs_store(json_path).items] == ["cat"]
+
+    migrate_json_srs_store(json_path, paths.srs_store_db_path_for(profile_id))
+    db_path = paths.srs_store_path_for(profile_id)
+    helper_store = load_srs_store(db_path)
+    save_srs_store(
+        SrsStore(items=helper_store.items + (SrsItem(item_id="en-ja:dog", lemma="dog", language_pair="en-ja", source_type="initial_set"),)),
+        db_path,
+    )
+
+    state.load_settings()
+    assert state.srs_store_path == db_path
+    assert [item.lemma for item in state.srs_store.items] == ["cat", "dog"]
+    state.update_srs_store(SrsStore(items=state.srs_store.items[1:]))
+    assert [item.lemma for item in load_srs_store(db_path).items] == ["dog"]
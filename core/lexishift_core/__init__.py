@@ -1,6 +1,16 @@
+from lexishift_core.replacement.automaton import PhraseAutomaton
+from lexishift_core.replacement.compiled import CompiledPhraseTrie
 from lexishift_core.replacement.core import (
+    MATCHER_AHO_CORASICK,
+    MATCHER_TRIE,
+    TOKENIZE_MODE_ARRAYS,
+    TOKENIZE_MODE_TOKENS,
+    TRIE_BACKEND_COMPACT,
+    TRIE_BACKEND_DICT,
+    CachedNormalizer,
     Match,
     MeaningRule,
+    NormalizationCacheStats,
     Normalizer,
     PhraseTrie,
     PhraseTrieNode,
@@ -9,10 +19,13 @@ from lexishift_core.replacement.core import (
     RuleMetadata,
     SynonymNormalizer,
     Token,
+    TokenArrays,
     Tokenizer,
     VocabPool,
     VocabRule,
 )
+from lexishift_core.replacement.batch import ParallelReplacer
+from lexishift_core.replacement.streaming import StreamingReplacer
 from lexishift_core.replacement.builder import BuildOptions, build_vocab_pool, expand_vocab_rules
 from lexishift_core.replacement.inflect import (
     DEFAULT_FORMS,
@@ -121,6 +134,9 @@ from lexishift_core.srs.signal_queue import (
     SIGNAL_FEEDBACK,
     SrsSignalEvent,
     append_signal_event,
+    append_signal_events,
+    event_from_dict,
+    event_to_dict,
     load_signal_events,
     save_signal_events,
     summarize_signal_events,
@@ -133,6 +149,7 @@ from lexishift_core.srs.store_ops import (
     record_feedback,
     upsert_item,
 )
+from lexishift_core.srs.store_index import IndexedSrsStore
 from lexishift_core.srs.time import format_ts, now_utc, parse_ts
 from lexishift_core.resources.synonyms import SynonymGenerator, SynonymOptions, SynonymSources
 from lexishift_core.resources.dict_loaders import (
@@ -140,6 +157,7 @@ from lexishift_core.resources.dict_loaders import (
     load_jmdict_glosses_ordered,
     load_jmdict_lemmas,
 )
+from lexishift_core.resources.jmdict_index import JmdictIndex, open_jmdict_index
 from lexishift_core.frequency import (
     FrequencyLexicon,
     FrequencySourceConfig,
@@ -153,6 +171,7 @@ from lexishift_core.frequency.providers import (
 )
 from lexishift_core.frequency.sqlite_store import SqliteFrequencyConfig, SqliteFrequencyStore
 from lexishift_core.rulegen.generation import (
+    EmbeddingScoreProvider,
     MappingCandidateSource,
     RuleCandidate,
     RuleConfidenceSignals,
@@ -182,6 +201,12 @@ from lexishift_core.srs.seed import (
     seed_to_selector_candidates,
 )
 from lexishift_core.scoring.weighting import GlossDecay, PmwWeighting, RankWeighting
+from lexishift_core.persistence.compiled_ruleset import (
+    load_compiled_ruleset,
+    load_compiled_vocab_pool,
+    ruleset_content_key,
+    save_compiled_ruleset,
+)
 from lexishift_core.persistence.storage import (
     InflectionSettings,
     LearningSettings,
@@ -193,23 +218,40 @@ from lexishift_core.persistence.storage import (
     dataset_to_dict,
     load_vocab_dataset,
     load_vocab_pool,
+    metadata_from_dict,
+    metadata_to_dict,
+    rule_from_dict,
+    rule_to_dict,
     save_vocab_dataset,
     save_vocab_pool,
 )
 
 __all__ = [
+    "CompiledPhraseTrie",
+    "MATCHER_AHO_CORASICK",
+    "MATCHER_TRIE",
+    "PhraseAutomaton",
+    "TOKENIZE_MODE_ARRAYS",
+    "TOKENIZE_MODE_TOKENS",
+    "TRIE_BACKEND_COMPACT",
+    "TRIE_BACKEND_DICT",
+    "CachedNormalizer",
     "Match",
     "MeaningRule",
+    "NormalizationCacheStats",
     "Normalizer",
     "PhraseTrie",
     "PhraseTrieNode",
     "Replacer",
     "ReplacementResult",
+    "StreamingReplacer",
+    "ParallelReplacer",
     "ReplacementMode",
     "ReplacementPipeline",
     "RuleMetadata",
     "SynonymNormalizer",
     "Token",
+    "TokenArrays",
     "Tokenizer",
     "InflectionSettings",
     "LearningSettings",
@@ -238,8 +280,16 @@ __all__ = [
     "dataset_to_dict",
     "load_vocab_dataset",
     "load_vocab_pool",
+    "metadata_from_dict",
+    "metadata_to_dict",
+    "rule_from_dict",
+    "rule_to_dict",
     "save_vocab_dataset",
     "save_vocab_pool",
+    "load_compiled_ruleset",
+    "load_compiled_vocab_pool",
+    "ruleset_content_key",
+    "save_compiled_ruleset",
     "export_dataset_json",
     "export_dataset_code",
     "export_dataset_python",
@@ -266,6 +316,8 @@ __all__ = [
     "load_jmdict_glosses",
     "load_jmdict_glosses_ordered",
     "load_jmdict_lemmas",
+    "JmdictIndex",
+    "open_jmdict_index",
     "FrequencyLexicon",
     "FrequencySourceConfig",
     "build_frequency_provider",
@@ -275,6 +327,7 @@ __all__ = [
     "SqliteFrequencyProvider",
     "SqliteFrequencyProviderConfig",
     "build_sqlite_frequency_provider",
+    "EmbeddingScoreProvider",
     "MappingCandidateSource",
     "RuleCandidate",
     "RuleConfidenceSignals",
@@ -357,6 +410,9 @@ __all__ = [
     "SIGNAL_FEEDBACK",
     "SrsSignalEvent",
     "append_signal_event",
+    "append_signal_events",
+    "event_from_dict",
+    "event_to_dict",
     "load_signal_events",
     "save_signal_events",
     "summarize_signal_events",
@@ -366,6 +422,7 @@ __all__ = [
     "record_exposure",
     "record_feedback",
     "upsert_item",
+    "IndexedSrsStore",
     "format_ts",
     "now_utc",
     "parse_ts",
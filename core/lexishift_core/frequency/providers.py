@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Callable, Optional
-
-from lexishift_core.frequency.sqlite_store import SqliteFrequencyConfig, SqliteFrequencyStore
+from typing import Callable, Iterable, Optional
+
+from lexishift_core.frequency.sqlite_store import (
+    DEFAULT_VALUE_CACHE_SIZE,
+    LruCache,
+    SqliteFrequencyConfig,
+    SqliteFrequencyStore,
+)
 from lexishift_core.scoring.weighting import PmwWeighting
 
 
@@ -13,15 +18,16 @@ class SqliteFrequencyProviderConfig:
     value_column: str = "pmw"
     weighting: PmwWeighting = field(default_factory=PmwWeighting)
     lower_case: bool = True
+    cache_size: int = DEFAULT_VALUE_CACHE_SIZE
 
 
 class SqliteFrequencyProvider:
     def __init__(self, config: SqliteFrequencyProviderConfig) -> None:
         self._config = config
-        self._store = SqliteFrequencyStore(config.sqlite)
+        self._store = SqliteFrequencyStore(config.sqlite, cache_size=config.cache_size)
         self._value_column = self._resolve_value_column(config.value_column)
         self._max_value = self._store.max_value(self._value_column)
-        self._cache: dict[str, float] = {}
+        self._cache: LruCache[str, float] = LruCache(config.cache_size)
 
     def close(self) -> None:
         self._store.close()
@@ -34,13 +40,24 @@ class SqliteFrequencyProvider:
 
     def weight(self, token: str) -> float:
         key = token.lower() if self._config.lower_case else token
-        if key in self._cache:
-            return self._cache[key]
-        raw = self._store.get_value(key, self._value_column)
-        weight = self._config.weighting.normalize(raw, max_value=self._max_value)
-        self._cache[key] = weight
+        weight = self._cache.get(key)
+        if weight is None:
+            self.prefetch([token])
+            weight = self._cache.get(key)
         return weight
 
+    def prefetch(self, tokens: Iterable[str]) -> None:
+        """Look up every uncached token in one batch of store queries."""
+        keys = [token.lower() if self._config.lower_case else token for token in tokens]
+        missing = [key for key in dict.fromkeys(keys) if key not in self._cache]
+        if not missing:
+            return
+        for key, raw in self._store.get_values(missing, self._value_column).items():
+            self._cache.put(key, self._config.weighting.normalize(raw, max_value=self._max_value))
+
+    def prefetch_phrases(self, phrases: Iterable[str]) -> None:
+        self.prefetch(token for phrase in phrases for token in phrase.split() if token)
+
     def weight_phrase(self, phrase: str, *, reducer: str = "avg") -> float:
         tokens = [item for item in phrase.split() if item]
         if not tokens:
@@ -76,5 +93,10 @@ def build_sqlite_frequency_provider(
         phrase = getattr(candidate, "source_phrase", "")
         return provider.weight_phrase(str(phrase), reducer=reducer)
 
+    def _prefetch(candidates: Iterable[object]) -> None:
+        provider.prefetch_phrases(str(getattr(candidate, "source_phrase", "")) for candidate in candidates)
+
     _fn._lexishift_provider = provider  # type: ignore[attr-defined]
+    # Picked up by SimpleSignalProvider.prefetch before a batch is scored.
+    _fn.prefetch = _prefetch  # type: ignore[attr-defined]
     return _fn
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Generic, Hashable, Iterable, Optional, TypeVar
 
 FREQUENCY_VALUE_COLUMNS = (
     "pmw",
@@ -16,6 +17,40 @@ FREQUENCY_VALUE_COLUMNS = (
     "ipm",
 )
 RANK_COLUMNS = ("core_rank", "rank", "id", "index")
+DEFAULT_VALUE_CACHE_SIZE = 100_000
+# Stays under SQLite's default bound-parameter limit.
+_LOOKUP_BATCH_SIZE = 500
+_MISSING = object()
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LruCache(Generic[K, V]):
+    """Dict-like cache that evicts the least recently used key past ``max_entries``."""
+
+    def __init__(self, max_entries: int = DEFAULT_VALUE_CACHE_SIZE) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._data: OrderedDict[K, V] = OrderedDict()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K, default: object = None):
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self._max_entries:
+            self._data.popitem(last=False)
 
 
 @dataclass(frozen=True)
@@ -28,12 +63,15 @@ class SqliteFrequencyConfig:
 
 
 class SqliteFrequencyStore:
-    def __init__(self, config: SqliteFrequencyConfig) -> None:
+    def __init__(self, config: SqliteFrequencyConfig, *, cache_size: int = DEFAULT_VALUE_CACHE_SIZE) -> None:
         self._config = config
         self._conn = sqlite3.connect(str(config.path))
         self._conn.row_factory = sqlite3.Row
-        self._cache: dict[tuple[str, str], Optional[float]] = {}
+        self._cache: LruCache[tuple[str, str], Optional[float]] = LruCache(cache_size)
         self._max_cache: dict[str, Optional[float]] = {}
+        # The schema of an open connection does not change; resolved once.
+        self._columns: Optional[list[str]] = None
+        self._value_columns: dict[tuple[Optional[str], bool], Optional[str]] = {}
 
     def close(self) -> None:
         self._conn.close()
@@ -45,12 +83,7 @@ class SqliteFrequencyStore:
         self.close()
 
     def max_value(self, column: str) -> Optional[float]:
-        columns = self.column_names()
-        resolved_column = self.resolve_column(column, available_columns=columns)
-        if not resolved_column and self._looks_like_frequency_column(column):
-            resolved_column = self.resolve_frequency_column(column, available_columns=columns)
-        if not resolved_column and self._looks_like_rank_column(column):
-            resolved_column = self.resolve_rank_column(column, available_columns=columns)
+        resolved_column = self._resolve_value_column(column)
         if not resolved_column:
             return None
         if resolved_column in self._max_cache:
@@ -62,30 +95,47 @@ class SqliteFrequencyStore:
         return value
 
     def column_names(self) -> list[str]:
-        rows = self._conn.execute(f"PRAGMA table_info({self._config.table});").fetchall()
-        return [row[1] for row in rows if len(row) > 1]
+        if self._columns is None:
+            rows = self._conn.execute(f"PRAGMA table_info({self._config.table});").fetchall()
+            self._columns = [row[1] for row in rows if len(row) > 1]
+        return list(self._columns)
 
     def get_value(self, lemma: str, column: str) -> Optional[float]:
-        columns = self.column_names()
-        resolved_lemma_column = self.resolve_column(self._config.lemma_column, available_columns=columns)
-        resolved_value_column = self.resolve_column(column, available_columns=columns)
-        if not resolved_value_column and self._looks_like_frequency_column(column):
-            resolved_value_column = self.resolve_frequency_column(column, available_columns=columns)
-        if not resolved_value_column and self._looks_like_rank_column(column):
-            resolved_value_column = self.resolve_rank_column(column, available_columns=columns)
+        return self.get_values([lemma], column)[lemma]
+
+    def get_values(self, lemmas: Iterable[str], column: str) -> dict[str, Optional[float]]:
+        """Values of ``column`` for each lemma (``None`` when missing), fetched
+        with chunked ``IN (...)`` queries for lemmas not already cached."""
+        lemmas = list(dict.fromkeys(lemmas))
+        resolved_lemma_column = self._resolve_value_column(self._config.lemma_column, direct_only=True)
+        resolved_value_column = self._resolve_value_column(column)
         if not resolved_lemma_column or not resolved_value_column:
-            return None
-        key = (lemma, resolved_value_column)
-        if key in self._cache:
-            return self._cache[key]
-        query = (
-            f"SELECT {resolved_value_column} as value FROM {self._config.table} "
-            f"WHERE {resolved_lemma_column} = ? LIMIT 1;"
-        )
-        row = self._conn.execute(query, (lemma,)).fetchone()
-        value = float(row["value"]) if row and row["value"] is not None else None
-        self._cache[key] = value
-        return value
+            return {lemma: None for lemma in lemmas}
+        values: dict[str, Optional[float]] = {}
+        missing: list[str] = []
+        for lemma in lemmas:
+            value = self._cache.get((lemma, resolved_value_column), _MISSING)
+            if value is _MISSING:
+                missing.append(lemma)
+            else:
+                values[lemma] = value
+        for start in range(0, len(missing), _LOOKUP_BATCH_SIZE):
+            batch = missing[start : start + _LOOKUP_BATCH_SIZE]
+            query = (
+                f"SELECT {resolved_lemma_column} as lemma, {resolved_value_column} as value "
+                f"FROM {self._config.table} "
+                f"WHERE {resolved_lemma_column} IN ({', '.join('?' for _ in batch)});"
+            )
+            found: dict[str, Optional[float]] = {}
+            for row in self._conn.execute(query, batch):
+                # Same as the old per-lemma ``LIMIT 1``: the first row wins.
+                if row["lemma"] not in found:
+                    found[row["lemma"]] = float(row["value"]) if row["value"] is not None else None
+            for lemma in batch:
+                value = found.get(lemma)
+                self._cache.put((lemma, resolved_value_column), value)
+                values[lemma] = value
+        return values
 
     def iter_top_by_rank(
         self,
@@ -180,6 +230,20 @@ class SqliteFrequencyStore:
                 return resolved
         return None
 
+    def _resolve_value_column(self, column: Optional[str], *, direct_only: bool = False) -> Optional[str]:
+        cache_key = (column, direct_only)
+        if cache_key in self._value_columns:
+            return self._value_columns[cache_key]
+        columns = self.column_names()
+        resolved = self.resolve_column(column, available_columns=columns)
+        if not direct_only:
+            if not resolved and self._looks_like_frequency_column(column):
+                resolved = self.resolve_frequency_column(column, available_columns=columns)
+            if not resolved and self._looks_like_rank_column(column):
+                resolved = self.resolve_rank_column(column, available_columns=columns)
+        self._value_columns[cache_key] = resolved
+        return resolved
+
     def _looks_like_frequency_column(self, column: Optional[str]) -> bool:
         lowered = str(column or "").strip().lower()
         if not lowered:
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import partial
 import json
 from pathlib import Path
-from typing import Mapping, Optional
+from typing import Any, Callable, Mapping, Optional, Sequence
 
 from lexishift_core.helper.lp_capabilities import resolve_pair_capability
 from lexishift_core.helper.paths import HelperPaths
@@ -16,6 +17,7 @@ from lexishift_core.helper.rulegen import (
     run_rulegen_for_pair,
     write_rulegen_outputs,
 )
+from lexishift_core.helper.resident import HelperStateCache
 from lexishift_core.helper.status import HelperStatus, load_status, save_status
 from lexishift_core.helper.use_cases.initialize_set import (
     initialize_srs_set as _initialize_srs_set_use_case,
@@ -24,8 +26,11 @@ from lexishift_core.helper.use_cases.refresh_set import (
     refresh_srs_set as _refresh_srs_set_use_case,
 )
 from lexishift_core.helper.use_cases.reset import reset_srs_data as _reset_srs_data_use_case
+from lexishift_core.helper.use_cases.rulegen_batch import run_rulegen_batch as _run_rulegen_batch_use_case
 from lexishift_core.helper.use_cases.rulegen_job import run_rulegen_job as _run_rulegen_job_use_case
-from lexishift_core.helper.use_cases.runtime_diagnostics import get_srs_runtime_diagnostics
+from lexishift_core.helper.use_cases.runtime_diagnostics import (
+    get_srs_runtime_diagnostics as _get_srs_runtime_diagnostics_use_case,
+)
 from lexishift_core.helper.use_cases.set_planning import (
     build_set_plan_payload as _build_set_plan_payload,
     count_items_for_pair as _count_items_for_pair,
@@ -34,7 +39,9 @@ from lexishift_core.helper.use_cases.set_planning import (
 from lexishift_core.helper.use_cases.signals import (
     apply_exposure as _apply_exposure_use_case,
     apply_feedback as _apply_feedback_use_case,
+    apply_signals_batch as _apply_signals_batch_use_case,
 )
+from lexishift_core.rulegen.resources import RulegenResourceCache
 from lexishift_core.srs import (
     SrsSettings,
     SrsStore,
@@ -49,7 +56,10 @@ from lexishift_core.srs.set_strategy import (
     OBJECTIVE_BOOTSTRAP,
     STRATEGY_FREQUENCY_BOOTSTRAP,
 )
+from lexishift_core.srs.signal_log import compact_signal_log
+from lexishift_core.srs.signal_stats import update_signal_stats
 from lexishift_core.srs.source import SOURCE_EXTENSION
+from lexishift_core.srs.sqlite_store import export_sqlite_srs_store_json, migrate_json_srs_store
 from lexishift_core.srs.time import now_utc
 
 
@@ -73,6 +83,7 @@ class RulegenJobConfig:
     sample_count: Optional[int] = None
     sample_strategy: Optional[str] = None
     sample_seed: Optional[int] = None
+    full_rebuild: bool = False
 
 
 @dataclass(frozen=True)
@@ -122,10 +133,18 @@ class SrsRefreshJobConfig:
     persist_store: bool = True
     trigger: str = "manual"
     profile_context: Optional[Mapping[str, object]] = None
+    full_rebuild: bool = False
 
 
-def _ensure_settings(paths: HelperPaths, *, persist_missing: bool = True) -> SrsSettings:
+def _ensure_settings(
+    paths: HelperPaths,
+    *,
+    persist_missing: bool = True,
+    state: Optional[HelperStateCache] = None,
+) -> SrsSettings:
     if paths.srs_settings_path.exists():
+        if state is not None:
+            return state.load("srs_settings", paths.srs_settings_path, load_srs_settings)
         return load_srs_settings(paths.srs_settings_path)
     settings = SrsSettings()
     if persist_missing:
@@ -151,16 +170,31 @@ def _ensure_store(
     *,
     profile_id: str,
     persist_missing: bool = True,
+    state: Optional[HelperStateCache] = None,
 ) -> SrsStore:
     store_path = paths.srs_store_path_for(profile_id)
     if store_path.exists():
-        return load_srs_store(store_path)
+        return state.load_store(store_path) if state is not None else load_srs_store(store_path)
     store = SrsStore()
     if persist_missing:
-        save_srs_store(store, store_path)
+        _save_store_fn(state)(store, store_path)
     return store
 
 
+def _save_store_fn(state: Optional[HelperStateCache]):
+    return state.save_store if state is not None else save_srs_store
+
+
+def _read_json(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _load_json(path: Path, *, state: Optional[HelperStateCache]) -> dict:
+    if state is not None:
+        return state.load("json", path, _read_json)
+    return _read_json(path)
+
+
 def _update_status(
     *,
     paths: HelperPaths,
@@ -184,18 +218,48 @@ def _update_status(
     save_status(status, status_path)
 
 
-def load_snapshot(paths: HelperPaths, *, pair: str, profile_id: str = "default") -> dict:
+def load_snapshot(
+    paths: HelperPaths,
+    *,
+    pair: str,
+    profile_id: str = "default",
+    state: Optional[HelperStateCache] = None,
+) -> dict:
     snapshot_path = paths.snapshot_path(pair, profile_id=profile_id)
     if not snapshot_path.exists():
         raise FileNotFoundError(snapshot_path)
-    return json.loads(snapshot_path.read_text(encoding="utf-8"))
+    return _load_json(snapshot_path, state=state)
 
 
-def load_ruleset(paths: HelperPaths, *, pair: str, profile_id: str = "default") -> dict:
+def load_ruleset(
+    paths: HelperPaths,
+    *,
+    pair: str,
+    profile_id: str = "default",
+    state: Optional[HelperStateCache] = None,
+) -> dict:
     ruleset_path = paths.ruleset_path(pair, profile_id=profile_id)
     if not ruleset_path.exists():
         raise FileNotFoundError(ruleset_path)
-    return json.loads(ruleset_path.read_text(encoding="utf-8"))
+    return _load_json(ruleset_path, state=state)
+
+
+def get_srs_runtime_diagnostics(
+    paths: HelperPaths,
+    *,
+    pair: str,
+    profile_id: str = "default",
+    state: Optional[HelperStateCache] = None,
+) -> dict:
+    if state is None:
+        return _get_srs_runtime_diagnostics_use_case(paths, pair=pair, profile_id=profile_id)
+    return _get_srs_runtime_diagnostics_use_case(
+        paths,
+        pair=pair,
+        profile_id=profile_id,
+        load_store_fn=state.load_store,
+        load_json_fn=partial(_load_json, state=state),
+    )
 
 
 def _resolve_pair_set_top_n(*, pair: str, requested_top_n: Optional[int], purpose: str) -> int:
@@ -260,7 +324,66 @@ def run_rulegen_job(
     paths: HelperPaths,
     *,
     config: RulegenJobConfig,
+    state: Optional[HelperStateCache] = None,
+    progress_fn: Optional[Callable[[int, int], None]] = None,
 ) -> dict:
+    return _run_rulegen_job_use_case(
+        paths,
+        config=config,
+        resolve_pair_set_top_n_fn=_resolve_pair_set_top_n,
+        resolve_pair_resources_fn=_resolve_pair_resources,
+        ensure_pair_requirements_fn=_ensure_pair_requirements,
+        resolve_profile_id_fn=_resolve_profile_id,
+        ensure_settings_fn=partial(_ensure_settings, state=state),
+        ensure_store_fn=partial(_ensure_store, state=state),
+        resolve_stopwords_path_fn=_resolve_stopwords_path,
+        update_status_fn=_update_status,
+        run_rulegen_for_pair_fn=partial(
+            run_rulegen_for_pair,
+            save_store_fn=_save_store_fn(state),
+            progress_fn=progress_fn,
+        ),
+        write_rulegen_outputs_fn=write_rulegen_outputs,
+    )
+
+
+def run_rulegen_batch(
+    paths: HelperPaths,
+    *,
+    configs: Sequence[RulegenJobConfig],
+    workers: Optional[int] = None,
+    mp_context: Optional[Any] = None,
+) -> dict:
+    return _run_rulegen_batch_use_case(
+        paths,
+        configs=configs,
+        workers=workers,
+        mp_context=mp_context,
+        resolve_job_key_fn=_resolve_rulegen_job_key,
+        prepare_profile_fn=_prepare_rulegen_profile,
+        run_job_fn=_run_rulegen_batch_job,
+    )
+
+
+def _resolve_rulegen_job_key(paths: HelperPaths, *, config: RulegenJobConfig) -> tuple[str, str]:
+    return _resolve_profile_id(paths, profile_id=config.profile_id), resolve_pair_capability(config.pair).pair
+
+
+def _prepare_rulegen_profile(paths: HelperPaths, *, profile_id: str, persist_missing: bool) -> None:
+    _ensure_settings(paths, persist_missing=persist_missing)
+    _ensure_store(paths, profile_id=profile_id, persist_missing=persist_missing)
+
+
+def _run_rulegen_batch_job(
+    paths: HelperPaths,
+    *,
+    config: RulegenJobConfig,
+    resources: RulegenResourceCache,
+    lock: Any,
+) -> dict:
+    # Other workers may be writing the same profile's store and status for
+    # other pairs, so those writes re-read under the shared lock.
+    pair = resolve_pair_capability(config.pair).pair
     return _run_rulegen_job_use_case(
         paths,
         config=config,
@@ -271,22 +394,40 @@ def run_rulegen_job(
         ensure_settings_fn=_ensure_settings,
         ensure_store_fn=_ensure_store,
         resolve_stopwords_path_fn=_resolve_stopwords_path,
-        update_status_fn=_update_status,
-        run_rulegen_for_pair_fn=run_rulegen_for_pair,
+        update_status_fn=partial(_locked_call, _update_status, lock=lock),
+        run_rulegen_for_pair_fn=partial(
+            run_rulegen_for_pair,
+            save_store_fn=partial(_save_pair_items, pair=pair, lock=lock),
+            resources=resources,
+        ),
         write_rulegen_outputs_fn=write_rulegen_outputs,
     )
 
 
+def _locked_call(fn, *args, lock: Any, **kwargs):
+    with lock:
+        return fn(*args, **kwargs)
+
+
+def _save_pair_items(store: SrsStore, path: Path, *, pair: str, lock: Any) -> None:
+    with lock:
+        current = load_srs_store(path) if Path(path).exists() else SrsStore()
+        items = [item for item in current.items if item.language_pair != pair]
+        items.extend(item for item in store.items if item.language_pair == pair)
+        save_srs_store(replace(current, items=tuple(items)), path)
+
+
 def plan_srs_set(
     paths: HelperPaths,
     *,
     config: SetPlanningJobConfig,
+    state: Optional[HelperStateCache] = None,
 ) -> dict:
     return _plan_srs_set_use_case(
         paths,
         config=config,
         resolve_profile_id_fn=_resolve_profile_id,
-        ensure_store_fn=_ensure_store,
+        ensure_store_fn=partial(_ensure_store, state=state),
         resolve_pair_set_top_n_fn=_resolve_pair_set_top_n,
         resolve_pair_initial_active_count_fn=_resolve_pair_initial_active_count,
         resolve_stopwords_path_fn=_resolve_stopwords_path,
@@ -297,6 +438,8 @@ def initialize_srs_set(
     paths: HelperPaths,
     *,
     config: SetInitializationJobConfig,
+    state: Optional[HelperStateCache] = None,
+    progress_fn: Optional[Callable[[int, int], None]] = None,
 ) -> dict:
     return _initialize_srs_set_use_case(
         paths,
@@ -306,15 +449,20 @@ def initialize_srs_set(
         resolve_pair_resources_fn=_resolve_pair_resources,
         ensure_pair_requirements_fn=_ensure_pair_requirements,
         resolve_profile_id_fn=_resolve_profile_id,
-        ensure_settings_fn=_ensure_settings,
-        ensure_store_fn=_ensure_store,
+        ensure_settings_fn=partial(_ensure_settings, state=state),
+        ensure_store_fn=partial(_ensure_store, state=state),
         count_items_for_pair_fn=_count_items_for_pair,
         build_set_plan_payload_fn=_build_set_plan_payload,
         resolve_stopwords_path_fn=_resolve_stopwords_path,
         initialize_store_from_frequency_list_with_report_fn=initialize_store_from_frequency_list_with_report,
-        run_rulegen_for_pair_fn=run_rulegen_for_pair,
+        run_rulegen_for_pair_fn=partial(
+            run_rulegen_for_pair,
+            save_store_fn=_save_store_fn(state),
+            progress_fn=progress_fn,
+        ),
         write_rulegen_outputs_fn=write_rulegen_outputs,
         update_status_fn=_update_status,
+        save_store_fn=_save_store_fn(state),
     )
 
 
@@ -322,6 +470,8 @@ def refresh_srs_set(
     paths: HelperPaths,
     *,
     config: SrsRefreshJobConfig,
+    state: Optional[HelperStateCache] = None,
+    progress_fn: Optional[Callable[[int, int], None]] = None,
 ) -> dict:
     return _refresh_srs_set_use_case(
         paths,
@@ -331,14 +481,19 @@ def refresh_srs_set(
         resolve_pair_resources_fn=_resolve_pair_resources,
         ensure_pair_requirements_fn=_ensure_pair_requirements,
         resolve_profile_id_fn=_resolve_profile_id,
-        ensure_settings_fn=_ensure_settings,
-        ensure_store_fn=_ensure_store,
+        ensure_settings_fn=partial(_ensure_settings, state=state),
+        ensure_store_fn=partial(_ensure_store, state=state),
         count_items_for_pair_fn=_count_items_for_pair,
         resolve_stopwords_path_fn=_resolve_stopwords_path,
         build_seed_candidates_fn=build_seed_candidates,
-        run_rulegen_for_pair_fn=run_rulegen_for_pair,
+        run_rulegen_for_pair_fn=partial(
+            run_rulegen_for_pair,
+            save_store_fn=_save_store_fn(state),
+            progress_fn=progress_fn,
+        ),
         write_rulegen_outputs_fn=write_rulegen_outputs,
         update_status_fn=_update_status,
+        save_store_fn=_save_store_fn(state),
     )
 
 
@@ -350,6 +505,7 @@ def apply_feedback(
     rating: str,
     profile_id: str = "default",
     source_type: str = SOURCE_EXTENSION,
+    state: Optional[HelperStateCache] = None,
 ) -> None:
     _apply_feedback_use_case(
         paths,
@@ -359,7 +515,8 @@ def apply_feedback(
         profile_id=profile_id,
         source_type=source_type,
         resolve_profile_id_fn=_resolve_profile_id,
-        ensure_store_fn=_ensure_store,
+        ensure_store_fn=partial(_ensure_store, state=state),
+        save_store_fn=_save_store_fn(state),
     )
 
 
@@ -370,6 +527,7 @@ def apply_exposure(
     lemma: str,
     profile_id: str = "default",
     source_type: str = SOURCE_EXTENSION,
+    state: Optional[HelperStateCache] = None,
 ) -> None:
     _apply_exposure_use_case(
         paths,
@@ -378,10 +536,85 @@ def apply_exposure(
         profile_id=profile_id,
         source_type=source_type,
         resolve_profile_id_fn=_resolve_profile_id,
-        ensure_store_fn=_ensure_store,
+        ensure_store_fn=partial(_ensure_store, state=state),
+        save_store_fn=_save_store_fn(state),
     )
 
 
+def apply_signals_batch(
+    paths: HelperPaths,
+    *,
+    events: Sequence[Mapping[str, Any]],
+    profile_id: str = "default",
+    state: Optional[HelperStateCache] = None,
+) -> dict:
+    return _apply_signals_batch_use_case(
+        paths,
+        events=events,
+        profile_id=profile_id,
+        resolve_profile_id_fn=_resolve_profile_id,
+        ensure_store_fn=partial(_ensure_store, state=state),
+        save_store_fn=_save_store_fn(state),
+    )
+
+
+def compact_signal_queue(
+    paths: HelperPaths,
+    *,
+    profile_id: str = "default",
+) -> dict:
+    normalized_profile_id = _resolve_profile_id(paths, profile_id=profile_id)
+    log_path = paths.srs_signal_queue_path_for(normalized_profile_id)
+    # Fold pending records into the running stats before their segments go.
+    update_signal_stats(log_path)
+    return {
+        "profile_id": normalized_profile_id,
+        "signal_log_path": str(log_path),
+        "compacted_events": compact_signal_log(log_path),
+    }
+
+
+def migrate_srs_store_to_sqlite(
+    paths: HelperPaths,
+    *,
+    profile_id: str = "default",
+    overwrite: bool = False,
+) -> dict:
+    normalized_profile_id = _resolve_profile_id(paths, profile_id=profile_id)
+    json_path = paths.srs_store_json_path_for(normalized_profile_id)
+    db_path = paths.srs_store_db_path_for(normalized_profile_id)
+    if not json_path.exists():
+        raise FileNotFoundError(json_path)
+    item_count = migrate_json_srs_store(json_path, db_path, overwrite=overwrite)
+    return {
+        "profile_id": normalized_profile_id,
+        "json_path": str(json_path),
+        "store_path": str(db_path),
+        "items": item_count,
+    }
+
+
+def export_srs_store_json(
+    paths: HelperPaths,
+    *,
+    profile_id: str = "default",
+    output_path: Optional[Path] = None,
+) -> dict:
+    """Write a migrated profile's SQLite store out in the JSON store shape,
+    by default over the profile's srs_store.json backup."""
+    normalized_profile_id = _resolve_profile_id(paths, profile_id=profile_id)
+    db_path = paths.srs_store_db_path_for(normalized_profile_id)
+    if not db_path.exists():
+        raise FileNotFoundError(db_path)
+    json_path = output_path or paths.srs_store_json_path_for(normalized_profile_id)
+    export_sqlite_srs_store_json(db_path, json_path)
+    return {
+        "profile_id": normalized_profile_id,
+        "store_path": str(db_path),
+        "json_path": str(json_path),
+    }
+
+
 def reset_srs_data(
     paths: HelperPaths,
     *,
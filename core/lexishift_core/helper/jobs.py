@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+import itertools
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Iterator, Optional
+
+from lexishift_core.persistence.file_lock import exclusive_file_lock
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+_FINISHED_STATES = {JOB_COMPLETED, JOB_FAILED, JOB_CANCELLED}
+
+# Called by a job as ``progress_fn(done, total)`` between units of work.
+JobProgressFn = Callable[[int, int], None]
+
+
+class JobCancelledError(Exception):
+    """Raised from a job's progress callback once cancel was requested."""
+
+
+@dataclass
+class HelperJob:
+    job_id: str
+    job_type: str
+    profile_id: str
+    fn: Callable[[JobProgressFn], Any] = field(repr=False)
+    state: str = JOB_QUEUED
+    result: Any = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    progress: Optional[dict[str, int]] = None
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.state in _FINISHED_STATES
+
+    def to_dict(self, *, include_result: bool = True) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "job_id": self.job_id,
+            "job_type": self.job_type,
+            "profile_id": self.profile_id,
+            "state": self.state,
+            "cancel_requested": self.cancel_requested,
+            "progress": dict(self.progress) if self.progress else None,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+        }
+        if include_result:
+            payload["result"] = self.result
+        return payload
+
+
+class HelperJobQueue:
+    """Background runner for long helper commands (rulegen, set refresh).
+
+    Jobs run one at a time on a daemon worker thread, so the host loop keeps
+    answering signal messages while a job is in flight. Every job holds its
+    profile's lock from ``profile_lock`` while it runs; synchronous writers
+    take the same lock so writes to one profile's store never interleave.
+    With ``lock_path_fn(profile_id)`` the outermost holder in this process
+    also takes an exclusive file lock there, which serializes writers in
+    other processes (one-shot native hosts, the GUI daemon) as well.
+
+    Job functions are called with a ``progress_fn(done, total)`` to call
+    between units of work (targets, pairs). It records the counts, emits a
+    progress event and raises ``JobCancelledError`` once cancel was
+    requested, so a job stops at its next checkpoint; jobs only call it
+    before their first write. Cancelling a queued job drops it.
+
+    ``on_event`` receives ``job.to_dict(include_result=False)`` plus the final
+    result on every state transition and progress report and must be
+    thread-safe.
+    """
+
+    def __init__(
+        self,
+        *,
+        on_event: Optional[Callable[[dict[str, Any]], None]] = None,
+        lock_path_fn: Optional[Callable[[str], Path]] = None,
+        max_finished: int = 64,
+    ) -> None:
+        self._on_event = on_event
+        self._lock_path_fn = lock_path_fn
+        self._max_finished = max(1, int(max_finished))
+        self._jobs: dict[str, HelperJob] = {}
+        self._pending: deque[HelperJob] = deque()
+        self._finished: deque[str] = deque()
+        self._profile_locks: dict[str, threading.RLock] = {}
+        self._profile_depths: dict[str, int] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+    @contextmanager
+    def profile_lock(self, profile_id: str) -> Iterator[None]:
+        with self._lock:
+            lock = self._profile_locks.setdefault(profile_id, threading.RLock())
+        with lock:
+            # Depth is only touched while holding the profile's RLock.
+            depth = self._profile_depths.get(profile_id, 0)
+            self._profile_depths[profile_id] = depth + 1
+            try:
+                if depth or self._lock_path_fn is None:
+                    yield
+                else:
+                    with exclusive_file_lock(self._lock_path_fn(profile_id)):
+                        yield
+            finally:
+                self._profile_depths[profile_id] = depth
+
+    def submit(
+        self,
+        job_type: str,
+        fn: Callable[[JobProgressFn], Any],
+        *,
+        profile_id: str = "default",
+    ) -> dict[str, Any]:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Job queue is closed.")
+            job = HelperJob(
+                job_id=f"job-{next(self._ids)}",
+                job_type=job_type,
+                profile_id=profile_id,
+                fn=fn,
+            )
+            self._jobs[job.job_id] = job
+            self._pending.append(job)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="lexishift-jobs", daemon=True)
+                self._worker.start()
+            self._wakeup.notify_all()
+            snapshot = job.to_dict(include_result=False)
+            snapshot["queue_position"] = len(self._pending)
+        self._emit(snapshot)
+        return snapshot
+
+    def status(self, job_id: str) -> dict[str, Any]:
+        with self._lock:
+            job = self._require(job_id)
+            snapshot = job.to_dict()
+            if job.state == JOB_QUEUED:
+                snapshot["queue_position"] = self._pending.index(job) + 1
+        return snapshot
+
+    def profile_busy(self, profile_id: str) -> bool:
+        with self._lock:
+            return any(
+                job.profile_id == profile_id and not job.finished
+                for job in self._jobs.values()
+            )
+
+    def list_jobs(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [job.to_dict(include_result=False) for job in self._jobs.values()]
+
+    def cancel(self, job_id: str) -> dict[str, Any]:
+        emit = False
+        with self._lock:
+            job = self._require(job_id)
+            if job.state == JOB_QUEUED:
+                self._pending.remove(job)
+                self._finish(job, JOB_CANCELLED)
+                emit = True
+            elif job.state == JOB_RUNNING:
+                job.cancel_requested = True
+            snapshot = job.to_dict(include_result=False)
+        if emit:
+            self._emit(snapshot)
+        return snapshot
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> dict[str, Any]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            job = self._require(job_id)
+            while not job.finished:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._wakeup.wait(remaining)
+            return job.to_dict()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify_all()
+            worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+
+    def _require(self, job_id: str) -> HelperJob:
+        job = self._jobs.get(str(job_id))
+        if job is None:
+            raise ValueError(f"Unknown job: {job_id}")
+        return job
+
+    def _finish(self, job: HelperJob, state: str) -> None:
+        job.state = state
+        job.finished_at = time.time()
+        job.fn = _noop
+        self._finished.append(job.job_id)
+        while len(self._finished) > self._max_finished:
+            self._jobs.pop(self._finished.popleft(), None)
+        self._wakeup.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._pending and not self._closed:
+                    self._wakeup.wait()
+                if not self._pending:
+                    return
+                job = self._pending.popleft()
+                job.state = JOB_RUNNING
+                job.started_at = time.time()
+                snapshot = job.to_dict(include_result=False)
+            self._emit(snapshot)
+            result: Any = None
+            error: Optional[str] = None
+            final_state = JOB_COMPLETED
+            with self.profile_lock(job.profile_id):
+                try:
+                    result = job.fn(partial(self._report_progress, job))
+                except JobCancelledError:
+                    final_state = JOB_CANCELLED
+                except Exception as exc:  # noqa: BLE001
+                    error = str(exc) or exc.__class__.__name__
+                    final_state = JOB_FAILED
+            with self._lock:
+                job.result = result
+                job.error = error
+                self._finish(job, final_state)
+                snapshot = job.to_dict()
+            self._emit(snapshot)
+
+    def _report_progress(self, job: HelperJob, done: int, total: int) -> None:
+        with self._lock:
+            job.progress = {"done": int(done), "total": int(total)}
+            cancelled = job.cancel_requested
+            snapshot = job.to_dict(include_result=False)
+        if cancelled:
+            raise JobCancelledError(job.job_id)
+        self._emit(snapshot)
+
+    def _emit(self, snapshot: dict[str, Any]) -> None:
+        if self._on_event is None:
+            return
+        try:
+            self._on_event(snapshot)
+        except Exception:  # noqa: BLE001
+            pass
+
+
+def _noop(_progress_fn: JobProgressFn) -> None:
+    return None
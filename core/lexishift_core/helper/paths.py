@@ -7,6 +7,9 @@ from pathlib import Path
 import sys
 import re
 
+from lexishift_core.persistence.compiled_ruleset import compiled_ruleset_path
+from lexishift_core.srs.signal_queue import import_legacy_signal_queue
+
 
 DEFAULT_PROFILE_ID = "default"
 DEFAULT_STOPWORDS_DE = (
@@ -102,12 +105,28 @@ class HelperPaths:
         return directory
 
     def srs_store_path_for(self, profile_id: str | None = None) -> Path:
+        # A migrated SQLite store takes over from the JSON file once present.
+        db_path = self.srs_store_db_path_for(profile_id)
+        if db_path.exists():
+            return db_path
+        return self.srs_store_json_path_for(profile_id)
+
+    def srs_store_json_path_for(self, profile_id: str | None = None) -> Path:
         return self.profile_srs_dir(profile_id) / "srs_store.json"
 
+    def srs_store_db_path_for(self, profile_id: str | None = None) -> Path:
+        return self.profile_srs_dir(profile_id) / "srs_store.sqlite3"
+
+    def srs_store_lock_path_for(self, profile_id: str | None = None) -> Path:
+        return self.profile_srs_dir(profile_id) / "srs_store.lock"
+
     def srs_status_path_for(self, profile_id: str | None = None) -> Path:
         return self.profile_srs_dir(profile_id) / "srs_status.json"
 
     def srs_signal_queue_path_for(self, profile_id: str | None = None) -> Path:
+        return self.profile_srs_dir(profile_id) / "srs_signal_log.jsonl"
+
+    def srs_signal_queue_json_path_for(self, profile_id: str | None = None) -> Path:
         return self.profile_srs_dir(profile_id) / "srs_signal_queue.json"
 
     def snapshot_path(self, pair: str, profile_id: str | None = None) -> Path:
@@ -118,6 +137,13 @@ class HelperPaths:
         safe_pair = pair.replace("/", "-").replace(":", "-")
         return self.profile_srs_dir(profile_id) / f"srs_ruleset_{safe_pair}.json"
 
+    def rulegen_cache_path(self, pair: str, profile_id: str | None = None) -> Path:
+        safe_pair = pair.replace("/", "-").replace(":", "-")
+        return self.profile_srs_dir(profile_id) / f"srs_rulegen_cache_{safe_pair}.json"
+
+    def compiled_ruleset_path(self, pair: str, profile_id: str | None = None) -> Path:
+        return compiled_ruleset_path(self.ruleset_path(pair, profile_id=profile_id))
+
 
 def build_helper_paths(root: Path | None = None) -> HelperPaths:
     data_root = root or resolve_data_root()
@@ -128,17 +154,31 @@ def build_helper_paths(root: Path | None = None) -> HelperPaths:
     language_packs_dir = data_root / "language_packs"
     frequency_packs_dir = data_root / "frequency_packs"
     _ensure_default_stopwords(srs_dir)
-    return HelperPaths(
+    paths = HelperPaths(
         data_root=data_root,
         srs_dir=srs_dir,
         app_settings_path=data_root / "settings.json",
         srs_store_path=default_profile_dir / "srs_store.json",
         srs_settings_path=srs_dir / "srs_settings.json",
         srs_status_path=default_profile_dir / "srs_status.json",
-        srs_signal_queue_path=default_profile_dir / "srs_signal_queue.json",
+        srs_signal_queue_path=default_profile_dir / "srs_signal_log.jsonl",
         language_packs_dir=language_packs_dir,
         frequency_packs_dir=frequency_packs_dir,
     )
+    _import_legacy_signal_queues(paths)
+    return paths
+
+
+def _import_legacy_signal_queues(paths: HelperPaths) -> None:
+    # Profiles from before the append-only log carry a JSON queue; copy it
+    # over once, at setup, so no history is lost.
+    for profile_dir in (paths.srs_dir / "profiles").iterdir():
+        if not profile_dir.is_dir():
+            continue
+        import_legacy_signal_queue(
+            paths.srs_signal_queue_json_path_for(profile_dir.name),
+            paths.srs_signal_queue_path_for(profile_dir.name),
+        )
 
 
 def _ensure_default_stopwords(srs_dir: Path) -> None:
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Iterator, Optional
+
+from lexishift_core.helper.jobs import HelperJobQueue
+from lexishift_core.helper.paths import HelperPaths, build_helper_paths
+from lexishift_core.srs import SrsStore, load_srs_store, save_srs_store
+from lexishift_core.srs.store import is_sqlite_store_path
+
+_FileSignature = tuple[int, int]
+
+
+def _file_signature(path: Path) -> Optional[_FileSignature]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class HelperStateCache:
+    """Parsed helper files kept in memory between requests.
+
+    Entries are keyed by ``(kind, path)`` and stamped with the file's
+    ``(mtime_ns, size)``, so edits from other processes (GUI, CLI) are picked
+    up on the next read. Cached values are shared and must be treated as
+    read-only; writes made through ``save_store``/``remember`` re-stamp the
+    entry so the next read stays warm.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, Path], tuple[_FileSignature, Any]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, kind: str, path: Path, loader: Callable[[Path], Any]) -> Any:
+        key = (kind, Path(path))
+        # Stamp before reading: a write racing the load only costs a reload.
+        signature = _file_signature(key[1])
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and signature is not None and cached[0] == signature:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+        self._local.misses = self.thread_misses() + 1
+        value = loader(key[1])
+        if signature is not None:
+            with self._lock:
+                self._entries[key] = (signature, value)
+        return value
+
+    def remember(self, kind: str, path: Path, value: Any) -> None:
+        key = (kind, Path(path))
+        signature = _file_signature(key[1])
+        with self._lock:
+            if signature is None:
+                self._entries.pop(key, None)
+            else:
+                self._entries[key] = (signature, value)
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[1] == Path(path)]:
+                del self._entries[key]
+
+    def load_store(self, path: Path) -> SrsStore:
+        # SQLite stores already read per row, and WAL writes need not touch
+        # the main file's mtime, so they are never cached here.
+        if is_sqlite_store_path(path):
+            return load_srs_store(path)
+        return self.load("srs_store", path, load_srs_store)
+
+    def save_store(self, store: SrsStore, path: Path) -> None:
+        save_srs_store(store, path)
+        if not is_sqlite_store_path(path):
+            self.remember("srs_store", path, store)
+
+    def thread_misses(self) -> int:
+        return getattr(self._local, "misses", 0)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+@dataclass
+class _LatencyBucket:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def add(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class HelperEngine:
+    """Resident helper state owned by a long-lived host process.
+
+    Holds the resolved ``HelperPaths``, a ``HelperStateCache`` that engine
+    calls receive as ``state=`` and the ``HelperJobQueue`` for long
+    commands. ``track`` times each request and files it as ``cold`` when it
+    had to read at least one file from disk, ``warm`` otherwise.
+
+    Only worth building in long-lived hosts; one-shot CLI commands use
+    ``build_helper_paths`` directly. The native host is long-lived because
+    the extension keeps one ``connectNative`` port open to it (a host per
+    ``sendNativeMessage`` call would start cold every time), and the GUI
+    helper daemon runs for the life of the GUI.
+    """
+
+    def __init__(
+        self,
+        paths: Optional[HelperPaths] = None,
+        *,
+        state: Optional[HelperStateCache] = None,
+        jobs: Optional[HelperJobQueue] = None,
+    ) -> None:
+        self.paths = paths or build_helper_paths()
+        self.state = state or HelperStateCache()
+        self.jobs = jobs or HelperJobQueue(lock_path_fn=self.paths.srs_store_lock_path_for)
+        self._started = time.monotonic()
+        self._latency: dict[str, dict[str, _LatencyBucket]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def track(self, msg_type: str) -> Iterator[None]:
+        misses_before = self.state.thread_misses()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            phase = "cold" if self.state.thread_misses() > misses_before else "warm"
+            with self._lock:
+                buckets = self._latency.setdefault(
+                    msg_type,
+                    {"cold": _LatencyBucket(), "warm": _LatencyBucket()},
+                )
+                buckets[phase].add(elapsed_ms)
+
+    def latency_stats(self) -> dict[str, object]:
+        with self._lock:
+            requests = {
+                msg_type: {phase: bucket.to_dict() for phase, bucket in buckets.items()}
+                for msg_type, buckets in sorted(self._latency.items())
+            }
+        return {
+            "uptime_s": round(time.monotonic() - self._started, 3),
+            "cache": self.state.stats(),
+            "requests": requests,
+        }
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime
 import json
+import os
 from pathlib import Path
-from typing import Iterable, Mapping, Optional, Sequence
+from typing import Callable, Iterable, Mapping, Optional, Sequence
 
 from lexishift_core.lexicon.word_package import (
     normalize_word_package,
@@ -12,16 +13,24 @@ from lexishift_core.lexicon.word_package import (
 )
 from lexishift_core.replacement.core import VocabRule
 from lexishift_core.helper.paths import HelperPaths
+from lexishift_core.helper.rulegen_cache import RulegenRuleCache, rulegen_fingerprint, word_package_key
 from lexishift_core.rulegen.adapters import RulegenAdapterRequest, run_rules_with_adapter
+from lexishift_core.rulegen.resources import RulegenResourceCache
 from lexishift_core.srs import SrsItem, SrsSettings, SrsStore, save_srs_store
 from lexishift_core.srs.admission_policy import resolve_default_pos_weights
 from lexishift_core.srs.source import SOURCE_INITIAL_SET
 from lexishift_core.srs.seed import SeedSelectionConfig, build_seed_candidates
 from lexishift_core.srs.store_ops import build_item_id, upsert_item
-from lexishift_core.persistence.storage import VocabDataset, save_vocab_dataset
+from lexishift_core.persistence.compiled_ruleset import load_compiled_vocab_pool
+from lexishift_core.persistence.storage import VocabDataset, dataset_to_dict
 from lexishift_core.scoring.weighting import GlossDecay
 
 
+# Targets per adapter call when a run reports progress; each chunk boundary
+# is also where a cancelled job stops.
+RULEGEN_PROGRESS_CHUNK = 50
+
+
 @dataclass(frozen=True)
 class SetInitializationConfig:
     frequency_db: Path
@@ -62,6 +71,7 @@ class RulegenOutput:
     rules: Sequence[VocabRule]
     snapshot: Mapping[str, object]
     target_count: int
+    regenerated_count: Optional[int] = None
 
 
 def _now_iso() -> str:
@@ -289,14 +299,31 @@ def write_rulegen_outputs(
     rules: Sequence[VocabRule],
     snapshot: Mapping[str, object],
 ) -> None:
+    """Write the ruleset and snapshot, each replaced atomically so readers
+    never see a half-written file. The ruleset's compiled artifact is built
+    here too, so the app loads it without expanding the rules again."""
     dataset = VocabDataset(rules=tuple(rules))
-    save_vocab_dataset(dataset, paths.ruleset_path(pair, profile_id=profile_id))
-    Path(paths.snapshot_path(pair, profile_id=profile_id)).write_text(
+    ruleset_path = Path(paths.ruleset_path(pair, profile_id=profile_id))
+    _write_text_atomic(
+        ruleset_path,
+        json.dumps(dataset_to_dict(dataset), indent=2, sort_keys=True),
+    )
+    load_compiled_vocab_pool(
+        ruleset_path,
+        artifact_path=paths.compiled_ruleset_path(pair, profile_id=profile_id),
+    )
+    _write_text_atomic(
+        Path(paths.snapshot_path(pair, profile_id=profile_id)),
         json.dumps(snapshot, indent=2, sort_keys=True),
-        encoding="utf-8",
     )
 
 
+def _write_text_atomic(target: Path, text: str) -> None:
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, target)
+
+
 def run_rulegen_for_pair(
     *,
     paths: HelperPaths,
@@ -311,7 +338,22 @@ def run_rulegen_for_pair(
     targets_override: Optional[Sequence[str]] = None,
     initialize_if_empty: bool = True,
     persist_store: bool = True,
+    save_store_fn: Callable[..., None] = save_srs_store,
+    resources: Optional[RulegenResourceCache] = None,
+    rule_cache_path: Optional[Path] = None,
+    full_rebuild: bool = False,
+    progress_fn: Optional[Callable[[int, int], None]] = None,
 ) -> tuple[SrsStore, RulegenOutput]:
+    """Generate rules for the pair's targets in ``store``.
+
+    With ``rule_cache_path`` only targets that are new, or whose word
+    package or dictionary changed, go through the pipeline; the rest are
+    taken from the per-target cache. ``full_rebuild`` ignores the cache.
+
+    ``progress_fn(done, total)`` is called before each chunk of
+    ``RULEGEN_PROGRESS_CHUNK`` targets and once at the end, before anything
+    is written; it may raise to abandon the run.
+    """
     rulegen_config = rulegen_config or RulegenConfig(language_pair=pair)
     updated_store = store
     if targets_override is not None:
@@ -329,20 +371,41 @@ def run_rulegen_for_pair(
         pair=pair,
         targets=targets,
     )
-    rules = run_rules_with_adapter(
-        RulegenAdapterRequest(
-            pair=pair,
-            targets=targets,
-            language_pair=rulegen_config.language_pair,
-            confidence_threshold=rulegen_config.confidence_threshold,
-            include_variants=rulegen_config.include_variants,
-            allow_multiword_glosses=rulegen_config.allow_multiword_glosses,
-            gloss_decay=rulegen_config.gloss_decay,
-            jmdict_path=jmdict_path,
-            freedict_de_en_path=freedict_de_en_path,
-            word_packages_by_target=target_word_packages or None,
-        )
+    request = RulegenAdapterRequest(
+        pair=pair,
+        targets=targets,
+        language_pair=rulegen_config.language_pair,
+        confidence_threshold=rulegen_config.confidence_threshold,
+        include_variants=rulegen_config.include_variants,
+        allow_multiword_glosses=rulegen_config.allow_multiword_glosses,
+        gloss_decay=rulegen_config.gloss_decay,
+        jmdict_path=jmdict_path,
+        freedict_de_en_path=freedict_de_en_path,
+        word_packages_by_target=target_word_packages or None,
+        resources=resources,
     )
+    regenerated_count: Optional[int] = None
+    if progress_fn is not None and request.resources is None:
+        # Chunks must share dictionary handles instead of reopening them.
+        request = replace(request, resources=RulegenResourceCache())
+    if rule_cache_path is None:
+        rules = _run_rules(request, progress_fn=progress_fn)
+    else:
+        rules, regenerated_count = _run_rules_with_cache(
+            request,
+            cache_path=rule_cache_path,
+            fingerprint=rulegen_fingerprint(
+                pair=pair,
+                dictionary_paths=(jmdict_path, freedict_de_en_path),
+                options={
+                    key: value
+                    for key, value in asdict(rulegen_config).items()
+                    if not key.startswith("max_snapshot_")
+                },
+            ),
+            full_rebuild=full_rebuild,
+            progress_fn=progress_fn,
+        )
     generated_at = _now_iso()
     snapshot = build_snapshot(
         rules=rules,
@@ -352,9 +415,71 @@ def run_rulegen_for_pair(
         max_sources=rulegen_config.max_snapshot_sources,
     )
     if persist_store and updated_store is not store:
-        save_srs_store(updated_store, paths.srs_store_path_for(profile_id))
+        save_store_fn(updated_store, paths.srs_store_path_for(profile_id))
     return updated_store, RulegenOutput(
         rules=rules,
         snapshot=snapshot,
         target_count=len(targets),
+        regenerated_count=regenerated_count,
     )
+
+
+def _run_rules_with_cache(
+    request: RulegenAdapterRequest,
+    *,
+    cache_path: Path,
+    fingerprint: str,
+    full_rebuild: bool,
+    progress_fn: Optional[Callable[[int, int], None]] = None,
+) -> tuple[list[VocabRule], int]:
+    cache = RulegenRuleCache(fingerprint) if full_rebuild else RulegenRuleCache.load(cache_path, fingerprint=fingerprint)
+    packages = request.word_packages_by_target or {}
+    ordered = list(dict.fromkeys(request.targets))
+    keys = {target: word_package_key(packages.get(target)) for target in ordered}
+    stale = [target for target in ordered if not cache.has(target, keys[target])]
+    if not stale and progress_fn is not None:
+        progress_fn(len(ordered), len(ordered))
+    if stale:
+        stale_packages = {target: packages[target] for target in stale if target in packages}
+        fresh = _run_rules(
+            replace(request, targets=tuple(stale), word_packages_by_target=stale_packages or None),
+            progress_fn=progress_fn,
+            done_offset=len(ordered) - len(stale),
+        )
+        # Rules are generated per target and carry it as their replacement.
+        by_target: dict[str, list[VocabRule]] = {target: [] for target in stale}
+        for rule in fresh:
+            by_target.setdefault(rule.replacement, []).append(rule)
+        for target in stale:
+            cache.put(target, keys[target], by_target[target])
+    cache.retain(ordered)
+    cache.save(cache_path)
+    rules: list[VocabRule] = []
+    for target in ordered:
+        rules.extend(cache.get(target, keys[target]) or ())
+    return rules, len(stale)
+
+
+def _run_rules(
+    request: RulegenAdapterRequest,
+    *,
+    progress_fn: Optional[Callable[[int, int], None]] = None,
+    done_offset: int = 0,
+) -> list[VocabRule]:
+    if progress_fn is None:
+        return run_rules_with_adapter(request)
+    targets = list(request.targets)
+    packages = request.word_packages_by_target or {}
+    total = done_offset + len(targets)
+    rules: list[VocabRule] = []
+    for start in range(0, len(targets), RULEGEN_PROGRESS_CHUNK):
+        progress_fn(done_offset + start, total)
+        chunk = targets[start : start + RULEGEN_PROGRESS_CHUNK]
+        chunk_packages = {target: packages[target] for target in chunk if target in packages}
+        rules.extend(
+            run_rules_with_adapter(
+                replace(request, targets=tuple(chunk), word_packages_by_target=chunk_packages or None)
+            )
+        )
+    progress_fn(total, total)
+    return rules
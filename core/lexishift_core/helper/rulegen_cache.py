@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+from lexishift_core.persistence.storage import rule_from_dict, rule_to_dict
+from lexishift_core.replacement.core import VocabRule
+
+# Bump when rule generation changes in a way that invalidates cached rules.
+RULEGEN_CACHE_VERSION = 1
+
+
+def rulegen_fingerprint(
+    *,
+    pair: str,
+    dictionary_paths: Iterable[Optional[Path]],
+    options: Mapping[str, object],
+) -> str:
+    """Digest of everything a cached rule depends on besides its target:
+    the pair, dictionary files (resolved path, mtime, size) and the rulegen
+    options."""
+    parts = [f"v{RULEGEN_CACHE_VERSION}", pair, json.dumps(options, sort_keys=True, default=repr)]
+    for path in dictionary_paths:
+        if path is None:
+            parts.append("-")
+            continue
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            parts.append(f"{path}|missing")
+            continue
+        parts.append(f"{Path(path).resolve()}|{stat.st_mtime_ns}|{stat.st_size}")
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def word_package_key(package: Optional[Mapping[str, object]]) -> str:
+    if not package:
+        return ""
+    payload = json.dumps(package, ensure_ascii=False, sort_keys=True, default=repr)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class RulegenRuleCache:
+    """Generated rules per target, valid for one rulegen fingerprint.
+
+    Each entry is stored with the key of the target's word package, so a
+    target whose package changed is regenerated. A cache written under a
+    different fingerprint loads empty.
+    """
+
+    def __init__(self, fingerprint: str) -> None:
+        self.fingerprint = fingerprint
+        self._entries: dict[str, tuple[str, list[dict[str, Any]]]] = {}
+
+    @classmethod
+    def load(cls, path: Path, *, fingerprint: str) -> "RulegenRuleCache":
+        cache = cls(fingerprint)
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cache
+        if not isinstance(data, Mapping) or data.get("fingerprint") != fingerprint:
+            return cache
+        for target, entry in dict(data.get("targets") or {}).items():
+            if isinstance(entry, Mapping) and isinstance(entry.get("rules"), list):
+                cache._entries[str(target)] = (str(entry.get("key") or ""), list(entry["rules"]))
+        return cache
+
+    def save(self, path: Path) -> None:
+        target = Path(path)
+        payload = {
+            "version": RULEGEN_CACHE_VERSION,
+            "fingerprint": self.fingerprint,
+            "targets": {
+                name: {"key": key, "rules": rules}
+                for name, (key, rules) in sorted(self._entries.items())
+            },
+        }
+        tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, target)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def has(self, target: str, key: str) -> bool:
+        entry = self._entries.get(target)
+        return entry is not None and entry[0] == key
+
+    def get(self, target: str, key: str) -> Optional[list[VocabRule]]:
+        entry = self._entries.get(target)
+        if entry is None or entry[0] != key:
+            return None
+        return [rule_from_dict(rule) for rule in entry[1]]
+
+    def put(self, target: str, key: str, rules: Sequence[VocabRule]) -> None:
+        self._entries[target] = (key, [rule_to_dict(rule) for rule in rules])
+
+    def retain(self, targets: Iterable[str]) -> int:
+        """Drop entries for targets no longer in the set; returns how many."""
+        keep = set(targets)
+        stale = [target for target in self._entries if target not in keep]
+        for target in stale:
+            del self._entries[target]
+        return len(stale)
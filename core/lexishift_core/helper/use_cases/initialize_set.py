@@ -14,7 +14,7 @@ from lexishift_core.helper.rulegen import (
 from lexishift_core.srs import SrsSettings, SrsStore, save_srs_store
 from lexishift_core.srs.pair_policy import pair_policy_to_dict, resolve_srs_pair_policy
 from lexishift_core.srs.set_policy import resolve_set_sizing_policy
-from lexishift_core.srs.signal_queue import summarize_signal_events
+from lexishift_core.srs.signal_stats import summarize_signal_stats
 from lexishift_core.srs.source import SOURCE_INITIAL_SET
 
 
@@ -39,6 +39,7 @@ def initialize_srs_set(
     run_rulegen_for_pair_fn: Callable[..., tuple[SrsStore, RulegenOutput]],
     write_rulegen_outputs_fn: Callable[..., None],
     update_status_fn: Callable[..., None],
+    save_store_fn: Callable[..., None] = save_srs_store,
 ) -> dict[str, object]:
     raw_pair = str(config.pair or "").strip()
     if not raw_pair:
@@ -91,7 +92,7 @@ def initialize_srs_set(
         max_active_items_hint=config.max_active_items_hint,
     )
     stopwords_path = resolve_stopwords_path_fn(paths, pair=pair)
-    signal_summary = summarize_signal_events(
+    signal_summary = summarize_signal_stats(
         paths.srs_signal_queue_path_for(profile_id),
         pair=pair,
     )
@@ -149,8 +150,8 @@ def initialize_srs_set(
             require_jmdict=capability.requires_jmdict_for_seed,
         ),
     )
-    save_srs_store(updated_store, paths.srs_store_path_for(profile_id))
-
+    # Rules are generated before anything is saved so a job cancelled
+    # mid-rulegen leaves the previous store and outputs in place.
     _updated_store, rulegen_output = run_rulegen_for_pair_fn(
         paths=paths,
         pair=pair,
@@ -163,6 +164,7 @@ def initialize_srs_set(
         initialize_if_empty=False,
         persist_store=False,
     )
+    save_store_fn(updated_store, paths.srs_store_path_for(profile_id))
     write_rulegen_outputs_fn(
         paths=paths,
         pair=pair,
@@ -6,7 +6,7 @@ from typing import Callable
 from lexishift_core.helper.lp_capabilities import resolve_pair_capability
 from lexishift_core.helper.paths import HelperPaths
 from lexishift_core.helper.rulegen import RulegenConfig, RulegenOutput
-from lexishift_core.srs import SrsSettings, SrsStore
+from lexishift_core.srs import SrsSettings, SrsStore, save_srs_store
 from lexishift_core.srs.admission_refresh import (
     AdmissionRefreshPolicy,
     admission_refresh_result_to_dict,
@@ -14,7 +14,7 @@ from lexishift_core.srs.admission_refresh import (
 )
 from lexishift_core.srs.pair_policy import pair_policy_to_dict, resolve_srs_pair_policy
 from lexishift_core.srs.seed import SeedSelectionConfig, SeedWord, seed_to_selector_candidates
-from lexishift_core.srs.signal_queue import load_signal_events
+from lexishift_core.srs.signal_stats import load_feedback_window_stats
 
 
 def refresh_srs_set(
@@ -34,6 +34,7 @@ def refresh_srs_set(
     run_rulegen_for_pair_fn: Callable[..., tuple[SrsStore, RulegenOutput]],
     write_rulegen_outputs_fn: Callable[..., None],
     update_status_fn: Callable[..., None],
+    save_store_fn: Callable[..., None] = save_srs_store,
 ) -> dict[str, object]:
     raw_pair = str(config.pair or "").strip()
     if not raw_pair:
@@ -88,7 +89,11 @@ def refresh_srs_set(
         ),
     )
     selector_candidates = seed_to_selector_candidates(selection)
-    signal_events = load_signal_events(paths.srs_signal_queue_path_for(profile_id))
+    feedback_window = load_feedback_window_stats(
+        paths.srs_signal_queue_path_for(profile_id),
+        pair=pair,
+        window_size=effective_feedback_window_size,
+    )
     refresh_policy = AdmissionRefreshPolicy(
         feedback_window_size=effective_feedback_window_size,
         max_active_items_override=config.max_active_items,
@@ -99,18 +104,14 @@ def refresh_srs_set(
         settings=settings,
         pair=pair,
         candidates=selector_candidates,
-        events=signal_events,
         policy=refresh_policy,
+        feedback_window=feedback_window,
     )
-    if config.persist_store:
-        from lexishift_core.srs import save_srs_store
-
-        save_srs_store(updated_store, paths.srs_store_path_for(profile_id))
-
     after_pair_count = count_items_for_pair_fn(updated_store, pair)
     added_items = max(0, after_pair_count - before_pair_count)
-    published_rulegen = None
+    rulegen_output = None
     if refresh_result.applied:
+        # Generate before saving so a cancelled job leaves the store untouched.
         _updated_store, rulegen_output = run_rulegen_for_pair_fn(
             paths=paths,
             pair=pair,
@@ -122,7 +123,13 @@ def refresh_srs_set(
             rulegen_config=RulegenConfig(language_pair=pair),
             initialize_if_empty=False,
             persist_store=False,
+            rule_cache_path=paths.rulegen_cache_path(pair, profile_id=profile_id),
+            full_rebuild=config.full_rebuild,
         )
+    if config.persist_store:
+        save_store_fn(updated_store, paths.srs_store_path_for(profile_id))
+    published_rulegen = None
+    if rulegen_output is not None:
         write_rulegen_outputs_fn(
             paths=paths,
             pair=pair,
@@ -142,6 +149,7 @@ def refresh_srs_set(
             "published": True,
             "targets": rulegen_output.target_count,
             "rules": len(rulegen_output.rules),
+            "regenerated_targets": rulegen_output.regenerated_count,
             "snapshot_path": str(paths.snapshot_path(pair, profile_id=profile_id)),
             "ruleset_path": str(paths.ruleset_path(pair, profile_id=profile_id)),
         }
@@ -50,6 +50,8 @@ def reset_srs_data(
             removed_snapshots += 1
         if _remove_file(paths.ruleset_path(scoped_pair, profile_id=normalized_profile_id)):
             removed_rulesets += 1
+        _remove_file(paths.compiled_ruleset_path(scoped_pair, profile_id=normalized_profile_id))
+        _remove_file(paths.rulegen_cache_path(scoped_pair, profile_id=normalized_profile_id))
     else:
         for snapshot in profile_srs_dir.glob("srs_rulegen_snapshot_*.json"):
             if _remove_file(snapshot):
@@ -57,6 +59,10 @@ def reset_srs_data(
         for ruleset in profile_srs_dir.glob("srs_ruleset_*.json"):
             if _remove_file(ruleset):
                 removed_rulesets += 1
+        for artifact in profile_srs_dir.glob("srs_ruleset_*.json.compiled"):
+            _remove_file(artifact)
+        for cache in profile_srs_dir.glob("srs_rulegen_cache_*.json"):
+            _remove_file(cache)
 
     status = load_status(profile_status_path)
     save_status(
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ProcessPoolExecutor
+import multiprocessing
+import os
+import threading
+import time
+from typing import Any, Callable, Optional, Sequence
+
+from lexishift_core.helper.paths import HelperPaths
+from lexishift_core.rulegen.resources import RulegenResourceCache
+
+_WORKER_RESOURCES: Optional[RulegenResourceCache] = None
+_WORKER_LOCK: Any = None
+
+
+def run_rulegen_batch(
+    paths: HelperPaths,
+    *,
+    configs: Sequence[Any],
+    workers: Optional[int] = None,
+    mp_context: Optional[Any] = None,
+    resolve_job_key_fn: Callable[..., tuple[str, str]],
+    prepare_profile_fn: Callable[..., None],
+    run_job_fn: Callable[..., dict],
+) -> dict[str, object]:
+    """Run independent (profile, pair) rulegen jobs over a process pool.
+
+    Each worker keeps one ``RulegenResourceCache`` for its lifetime, so a
+    dictionary is opened at most once per worker however many profiles use
+    it. Missing profile stores are created up front, before any worker can
+    race on them; ``run_job_fn`` receives a lock shared by all workers for
+    the remaining per-profile writes. One failing job does not stop the
+    others.
+    """
+    started = time.perf_counter()
+    entries: list[dict[str, object]] = []
+    runnable: list[tuple[int, Any]] = []
+    seen: set[tuple[str, str]] = set()
+    for index, config in enumerate(configs):
+        try:
+            profile_id, pair = resolve_job_key_fn(paths, config=config)
+        except Exception as exc:  # noqa: BLE001 - reported per job
+            entries.append(_failed_entry(config.profile_id, config.pair, exc))
+            continue
+        entries.append({"profile_id": profile_id, "pair": pair})
+        if (profile_id, pair) in seen:
+            entries[index] = _failed_entry(
+                profile_id,
+                pair,
+                ValueError(f"Duplicate rulegen job for profile '{profile_id}' and pair '{pair}'."),
+            )
+            continue
+        seen.add((profile_id, pair))
+        runnable.append((index, config))
+
+    prepared: set[str] = set()
+    for index, config in runnable:
+        profile_id = str(entries[index]["profile_id"])
+        if profile_id not in prepared:
+            prepare_profile_fn(paths, profile_id=profile_id, persist_missing=config.persist_store)
+            prepared.add(profile_id)
+
+    # Neighbouring jobs share a pair, so a worker tends to reuse what it has open.
+    runnable.sort(key=lambda job: (str(entries[job[0]]["pair"]), job[0]))
+    worker_count = max(1, min(workers or os.cpu_count() or 1, len(runnable) or 1))
+    if worker_count == 1:
+        resources = RulegenResourceCache()
+        lock = threading.Lock()
+        try:
+            for index, config in runnable:
+                entries[index].update(_timed_job(run_job_fn, paths, config, resources, lock))
+        finally:
+            resources.close()
+    else:
+        context = mp_context or multiprocessing.get_context()
+        with ProcessPoolExecutor(
+            max_workers=worker_count,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(context.Lock(),),
+        ) as executor:
+            futures: list[tuple[int, Future]] = [
+                (index, executor.submit(_run_worker_job, run_job_fn, paths, config))
+                for index, config in runnable
+            ]
+            for index, future in futures:
+                try:
+                    entries[index].update(future.result())
+                except Exception as exc:  # noqa: BLE001 - a crashed worker fails its job only
+                    entries[index].update(_failed_entry(None, None, exc, include_key=False))
+    failed = sum(1 for entry in entries if not entry.get("ok"))
+    return {
+        "jobs": entries,
+        "ok": len(entries) - failed,
+        "failed": failed,
+        "workers": worker_count,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000.0, 3),
+    }
+
+
+def _init_worker(lock: Any) -> None:
+    global _WORKER_LOCK, _WORKER_RESOURCES
+    _WORKER_LOCK = lock
+    _WORKER_RESOURCES = RulegenResourceCache()
+
+
+def _run_worker_job(run_job_fn: Callable[..., dict], paths: HelperPaths, config: Any) -> dict[str, object]:
+    if _WORKER_RESOURCES is None:
+        raise RuntimeError("Rulegen batch worker was not initialized.")
+    return _timed_job(run_job_fn, paths, config, _WORKER_RESOURCES, _WORKER_LOCK)
+
+
+def _timed_job(
+    run_job_fn: Callable[..., dict],
+    paths: HelperPaths,
+    config: Any,
+    resources: RulegenResourceCache,
+    lock: Any,
+) -> dict[str, object]:
+    started = time.perf_counter()
+    misses = resources.misses
+    try:
+        result = run_job_fn(paths, config=config, resources=resources, lock=lock)
+    except Exception as exc:  # noqa: BLE001 - reported per job
+        entry = _failed_entry(None, None, exc, include_key=False)
+    else:
+        entry = {"ok": True, "error": None, "result": result}
+    entry["elapsed_ms"] = round((time.perf_counter() - started) * 1000.0, 3)
+    entry["worker_pid"] = os.getpid()
+    entry["dictionaries_opened"] = resources.misses - misses
+    return entry
+
+
+def _failed_entry(
+    profile_id: Optional[str],
+    pair: Optional[str],
+    exc: BaseException,
+    *,
+    include_key: bool = True,
+) -> dict[str, object]:
+    entry: dict[str, object] = {"ok": False, "error": f"{exc.__class__.__name__}: {exc}", "result": None}
+    if include_key:
+        entry = {"profile_id": profile_id, "pair": pair, **entry}
+    return entry
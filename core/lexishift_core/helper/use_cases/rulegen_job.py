@@ -132,6 +132,13 @@ def run_rulegen_job(
         targets_override=targets_override,
         initialize_if_empty=config.initialize_if_empty,
         persist_store=config.persist_store,
+        # Sampled or preview runs must not touch the per-target rule cache.
+        rule_cache_path=(
+            paths.rulegen_cache_path(pair, profile_id=profile_id)
+            if config.persist_outputs and targets_override is None
+            else None
+        ),
+        full_rebuild=config.full_rebuild,
     )
     if config.persist_outputs:
         write_rulegen_outputs_fn(
@@ -155,6 +162,7 @@ def run_rulegen_job(
         "profile_id": profile_id,
         "targets": output.target_count,
         "rules": len(output.rules),
+        "regenerated_targets": output.regenerated_count,
         "snapshot": output.snapshot,
         "snapshot_path": (
             str(paths.snapshot_path(pair, profile_id=profile_id))
@@ -1,20 +1,28 @@
 from __future__ import annotations
 
 import json
+from pathlib import Path
+from typing import Any, Callable
 
 from lexishift_core.helper.lp_capabilities import pair_requirements, resolve_pair_capability
 from lexishift_core.helper.pair_resources import resolve_pair_resources, resolve_stopwords_path
 from lexishift_core.helper.paths import HelperPaths
 from lexishift_core.helper.status import load_status
-from lexishift_core.srs import load_srs_store
+from lexishift_core.srs import SrsStore, load_srs_store
 from lexishift_core.srs.pair_policy import pair_policy_to_dict, resolve_srs_pair_policy
 
 
+def _read_json(path: Path) -> Any:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
 def get_srs_runtime_diagnostics(
     paths: HelperPaths,
     *,
     pair: str,
     profile_id: str = "default",
+    load_store_fn: Callable[..., SrsStore] = load_srs_store,
+    load_json_fn: Callable[[Path], Any] = _read_json,
 ) -> dict:
     capability = resolve_pair_capability(pair)
     normalized_pair = capability.pair
@@ -89,7 +97,7 @@ def get_srs_runtime_diagnostics(
     }
     if diagnostics["store_exists"]:
         try:
-            store = load_srs_store(store_path)
+            store = load_store_fn(store_path)
             diagnostics["store_items_total"] = len(store.items)
             diagnostics["store_items_with_word_package_total"] = len(
                 [item for item in store.items if item.word_package]
@@ -103,7 +111,7 @@ def get_srs_runtime_diagnostics(
             diagnostics["store_error"] = str(exc)
     if diagnostics["ruleset_exists"]:
         try:
-            ruleset_payload = json.loads(ruleset_path.read_text(encoding="utf-8"))
+            ruleset_payload = load_json_fn(ruleset_path)
             rules = ruleset_payload.get("rules", [])
             if isinstance(rules, list):
                 diagnostics["ruleset_rules_count"] = len(rules)
@@ -131,7 +139,7 @@ def get_srs_runtime_diagnostics(
             diagnostics["ruleset_error"] = str(exc)
     if diagnostics["snapshot_exists"]:
         try:
-            snapshot_payload = json.loads(snapshot_path.read_text(encoding="utf-8"))
+            snapshot_payload = load_json_fn(snapshot_path)
             stats = snapshot_payload.get("stats", {})
             target_count = stats.get("target_count")
             if target_count is None and isinstance(snapshot_payload.get("targets"), list):
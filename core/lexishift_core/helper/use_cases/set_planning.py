@@ -9,11 +9,11 @@ from lexishift_core.srs import SrsStore
 from lexishift_core.srs.pair_policy import pair_policy_to_dict, resolve_srs_pair_policy
 from lexishift_core.srs.set_planner import SrsSetPlanRequest, build_srs_set_plan, plan_to_dict
 from lexishift_core.srs.set_policy import resolve_set_sizing_policy
-from lexishift_core.srs.signal_queue import summarize_signal_events
+from lexishift_core.srs.signal_stats import summarize_signal_stats
 
 
 def count_items_for_pair(store: SrsStore, pair: str) -> int:
-    return len([item for item in store.items if item.language_pair == pair])
+    return store.count_for_pair(pair)
 
 
 def build_set_plan_payload(
@@ -110,7 +110,7 @@ def plan_srs_set(
         max_active_items_hint=config.max_active_items_hint,
     )
     stopwords_path = resolve_stopwords_path_fn(paths, pair=pair)
-    signal_summary = summarize_signal_events(
+    signal_summary = summarize_signal_stats(
         paths.srs_signal_queue_path_for(profile_id),
         pair=pair,
     )
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
-from typing import Callable
+from datetime import datetime
+from typing import Any, Callable, Mapping, Optional, Sequence
 
 from lexishift_core.helper.paths import HelperPaths
 from lexishift_core.srs import SrsStore, save_srs_store
+from lexishift_core.srs.sqlite_store import SqliteSrsStore
 from lexishift_core.srs.signal_queue import (
     SIGNAL_EXPOSURE,
     SIGNAL_FEEDBACK,
     SrsSignalEvent,
-    append_signal_event,
 )
+from lexishift_core.srs.signal_stats import record_signal_events
 from lexishift_core.srs.source import SOURCE_EXTENSION
-from lexishift_core.srs.store_ops import record_exposure, record_feedback
+from lexishift_core.srs.store import is_sqlite_store_path
+from lexishift_core.srs.store_index import IndexedSrsStore
+from lexishift_core.srs.store_ops import build_item_id, find_item, record_exposure, record_feedback
+from lexishift_core.srs.time import now_utc, parse_ts
 
 
 def apply_feedback(
@@ -24,30 +29,39 @@ def apply_feedback(
     source_type: str = SOURCE_EXTENSION,
     resolve_profile_id_fn: Callable[..., str],
     ensure_store_fn: Callable[..., SrsStore],
+    save_store_fn: Callable[..., None] = save_srs_store,
 ) -> None:
     normalized_profile_id = resolve_profile_id_fn(paths, profile_id=profile_id)
-    store = ensure_store_fn(paths, profile_id=normalized_profile_id)
     normalized_pair = str(pair or "").strip()
     normalized_lemma = str(lemma or "").strip()
     normalized_source_type = str(source_type or SOURCE_EXTENSION).strip() or SOURCE_EXTENSION
-    store = record_feedback(
-        store,
-        language_pair=normalized_pair,
+    _record_signal(
+        paths,
+        profile_id=normalized_profile_id,
+        pair=normalized_pair,
         lemma=normalized_lemma,
-        rating=rating,
-        create_if_missing=True,
-        source_type=normalized_source_type,
+        ensure_store_fn=ensure_store_fn,
+        save_store_fn=save_store_fn,
+        record_fn=lambda store: record_feedback(
+            store,
+            language_pair=normalized_pair,
+            lemma=normalized_lemma,
+            rating=rating,
+            create_if_missing=True,
+            source_type=normalized_source_type,
+        ),
     )
-    save_srs_store(store, paths.srs_store_path_for(normalized_profile_id))
     if normalized_pair and normalized_lemma:
-        append_signal_event(
+        record_signal_events(
             paths.srs_signal_queue_path_for(normalized_profile_id),
-            SrsSignalEvent(
-                event_type=SIGNAL_FEEDBACK,
-                pair=normalized_pair,
-                lemma=normalized_lemma,
-                source_type=normalized_source_type,
-                rating=rating,
+            (
+                SrsSignalEvent(
+                    event_type=SIGNAL_FEEDBACK,
+                    pair=normalized_pair,
+                    lemma=normalized_lemma,
+                    source_type=normalized_source_type,
+                    rating=rating,
+                ),
             ),
         )
 
@@ -61,27 +75,176 @@ def apply_exposure(
     source_type: str = SOURCE_EXTENSION,
     resolve_profile_id_fn: Callable[..., str],
     ensure_store_fn: Callable[..., SrsStore],
+    save_store_fn: Callable[..., None] = save_srs_store,
 ) -> None:
     normalized_profile_id = resolve_profile_id_fn(paths, profile_id=profile_id)
-    store = ensure_store_fn(paths, profile_id=normalized_profile_id)
     normalized_pair = str(pair or "").strip()
     normalized_lemma = str(lemma or "").strip()
     normalized_source_type = str(source_type or SOURCE_EXTENSION).strip() or SOURCE_EXTENSION
-    store = record_exposure(
-        store,
-        language_pair=normalized_pair,
+    _record_signal(
+        paths,
+        profile_id=normalized_profile_id,
+        pair=normalized_pair,
         lemma=normalized_lemma,
-        create_if_missing=True,
-        source_type=normalized_source_type,
+        ensure_store_fn=ensure_store_fn,
+        save_store_fn=save_store_fn,
+        record_fn=lambda store: record_exposure(
+            store,
+            language_pair=normalized_pair,
+            lemma=normalized_lemma,
+            create_if_missing=True,
+            source_type=normalized_source_type,
+        ),
     )
-    save_srs_store(store, paths.srs_store_path_for(normalized_profile_id))
     if normalized_pair and normalized_lemma:
-        append_signal_event(
+        record_signal_events(
             paths.srs_signal_queue_path_for(normalized_profile_id),
-            SrsSignalEvent(
-                event_type=SIGNAL_EXPOSURE,
-                pair=normalized_pair,
-                lemma=normalized_lemma,
-                source_type=normalized_source_type,
+            (
+                SrsSignalEvent(
+                    event_type=SIGNAL_EXPOSURE,
+                    pair=normalized_pair,
+                    lemma=normalized_lemma,
+                    source_type=normalized_source_type,
+                ),
             ),
         )
+
+
+def _record_signal(
+    paths: HelperPaths,
+    *,
+    profile_id: str,
+    pair: str,
+    lemma: str,
+    ensure_store_fn: Callable[..., SrsStore],
+    save_store_fn: Callable[..., None],
+    record_fn: Callable[[SrsStore], SrsStore],
+) -> None:
+    store_path = paths.srs_store_path_for(profile_id)
+    if not is_sqlite_store_path(store_path):
+        store = record_fn(ensure_store_fn(paths, profile_id=profile_id))
+        save_store_fn(store, store_path)
+        return
+    # SQLite stores only read and write the one affected item.
+    with SqliteSrsStore(store_path) as db:
+        existing = db.get_item(build_item_id(pair, lemma))
+        store = record_fn(SrsStore(items=(existing,) if existing else ()))
+        updated = find_item(store, language_pair=pair, lemma=lemma)
+        if updated is not None:
+            db.upsert_item(updated)
+
+
+def apply_signals_batch(
+    paths: HelperPaths,
+    *,
+    events: Sequence[Mapping[str, Any]],
+    profile_id: str = "default",
+    resolve_profile_id_fn: Callable[..., str],
+    ensure_store_fn: Callable[..., SrsStore],
+    save_store_fn: Callable[..., None] = save_srs_store,
+) -> dict[str, Any]:
+    """Apply many feedback/exposure events with one store load, one save and
+    one signal-queue write.
+
+    Events run in order, updating an ``IndexedSrsStore`` built for the batch
+    in place, so each event costs a lookup and an index update rather than a
+    store copy, and the saved store matches applying them one at a time. Each
+    event may carry an ISO ``ts`` used as the signal time. Invalid events are
+    reported in ``results`` and skipped; they never abort the batch.
+    """
+    normalized_profile_id = resolve_profile_id_fn(paths, profile_id=profile_id)
+    parsed = [_parse_batch_event(raw) for raw in events]
+    results: list[dict[str, Any]] = []
+    accepted: list[SrsSignalEvent] = []
+    touched: dict[str, str] = {}
+
+    def apply_all(store: IndexedSrsStore) -> IndexedSrsStore:
+        for index, (event, now, error) in enumerate(parsed):
+            if event is not None:
+                try:
+                    store = _apply_batch_event(store, event, now)
+                except ValueError as exc:
+                    error = str(exc)
+            if error is not None:
+                results.append({"index": index, "ok": False, "error": error})
+                continue
+            item_id = build_item_id(event.pair, event.lemma)
+            touched[item_id] = event.pair
+            accepted.append(event)
+            results.append({"index": index, "ok": True, "event_type": event.event_type, "item_id": item_id})
+        return store
+
+    store_path = paths.srs_store_path_for(normalized_profile_id)
+    if not is_sqlite_store_path(store_path):
+        loaded = ensure_store_fn(paths, profile_id=normalized_profile_id)
+        # A fresh index the batch owns, so events update it in place; the
+        # loaded store may be shared through the state cache.
+        store = apply_all(IndexedSrsStore(loaded.items, version=loaded.version))
+        if accepted:
+            save_store_fn(store.to_store(), store_path)
+    else:
+        # Only the rows named by the batch are read and written back.
+        with SqliteSrsStore(store_path) as db:
+            item_ids = {
+                build_item_id(event.pair, event.lemma) for event, _now, _error in parsed if event is not None
+            }
+            existing = [db.get_item(item_id) for item_id in sorted(item_ids)]
+            store = apply_all(IndexedSrsStore(item for item in existing if item is not None))
+            db.upsert_items(store.get(item_id) for item_id in touched)
+    record_signal_events(paths.srs_signal_queue_path_for(normalized_profile_id), accepted)
+    return {
+        "profile_id": normalized_profile_id,
+        "applied": len(accepted),
+        "rejected": len(results) - len(accepted),
+        "results": results,
+    }
+
+
+def _parse_batch_event(
+    raw: object,
+) -> tuple[Optional[SrsSignalEvent], Optional[datetime], Optional[str]]:
+    if not isinstance(raw, Mapping):
+        return None, None, "Event must be an object."
+    event_type = str(raw.get("event_type") or raw.get("type") or "").strip().lower()
+    if event_type not in (SIGNAL_FEEDBACK, SIGNAL_EXPOSURE):
+        return None, None, f"Unknown event type: {event_type or '(missing)'}"
+    pair = str(raw.get("pair") or "").strip()
+    lemma = str(raw.get("lemma") or "").strip()
+    if not pair or not lemma:
+        return None, None, "Event requires pair and lemma."
+    rating = str(raw.get("rating") or "").strip() or None
+    if event_type == SIGNAL_FEEDBACK and rating is None:
+        return None, None, "Feedback event requires rating."
+    now = parse_ts(str(raw.get("ts") or "").strip() or None) or now_utc()
+    event = SrsSignalEvent(
+        event_type=event_type,
+        pair=pair,
+        lemma=lemma,
+        source_type=str(raw.get("source_type") or SOURCE_EXTENSION).strip() or SOURCE_EXTENSION,
+        rating=rating,
+        ts=now.isoformat(),
+    )
+    return event, now, None
+
+
+def _apply_batch_event(store: IndexedSrsStore, event: SrsSignalEvent, now: datetime) -> IndexedSrsStore:
+    if event.event_type == SIGNAL_FEEDBACK:
+        return record_feedback(
+            store,
+            language_pair=event.pair,
+            lemma=event.lemma,
+            rating=str(event.rating),
+            now=now,
+            create_if_missing=True,
+            source_type=event.source_type,
+            in_place=True,
+        )
+    return record_exposure(
+        store,
+        language_pair=event.pair,
+        lemma=event.lemma,
+        now=now,
+        create_if_missing=True,
+        source_type=event.source_type,
+        in_place=True,
+    )
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from array import array
+import hashlib
+import json
+import os
+from pathlib import Path
+import struct
+import sys
+from typing import Optional, Sequence
+
+from lexishift_core.persistence.storage import (
+    build_vocab_pool_from_dataset,
+    dataset_from_dict,
+    metadata_from_dict,
+    metadata_to_dict,
+)
+from lexishift_core.replacement.compiled import CompiledPhraseTrie
+from lexishift_core.replacement.core import (
+    TRIE_BACKEND_COMPACT,
+    Normalizer,
+    RuleMetadata,
+    Tokenizer,
+    VocabPool,
+    VocabRule,
+)
+
+COMPILED_RULESET_MAGIC = b"LXCR"
+# Bump whenever the layout, rule expansion or tokenization changes meaning.
+COMPILED_RULESET_VERSION = 2
+COMPILED_RULESET_SUFFIX = ".compiled"
+
+_PREAMBLE = struct.Struct("<4sI64sII")
+_ARRAY_FIELDS = ("child_offsets", "child_tokens", "child_nodes", "rule_indices")
+# Every section is an int32 column. Strings live once in a UTF-8 blob and
+# the columns hold their indices, -1 standing for None.
+_SECTIONS = (
+    "string_offsets",
+    "tokens",
+    "rule_source",
+    "rule_replacement",
+    "rule_priority",
+    "rule_case_policy",
+    "rule_enabled",
+    "rule_tag_offsets",
+    "rule_tags",
+    "rule_metadata",
+    "rule_created_at",
+    "trie_rules",
+) + _ARRAY_FIELDS
+_COUNTS = struct.Struct("<" + "I" * len(_SECTIONS))
+
+
+def compiled_ruleset_path(dataset_path: str | Path) -> Path:
+    path = Path(dataset_path)
+    return path.with_name(path.name + COMPILED_RULESET_SUFFIX)
+
+
+def ruleset_content_key(payload: bytes) -> str:
+    """Hash of the raw dataset JSON (rules and inflection settings) plus the
+    artifact format and the default tokenizer it was compiled with."""
+    digest = hashlib.sha256()
+    digest.update(COMPILED_RULESET_MAGIC)
+    digest.update(str(COMPILED_RULESET_VERSION).encode("ascii"))
+    digest.update(Tokenizer._token_re.pattern.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(payload)
+    return digest.hexdigest()
+
+
+def save_compiled_ruleset(pool: VocabPool, path: str | Path, *, key: str) -> None:
+    trie = pool.trie
+    if not isinstance(trie, CompiledPhraseTrie):
+        raise ValueError("Compiled rulesets require a pool with the compact trie backend.")
+    rules = pool.rules
+    positions = {id(rule): index for index, rule in enumerate(rules)}
+    strings = _StringTable()
+    sections = {name: array("i") for name in _SECTIONS}
+    sections["tokens"].extend(
+        strings.add(token) for token in sorted(trie.token_ids, key=trie.token_ids.__getitem__)
+    )
+    sections["rule_tag_offsets"].append(0)
+    for rule in rules:
+        sections["rule_source"].append(strings.add(rule.source_phrase))
+        sections["rule_replacement"].append(strings.add(rule.replacement))
+        sections["rule_priority"].append(rule.priority)
+        sections["rule_case_policy"].append(strings.add(rule.case_policy))
+        sections["rule_enabled"].append(1 if rule.enabled else 0)
+        sections["rule_tags"].extend(strings.add(tag) for tag in rule.tags)
+        sections["rule_tag_offsets"].append(len(sections["rule_tags"]))
+        # Rules expanded from one entry share their metadata, so it is
+        # interned once as a string rather than encoded per rule.
+        metadata = metadata_to_dict(rule.metadata)
+        sections["rule_metadata"].append(
+            strings.add(None if metadata is None else json.dumps(metadata, ensure_ascii=False, sort_keys=True))
+        )
+        sections["rule_created_at"].append(strings.add(rule.created_at))
+    # In-place edits can leave cleared rule slots behind; write only live ones.
+    trie_rules, rule_indices = trie.live_rules()
+    sections["trie_rules"].extend(positions[id(rule)] for rule in trie_rules)
+    for name in _ARRAY_FIELDS:
+        sections[name].extend(getattr(trie, name))
+    sections["rule_indices"] = array("i", rule_indices)
+    blob, offsets = strings.encode()
+    sections["string_offsets"] = offsets
+
+    chunks = [
+        _PREAMBLE.pack(COMPILED_RULESET_MAGIC, COMPILED_RULESET_VERSION, key.encode("ascii"), trie.max_depth, len(blob)),
+        _COUNTS.pack(*(len(sections[name]) for name in _SECTIONS)),
+        blob,
+    ]
+    for name in _SECTIONS:
+        chunks.append(_to_little_endian(sections[name]).tobytes())
+
+    target = Path(path)
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(b"".join(chunks))
+        os.replace(tmp_path, target)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def load_compiled_ruleset(path: str | Path, *, key: str) -> Optional[VocabPool]:
+    """Return the precompiled pool, or ``None`` if the artifact is missing,
+    stale (``key`` differs) or unreadable."""
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+    if len(data) < _PREAMBLE.size + _COUNTS.size:
+        return None
+    magic, version, stored_key, max_depth, blob_size = _PREAMBLE.unpack_from(data)
+    if magic != COMPILED_RULESET_MAGIC or version != COMPILED_RULESET_VERSION:
+        return None
+    if stored_key != key.encode("ascii"):
+        return None
+    try:
+        counts = _COUNTS.unpack_from(data, _PREAMBLE.size)
+        offset = _PREAMBLE.size + _COUNTS.size
+        blob = data[offset : offset + blob_size]
+        offset += blob_size
+        sections = {}
+        for name, count in zip(_SECTIONS, counts):
+            values = array("i")
+            values.frombytes(data[offset : offset + count * values.itemsize])
+            if len(values) != count:
+                return None
+            sections[name] = _to_little_endian(values)
+            offset += count * values.itemsize
+        strings = _decode_strings(blob, sections["string_offsets"])
+        rules = _decode_rules(sections, strings)
+        trie = CompiledPhraseTrie(
+            token_ids={strings[string_id]: index for index, string_id in enumerate(sections["tokens"])},
+            rules=[rules[index] for index in sections["trie_rules"]],
+            max_depth=max_depth,
+            **{name: sections[name] for name in _ARRAY_FIELDS},
+        )
+    except (ValueError, KeyError, IndexError, TypeError, UnicodeDecodeError):
+        return None
+    return VocabPool.from_compiled(rules, trie)
+
+
+def load_compiled_vocab_pool(
+    dataset_path: str | Path,
+    *,
+    artifact_path: Optional[str | Path] = None,
+    write_artifact: bool = True,
+) -> VocabPool:
+    """Load a dataset's expanded, compiled pool, reusing the binary artifact
+    next to it when its content key still matches."""
+    payload = Path(dataset_path).read_bytes()
+    key = ruleset_content_key(payload)
+    target = Path(artifact_path) if artifact_path else compiled_ruleset_path(dataset_path)
+    pool = load_compiled_ruleset(target, key=key)
+    if pool is not None:
+        return pool
+    dataset = dataset_from_dict(json.loads(payload.decode("utf-8")))
+    pool = build_vocab_pool_from_dataset(
+        dataset,
+        tokenizer=Tokenizer(),
+        normalizer=Normalizer(),
+        trie_backend=TRIE_BACKEND_COMPACT,
+    )
+    if write_artifact:
+        try:
+            save_compiled_ruleset(pool, target, key=key)
+        except OSError:
+            pass
+    return pool
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self._index: dict[str, int] = {}
+        self._values: list[str] = []
+
+    def add(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        index = self._index.get(value)
+        if index is None:
+            index = len(self._values)
+            self._index[value] = index
+            self._values.append(value)
+        return index
+
+    def encode(self) -> tuple[bytes, array]:
+        offsets = array("i", [0])
+        chunks = []
+        size = 0
+        for value in self._values:
+            encoded = value.encode("utf-8")
+            chunks.append(encoded)
+            size += len(encoded)
+            offsets.append(size)
+        return b"".join(chunks), offsets
+
+
+def _decode_strings(blob: bytes, offsets: Sequence[int]) -> list[str]:
+    return [blob[offsets[index] : offsets[index + 1]].decode("utf-8") for index in range(len(offsets) - 1)]
+
+
+def _decode_rules(sections: dict[str, array], strings: Sequence[str]) -> list[VocabRule]:
+    def text(index: int) -> Optional[str]:
+        return None if index < 0 else strings[index]
+
+    metadata_cache: dict[int, Optional[RuleMetadata]] = {-1: None}
+    tag_offsets = sections["rule_tag_offsets"]
+    tags = sections["rule_tags"]
+    rules = []
+    for index in range(len(sections["rule_source"])):
+        metadata_id = sections["rule_metadata"][index]
+        if metadata_id not in metadata_cache:
+            metadata_cache[metadata_id] = metadata_from_dict(json.loads(strings[metadata_id]))
+        rules.append(
+            VocabRule(
+                source_phrase=strings[sections["rule_source"][index]],
+                replacement=strings[sections["rule_replacement"][index]],
+                priority=sections["rule_priority"][index],
+                case_policy=strings[sections["rule_case_policy"][index]],
+                enabled=bool(sections["rule_enabled"][index]),
+                tags=tuple(strings[tag] for tag in tags[tag_offsets[index] : tag_offsets[index + 1]]),
+                metadata=metadata_cache[metadata_id],
+                created_at=text(sections["rule_created_at"][index]),
+            )
+        )
+    return rules
+
+
+def _to_little_endian(values: array) -> array:
+    if sys.byteorder == "little":
+        return values
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped
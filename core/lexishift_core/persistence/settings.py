@@ -40,6 +40,7 @@ class SynonymSourceSettings:
     use_embeddings: bool = False
     embedding_threshold: float = 0.0
     embedding_fallback: bool = True
+    embedding_nprobe: int = 0
     language_packs: Mapping[str, str] = field(default_factory=dict)
     frequency_packs: Mapping[str, str] = field(default_factory=dict)
     last_selected_pack_ids: Sequence[str] = field(default_factory=tuple)
@@ -170,6 +171,7 @@ def _synonym_sources_from_dict(data: Optional[Mapping[str, Any]]) -> Optional[Sy
         use_embeddings=bool(data.get("use_embeddings", False)),
         embedding_threshold=float(data.get("embedding_threshold", 0.0)),
         embedding_fallback=bool(data.get("embedding_fallback", True)),
+        embedding_nprobe=int(data.get("embedding_nprobe", 0) or 0),
         language_packs=dict(data.get("language_packs", {})),
         frequency_packs=dict(data.get("frequency_packs", {})),
         last_selected_pack_ids=tuple(data.get("last_selected_pack_ids", [])),
@@ -196,6 +198,7 @@ def _synonym_sources_to_dict(settings: Optional[SynonymSourceSettings]) -> Optio
         "use_embeddings": settings.use_embeddings,
         "embedding_threshold": settings.embedding_threshold,
         "embedding_fallback": settings.embedding_fallback,
+        "embedding_nprobe": settings.embedding_nprobe,
         "language_packs": dict(settings.language_packs or {}),
         "frequency_packs": dict(settings.frequency_packs or {}),
         "last_selected_pack_ids": list(settings.last_selected_pack_ids or []),
@@ -6,7 +6,13 @@ from pathlib import Path
 from typing import Any, Mapping, Optional, Sequence
 
 from lexishift_core.lexicon.word_package import normalize_word_package
-from lexishift_core.replacement.core import MeaningRule, RuleMetadata, VocabPool, VocabRule
+from lexishift_core.replacement.core import (
+    TRIE_BACKEND_DICT,
+    MeaningRule,
+    RuleMetadata,
+    VocabPool,
+    VocabRule,
+)
 from lexishift_core.replacement.inflect import InflectionOverrides, InflectionSpec
 
 
@@ -68,7 +74,7 @@ def save_vocab_pool(pool: VocabPool, path: str | Path) -> None:
 
 def dataset_from_dict(data: Mapping[str, Any]) -> VocabDataset:
     version = int(data.get("version", 1))
-    rules = [_rule_from_dict(item) for item in data.get("rules", [])]
+    rules = [rule_from_dict(item) for item in data.get("rules", [])]
     meaning_rules = [_meaning_rule_from_dict(item) for item in data.get("meaning_rules", [])]
     synonyms = dict(data.get("synonyms", {}))
     settings = _settings_from_dict(data.get("settings"))
@@ -84,7 +90,7 @@ def dataset_from_dict(data: Mapping[str, Any]) -> VocabDataset:
 def dataset_to_dict(dataset: VocabDataset) -> dict[str, Any]:
     data = {
         "version": dataset.version,
-        "rules": [_rule_to_dict(rule) for rule in dataset.rules],
+        "rules": [rule_to_dict(rule) for rule in dataset.rules],
         "meaning_rules": [_meaning_rule_to_dict(rule) for rule in dataset.meaning_rules],
         "synonyms": dict(dataset.synonyms),
     }
@@ -94,7 +100,7 @@ def dataset_to_dict(dataset: VocabDataset) -> dict[str, Any]:
     return data
 
 
-def _metadata_from_dict(data: Optional[Mapping[str, Any]]) -> Optional[RuleMetadata]:
+def metadata_from_dict(data: Optional[Mapping[str, Any]]) -> Optional[RuleMetadata]:
     if not data:
         return None
     examples = tuple(str(item) for item in data.get("examples", []))
@@ -142,7 +148,7 @@ def _metadata_from_dict(data: Optional[Mapping[str, Any]]) -> Optional[RuleMetad
     )
 
 
-def _metadata_to_dict(metadata: Optional[RuleMetadata]) -> Optional[dict[str, Any]]:
+def metadata_to_dict(metadata: Optional[RuleMetadata]) -> Optional[dict[str, Any]]:
     if metadata is None:
         return None
     word_package = normalize_word_package(metadata.word_package)
@@ -179,7 +185,7 @@ def _metadata_to_dict(metadata: Optional[RuleMetadata]) -> Optional[dict[str, An
     return trimmed or None
 
 
-def _rule_from_dict(data: Mapping[str, Any]) -> VocabRule:
+def rule_from_dict(data: Mapping[str, Any]) -> VocabRule:
     created_at = data.get("created_at")
     return VocabRule(
         source_phrase=str(data.get("source_phrase", "")),
@@ -188,12 +194,12 @@ def _rule_from_dict(data: Mapping[str, Any]) -> VocabRule:
         case_policy=str(data.get("case_policy", "match")),
         enabled=bool(data.get("enabled", True)),
         tags=tuple(data.get("tags", [])),
-        metadata=_metadata_from_dict(data.get("metadata")),
+        metadata=metadata_from_dict(data.get("metadata")),
         created_at=str(created_at) if created_at else None,
     )
 
 
-def _rule_to_dict(rule: VocabRule) -> dict[str, Any]:
+def rule_to_dict(rule: VocabRule) -> dict[str, Any]:
     data: dict[str, Any] = {
         "source_phrase": rule.source_phrase,
         "replacement": rule.replacement,
@@ -204,7 +210,7 @@ def _rule_to_dict(rule: VocabRule) -> dict[str, Any]:
     }
     if rule.created_at:
         data["created_at"] = rule.created_at
-    metadata = _metadata_to_dict(rule.metadata)
+    metadata = metadata_to_dict(rule.metadata)
     if metadata:
         data["metadata"] = metadata
     return data
@@ -219,7 +225,7 @@ def _meaning_rule_from_dict(data: Mapping[str, Any]) -> MeaningRule:
         case_policy=str(data.get("case_policy", "match")),
         enabled=bool(data.get("enabled", True)),
         tags=tuple(data.get("tags", [])),
-        metadata=_metadata_from_dict(data.get("metadata")),
+        metadata=metadata_from_dict(data.get("metadata")),
     )
 
 
@@ -232,7 +238,7 @@ def _meaning_rule_to_dict(rule: MeaningRule) -> dict[str, Any]:
         "enabled": rule.enabled,
         "tags": list(rule.tags),
     }
-    metadata = _metadata_to_dict(rule.metadata)
+    metadata = metadata_to_dict(rule.metadata)
     if metadata:
         data["metadata"] = metadata
     return data
@@ -389,6 +395,7 @@ def build_vocab_pool_from_dataset(
     tokenizer=None,
     normalizer=None,
     practice_gate=None,
+    trie_backend: str = TRIE_BACKEND_DICT,
 ) -> VocabPool:
     from lexishift_core.replacement.builder import build_vocab_pool
 
@@ -396,4 +403,10 @@ def build_vocab_pool_from_dataset(
     if practice_gate is not None:
         rules = practice_gate.filter_rules(rules)
     options = build_options_from_settings(dataset.settings)
-    return build_vocab_pool(rules, options=options, tokenizer=tokenizer, normalizer=normalizer)
+    return build_vocab_pool(
+        rules,
+        options=options,
+        tokenizer=tokenizer,
+        normalizer=normalizer,
+        trie_backend=trie_backend,
+    )
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from lexishift_core.replacement.core import VocabRule
+
+ROOT_STATE = 0
+NO_STATE = -1
+
+
+class PhraseAutomaton:
+    """Aho-Corasick automaton over normalized word tokens.
+
+    ``scan`` reads the word stream once and reports, for every start index,
+    the match ``Replacer`` would pick there: highest priority first, then the
+    longest phrase. Failure links never cross a gap that is not plain space.
+    """
+
+    __slots__ = ("goto", "fail", "output", "depth", "rules")
+
+    def __init__(
+        self,
+        *,
+        goto: List[dict[str, int]],
+        fail: List[int],
+        output: List[int],
+        depth: List[int],
+        rules: List[Optional["VocabRule"]],
+    ) -> None:
+        self.goto = goto
+        self.fail = fail
+        self.output = output
+        self.depth = depth
+        self.rules = rules
+
+    @classmethod
+    def build(cls, entries: Iterable[tuple[Sequence[str], "VocabRule"]]) -> "PhraseAutomaton":
+        goto: List[dict[str, int]] = [{}]
+        depth: List[int] = [0]
+        rules: List[Optional["VocabRule"]] = [None]
+        for tokens, rule in entries:
+            if not tokens:
+                continue
+            state = ROOT_STATE
+            for token in tokens:
+                next_state = goto[state].get(token)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][token] = next_state
+                    goto.append({})
+                    depth.append(depth[state] + 1)
+                    rules.append(None)
+                state = next_state
+            current = rules[state]
+            if current is None or rule.priority > current.priority:
+                rules[state] = rule
+
+        fail = [ROOT_STATE] * len(goto)
+        # ``output`` links each state to the nearest proper suffix state that
+        # carries a rule, so a scan only visits states that can report matches.
+        output = [NO_STATE] * len(goto)
+        queue = list(goto[ROOT_STATE].values())
+        cursor = 0
+        while cursor < len(queue):
+            state = queue[cursor]
+            cursor += 1
+            for token, child in goto[state].items():
+                fallback = fail[state]
+                while fallback != ROOT_STATE and token not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(token, ROOT_STATE)
+                fail[child] = target
+                output[child] = target if rules[target] is not None else output[target]
+                queue.append(child)
+        return cls(goto=goto, fail=fail, output=output, depth=depth, rules=rules)
+
+    @property
+    def state_count(self) -> int:
+        return len(self.goto)
+
+    def scan(
+        self,
+        tokens: Sequence[str],
+        gap_ok: Sequence[bool],
+    ) -> List[Optional[tuple[int, "VocabRule"]]]:
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+        depth = self.depth
+        rules = self.rules
+        best: List[Optional[tuple[int, "VocabRule"]]] = [None] * len(tokens)
+        state = ROOT_STATE
+        for idx, token in enumerate(tokens):
+            if idx and not gap_ok[idx - 1]:
+                state = ROOT_STATE
+            while True:
+                next_state = goto[state].get(token)
+                if next_state is not None:
+                    state = next_state
+                    break
+                if state == ROOT_STATE:
+                    break
+                state = fail[state]
+
+            hit = state if rules[state] is not None else output[state]
+            while hit > ROOT_STATE:
+                rule = rules[hit]
+                if rule is not None:
+                    start = idx - depth[hit] + 1
+                    current = best[start]
+                    # Ends arrive in increasing order, so ties go to the longer
+                    # phrase. The -1 floor mirrors Replacer's trie walk.
+                    if current is None:
+                        if rule.priority >= -1:
+                            best[start] = (idx, rule)
+                    elif rule.priority >= current[1].priority:
+                        best[start] = (idx, rule)
+                hit = output[hit]
+        return best
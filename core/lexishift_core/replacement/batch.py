@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+from typing import Any, Iterable, List, Optional
+
+from lexishift_core.replacement.core import MATCHER_AHO_CORASICK, ReplacementResult, Replacer
+
+DEFAULT_BATCH_CHUNK_SIZE = 256
+
+_WORKER_REPLACER: Optional[Replacer] = None
+
+
+class ParallelReplacer:
+    """Spreads ``Replacer.replace_many`` batches over a process pool.
+
+    The replacer (with its trie already compiled) is handed to each worker
+    once through the pool initializer; under ``fork`` it is inherited rather
+    than pickled. Results come back in input order.
+    """
+
+    def __init__(
+        self,
+        replacer: Replacer,
+        *,
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+        mp_context: Optional[Any] = None,
+    ) -> None:
+        self._replacer = replacer
+        self._workers = max(1, workers or os.cpu_count() or 1)
+        self._chunk_size = max(1, chunk_size)
+        self._mp_context = mp_context
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "ParallelReplacer":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def replace_many(
+        self,
+        texts: Iterable[str],
+        *,
+        with_stats: bool = False,
+    ) -> List[str] | List[ReplacementResult]:
+        texts = list(texts)
+        chunks = [texts[idx : idx + self._chunk_size] for idx in range(0, len(texts), self._chunk_size)]
+        if self._workers == 1 or len(chunks) <= 1:
+            return self._replacer.replace_many(texts, with_stats=with_stats)
+        executor = self._ensure_executor()
+        results: List = []
+        for chunk_results in executor.map(_replace_chunk, chunks, [with_stats] * len(chunks)):
+            results.extend(chunk_results)
+        return results
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Compile before forking so workers never rebuild the trie.
+            pool = self._replacer.pool
+            _ = pool.trie
+            if self._replacer.matcher == MATCHER_AHO_CORASICK:
+                _ = pool.automaton
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=self._mp_context or multiprocessing.get_context(),
+                initializer=_init_worker,
+                initargs=(self._replacer,),
+            )
+        return self._executor
+
+
+def _init_worker(replacer: Replacer) -> None:
+    global _WORKER_REPLACER
+    _WORKER_REPLACER = replacer
+
+
+def _replace_chunk(texts: List[str], with_stats: bool) -> List:
+    if _WORKER_REPLACER is None:
+        raise RuntimeError("Batch worker was not initialized.")
+    return _WORKER_REPLACER.replace_many(texts, with_stats=with_stats)
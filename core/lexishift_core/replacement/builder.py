@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Iterable, Mapping, Optional, Sequence
 
-from lexishift_core.replacement.core import Tokenizer, VocabPool, VocabRule
+from lexishift_core.replacement.core import TRIE_BACKEND_DICT, Tokenizer, VocabPool, VocabRule
 from lexishift_core.replacement.inflect import InflectionGenerator, InflectionSpec, expand_phrase
 
 
@@ -66,9 +66,10 @@ def build_vocab_pool(
     options: Optional[BuildOptions] = None,
     tokenizer: Optional[Tokenizer] = None,
     normalizer=None,
+    trie_backend: str = TRIE_BACKEND_DICT,
 ) -> VocabPool:
     expanded = expand_vocab_rules(rules, options=options)
-    return VocabPool(expanded, tokenizer=tokenizer, normalizer=normalizer)
+    return VocabPool(expanded, tokenizer=tokenizer, normalizer=normalizer, trie_backend=trie_backend)
 
 
 def _append_rule(rule: VocabRule, expanded: list[VocabRule], seen_sources: set[str]) -> None:
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence
+
+if TYPE_CHECKING:
+    from lexishift_core.replacement.core import VocabRule
+
+NO_RULE = -1
+NO_NODE = -1
+
+
+class CompiledPhraseTrie:
+    """Array-backed phrase trie in CSR layout.
+
+    Tokens are interned into integer ids. Node ``n`` owns the edge slice
+    ``child_offsets[n]:child_offsets[n + 1]`` of ``child_tokens``/``child_nodes``,
+    sorted by token id. ``rule_indices[n]`` points into ``rules`` or is ``NO_RULE``.
+    Node ``0`` is the root.
+    """
+
+    __slots__ = (
+        "token_ids",
+        "child_offsets",
+        "child_tokens",
+        "child_nodes",
+        "rule_indices",
+        "rules",
+        "max_depth",
+    )
+
+    def __init__(
+        self,
+        *,
+        token_ids: dict[str, int],
+        child_offsets: array,
+        child_tokens: array,
+        child_nodes: array,
+        rule_indices: array,
+        rules: Sequence["VocabRule"],
+        max_depth: int = 0,
+    ) -> None:
+        self.token_ids = token_ids
+        self.child_offsets = child_offsets
+        self.child_tokens = child_tokens
+        self.child_nodes = child_nodes
+        self.rule_indices = rule_indices
+        self.rules = list(rules)
+        self.max_depth = max_depth
+
+    @classmethod
+    def build(cls, entries: Iterable[tuple[Sequence[str], "VocabRule"]]) -> "CompiledPhraseTrie":
+        token_ids: dict[str, int] = {}
+        paths: list[tuple[int, ...]] = []
+        rules: list["VocabRule"] = []
+        for tokens, rule in entries:
+            if not tokens:
+                continue
+            path = []
+            for token in tokens:
+                token_id = token_ids.get(token)
+                if token_id is None:
+                    token_id = len(token_ids)
+                    token_ids[token] = token_id
+                path.append(token_id)
+            paths.append(tuple(path))
+            rules.append(rule)
+
+        # Stable sort keeps insertion order among identical paths, so the
+        # first rule added wins priority ties exactly like PhraseTrie.add.
+        order = sorted(range(len(paths)), key=paths.__getitem__)
+        sorted_paths = [paths[index] for index in order]
+        priorities = [rules[index].priority for index in order]
+
+        child_offsets = array("i", [0])
+        child_tokens = array("i")
+        child_nodes = array("i")
+        rule_indices = array("i", [NO_RULE])
+        # Breadth-first over contiguous ranges of the sorted paths; node ids are
+        # assigned in visiting order so every node's edges stay contiguous.
+        pending: list[tuple[int, int, int]] = [(0, len(sorted_paths), 0)]
+        cursor = 0
+        while cursor < len(pending):
+            lo, hi, depth = pending[cursor]
+            node = cursor
+            cursor += 1
+            best = NO_RULE
+            while lo < hi and len(sorted_paths[lo]) == depth:
+                if best == NO_RULE or priorities[lo] > priorities[best]:
+                    best = lo
+                lo += 1
+            if best != NO_RULE:
+                rule_indices[node] = order[best]
+            while lo < hi:
+                token_id = sorted_paths[lo][depth]
+                group_end = lo + 1
+                while group_end < hi and sorted_paths[group_end][depth] == token_id:
+                    group_end += 1
+                child_tokens.append(token_id)
+                child_nodes.append(len(pending))
+                rule_indices.append(NO_RULE)
+                pending.append((lo, group_end, depth + 1))
+                lo = group_end
+            child_offsets.append(len(child_tokens))
+
+        used = sorted({index for index in rule_indices if index != NO_RULE})
+        remap = {index: position for position, index in enumerate(used)}
+        compact_indices = array("i", (remap.get(index, NO_RULE) for index in rule_indices))
+        return cls(
+            token_ids=token_ids,
+            child_offsets=child_offsets,
+            child_tokens=child_tokens,
+            child_nodes=child_nodes,
+            rule_indices=compact_indices,
+            rules=[rules[index] for index in used],
+            max_depth=max((len(path) for path in paths), default=0),
+        )
+
+    @property
+    def node_count(self) -> int:
+        return len(self.rule_indices)
+
+    def child(self, node: int, token_id: int) -> int:
+        lo = self.child_offsets[node]
+        hi = self.child_offsets[node + 1]
+        pos = bisect_left(self.child_tokens, token_id, lo, hi)
+        if pos < hi and self.child_tokens[pos] == token_id:
+            return self.child_nodes[pos]
+        return NO_NODE
+
+    def find_node(self, tokens: Sequence[str]) -> int:
+        node = 0
+        for token in tokens:
+            token_id = self.token_ids.get(token)
+            if token_id is None:
+                return NO_NODE
+            node = self.child(node, token_id)
+            if node == NO_NODE:
+                return NO_NODE
+        return node
+
+    def set_rule(self, tokens: Sequence[str], rule: Optional["VocabRule"]) -> bool:
+        """Overwrite the rule stored for ``tokens`` in place.
+
+        Returns ``False`` when ``tokens`` has no node yet; adding a path needs
+        a rebuild of the CSR arrays. Cleared slots stay in ``rules`` until the
+        next rebuild (``live_rules`` skips them).
+        """
+        node = self.find_node(tokens)
+        if node == NO_NODE:
+            return rule is None
+        index = self.rule_indices[node]
+        if rule is None:
+            self.rule_indices[node] = NO_RULE
+        elif index == NO_RULE:
+            self.rule_indices[node] = len(self.rules)
+            self.rules.append(rule)
+        else:
+            self.rules[index] = rule
+        return True
+
+    def live_rules(self) -> tuple[list["VocabRule"], array]:
+        """``rules`` without cleared slots, and ``rule_indices`` remapped to it."""
+        used = sorted({index for index in self.rule_indices if index != NO_RULE})
+        if len(used) == len(self.rules):
+            return list(self.rules), self.rule_indices
+        remap = {index: position for position, index in enumerate(used)}
+        indices = array("i", (remap.get(index, NO_RULE) for index in self.rule_indices))
+        return [self.rules[index] for index in used], indices
+
+    def rule_at(self, node: int) -> Optional["VocabRule"]:
+        index = self.rule_indices[node]
+        if index == NO_RULE:
+            return None
+        return self.rules[index]
+
+    def longest_match(
+        self,
+        tokens: Sequence[str],
+        gap_ok: Sequence[bool],
+        start_index: int,
+    ) -> Optional[tuple[int, "VocabRule"]]:
+        token_ids = self.token_ids
+        child_offsets = self.child_offsets
+        child_tokens = self.child_tokens
+        child_nodes = self.child_nodes
+        rule_indices = self.rule_indices
+        node = 0
+        best_rule: Optional["VocabRule"] = None
+        best_end: Optional[int] = None
+        best_priority = -1
+
+        for idx in range(start_index, len(tokens)):
+            if idx > start_index and not gap_ok[idx - 1]:
+                break
+            token_id = token_ids.get(tokens[idx])
+            if token_id is None:
+                break
+            lo = child_offsets[node]
+            hi = child_offsets[node + 1]
+            pos = bisect_left(child_tokens, token_id, lo, hi)
+            if pos >= hi or child_tokens[pos] != token_id:
+                break
+            node = child_nodes[pos]
+            rule_index = rule_indices[node]
+            if rule_index == NO_RULE:
+                continue
+            rule = self.rules[rule_index]
+            if rule.priority >= best_priority:
+                if rule.priority > best_priority or best_end is None or idx > best_end:
+                    best_rule = rule
+                    best_end = idx
+                    best_priority = rule.priority
+
+        if best_rule is None or best_end is None:
+            return None
+        return best_end, best_rule
@@ -1,9 +1,40 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from array import array
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 import re
 from typing import Iterable, List, Mapping, Optional, Sequence
 
+from lexishift_core.replacement.automaton import PhraseAutomaton
+from lexishift_core.replacement.compiled import CompiledPhraseTrie
+
+TRIE_BACKEND_DICT = "dict"
+TRIE_BACKEND_COMPACT = "compact"
+TRIE_BACKENDS = (TRIE_BACKEND_DICT, TRIE_BACKEND_COMPACT)
+
+MATCHER_TRIE = "trie"
+MATCHER_AHO_CORASICK = "aho_corasick"
+MATCHERS = (MATCHER_TRIE, MATCHER_AHO_CORASICK)
+
+TOKENIZE_MODE_TOKENS = "tokens"
+TOKENIZE_MODE_ARRAYS = "arrays"
+TOKENIZE_MODES = (TOKENIZE_MODE_TOKENS, TOKENIZE_MODE_ARRAYS)
+
+DEFAULT_NORMALIZATION_CACHE_SIZE = 65536
+
+# Kind codes used by Tokenizer.tokenize_arrays; they equal the regex group index.
+KIND_WORD = 1
+KIND_SPACE = 2
+KIND_PUNCT = 3
+
+# Joins batch texts for one tokenizer pass. It tokenizes as punctuation, so
+# no phrase can match across two texts.
+BATCH_SEPARATOR = "\x00"
+# Texts per joined pass; very long joined strings lose to GC pressure.
+BATCH_JOIN_SIZE = 64
+
 
 @dataclass(frozen=True)
 class Token:
@@ -11,9 +42,17 @@ class Token:
     kind: str  # "word", "space", "punct"
 
 
+@dataclass(frozen=True)
+class TokenArrays:
+    kinds: array  # array("b") of KIND_* codes
+    starts: array  # array("l") of token start offsets
+    ends: array  # array("l") of token end offsets
+
+
 class Tokenizer:
     _token_re = re.compile(r"[A-Za-z0-9]+(?:'[A-Za-z0-9]+)*|\s+|[^\w\s]+")
     _word_re = re.compile(r"[A-Za-z0-9]+(?:'[A-Za-z0-9]+)*\Z")
+    _kind_re = re.compile(r"(?P<word>[A-Za-z0-9]+(?:'[A-Za-z0-9]+)*)|(?P<space>\s+)|(?P<punct>[^\w\s]+)")
 
     def tokenize(self, text: str) -> List[Token]:
         tokens: List[Token] = []
@@ -28,12 +67,87 @@ class Tokenizer:
             tokens.append(Token(text=chunk, kind=kind))
         return tokens
 
+    def tokenize_with_offsets(self, text: str) -> List[tuple[int, Token]]:
+        tokens: List[tuple[int, Token]] = []
+        for match in self._token_re.finditer(text):
+            chunk = match.group(0)
+            if self._word_re.match(chunk):
+                kind = "word"
+            elif chunk.isspace():
+                kind = "space"
+            else:
+                kind = "punct"
+            tokens.append((match.start(), Token(text=chunk, kind=kind)))
+        return tokens
+
+    def tokenize_arrays(self, text: str) -> TokenArrays:
+        kinds = array("b")
+        starts = array("l")
+        ends = array("l")
+        for match in self._kind_re.finditer(text):
+            start, end = match.span()
+            kinds.append(match.lastindex or KIND_PUNCT)
+            starts.append(start)
+            ends.append(end)
+        return TokenArrays(kinds=kinds, starts=starts, ends=ends)
+
 
 class Normalizer:
     def normalize_word(self, word: str) -> str:
         return word.lower()
 
 
+@dataclass(frozen=True)
+class NormalizationCacheStats:
+    hits: int
+    misses: int
+    size: int
+    max_entries: Optional[int]
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CachedNormalizer(Normalizer):
+    """Bounded LRU memo around another normalizer."""
+
+    def __init__(self, inner: Normalizer, *, max_entries: Optional[int] = DEFAULT_NORMALIZATION_CACHE_SIZE) -> None:
+        self._inner = inner
+        self._max_entries = max_entries
+        self._cached = lru_cache(maxsize=max_entries)(inner.normalize_word)
+
+    def normalize_word(self, word: str) -> str:
+        return self._cached(word)
+
+    @property
+    def inner(self) -> Normalizer:
+        return self._inner
+
+    def cache_stats(self) -> NormalizationCacheStats:
+        info = self._cached.cache_info()
+        return NormalizationCacheStats(
+            hits=info.hits,
+            misses=info.misses,
+            size=info.currsize,
+            max_entries=self._max_entries,
+        )
+
+    def clear_cache(self) -> None:
+        self._cached.cache_clear()
+
+    # The lru_cache wrapper is not picklable; workers start with an empty cache.
+    def __getstate__(self) -> tuple[Normalizer, Optional[int]]:
+        return self._inner, self._max_entries
+
+    def __setstate__(self, state: tuple[Normalizer, Optional[int]]) -> None:
+        inner, max_entries = state
+        self._inner = inner
+        self._max_entries = max_entries
+        self._cached = lru_cache(maxsize=max_entries)(inner.normalize_word)
+
+
 class SynonymNormalizer(Normalizer):
     def __init__(self, synonyms: Mapping[str, str], *, fallback: Optional[Normalizer] = None) -> None:
         self._fallback = fallback or Normalizer()
@@ -114,14 +228,44 @@ class PhraseTrieNode:
 class PhraseTrie:
     def __init__(self) -> None:
         self.root = PhraseTrieNode()
+        self.max_depth = 0
 
     def add(self, tokens: Sequence[str], rule: VocabRule) -> None:
+        self.max_depth = max(self.max_depth, len(tokens))
         node = self.root
         for token in tokens:
             node = node.children.setdefault(token, PhraseTrieNode())
         if node.best_rule is None or rule.priority > node.best_rule.priority:
             node.best_rule = rule
 
+    def set_rule(self, tokens: Sequence[str], rule: Optional[VocabRule]) -> bool:
+        """Overwrite the rule stored for ``tokens``; ``None`` clears it and prunes empty nodes.
+
+        ``max_depth`` is left as an upper bound after removals. Always
+        succeeds (see ``CompiledPhraseTrie.set_rule``).
+        """
+        if rule is not None:
+            self.max_depth = max(self.max_depth, len(tokens))
+            node = self.root
+            for token in tokens:
+                node = node.children.setdefault(token, PhraseTrieNode())
+            node.best_rule = rule
+            return True
+
+        path = [self.root]
+        for token in tokens:
+            child = path[-1].children.get(token)
+            if child is None:
+                return True
+            path.append(child)
+        path[-1].best_rule = None
+        for depth in range(len(tokens), 0, -1):
+            node = path[depth]
+            if node.children or node.best_rule is not None:
+                break
+            del path[depth - 1].children[tokens[depth - 1]]
+        return True
+
 
 class VocabPool:
     def __init__(
@@ -130,11 +274,26 @@ class VocabPool:
         *,
         tokenizer: Optional[Tokenizer] = None,
         normalizer: Optional[Normalizer] = None,
+        trie_backend: str = TRIE_BACKEND_DICT,
     ) -> None:
-        self._rules: List[VocabRule] = list(rules) if rules else []
+        if trie_backend not in TRIE_BACKENDS:
+            raise ValueError(f"Unknown trie backend: {trie_backend}")
+        # Rules keyed by insertion sequence (dict order is rule order); the
+        # sequence keeps priority ties stable across edits.
+        self._rules: dict[int, VocabRule] = dict(enumerate(rules)) if rules else {}
+        self._next_seq = len(self._rules)
+        # id(rule) -> sequences holding that object, for O(1) edit lookups.
+        self._seqs_by_id: dict[int, List[int]] = {}
+        for seq, rule in self._rules.items():
+            self._seqs_by_id.setdefault(id(rule), []).append(seq)
         self._tokenizer = tokenizer or Tokenizer()
         self._normalizer = normalizer or Normalizer()
-        self._trie: Optional[PhraseTrie] = None
+        self._trie_backend = trie_backend
+        self._trie: Optional[PhraseTrie | CompiledPhraseTrie] = None
+        self._automaton: Optional[PhraseAutomaton] = None
+        # Tokens of live rules only, dropped with the rule.
+        self._token_cache: dict[int, List[str]] = {}
+        self._phrase_index: Optional[dict[tuple[str, ...], List[tuple[int, VocabRule]]]] = None
         self._dirty = True
 
     @classmethod
@@ -144,48 +303,188 @@ class VocabPool:
         *,
         tokenizer: Optional[Tokenizer] = None,
         normalizer: Optional[Normalizer] = None,
+        trie_backend: str = TRIE_BACKEND_DICT,
     ) -> "VocabPool":
         rules = [VocabRule(source, replacement) for source, replacement in mapping.items()]
-        return cls(rules, tokenizer=tokenizer, normalizer=normalizer)
+        return cls(rules, tokenizer=tokenizer, normalizer=normalizer, trie_backend=trie_backend)
+
+    @classmethod
+    def from_compiled(
+        cls,
+        rules: Iterable[VocabRule],
+        trie: CompiledPhraseTrie,
+        *,
+        tokenizer: Optional[Tokenizer] = None,
+        normalizer: Optional[Normalizer] = None,
+    ) -> "VocabPool":
+        # Trusts that ``trie`` was compiled from ``rules`` with the same
+        # tokenizer and normalizer; later edits recompile as usual.
+        pool = cls(rules, tokenizer=tokenizer, normalizer=normalizer, trie_backend=TRIE_BACKEND_COMPACT)
+        pool._trie = trie
+        pool._dirty = False
+        return pool
 
     def add_rule(self, rule: VocabRule) -> None:
-        self._rules.append(rule)
-        self._dirty = True
+        self._append_rule(rule)
 
     def add_meaning_rule(self, rule: MeaningRule) -> None:
-        self._rules.extend(rule.to_vocab_rules())
-        self._dirty = True
+        for vocab_rule in rule.to_vocab_rules():
+            self._append_rule(vocab_rule)
+
+    def remove_rule(self, rule: VocabRule) -> None:
+        seq = self._seq_of(rule)
+        removed = self._rules.pop(seq)
+        self._forget_seq(removed, seq)
+        if removed.enabled:
+            self._patch_compiled(seq, removed, insert=False)
+        self._token_cache.pop(seq, None)
+
+    def set_rule_enabled(self, rule: VocabRule, enabled: bool) -> VocabRule:
+        seq = self._seq_of(rule)
+        current = self._rules[seq]
+        if current.enabled == enabled:
+            return current
+        updated = replace(current, enabled=enabled)
+        self._rules[seq] = updated
+        self._forget_seq(current, seq)
+        self._seqs_by_id.setdefault(id(updated), []).append(seq)
+        if enabled:
+            self._patch_compiled(seq, updated, insert=True)
+        else:
+            self._patch_compiled(seq, current, insert=False)
+        return updated
+
+    def _append_rule(self, rule: VocabRule) -> None:
+        seq = self._next_seq
+        self._next_seq += 1
+        self._rules[seq] = rule
+        self._seqs_by_id.setdefault(id(rule), []).append(seq)
+        if rule.enabled:
+            self._patch_compiled(seq, rule, insert=True)
+
+    def _seq_of(self, rule: VocabRule) -> int:
+        seqs = self._seqs_by_id.get(id(rule))
+        if seqs:
+            return seqs[0]
+        # An equal rule that is not the stored object: first match in order.
+        for seq, candidate in self._rules.items():
+            if candidate == rule:
+                return seq
+        raise ValueError(f"{rule!r} is not in the pool")
+
+    def _forget_seq(self, rule: VocabRule, seq: int) -> None:
+        seqs = self._seqs_by_id.get(id(rule), [])
+        if seq in seqs:
+            seqs.remove(seq)
+        if not seqs:
+            self._seqs_by_id.pop(id(rule), None)
+
+    def _patch_compiled(self, seq: int, rule: VocabRule, *, insert: bool) -> None:
+        # The dict trie is patched in place, and so is the compact trie while
+        # the edited phrase's node already exists. A new phrase path in the
+        # compact trie, and any edit for the automaton, falls back to a lazy
+        # rebuild on next use.
+        self._automaton = None
+        trie = self._trie
+        if self._dirty or trie is None:
+            self._dirty = True
+            return
+        tokens = self._rule_tokens(seq, rule)
+        if not tokens:
+            return
+        if (
+            insert
+            and isinstance(trie, PhraseTrie)
+            and self._phrase_index is None
+            and seq == self._next_seq - 1
+        ):
+            trie.add(tokens, rule)
+            return
+        # A freshly built index already reflects the edited rule list.
+        if self._phrase_index is None:
+            index = self._ensure_phrase_index()
+            entries = index.get(tuple(tokens), [])
+        else:
+            index = self._phrase_index
+            entries = index.setdefault(tuple(tokens), [])
+            if insert:
+                insort(entries, (seq, rule), key=lambda entry: entry[0])
+            else:
+                entries[:] = [entry for entry in entries if entry[0] != seq]
+        best: Optional[VocabRule] = None
+        for _, candidate in entries:
+            if best is None or candidate.priority > best.priority:
+                best = candidate
+        if not entries:
+            index.pop(tuple(tokens), None)
+        if not trie.set_rule(tokens, best):
+            self._dirty = True
+
+    def _ensure_phrase_index(self) -> dict[tuple[str, ...], List[tuple[int, VocabRule]]]:
+        if self._phrase_index is None:
+            index: dict[tuple[str, ...], List[tuple[int, VocabRule]]] = {}
+            for seq, rule in self._rules.items():
+                if not rule.enabled:
+                    continue
+                tokens = self._rule_tokens(seq, rule)
+                if tokens:
+                    index.setdefault(tuple(tokens), []).append((seq, rule))
+            self._phrase_index = index
+        return self._phrase_index
+
+    def _rule_tokens(self, seq: int, rule: VocabRule) -> List[str]:
+        tokens = self._token_cache.get(seq)
+        if tokens is None:
+            tokens = rule.tokens(self._tokenizer, self._normalizer)
+            self._token_cache[seq] = tokens
+        return tokens
 
     def compile(self) -> None:
-        trie = PhraseTrie()
-        for rule in self._rules:
+        entries = self._iter_trie_entries()
+        if self._trie_backend == TRIE_BACKEND_COMPACT:
+            self._trie = CompiledPhraseTrie.build(entries)
+        else:
+            trie = PhraseTrie()
+            for tokens, rule in entries:
+                trie.add(tokens, rule)
+            self._trie = trie
+        self._automaton = None
+        self._phrase_index = None
+        self._dirty = False
+
+    def _iter_trie_entries(self) -> Iterable[tuple[List[str], VocabRule]]:
+        for seq, rule in self._rules.items():
             if not rule.enabled:
                 continue
-            tokens = rule.tokens(self._tokenizer, self._normalizer)
+            tokens = self._rule_tokens(seq, rule)
             if not tokens:
                 continue
-            trie.add(tokens, rule)
-        self._trie = trie
-        self._dirty = False
+            yield tokens, rule
 
     def clone(
         self,
         *,
         tokenizer: Optional[Tokenizer] = None,
         normalizer: Optional[Normalizer] = None,
+        trie_backend: Optional[str] = None,
     ) -> "VocabPool":
         return VocabPool(
-            self._rules,
+            self._rules.values(),
             tokenizer=tokenizer or self._tokenizer,
             normalizer=normalizer or self._normalizer,
+            trie_backend=trie_backend or self._trie_backend,
         )
 
     @property
     def rules(self) -> Sequence[VocabRule]:
-        return tuple(self._rules)
+        return tuple(self._rules.values())
+
+    @property
+    def trie_backend(self) -> str:
+        return self._trie_backend
 
     @property
-    def trie(self) -> PhraseTrie:
+    def trie(self) -> PhraseTrie | CompiledPhraseTrie:
         if self._dirty or self._trie is None:
             self.compile()
         trie = self._trie
@@ -193,6 +492,14 @@ class VocabPool:
             raise RuntimeError("Vocab trie compilation failed.")
         return trie
 
+    @property
+    def automaton(self) -> PhraseAutomaton:
+        if self._dirty:
+            self.compile()
+        if self._automaton is None:
+            self._automaton = PhraseAutomaton.build(self._iter_trie_entries())
+        return self._automaton
+
     @property
     def normalizer(self) -> Normalizer:
         return self._normalizer
@@ -216,30 +523,153 @@ class ReplacementResult:
 
 
 class Replacer:
-    def __init__(self, vocab_pool: VocabPool) -> None:
+    def __init__(
+        self,
+        vocab_pool: VocabPool,
+        *,
+        matcher: str = MATCHER_TRIE,
+        tokenize_mode: str = TOKENIZE_MODE_TOKENS,
+    ) -> None:
+        if matcher not in MATCHERS:
+            raise ValueError(f"Unknown matcher: {matcher}")
+        if tokenize_mode not in TOKENIZE_MODES:
+            raise ValueError(f"Unknown tokenize mode: {tokenize_mode}")
         self._pool = vocab_pool
+        self._matcher = matcher
+        self._tokenize_mode = tokenize_mode
+
+    @property
+    def pool(self) -> VocabPool:
+        return self._pool
+
+    @property
+    def matcher(self) -> str:
+        return self._matcher
+
+    @property
+    def tokenize_mode(self) -> str:
+        return self._tokenize_mode
 
     def replace_text(self, text: str, *, with_stats: bool = False) -> str | ReplacementResult:
+        if self._tokenize_mode == TOKENIZE_MODE_ARRAYS:
+            replaced_text, matches, _ = self._replace_arrays(text)
+            if with_stats:
+                return ReplacementResult(text=replaced_text, matches=matches)
+            return replaced_text
         tokens = self._pool.tokenizer.tokenize(text)
         word_positions = [idx for idx, token in enumerate(tokens) if token.kind == "word"]
         word_texts = [tokens[idx].text for idx in word_positions]
         gap_ok = self._compute_word_gaps_ok(tokens, word_positions)
-
-        matches: List[Match] = []
-        word_index = 0
-        while word_index < len(word_texts):
-            match = self._find_longest_match(word_texts, gap_ok, word_index)
-            if match:
-                matches.append(match)
-                word_index = match.end_word_index + 1
-            else:
-                word_index += 1
-
+        matches = self._find_matches(word_texts, gap_ok)
         replaced_text = self._apply_matches(tokens, word_positions, word_texts, matches)
         if with_stats:
             return ReplacementResult(text=replaced_text, matches=matches)
         return replaced_text
 
+    def replace_many(
+        self,
+        texts: Iterable[str],
+        *,
+        with_stats: bool = False,
+    ) -> List[str] | List[ReplacementResult]:
+        # Process-pool batches go through a long-lived ``ParallelReplacer``
+        # (replacement/batch.py) so workers start once, not per call.
+        texts = list(texts)
+        return self._replace_batch(texts, with_stats=with_stats)
+
+    def _replace_batch(self, texts: Sequence[str], *, with_stats: bool) -> List:
+        results: List = []
+        for idx in range(0, len(texts), BATCH_JOIN_SIZE):
+            results.extend(self._replace_joined(texts[idx : idx + BATCH_JOIN_SIZE], with_stats=with_stats))
+        return results
+
+    def _replace_joined(self, texts: Sequence[str], *, with_stats: bool) -> List:
+        if any(BATCH_SEPARATOR in text for text in texts):
+            return [self.replace_text(text, with_stats=with_stats) for text in texts]
+
+        joined = BATCH_SEPARATOR.join(texts)
+        word_starts: Sequence[int] = ()
+        if self._tokenize_mode == TOKENIZE_MODE_ARRAYS:
+            replaced_text, matches, word_starts = self._replace_arrays(joined)
+        else:
+            tokenizer = self._pool.tokenizer
+            spans = tokenizer.tokenize_with_offsets(joined) if with_stats else None
+            tokens = [token for _, token in spans] if spans is not None else tokenizer.tokenize(joined)
+            word_positions = [idx for idx, token in enumerate(tokens) if token.kind == "word"]
+            word_texts = [tokens[idx].text for idx in word_positions]
+            gap_ok = self._compute_word_gaps_ok(tokens, word_positions)
+            matches = self._find_matches(word_texts, gap_ok)
+            replaced_text = self._apply_matches(tokens, word_positions, word_texts, matches)
+            if spans is not None:
+                word_starts = [spans[idx][0] for idx in word_positions]
+        pieces = replaced_text.split(BATCH_SEPARATOR)
+        if len(pieces) != len(texts):
+            # A replacement carried the separator; fall back to per-text calls.
+            return [self.replace_text(text, with_stats=with_stats) for text in texts]
+        if not with_stats:
+            return pieces
+
+        results: List[ReplacementResult] = []
+        match_cursor = 0
+        text_start = 0
+        for text, piece in zip(texts, pieces):
+            text_end = text_start + len(text)
+            first_word = bisect_left(word_starts, text_start)
+            end_word = bisect_left(word_starts, text_end)
+            text_matches: List[Match] = []
+            while match_cursor < len(matches) and matches[match_cursor].start_word_index < end_word:
+                match = matches[match_cursor]
+                text_matches.append(
+                    Match(
+                        start_word_index=match.start_word_index - first_word,
+                        end_word_index=match.end_word_index - first_word,
+                        rule=match.rule,
+                    )
+                )
+                match_cursor += 1
+            results.append(ReplacementResult(text=piece, matches=text_matches))
+            text_start = text_end + len(BATCH_SEPARATOR)
+        return results
+
+    def _replace_arrays(self, text: str) -> tuple[str, List[Match], array]:
+        arrays = self._pool.tokenizer.tokenize_arrays(text)
+        kinds = arrays.kinds
+        starts = arrays.starts
+        ends = arrays.ends
+
+        word_positions: List[int] = []
+        gap_ok: List[bool] = []
+        ok = True
+        for idx, kind in enumerate(kinds):
+            if kind == KIND_WORD:
+                if word_positions:
+                    gap_ok.append(ok)
+                word_positions.append(idx)
+                ok = True
+            elif kind != KIND_SPACE:
+                ok = False
+        word_starts = array("l", (starts[idx] for idx in word_positions))
+        word_texts = [text[starts[idx] : ends[idx]] for idx in word_positions]
+        matches = self._find_matches(word_texts, gap_ok)
+
+        # Characters the tokenizer skips are dropped from the token path's
+        # output, so plain slicing is only byte-identical when tokens cover
+        # the whole string.
+        covered = sum(ends) - sum(starts) == len(text)
+        output_parts: List[str] = []
+        token_cursor = 0
+        for match in matches:
+            start_token_idx = word_positions[match.start_word_index]
+            end_token_idx = word_positions[match.end_word_index]
+            if token_cursor < start_token_idx:
+                output_parts.append(_slice_tokens(text, starts, ends, token_cursor, start_token_idx, covered))
+            source_words = word_texts[match.start_word_index : match.end_word_index + 1]
+            output_parts.append(_apply_case(match.rule.replacement, source_words, match.rule.case_policy))
+            token_cursor = end_token_idx + 1
+        if token_cursor < len(kinds):
+            output_parts.append(_slice_tokens(text, starts, ends, token_cursor, len(kinds), covered))
+        return "".join(output_parts), matches, word_starts
+
     def _compute_word_gaps_ok(self, tokens: Sequence[Token], word_positions: Sequence[int]) -> List[bool]:
         gap_ok: List[bool] = []
         for idx in range(len(word_positions) - 1):
@@ -253,22 +683,71 @@ class Replacer:
             gap_ok.append(ok)
         return gap_ok
 
+    def _normalize_words(self, words: Sequence[str]) -> List[str]:
+        # Each distinct surface form is normalized once per call.
+        normalize = self._pool.normalizer.normalize_word
+        memo: dict[str, str] = {}
+        normalized: List[str] = []
+        for word in words:
+            value = memo.get(word)
+            if value is None:
+                value = normalize(word)
+                memo[word] = value
+            normalized.append(value)
+        return normalized
+
+    def _find_matches(self, words: Sequence[str], gap_ok: Sequence[bool]) -> List[Match]:
+        normalized = self._normalize_words(words)
+        if self._matcher == MATCHER_AHO_CORASICK:
+            return self._find_matches_single_pass(normalized, gap_ok)
+        matches: List[Match] = []
+        word_index = 0
+        while word_index < len(normalized):
+            match = self._find_longest_match(normalized, gap_ok, word_index)
+            if match:
+                matches.append(match)
+                word_index = match.end_word_index + 1
+            else:
+                word_index += 1
+        return matches
+
+    def _find_matches_single_pass(self, normalized: Sequence[str], gap_ok: Sequence[bool]) -> List[Match]:
+        best = self._pool.automaton.scan(normalized, gap_ok)
+        matches: List[Match] = []
+        word_index = 0
+        while word_index < len(normalized):
+            found = best[word_index]
+            if found is None:
+                word_index += 1
+                continue
+            end_index, rule = found
+            matches.append(Match(start_word_index=word_index, end_word_index=end_index, rule=rule))
+            word_index = end_index + 1
+        return matches
+
     def _find_longest_match(
         self,
-        words: Sequence[str],
+        normalized: Sequence[str],
         gap_ok: Sequence[bool],
         start_index: int,
     ) -> Optional[Match]:
-        node: PhraseTrieNode = self._pool.trie.root
+        trie = self._pool.trie
+        if isinstance(trie, CompiledPhraseTrie):
+            found = trie.longest_match(normalized, gap_ok, start_index)
+            if found is None:
+                return None
+            end_index, rule = found
+            return Match(start_word_index=start_index, end_word_index=end_index, rule=rule)
+
+        node: PhraseTrieNode = trie.root
         best_rule: Optional[VocabRule] = None
         best_end: Optional[int] = None
         best_priority = -1
 
-        for idx in range(start_index, len(words)):
+        for idx in range(start_index, len(normalized)):
             if idx > start_index and not gap_ok[idx - 1]:
                 break
-            normalized = self._pool.normalizer.normalize_word(words[idx])
-            next_node = node.children.get(normalized)
+            next_node = node.children.get(normalized[idx])
             if next_node is None:
                 break
             node = next_node
@@ -307,6 +786,12 @@ class Replacer:
         return "".join(output_parts)
 
 
+def _slice_tokens(text: str, starts: array, ends: array, first: int, stop: int, covered: bool) -> str:
+    if covered:
+        return text[starts[first] : ends[stop - 1]]
+    return "".join(text[starts[idx] : ends[idx]] for idx in range(first, stop))
+
+
 def _apply_case(replacement: str, source_words: Sequence[str], policy: str) -> str:
     if policy == "as-is":
         return replacement
@@ -2,9 +2,19 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterable, Mapping, Optional
+from typing import Iterable, Iterator, List, Mapping, Optional
 
-from lexishift_core.replacement.core import MeaningRule, Replacer, SynonymNormalizer, VocabPool
+from lexishift_core.replacement.core import (
+    MATCHER_TRIE,
+    CachedNormalizer,
+    TOKENIZE_MODE_TOKENS,
+    MeaningRule,
+    Replacer,
+    ReplacementResult,
+    SynonymNormalizer,
+    VocabPool,
+)
+from lexishift_core.replacement.streaming import DEFAULT_STREAM_CHUNK_SIZE, StreamingReplacer, TextSource
 
 
 class ReplacementMode(Enum):
@@ -22,17 +32,50 @@ class ReplacementPipeline:
             return self.meaning.replace_text(text, with_stats=with_stats)
         return self.exact.replace_text(text, with_stats=with_stats)
 
+    def replace_many(
+        self,
+        texts: Iterable[str],
+        *,
+        mode: ReplacementMode = ReplacementMode.EXACT,
+        with_stats: bool = False,
+    ) -> List[str] | List[ReplacementResult]:
+        if mode is ReplacementMode.MEANING and self.meaning is not None:
+            return self.meaning.replace_many(texts, with_stats=with_stats)
+        return self.exact.replace_many(texts, with_stats=with_stats)
+
+    def replace_stream(
+        self,
+        source: TextSource,
+        *,
+        mode: ReplacementMode = ReplacementMode.EXACT,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> Iterator[ReplacementResult]:
+        replacer = self.exact
+        if mode is ReplacementMode.MEANING and self.meaning is not None:
+            replacer = self.meaning
+        return StreamingReplacer(replacer.pool).replace_stream(source, chunk_size=chunk_size)
+
 
 def build_meaning_pool(
     base_pool: VocabPool,
     *,
     meaning_rules: Optional[Iterable[MeaningRule]] = None,
     synonyms: Optional[Mapping[str, str]] = None,
+    normalization_cache_size: Optional[int] = None,
 ) -> VocabPool:
     normalizer = base_pool.normalizer
+    if normalization_cache_size and isinstance(normalizer, CachedNormalizer):
+        normalizer = normalizer.inner
     if synonyms:
         normalizer = SynonymNormalizer(synonyms, fallback=normalizer)
-    meaning_pool = VocabPool(base_pool.rules, tokenizer=base_pool.tokenizer, normalizer=normalizer)
+    if normalization_cache_size:
+        normalizer = CachedNormalizer(normalizer, max_entries=normalization_cache_size)
+    meaning_pool = VocabPool(
+        base_pool.rules,
+        tokenizer=base_pool.tokenizer,
+        normalizer=normalizer,
+        trie_backend=base_pool.trie_backend,
+    )
     if meaning_rules:
         for rule in meaning_rules:
             meaning_pool.add_meaning_rule(rule)
@@ -44,10 +87,24 @@ def compile_pipeline(
     *,
     meaning_rules: Optional[Iterable[MeaningRule]] = None,
     synonyms: Optional[Mapping[str, str]] = None,
+    trie_backend: Optional[str] = None,
+    matcher: str = MATCHER_TRIE,
+    tokenize_mode: str = TOKENIZE_MODE_TOKENS,
+    normalization_cache_size: Optional[int] = None,
 ) -> ReplacementPipeline:
-    exact = Replacer(base_pool)
+    if trie_backend is not None and trie_backend != base_pool.trie_backend:
+        base_pool = base_pool.clone(trie_backend=trie_backend)
+    if normalization_cache_size and not isinstance(base_pool.normalizer, CachedNormalizer):
+        cached = CachedNormalizer(base_pool.normalizer, max_entries=normalization_cache_size)
+        base_pool = base_pool.clone(normalizer=cached)
+    exact = Replacer(base_pool, matcher=matcher, tokenize_mode=tokenize_mode)
     meaning: Optional[Replacer] = None
     if meaning_rules or synonyms:
-        meaning_pool = build_meaning_pool(base_pool, meaning_rules=meaning_rules, synonyms=synonyms)
-        meaning = Replacer(meaning_pool)
+        meaning_pool = build_meaning_pool(
+            base_pool,
+            meaning_rules=meaning_rules,
+            synonyms=synonyms,
+            normalization_cache_size=normalization_cache_size,
+        )
+        meaning = Replacer(meaning_pool, matcher=matcher, tokenize_mode=tokenize_mode)
     return ReplacementPipeline(exact=exact, meaning=meaning)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import IO, Iterable, Iterator, List, Union
+
+from lexishift_core.replacement.core import Match, ReplacementResult, Replacer, Token, VocabPool
+
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+TextSource = Union[Iterable[str], IO[str]]
+
+
+class StreamingReplacer(Replacer):
+    """Replacer for unbounded text streams.
+
+    Only the unresolved tail is buffered: at most the trie's longest phrase in
+    words plus the last, possibly incomplete, token. Output pieces
+    concatenate to exactly what ``replace_text`` returns for the whole input,
+    and ``Match`` word indexes count from the start of the stream.
+    """
+
+    def __init__(self, vocab_pool: VocabPool) -> None:
+        super().__init__(vocab_pool)
+        self._pending = ""
+        self._word_offset = 0
+
+    def reset(self) -> None:
+        self._pending = ""
+        self._word_offset = 0
+
+    def feed(self, chunk: str) -> ReplacementResult:
+        self._pending += chunk
+        return self._drain(final=False)
+
+    def flush(self) -> ReplacementResult:
+        result = self._drain(final=True)
+        self.reset()
+        return result
+
+    def replace_stream(
+        self,
+        source: TextSource,
+        *,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> Iterator[ReplacementResult]:
+        self.reset()
+        for chunk in _iter_chunks(source, chunk_size):
+            result = self.feed(chunk)
+            if result.text or result.matches:
+                yield result
+        result = self.flush()
+        if result.text or result.matches:
+            yield result
+
+    def _drain(self, *, final: bool) -> ReplacementResult:
+        text = self._pending
+        spans = self._pool.tokenizer.tokenize_with_offsets(text)
+        if final:
+            cut = len(text)
+        else:
+            stable, cut = _stable_prefix(text, spans)
+            spans = spans[:stable]
+        tokens: List[Token] = [token for _, token in spans]
+        word_positions = [idx for idx, token in enumerate(tokens) if token.kind == "word"]
+        word_texts = [tokens[idx].text for idx in word_positions]
+        gap_ok = self._compute_word_gaps_ok(tokens, word_positions)
+
+        # A start index is decided once the longest phrase starting there fits
+        # inside the stable words; everything before it can be emitted.
+        lookahead = max(self._pool.trie.max_depth, 1)
+        limit = len(word_texts) if final else len(word_texts) - lookahead + 1
+        normalized = self._normalize_words(word_texts)
+        matches: List[Match] = []
+        word_index = 0
+        while word_index < limit:
+            match = self._find_longest_match(normalized, gap_ok, word_index)
+            if match:
+                matches.append(match)
+                word_index = match.end_word_index + 1
+            else:
+                word_index += 1
+
+        if word_index < len(word_texts):
+            emit_tokens = word_positions[word_index]
+            self._pending = text[spans[emit_tokens][0] :]
+        else:
+            emit_tokens = len(tokens)
+            self._pending = text[cut:]
+
+        replaced = self._apply_matches(tokens[:emit_tokens], word_positions, word_texts, matches)
+        offset = self._word_offset
+        self._word_offset += word_index
+        shifted = [
+            Match(
+                start_word_index=match.start_word_index + offset,
+                end_word_index=match.end_word_index + offset,
+                rule=match.rule,
+            )
+            for match in matches
+        ]
+        return ReplacementResult(text=replaced, matches=shifted)
+
+
+def _stable_prefix(text: str, spans: List[tuple[int, Token]]) -> tuple[int, int]:
+    """Tokens (count, end offset) that more input cannot change.
+
+    Only the last token can grow, except that a word followed by a lone
+    trailing apostrophe may still become a contraction ("don'" + "t").
+    Characters the tokenizer skips never join a token, so when the text ends
+    in them everything is stable.
+    """
+    if not spans:
+        return 0, len(text)
+    last_start, last = spans[-1]
+    if last_start + len(last.text) < len(text):
+        return len(spans), len(text)
+    count = len(spans) - 1
+    if last.text == "'" and count:
+        prev_start, prev = spans[count - 1]
+        if prev.kind == "word" and prev_start + len(prev.text) == last_start:
+            count -= 1
+    return count, spans[count][0]
+
+
+def _iter_chunks(source: TextSource, chunk_size: int) -> Iterator[str]:
+    if isinstance(source, str):
+        yield source
+        return
+    read = getattr(source, "read", None)
+    if read is None:
+        yield from source
+        return
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 import sqlite3
-from typing import Iterable
+from typing import Iterable, Iterator, Optional
 from xml.etree import ElementTree
 
 from lexishift_core.resources.japanese_script import (
@@ -145,56 +145,87 @@ def load_jmdict_entry_index_glosses_and_script_forms(
     languages: Iterable[str] = ("eng", "en"),
     include_kana: bool = True,
     include_kanji: bool = True,
+    targets: Optional[Iterable[str]] = None,
 ) -> tuple[dict[str, list[JmdictEntryRecord]], dict[str, list[str]], dict[str, dict[str, str]]]:
+    if targets is not None:
+        from lexishift_core.resources.jmdict_index import open_jmdict_index
+
+        index = open_jmdict_index(path, languages=languages)
+        if index is not None:
+            with index:
+                return index.lookup(targets, include_kana=include_kana, include_kanji=include_kanji)
     entries_by_term: dict[str, list[JmdictEntryRecord]] = {}
     mapping: dict[str, list[str]] = {}
     forms_by_term: dict[str, dict[str, str]] = {}
+    wanted = set(targets) if targets is not None else None
+    for entry_record in iter_jmdict_entries(path, languages=languages):
+        if not entry_record.glosses:
+            continue
+        terms: list[str] = []
+        if include_kanji:
+            terms.extend(entry_record.kanji_forms)
+        if include_kana:
+            terms.extend(entry_record.kana_forms)
+        for term in terms:
+            if wanted is not None and term not in wanted:
+                continue
+            add_jmdict_term_entry(
+                term,
+                entry_record,
+                entries_by_term=entries_by_term,
+                mapping=mapping,
+                forms_by_term=forms_by_term,
+            )
+    return entries_by_term, mapping, forms_by_term
+
+
+def iter_jmdict_entries(
+    path: Path,
+    *,
+    languages: Iterable[str] = ("eng", "en"),
+) -> Iterator[JmdictEntryRecord]:
+    """Yield every JMdict entry in document order, including entries whose
+    glosses were all filtered out by ``languages``."""
     if not path.exists():
-        return entries_by_term, mapping, forms_by_term
+        return
     allowed = {lang.lower() for lang in languages} if languages else set()
     try:
         context = ElementTree.iterparse(path, events=("end",))
     except (ElementTree.ParseError, OSError):
-        return entries_by_term, mapping, forms_by_term
+        return
     for _event, elem in context:
         if elem.tag != "entry":
             continue
-        glosses = _collect_glosses(elem=elem, allowed_languages=allowed)
-        if not glosses:
-            elem.clear()
-            continue
-        kanji_forms = _collect_forms(elem=elem, tag_path="k_ele/keb")
-        kana_forms = _collect_forms(elem=elem, tag_path="r_ele/reb")
-        canonical_kanji = kanji_forms[0] if kanji_forms else ""
-        canonical_kana = kana_forms[0] if kana_forms else ""
-        terms: list[str] = []
-        if include_kanji:
-            terms.extend(kanji_forms)
-        if include_kana:
-            terms.extend(kana_forms)
-        entry_record = JmdictEntryRecord(
-            kanji_forms=tuple(kanji_forms),
-            kana_forms=tuple(kana_forms),
-            glosses=tuple(glosses),
+        yield JmdictEntryRecord(
+            kanji_forms=tuple(_collect_forms(elem=elem, tag_path="k_ele/keb")),
+            kana_forms=tuple(_collect_forms(elem=elem, tag_path="r_ele/reb")),
+            glosses=tuple(_collect_glosses(elem=elem, allowed_languages=allowed)),
         )
-        for term in terms:
-            entry_bucket = entries_by_term.setdefault(term, [])
-            entry_bucket.append(entry_record)
-            bucket = mapping.setdefault(term, [])
-            for gloss in glosses:
-                if gloss not in bucket:
-                    bucket.append(gloss)
-            entry_forms = _build_script_forms(
-                term=term,
-                canonical_kanji=canonical_kanji,
-                canonical_kana=canonical_kana,
-            )
-            existing = forms_by_term.setdefault(term, {})
-            for script, value in entry_forms.items():
-                if script not in existing and value:
-                    existing[script] = value
         elem.clear()
-    return entries_by_term, mapping, forms_by_term
+
+
+def add_jmdict_term_entry(
+    term: str,
+    entry_record: JmdictEntryRecord,
+    *,
+    entries_by_term: dict[str, list[JmdictEntryRecord]],
+    mapping: dict[str, list[str]],
+    forms_by_term: dict[str, dict[str, str]],
+) -> None:
+    entries_by_term.setdefault(term, []).append(entry_record)
+    bucket = mapping.setdefault(term, [])
+    for gloss in entry_record.glosses:
+        if gloss not in bucket:
+            bucket.append(gloss)
+    entry_forms = _build_script_forms(
+        term=term,
+        canonical_kanji=entry_record.kanji_forms[0] if entry_record.kanji_forms else "",
+        canonical_kana=entry_record.kana_forms[0] if entry_record.kana_forms else "",
+    )
+    existing = forms_by_term.setdefault(term, {})
+    for script, value in entry_forms.items():
+        if script not in existing and value:
+            existing[script] = value
 
 
 def load_jmdict_lemmas(
@@ -202,26 +233,24 @@ def load_jmdict_lemmas(
     *,
     include_kana: bool = True,
     include_kanji: bool = True,
+    targets: Optional[Iterable[str]] = None,
 ) -> set[str]:
+    if targets is not None:
+        from lexishift_core.resources.jmdict_index import open_jmdict_index
+
+        index = open_jmdict_index(path)
+        if index is not None:
+            with index:
+                return index.known_lemmas(targets, include_kana=include_kana, include_kanji=include_kanji)
     lemmas: set[str] = set()
-    if not path.exists():
-        return lemmas
-    try:
-        context = ElementTree.iterparse(path, events=("end",))
-    except (ElementTree.ParseError, OSError):
-        return lemmas
-    for _event, elem in context:
-        if elem.tag != "entry":
-            continue
+    wanted = set(targets) if targets is not None else None
+    for entry_record in iter_jmdict_entries(path, languages=()):
         if include_kanji:
-            for keb in elem.findall("k_ele/keb"):
-                if keb.text and keb.text.strip():
-                    lemmas.add(keb.text.strip())
+            lemmas.update(entry_record.kanji_forms)
         if include_kana:
-            for reb in elem.findall("r_ele/reb"):
-                if reb.text and reb.text.strip():
-                    lemmas.add(reb.text.strip())
-        elem.clear()
+            lemmas.update(entry_record.kana_forms)
+    if wanted is not None:
+        lemmas &= wanted
     return lemmas
 
 
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import Any, Optional
+
+try:  # NumPy is optional; see embedding_matrix.
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+ANN_SUFFIX = ".ivf.npz"
+IVF_VERSION = 1
+DEFAULT_NPROBE = 16
+_ASSIGN_CHUNK = 65_536
+
+
+def embedding_ann_path(matrix_path: Path) -> Path:
+    return Path(matrix_path).with_suffix(ANN_SUFFIX)
+
+
+def default_list_count(row_count: int) -> int:
+    return max(1, min(row_count, int(round(4 * math.sqrt(row_count)))))
+
+
+class IvfIndex:
+    """Inverted-file index over the unit-length rows of an ``EmbeddingMatrix``.
+
+    Rows are partitioned by their nearest k-means centroid; a query scores
+    the centroids and searches only the rows of its ``nprobe`` best lists.
+    ``nprobe`` is the recall/latency knob: probing every list is exact.
+    """
+
+    def __init__(self, centroids: Any, offsets: Any, row_ids: Any) -> None:
+        self.centroids = centroids
+        self.offsets = offsets
+        self.row_ids = row_ids
+
+    @property
+    def list_count(self) -> int:
+        return int(self.centroids.shape[0])
+
+    @property
+    def row_count(self) -> int:
+        return int(self.row_ids.shape[0])
+
+    def save(self, path: Path) -> None:
+        with Path(path).open("wb") as handle:
+            np.savez(
+                handle,
+                version=np.asarray(IVF_VERSION),
+                centroids=self.centroids,
+                offsets=self.offsets,
+                row_ids=self.row_ids,
+            )
+
+    def probe(self, queries: Any, nprobe: int) -> list[Any]:
+        """Sorted candidate row ids for each query (one row of ``queries``)."""
+        nprobe = max(1, min(int(nprobe), self.list_count))
+        centroid_scores = queries @ self.centroids.T
+        if nprobe < self.list_count:
+            lists = np.argpartition(-centroid_scores, nprobe - 1, axis=1)[:, :nprobe]
+        else:
+            lists = np.broadcast_to(np.arange(self.list_count), centroid_scores.shape)
+        candidates = []
+        for probed in lists:
+            parts = [self.row_ids[self.offsets[idx] : self.offsets[idx + 1]] for idx in probed.tolist()]
+            candidates.append(np.sort(np.concatenate(parts)))
+        return candidates
+
+
+def build_ivf_index(
+    rows: Any,
+    *,
+    list_count: Optional[int] = None,
+    iterations: int = 10,
+    sample_size: Optional[int] = None,
+    seed: int = 1337,
+) -> IvfIndex:
+    """Spherical k-means on a sample of ``rows``, then assign every row."""
+    row_count = int(rows.shape[0])
+    if row_count == 0:
+        raise ValueError("Cannot build an IVF index over an empty matrix.")
+    list_count = max(1, min(list_count or default_list_count(row_count), row_count))
+    rng = np.random.default_rng(seed)
+    sample_size = min(row_count, sample_size or max(list_count * 64, 10_000))
+    sample_ids = np.sort(rng.choice(row_count, size=sample_size, replace=False))
+    sample = np.asarray(rows[sample_ids], dtype=np.float32)
+    centroids = sample[rng.choice(sample_size, size=list_count, replace=False)].copy()
+    for _ in range(max(0, iterations)):
+        assignment = _assign(sample, centroids)
+        counts = np.bincount(assignment, minlength=list_count)
+        filled = np.flatnonzero(counts)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[filled]
+        sums = np.zeros_like(centroids)
+        sums[filled] = np.add.reduceat(sample[np.argsort(assignment, kind="stable")], starts, axis=0)
+        norms = np.linalg.norm(sums, axis=1)
+        empty = norms <= 0.0
+        if empty.any():
+            # Reseed empty lists so every centroid keeps covering some rows.
+            sums[empty] = sample[rng.choice(sample_size, size=int(empty.sum()), replace=False)]
+            norms[empty] = 1.0
+        centroids = (sums / norms[:, None]).astype(np.float32)
+    assignment = np.concatenate(
+        [
+            _assign(rows[start : start + _ASSIGN_CHUNK], centroids)
+            for start in range(0, row_count, _ASSIGN_CHUNK)
+        ]
+    )
+    row_ids = np.argsort(assignment, kind="stable").astype(np.int32)
+    offsets = np.zeros(list_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(assignment, minlength=list_count), out=offsets[1:])
+    return IvfIndex(centroids, offsets, row_ids)
+
+
+def open_ivf_index(path: Path, *, row_count: int, dim: int) -> Optional[IvfIndex]:
+    """Load an index written by ``IvfIndex.save``; ``None`` when it is missing
+    or does not fit a matrix of ``row_count`` x ``dim``."""
+    if np is None:
+        return None
+    try:
+        with np.load(Path(path), allow_pickle=False) as data:
+            if int(data["version"]) != IVF_VERSION:
+                return None
+            index = IvfIndex(data["centroids"], data["offsets"], data["row_ids"])
+    except (OSError, KeyError, ValueError):
+        return None
+    if (
+        index.centroids.ndim != 2
+        or index.centroids.shape[1] != dim
+        or index.row_count != row_count
+        or index.offsets.shape[0] != index.list_count + 1
+        or int(index.offsets[-1]) != row_count
+    ):
+        return None
+    return index
+
+
+def _assign(rows: Any, centroids: Any) -> Any:
+    return np.argmax(np.asarray(rows, dtype=np.float32) @ centroids.T, axis=1)
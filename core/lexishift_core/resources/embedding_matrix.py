@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+from pathlib import Path
+import re
+import sqlite3
+from typing import Any, Iterable, Optional, Sequence
+
+from lexishift_core.resources.embedding_ann import (
+    DEFAULT_NPROBE,
+    IvfIndex,
+    embedding_ann_path,
+    open_ivf_index,
+)
+
+try:  # NumPy is optional; EmbeddingIndex falls back to pure Python without it.
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+MATRIX_SUFFIX = ".npy"
+VOCAB_SUFFIX = ".vocab"
+# Queries scored per matrix product; bounds the (queries x vocabulary) score block.
+_QUERY_BATCH = 32
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+def embedding_vocab_path(matrix_path: Path) -> Path:
+    return Path(matrix_path).with_suffix(VOCAB_SUFFIX)
+
+
+class EmbeddingMatrix:
+    """Word vectors as one contiguous float32 matrix of unit-length rows.
+
+    ``rows`` is an in-memory array or a read-only memory map of a ``.npy``
+    file written by ``save``. ``norms`` keeps each row's original length so
+    multi-word terms are averaged over the raw vectors, as the pure-Python
+    index does. With ``lower_case`` several stored words can share a key;
+    the exact lowercase spelling wins, else the first row, and the other
+    rows are left out of neighbor results.
+
+    With an ``ann`` index, neighbor queries search only the rows of the
+    ``nprobe`` closest inverted lists; ``exact=True`` scores every row.
+    """
+
+    def __init__(self, words: Sequence[str], rows: Any, norms: Any, *, lower_case: bool) -> None:
+        self.words = list(words)
+        self.rows = rows
+        self.norms = norms
+        self.dim = int(rows.shape[1])
+        self._lower_case = lower_case
+        self._index: dict[str, int] = {}
+        for row, word in enumerate(self.words):
+            key = word.lower() if lower_case else word
+            current = self._index.get(key)
+            if current is None or (word == key and self.words[current] != key):
+                self._index[key] = row
+        aliases = [row for row, word in enumerate(self.words) if self._index[self._key(word)] != row]
+        self._alias_mask = None
+        if aliases:
+            self._alias_mask = np.zeros(len(self.words), dtype=bool)
+            self._alias_mask[aliases] = True
+        self._query_cache: dict[str, Optional[Any]] = {}
+        self.ann: Optional[IvfIndex] = None
+        self.nprobe = DEFAULT_NPROBE
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def save(self, path: Path) -> None:
+        """Write ``path`` (``.npy``) and its ``.vocab`` file (word and norm per line)."""
+        path = Path(path)
+        with path.open("wb") as handle:
+            np.save(handle, np.ascontiguousarray(self.rows, dtype=np.float32), allow_pickle=False)
+        with embedding_vocab_path(path).open("w", encoding="utf-8") as handle:
+            for word, norm in zip(self.words, self.norms.tolist()):
+                handle.write(f"{word}\t{norm:.9g}\n")
+
+    def query_vector(self, term: str) -> Optional[Any]:
+        """Unit vector for ``term``; hyphenated or spaced terms average their parts."""
+        key = self._key(term)
+        if key in self._query_cache:
+            return self._query_cache[key]
+        vector = None
+        row = self._index.get(key)
+        if row is not None:
+            vector = np.asarray(self.rows[row], dtype=np.float32)
+        elif " " in key or "-" in key:
+            parts = [part for part in re.split(r"[\s-]+", key) if part]
+            part_rows = [self._index.get(part) for part in parts]
+            if parts and all(part_row is not None for part_row in part_rows):
+                raw = self.rows[part_rows] * self.norms[part_rows][:, None]
+                averaged = raw.mean(axis=0)
+                norm = float(np.linalg.norm(averaged))
+                if norm > 0.0:
+                    vector = (averaged / norm).astype(np.float32)
+        self._query_cache[key] = vector
+        return vector
+
+    def similarity(self, term_a: str, term_b: str) -> Optional[float]:
+        vec_a = self.query_vector(term_a)
+        vec_b = self.query_vector(term_b)
+        if vec_a is None or vec_b is None:
+            return None
+        return float(vec_a @ vec_b)
+
+    def score_pairs(self, pairs: Sequence[tuple[str, str]]) -> list[Optional[float]]:
+        """Cosine similarity per pair; the rows of all single-word terms are
+        gathered in one indexing operation."""
+        vectors = self._gather({term for pair in pairs for term in pair})
+        scored = [
+            slot
+            for slot, (term_a, term_b) in enumerate(pairs)
+            if vectors[term_a] is not None and vectors[term_b] is not None
+        ]
+        results: list[Optional[float]] = [None] * len(pairs)
+        if scored:
+            left = np.stack([vectors[pairs[slot][0]] for slot in scored])
+            right = np.stack([vectors[pairs[slot][1]] for slot in scored])
+            for slot, score in zip(scored, np.einsum("ij,ij->i", left, right).tolist()):
+                results[slot] = score
+        return results
+
+    def _gather(self, terms: Iterable[str]) -> dict[str, Optional[Any]]:
+        vectors: dict[str, Optional[Any]] = {}
+        pending: list[tuple[str, int]] = []
+        for term in terms:
+            key = self._key(term)
+            row = self._index.get(key)
+            if key in self._query_cache or row is None:
+                vectors[term] = self.query_vector(term)
+            else:
+                pending.append((term, row))
+        if pending:
+            rows = np.asarray(self.rows[np.asarray([row for _term, row in pending])], dtype=np.float32)
+            for (term, _row), vector in zip(pending, rows):
+                self._query_cache[self._key(term)] = vector
+                vectors[term] = vector
+        return vectors
+
+    def nearest_neighbors(
+        self,
+        term: str,
+        *,
+        limit: int,
+        min_score: float,
+        exact: bool = False,
+    ) -> list[tuple[str, float]]:
+        return self.nearest_neighbors_many([term], limit=limit, min_score=min_score, exact=exact)[0]
+
+    def nearest_neighbors_many(
+        self,
+        terms: Sequence[str],
+        *,
+        limit: int,
+        min_score: float,
+        exact: bool = False,
+    ) -> list[list[tuple[str, float]]]:
+        """Cosine neighbors for several terms, scored in matrix blocks."""
+        results: list[list[tuple[str, float]]] = [[] for _ in terms]
+        if limit <= 0 or not len(self.words):
+            return results
+        queries = [(slot, self.query_vector(term)) for slot, term in enumerate(terms)]
+        queries = [(slot, vector) for slot, vector in queries if vector is not None]
+        use_ann = not exact and self.ann is not None and self.nprobe < self.ann.list_count
+        for start in range(0, len(queries), _QUERY_BATCH):
+            block = queries[start : start + _QUERY_BATCH]
+            vectors = np.stack([vector for _slot, vector in block])
+            if use_ann:
+                candidates = self.ann.probe(vectors, self.nprobe)
+                for (slot, vector), rows in zip(block, candidates):
+                    scores = self.rows[rows] @ vector
+                    results[slot] = self._top(scores, rows, terms[slot], limit, min_score)
+                continue
+            for (slot, _vector), scores in zip(block, vectors @ self.rows.T):
+                results[slot] = self._top(scores, None, terms[slot], limit, min_score)
+        return results
+
+    def _top(
+        self,
+        scores: Any,
+        rows: Optional[Any],
+        term: str,
+        limit: int,
+        min_score: float,
+    ) -> list[tuple[str, float]]:
+        """Best ``limit`` of ``scores``, which cover ``rows`` (all rows when ``None``)."""
+        own_row = self._index.get(self._key(term))
+        if rows is None:
+            if self._alias_mask is not None:
+                scores[self._alias_mask] = -np.inf
+            if own_row is not None:
+                scores[own_row] = -np.inf
+        else:
+            if self._alias_mask is not None:
+                scores[self._alias_mask[rows]] = -np.inf
+            if own_row is not None:
+                scores[rows == own_row] = -np.inf
+        count = min(limit, scores.shape[0])
+        if count <= 0:
+            return []
+        top = np.argpartition(-scores, count - 1)[:count]
+        top = top[np.lexsort((top, -scores[top]))]
+        neighbors: list[tuple[str, float]] = []
+        for position in top.tolist():
+            score = float(scores[position])
+            if not np.isfinite(score) or score < min_score:
+                break
+            row = position if rows is None else int(rows[position])
+            neighbors.append((self._key(self.words[row]), score))
+        return neighbors
+
+    def _key(self, word: str) -> str:
+        return word.lower() if self._lower_case else word
+
+
+def open_embedding_matrix(path: Path, *, lower_case: bool) -> Optional[EmbeddingMatrix]:
+    """Memory-map a matrix written by ``EmbeddingMatrix.save``, with its IVF
+    index when one was built; ``None`` when NumPy is missing or the files are
+    absent or inconsistent."""
+    if np is None:
+        return None
+    vocab_path = embedding_vocab_path(path)
+    try:
+        rows = np.load(Path(path), mmap_mode="r", allow_pickle=False)
+        lines = vocab_path.read_text(encoding="utf-8").splitlines()
+    except (OSError, ValueError):
+        return None
+    if rows.ndim != 2 or rows.dtype != np.float32 or rows.shape[0] != len(lines):
+        return None
+    words: list[str] = []
+    norms = np.empty(len(lines), dtype=np.float32)
+    for idx, line in enumerate(lines):
+        word, _sep, norm = line.rpartition("\t")
+        try:
+            norms[idx] = float(norm)
+        except ValueError:
+            return None
+        words.append(word)
+    matrix = EmbeddingMatrix(words, rows, norms, lower_case=lower_case)
+    matrix.ann = open_ivf_index(embedding_ann_path(path), row_count=len(words), dim=matrix.dim)
+    return matrix
+
+
+def load_text_embedding_matrix(paths: Iterable[Path], *, lower_case: bool) -> Optional[EmbeddingMatrix]:
+    """Build a matrix from ``.vec``/``.txt`` files; later duplicates win."""
+    if np is None:
+        return None
+    builder = _MatrixBuilder(lower_case=lower_case)
+    for path in paths:
+        with Path(path).open("r", encoding="utf-8", errors="ignore") as handle:
+            first_line = handle.readline()
+            if not first_line:
+                continue
+            parts = first_line.split()
+            if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
+                if builder.dim is None:
+                    builder.dim = int(parts[1])
+            else:
+                builder.add_text(parts)
+            for line in handle:
+                builder.add_text(line.split())
+    return builder.build()
+
+
+def load_word2vec_embedding_matrix(path: Path, *, lower_case: bool) -> Optional[EmbeddingMatrix]:
+    """Build a matrix from a word2vec binary file."""
+    if np is None:
+        return None
+    from lexishift_core.resources.synonyms import _read_binary_word
+
+    builder = _MatrixBuilder(lower_case=lower_case)
+    with Path(path).open("rb") as handle:
+        parts = handle.readline().split()
+        if len(parts) < 2 or not parts[0].isdigit() or not parts[1].isdigit():
+            return builder.build()
+        vocab_size, builder.dim = int(parts[0]), int(parts[1])
+        byte_count = builder.dim * 4
+        for _ in range(vocab_size):
+            word = _read_binary_word(handle)
+            if not word:
+                break
+            data = handle.read(byte_count)
+            if len(data) != byte_count:
+                break
+            builder.add(word, np.frombuffer(data, dtype="<f4"))
+    return builder.build()
+
+
+def load_sqlite_embedding_matrix(path: Path, *, lower_case: bool) -> Optional[EmbeddingMatrix]:
+    """Build a matrix from a ``convert_embeddings.py`` SQLite file."""
+    if np is None:
+        return None
+    builder = _MatrixBuilder(lower_case=False)
+    conn = sqlite3.connect(Path(path))
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'dim' LIMIT 1").fetchone()
+        if row and str(row[0]).isdigit():
+            builder.dim = int(row[0])
+        for word, blob in conn.execute("SELECT word, vector FROM vectors ORDER BY rowid"):
+            if blob:
+                builder.add(word, np.frombuffer(blob, dtype="<f4"))
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+    matrix = builder.build()
+    if matrix is None:
+        return None
+    return EmbeddingMatrix(matrix.words, matrix.rows, matrix.norms, lower_case=lower_case)
+
+
+class _MatrixBuilder:
+    def __init__(self, *, lower_case: bool) -> None:
+        self.dim: Optional[int] = None
+        self._lower_case = lower_case
+        self._slots: dict[str, int] = {}
+        self._words: list[str] = []
+        self._vectors: list[Any] = []
+
+    def add_text(self, parts: list[str]) -> None:
+        if len(parts) < 2:
+            return
+        try:
+            values = np.asarray(parts[1:], dtype=np.float32)
+        except ValueError:
+            return
+        self.add(parts[0], values)
+
+    def add(self, word: str, values: Any) -> None:
+        if not word or "\t" in word or "\n" in word:
+            return
+        if self.dim is None:
+            self.dim = int(values.shape[0])
+        if values.shape[0] != self.dim:
+            return
+        if self._lower_case:
+            word = word.lower()
+        slot = self._slots.get(word)
+        if slot is None:
+            self._slots[word] = len(self._words)
+            self._words.append(word)
+            self._vectors.append(values)
+        else:
+            self._vectors[slot] = values
+
+    def build(self) -> Optional[EmbeddingMatrix]:
+        if self.dim is None:
+            return None
+        if not self._vectors:
+            rows = np.zeros((0, self.dim), dtype=np.float32)
+            return EmbeddingMatrix([], rows, np.zeros(0, dtype=np.float32), lower_case=self._lower_case)
+        rows = np.stack(self._vectors).astype(np.float32, copy=False)
+        norms = np.linalg.norm(rows, axis=1)
+        keep = norms > 0.0
+        words = [word for word, kept in zip(self._words, keep.tolist()) if kept]
+        rows = np.ascontiguousarray(rows[keep] / norms[keep][:, None], dtype=np.float32)
+        return EmbeddingMatrix(words, rows, norms[keep].astype(np.float32), lower_case=self._lower_case)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from pathlib import Path
+import sqlite3
+from typing import Iterable, Iterator, Optional
+
+_LOOKUP_BATCH_SIZE = 500
+_REQUIRED_COLUMNS = {"headword", "headword_lc", "translation", "translation_lc", "rank"}
+
+
+class FreedictSqliteLookup(Mapping):
+    """Lazy ``headword -> translations`` view over a converted FreeDict SQLite file.
+
+    Lookups run per target (batched ``IN (...)`` queries through ``prefetch``)
+    and are cached, so memory scales with the targets rather than the
+    dictionary. Translation order matches ``load_freedict_sqlite_glosses_ordered``.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = Path(path)
+        self._conn = sqlite3.connect(self._path)
+        self._cache: dict[str, Optional[list[str]]] = {}
+        self._gloss_forms: Optional[FreedictGlossForms] = None
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "FreedictSqliteLookup":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def gloss_forms(self) -> "FreedictGlossForms":
+        if self._gloss_forms is None:
+            self._gloss_forms = FreedictGlossForms(self._conn)
+        return self._gloss_forms
+
+    def prefetch(self, terms: Iterable[str]) -> None:
+        missing = [term for term in dict.fromkeys(terms) if term not in self._cache]
+        for start in range(0, len(missing), _LOOKUP_BATCH_SIZE):
+            batch = missing[start : start + _LOOKUP_BATCH_SIZE]
+            found: dict[str, list[str]] = {}
+            rows = self._conn.execute(
+                "SELECT headword, translation FROM entries "
+                f"WHERE headword IN ({', '.join('?' for _ in batch)}) "
+                "ORDER BY headword_lc, rank, headword",
+                batch,
+            )
+            for headword, translation in rows:
+                translation_text = str(translation or "").strip()
+                if not translation_text:
+                    continue
+                bucket = found.setdefault(headword, [])
+                if translation_text not in bucket:
+                    bucket.append(translation_text)
+            for term in batch:
+                self._cache[term] = found.get(term)
+
+    def __getitem__(self, term: str) -> list[str]:
+        if term not in self._cache:
+            self.prefetch((term,))
+        glosses = self._cache[term]
+        if glosses is None:
+            raise KeyError(term)
+        return glosses
+
+    def __contains__(self, term: object) -> bool:
+        if not isinstance(term, str):
+            return False
+        if term not in self._cache:
+            self.prefetch((term,))
+        return self._cache[term] is not None
+
+    def __iter__(self) -> Iterator[str]:
+        rows = self._conn.execute("SELECT DISTINCT headword FROM entries ORDER BY headword")
+        return (headword for (headword,) in rows)
+
+    def __len__(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(DISTINCT headword) FROM entries").fetchone()[0])
+
+
+class FreedictGlossForms:
+    """Membership view of lower-cased translations (``translation_lc``), for
+    ``InflectionArtifactFilter``."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+        self._has_rows: Optional[bool] = None
+
+    def __contains__(self, form: object) -> bool:
+        if not isinstance(form, str):
+            return False
+        row = self._conn.execute(
+            "SELECT 1 FROM entries WHERE translation_lc = ? LIMIT 1",
+            (form,),
+        ).fetchone()
+        return row is not None
+
+    def __bool__(self) -> bool:
+        if self._has_rows is None:
+            self._has_rows = self._conn.execute("SELECT 1 FROM entries LIMIT 1").fetchone() is not None
+        return self._has_rows
+
+
+def open_freedict_sqlite_lookup(path: Path) -> Optional[FreedictSqliteLookup]:
+    """Return a lazy lookup for a converted FreeDict SQLite file, or ``None``
+    when ``path`` is not one (TEI XML, missing file, unexpected schema)."""
+    path = Path(path)
+    if not path.is_file():
+        return None
+    try:
+        with path.open("rb") as handle:
+            if not handle.read(16).startswith(b"SQLite format 3"):
+                return None
+        lookup = FreedictSqliteLookup(path)
+        columns = {row[1] for row in lookup._conn.execute("PRAGMA table_info(entries)")}
+    except (OSError, sqlite3.Error):
+        return None
+    if not _REQUIRED_COLUMNS.issubset(columns):
+        lookup.close()
+        return None
+    return lookup
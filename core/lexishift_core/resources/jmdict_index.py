@@ -0,0 +1,356 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+import json
+import os
+from pathlib import Path
+import sqlite3
+from typing import Iterable, Iterator, Optional
+
+from lexishift_core.resources.dict_loaders import (
+    JmdictEntryRecord,
+    add_jmdict_term_entry,
+    iter_jmdict_entries,
+)
+
+# Bump when the schema or the XML extraction rules change.
+JMDICT_INDEX_VERSION = 1
+JMDICT_INDEX_SUFFIX = ".index.sqlite3"
+
+KIND_KANJI = 0
+KIND_KANA = 1
+
+_LOOKUP_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE entries (
+    entry_id INTEGER PRIMARY KEY,
+    kanji_forms TEXT NOT NULL,
+    kana_forms TEXT NOT NULL,
+    glosses TEXT NOT NULL,
+    gloss_count INTEGER NOT NULL
+);
+CREATE TABLE terms (
+    term TEXT NOT NULL,
+    kind INTEGER NOT NULL,
+    entry_id INTEGER NOT NULL
+);
+CREATE TABLE gloss_forms (
+    form TEXT PRIMARY KEY
+) WITHOUT ROWID;
+"""
+
+_INDEXES = """
+CREATE INDEX terms_term ON terms (term, entry_id, kind);
+"""
+
+
+def jmdict_index_path(path: Path) -> Path:
+    return path.with_name(path.name + JMDICT_INDEX_SUFFIX)
+
+
+def jmdict_source_key(path: Path, *, languages: Iterable[str] = ("eng", "en")) -> Optional[str]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    allowed = ",".join(sorted({lang.lower() for lang in languages}))
+    return f"v{JMDICT_INDEX_VERSION}|{path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}|{allowed}"
+
+
+class JmdictIndex:
+    """Read-only SQLite index of one JMdict XML file.
+
+    Terms map to entry records in document order, so per-term lookups give
+    the same entries, glosses and script forms as the full XML loaders.
+    """
+
+    def __init__(self, index_path: Path) -> None:
+        self._path = index_path
+        self._conn = sqlite3.connect(f"file:{index_path}?mode=ro", uri=True)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "JmdictIndex":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def source_key(self) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'source_key';").fetchone()
+        return str(row[0]) if row else None
+
+    def lookup(
+        self,
+        terms: Iterable[str],
+        *,
+        include_kana: bool = True,
+        include_kanji: bool = True,
+    ) -> tuple[dict[str, list[JmdictEntryRecord]], dict[str, list[str]], dict[str, dict[str, str]]]:
+        entries_by_term: dict[str, list[JmdictEntryRecord]] = {}
+        mapping: dict[str, list[str]] = {}
+        forms_by_term: dict[str, dict[str, str]] = {}
+        kinds = _kinds(include_kana=include_kana, include_kanji=include_kanji)
+        if not kinds:
+            return entries_by_term, mapping, forms_by_term
+        records: dict[int, JmdictEntryRecord] = {}
+        for batch in _batches(terms):
+            rows = self._conn.execute(
+                "SELECT terms.term, entries.entry_id, entries.kanji_forms, entries.kana_forms, entries.glosses "
+                "FROM terms JOIN entries ON entries.entry_id = terms.entry_id "
+                f"WHERE terms.term IN ({_placeholders(batch)}) "
+                f"AND terms.kind IN ({_placeholders(kinds)}) AND entries.gloss_count > 0 "
+                "ORDER BY terms.term, entries.entry_id, terms.kind;",
+                (*batch, *kinds),
+            )
+            for term, entry_id, kanji_forms, kana_forms, glosses in rows:
+                record = records.get(entry_id)
+                if record is None:
+                    record = JmdictEntryRecord(
+                        kanji_forms=tuple(json.loads(kanji_forms)),
+                        kana_forms=tuple(json.loads(kana_forms)),
+                        glosses=tuple(json.loads(glosses)),
+                    )
+                    records[entry_id] = record
+                add_jmdict_term_entry(
+                    term,
+                    record,
+                    entries_by_term=entries_by_term,
+                    mapping=mapping,
+                    forms_by_term=forms_by_term,
+                )
+        return entries_by_term, mapping, forms_by_term
+
+    def known_lemmas(
+        self,
+        terms: Iterable[str],
+        *,
+        include_kana: bool = True,
+        include_kanji: bool = True,
+    ) -> set[str]:
+        kinds = _kinds(include_kana=include_kana, include_kanji=include_kanji)
+        found: set[str] = set()
+        if not kinds:
+            return found
+        for batch in _batches(terms):
+            rows = self._conn.execute(
+                f"SELECT DISTINCT term FROM terms WHERE term IN ({_placeholders(batch)}) "
+                f"AND kind IN ({_placeholders(kinds)});",
+                (*batch, *kinds),
+            )
+            found.update(term for (term,) in rows)
+        return found
+
+    def has_lemma(self, term: str, *, include_kana: bool = True, include_kanji: bool = True) -> bool:
+        return bool(self.known_lemmas((term,), include_kana=include_kana, include_kanji=include_kanji))
+
+    def has_gloss_form(self, form: str) -> bool:
+        row = self._conn.execute("SELECT 1 FROM gloss_forms WHERE form = ?;", (form,)).fetchone()
+        return row is not None
+
+    def gloss_form_count(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM gloss_forms;").fetchone()[0])
+
+
+class JmdictTermMapping(Mapping):
+    """Lazy ``term -> value`` view over a ``JmdictIndex``.
+
+    Missing terms are fetched on first access (or in bulk via ``prefetch``)
+    and cached, so rulegen only touches the rows for its targets. ``part`` is
+    ``entries``, ``glosses`` or ``script_forms``.
+    """
+
+    def __init__(self, index: JmdictIndex, *, part: str, cache: Optional[dict] = None) -> None:
+        if part not in ("entries", "glosses", "script_forms"):
+            raise ValueError(f"Unknown JMdict mapping part: {part}")
+        self._index = index
+        self._part = part
+        self._cache: dict[str, Optional[tuple]] = cache if cache is not None else {}
+
+    def prefetch(self, terms: Iterable[str]) -> None:
+        missing = [term for term in dict.fromkeys(terms) if term not in self._cache]
+        if not missing:
+            return
+        entries, mapping, forms = self._index.lookup(missing)
+        for term in missing:
+            if term in entries:
+                self._cache[term] = (entries[term], mapping[term], forms[term])
+            else:
+                self._cache[term] = None
+
+    def __getitem__(self, term: str):
+        if term not in self._cache:
+            self.prefetch((term,))
+        cached = self._cache[term]
+        if cached is None:
+            raise KeyError(term)
+        entries, glosses, forms = cached
+        if self._part == "entries":
+            return entries
+        if self._part == "glosses":
+            return glosses
+        return forms
+
+    def __iter__(self) -> Iterator[str]:
+        # Full iteration is rare (debugging); it walks every indexed term.
+        rows = self._index._conn.execute(
+            "SELECT DISTINCT terms.term FROM terms JOIN entries ON entries.entry_id = terms.entry_id "
+            "WHERE entries.gloss_count > 0 ORDER BY terms.term;"
+        )
+        return (term for (term,) in rows)
+
+    def __len__(self) -> int:
+        row = self._index._conn.execute(
+            "SELECT COUNT(DISTINCT terms.term) FROM terms JOIN entries ON entries.entry_id = terms.entry_id "
+            "WHERE entries.gloss_count > 0;"
+        ).fetchone()
+        return int(row[0])
+
+    def __contains__(self, term: object) -> bool:
+        if not isinstance(term, str):
+            return False
+        if term not in self._cache:
+            self.prefetch((term,))
+        return self._cache[term] is not None
+
+
+class JmdictLemmaSet:
+    """Membership-only view of the indexed kanji/kana forms."""
+
+    def __init__(self, index: JmdictIndex, *, include_kana: bool = True, include_kanji: bool = True) -> None:
+        self._index = index
+        self._include_kana = include_kana
+        self._include_kanji = include_kanji
+
+    def __contains__(self, term: object) -> bool:
+        if not isinstance(term, str):
+            return False
+        return self._index.has_lemma(term, include_kana=self._include_kana, include_kanji=self._include_kanji)
+
+
+class JmdictGlossForms:
+    """Membership view of lower-cased glosses, for ``InflectionArtifactFilter``."""
+
+    def __init__(self, index: JmdictIndex) -> None:
+        self._index = index
+        self._size: Optional[int] = None
+
+    def __contains__(self, form: object) -> bool:
+        return isinstance(form, str) and self._index.has_gloss_form(form)
+
+    def __len__(self) -> int:
+        if self._size is None:
+            self._size = self._index.gloss_form_count()
+        return self._size
+
+
+def open_jmdict_index(
+    path: Path,
+    *,
+    index_path: Optional[Path] = None,
+    languages: Iterable[str] = ("eng", "en"),
+) -> Optional[JmdictIndex]:
+    """Open the compiled index for ``path``, building it when missing or stale.
+
+    The index is keyed by the XML file's resolved path, mtime and size (plus
+    the gloss languages). Returns ``None`` when the source is missing or the
+    index cannot be written, so callers can fall back to parsing the XML.
+    """
+    path = Path(path)
+    languages = tuple(languages)
+    if not path.is_file():
+        return None
+    key = jmdict_source_key(path, languages=languages)
+    if key is None:
+        return None
+    target = index_path or jmdict_index_path(path)
+    if target.exists():
+        try:
+            index = JmdictIndex(target)
+            if index.source_key() == key:
+                return index
+            index.close()
+        except sqlite3.Error:
+            pass
+    try:
+        build_jmdict_index(path, target, languages=languages, source_key=key)
+        return JmdictIndex(target)
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def build_jmdict_index(
+    path: Path,
+    index_path: Path,
+    *,
+    languages: Iterable[str] = ("eng", "en"),
+    source_key: Optional[str] = None,
+) -> None:
+    languages = tuple(languages)
+    key = source_key or jmdict_source_key(path, languages=languages) or ""
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+    conn = sqlite3.connect(str(tmp_path))
+    try:
+        conn.executescript(_SCHEMA)
+        gloss_forms: set[str] = set()
+        entry_rows = []
+        term_rows = []
+        for entry_id, record in enumerate(iter_jmdict_entries(path, languages=languages)):
+            entry_rows.append(
+                (
+                    entry_id,
+                    json.dumps(record.kanji_forms, ensure_ascii=False),
+                    json.dumps(record.kana_forms, ensure_ascii=False),
+                    json.dumps(record.glosses, ensure_ascii=False),
+                    len(record.glosses),
+                )
+            )
+            term_rows.extend((term, KIND_KANJI, entry_id) for term in record.kanji_forms)
+            term_rows.extend((term, KIND_KANA, entry_id) for term in record.kana_forms)
+            if record.kanji_forms or record.kana_forms:
+                gloss_forms.update(str(gloss).strip().lower() for gloss in record.glosses)
+        conn.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?);", entry_rows)
+        conn.executemany("INSERT INTO terms VALUES (?, ?, ?);", term_rows)
+        conn.executemany("INSERT INTO gloss_forms VALUES (?);", ((form,) for form in gloss_forms))
+        conn.executescript(_INDEXES)
+        conn.execute("INSERT INTO meta VALUES ('source_key', ?);", (key,))
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp_path, index_path)
+
+
+def _kinds(*, include_kana: bool, include_kanji: bool) -> tuple[int, ...]:
+    kinds = []
+    if include_kanji:
+        kinds.append(KIND_KANJI)
+    if include_kana:
+        kinds.append(KIND_KANA)
+    return tuple(kinds)
+
+
+def _batches(terms: Iterable[str]) -> Iterator[list[str]]:
+    batch: list[str] = []
+    for term in dict.fromkeys(terms):
+        batch.append(term)
+        if len(batch) >= _LOOKUP_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _placeholders(values) -> str:
+    return ", ".join("?" for _ in values)
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+import sqlite3
+from typing import Callable, Iterable, Mapping, Optional, Sequence
+
+# Bump when a thesaurus loader changes what it produces for the same file.
+SYNONYM_STORE_VERSION = 1
+_LOOKUP_BATCH_SIZE = 500
+# Keys whose synonym set is empty are kept (they count as entries) under
+# this synonym, which no loader produces.
+_EMPTY = ""
+
+
+def source_fingerprint(path: Path, *, extra: str = "") -> str:
+    """Digest of a source file, or of the files directly inside a source
+    directory: resolved path, mtime and size."""
+    path = Path(path)
+    parts = [f"v{SYNONYM_STORE_VERSION}", extra]
+    files = sorted(item for item in path.iterdir() if item.is_file()) if path.is_dir() else [path]
+    for item in files:
+        try:
+            stat = item.stat()
+        except OSError:
+            parts.append(f"{item}|missing")
+            continue
+        parts.append(f"{item.resolve()}|{stat.st_mtime_ns}|{stat.st_size}")
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class SynonymStore:
+    """Parsed thesaurus sources compiled into one SQLite file.
+
+    Each source is stored as ``(source, key, synonym)`` rows with the
+    fingerprint of the file it came from; ``ensure`` reparses a source only
+    when that fingerprint changes. ``lookup`` then answers per-key queries
+    without loading any source into memory.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sources ("
+                "source TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, entries INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS synonyms ("
+                "source TEXT NOT NULL, key TEXT NOT NULL, key_lc TEXT NOT NULL, synonym TEXT NOT NULL, "
+                "PRIMARY KEY (source, key, synonym))"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_synonyms_key ON synonyms(key)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_synonyms_key_lc ON synonyms(key_lc)")
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def ensure(
+        self,
+        source: str,
+        path: Path,
+        loader: Callable[[], Mapping[str, set[str]]],
+        *,
+        extra: str = "",
+    ) -> int:
+        """Compile ``source`` from ``loader()`` unless the stored copy matches
+        ``path``; returns the source's entry count."""
+        fingerprint = source_fingerprint(path, extra=extra)
+        entries = self.entries(source, fingerprint)
+        if entries is not None:
+            return entries
+        return self.store(source, fingerprint, loader())
+
+    def entries(self, source: str, fingerprint: str) -> Optional[int]:
+        """Entry count of ``source`` if it is stored with ``fingerprint``."""
+        row = self._conn.execute(
+            "SELECT fingerprint, entries FROM sources WHERE source = ?",
+            (source,),
+        ).fetchone()
+        if row and row[0] == fingerprint:
+            return int(row[1])
+        return None
+
+    def store(self, source: str, fingerprint: str, mapping: Mapping[str, set[str]]) -> int:
+        with self._conn:
+            self._conn.execute("DELETE FROM synonyms WHERE source = ?", (source,))
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO synonyms (source, key, key_lc, synonym) VALUES (?, ?, ?, ?)",
+                (
+                    (source, key, key.lower(), synonym)
+                    for key, values in mapping.items()
+                    for synonym in (values or (_EMPTY,))
+                ),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sources (source, fingerprint, entries) VALUES (?, ?, ?)",
+                (source, fingerprint, len(mapping)),
+            )
+        return len(mapping)
+
+    def fingerprint(self, source: str) -> Optional[str]:
+        row = self._conn.execute("SELECT fingerprint FROM sources WHERE source = ?", (source,)).fetchone()
+        return str(row[0]) if row else None
+
+    def lookup(self, sources: Sequence[str], *, lower_case: bool, min_sources: int = 1) -> "SynonymStoreLookup":
+        return SynonymStoreLookup(self._conn, sources, lower_case=lower_case, min_sources=min_sources)
+
+
+class SynonymStoreLookup:
+    """Merged synonyms of several stored sources, resolved per key.
+
+    Matches merging the parsed mappings in memory: keys and synonyms are
+    lowercased when ``lower_case`` is set, and with ``min_sources`` > 1 a
+    synonym is kept only when that many sources list it for the same head.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        sources: Sequence[str],
+        *,
+        lower_case: bool,
+        min_sources: int,
+    ) -> None:
+        self._conn = conn
+        self._sources = list(dict.fromkeys(sources))
+        self._lower_case = lower_case
+        self._min_sources = max(1, int(min_sources))
+        self._cache: dict[str, set[str]] = {}
+        self._size: Optional[int] = None
+
+    def __len__(self) -> int:
+        if self._size is None:
+            self._size = self._count_keys()
+        return self._size
+
+    def get(self, key: str) -> set[str]:
+        if key not in self._cache:
+            self.prefetch([key])
+        return self._cache[key]
+
+    def prefetch(self, keys: Iterable[str]) -> None:
+        missing = [key for key in dict.fromkeys(keys) if key not in self._cache]
+        column = "key_lc" if self._lower_case else "key"
+        source_marks = ", ".join("?" for _ in self._sources)
+        for start in range(0, len(missing), _LOOKUP_BATCH_SIZE):
+            batch = missing[start : start + _LOOKUP_BATCH_SIZE]
+            heads: dict[str, dict[str, dict[str, int]]] = {key: {} for key in batch}
+            if self._sources:
+                rows = self._conn.execute(
+                    f"SELECT {column}, key, synonym FROM synonyms "
+                    f"WHERE {column} IN ({', '.join('?' for _ in batch)}) AND source IN ({source_marks})",
+                    [*batch, *self._sources],
+                )
+                for lookup_key, head, synonym in rows:
+                    counts = heads[lookup_key].setdefault(head, {})
+                    if synonym != _EMPTY:
+                        counts[synonym] = counts.get(synonym, 0) + 1
+            for key, by_head in heads.items():
+                merged: set[str] = set()
+                for counts in by_head.values():
+                    merged.update(synonym for synonym, count in counts.items() if count >= self._min_sources)
+                self._cache[key] = {synonym.lower() for synonym in merged} if self._lower_case else merged
+
+    def _count_keys(self) -> int:
+        if not self._sources:
+            return 0
+        column = "key_lc" if self._lower_case else "key"
+        source_marks = ", ".join("?" for _ in self._sources)
+        if self._min_sources <= 1:
+            row = self._conn.execute(
+                f"SELECT COUNT(DISTINCT {column}) FROM synonyms WHERE source IN ({source_marks})",
+                self._sources,
+            ).fetchone()
+        else:
+            row = self._conn.execute(
+                f"SELECT COUNT(DISTINCT head) FROM ("
+                f"SELECT {column} AS head FROM synonyms "
+                f"WHERE source IN ({source_marks}) AND synonym != ? "
+                f"GROUP BY key, synonym HAVING COUNT(*) >= ?)",
+                [*self._sources, _EMPTY, self._min_sources],
+            ).fetchone()
+        return int(row[0]) if row else 0
@@ -1,18 +1,33 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 import heapq
 import json
 import math
+import os
 import re
 import sqlite3
 import struct
+import time
 from pathlib import Path
-from typing import Iterable, Mapping, Optional, Sequence
+from typing import Callable, Iterable, Iterator, Mapping, Optional, Sequence
 from xml.etree import ElementTree
 
 from lexishift_core.resources.db_handlers import load_synonyms_from_db
 from lexishift_core.resources.dict_loaders import load_jmdict_glosses
+from lexishift_core.resources.embedding_matrix import (
+    MATRIX_SUFFIX,
+    EmbeddingMatrix,
+    load_text_embedding_matrix,
+    load_word2vec_embedding_matrix,
+    numpy_available,
+    open_embedding_matrix,
+)
+from lexishift_core.resources.synonym_store import SynonymStore, SynonymStoreLookup, source_fingerprint
+
+# (store id, stats key, path, loader, loader kwargs) for one selected source.
+_SourceSpec = tuple[str, str, Path, Callable[..., Mapping[str, set[str]]], dict]
 
 @dataclass(frozen=True)
 class SynonymSources:
@@ -39,6 +54,16 @@ class SynonymOptions:
     embedding_pair: Optional[str] = None
     embedding_threshold: float = 0.0
     embedding_fallback: bool = True
+    # Inverted lists probed per fallback query when the matrix has an IVF
+    # index; 0 keeps the default. Higher is slower with better recall.
+    embedding_nprobe: int = 0
+    # SQLite file of compiled sources (see synonym_store). When set, each
+    # source is parsed once per file version and synonyms are looked up per
+    # word instead of being merged in memory.
+    store_path: Optional[Path] = None
+    # Processes used to parse sources when several need parsing; 0 picks
+    # one per source (up to the CPU count), 1 parses them in this process.
+    load_workers: int = 0
 
 
 class SynonymGenerator:
@@ -57,10 +82,18 @@ class SynonymGenerator:
             "freedict_de_en": 0,
             "freedict_en_de": 0,
         }
+        self._load_seconds: dict[str, float] = {}
         self._embeddings: Optional[EmbeddingIndex] = None
+        self._store: Optional[SynonymStore] = None
+        self._store_lookup: Optional[SynonymStoreLookup] = None
         self._load_sources()
         self._load_embeddings()
 
+    def close(self) -> None:
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
     def synonyms_for(self, word: str) -> list[str]:
         return self._synonyms_for_detail(word)[0]
 
@@ -80,57 +113,84 @@ class SynonymGenerator:
             return False
         return self._embeddings.has_vector(word)
 
+    def synonyms_for_details(self, words: Sequence[str]) -> list[tuple[list[str], bool]]:
+        """``synonyms_for_detail`` for many words, with the embedding work
+        batched: one vector prefetch, one ``score_pairs`` call and one
+        neighbor query block for the words that need the fallback."""
+        return self._synonyms_for_details(list(words))
+
     def _synonyms_for_detail(self, word: str) -> tuple[list[str], bool]:
-        key = word.lower() if self._options.lower_case else word
-        synonyms = self._synonyms.get(key, set()).copy()
-        if not self._options.include_phrases:
-            synonyms = {item for item in synonyms if " " not in item}
-        if self._options.lower_case:
-            synonyms.discard(key)
-        else:
-            synonyms.discard(word)
-        results = sorted(synonyms)
-        used_fallback = False
-        if (
-            not results
-            and self._embeddings
-            and self._options.embedding_fallback
-            and self._embeddings.supports_neighbors()
-        ):
-            neighbors = self._embeddings.nearest_neighbors(
-                key,
+        return self._synonyms_for_details([word])[0]
+
+    def _synonyms_for_details(self, words: list[str]) -> list[tuple[list[str], bool]]:
+        keys = [word.lower() if self._options.lower_case else word for word in words]
+        if self._store_lookup is not None:
+            self._store_lookup.prefetch(keys)
+        candidates: list[list[str]] = []
+        for word, key in zip(words, keys):
+            synonyms = self._source_synonyms(key)
+            if not self._options.include_phrases:
+                synonyms = {item for item in synonyms if " " not in item}
+            if self._options.lower_case:
+                synonyms.discard(key)
+            else:
+                synonyms.discard(word)
+            candidates.append(sorted(synonyms))
+        embeddings = self._embeddings
+        fallback_slots: list[int] = []
+        if embeddings and self._options.embedding_fallback and embeddings.supports_neighbors():
+            fallback_slots = [slot for slot, synonyms in enumerate(candidates) if not synonyms]
+        neighbors: dict[int, list[tuple[str, float]]] = {}
+        if fallback_slots:
+            found = embeddings.nearest_neighbors_many(
+                [keys[slot] for slot in fallback_slots],
                 limit=self._options.max_synonyms,
                 min_score=0.0,
             )
-            fallback = [word for word, _score in neighbors]
-            if not self._options.include_phrases:
-                fallback = [item for item in fallback if " " not in item]
-            results = fallback
-            used_fallback = True
-        if not used_fallback and self._embeddings and self._embeddings.has_vector(key):
-            scored = []
-            unknown: list[str] = []
-            for synonym in synonyms:
-                score = self._embeddings.similarity(key, synonym)
-                if score is None:
-                    unknown.append(synonym)
-                    continue
-                if score < self._options.embedding_threshold:
-                    continue
-                scored.append((score, synonym))
-            scored.sort(key=lambda item: (-item[0], item[1]))
-            results = [synonym for _, synonym in scored]
-            if self._options.embedding_threshold <= 0 and unknown:
-                results.extend(sorted(unknown))
-        if self._options.max_synonyms > 0:
-            results = results[: self._options.max_synonyms]
-        return results, used_fallback
+            neighbors = dict(zip(fallback_slots, found))
+        scored_slots: list[int] = []
+        if embeddings:
+            open_slots = [slot for slot in range(len(keys)) if slot not in neighbors]
+            embeddings.prefetch(
+                [keys[slot] for slot in open_slots]
+                + [synonym for slot in open_slots for synonym in candidates[slot]]
+            )
+            scored_slots = [slot for slot in open_slots if embeddings.has_vector(keys[slot])]
+        pairs = [(keys[slot], synonym) for slot in scored_slots for synonym in candidates[slot]]
+        pair_scores = iter(embeddings.score_pairs(pairs) if pairs else ())
+        scores = {slot: [next(pair_scores) for _ in candidates[slot]] for slot in scored_slots}
+        details: list[tuple[list[str], bool]] = []
+        for slot, synonyms in enumerate(candidates):
+            results = synonyms
+            used_fallback = slot in neighbors
+            if used_fallback:
+                results = [word for word, _score in neighbors[slot]]
+                if not self._options.include_phrases:
+                    results = [item for item in results if " " not in item]
+            elif slot in scores:
+                scored = []
+                unknown: list[str] = []
+                for synonym, score in zip(synonyms, scores[slot]):
+                    if score is None:
+                        unknown.append(synonym)
+                        continue
+                    if score < self._options.embedding_threshold:
+                        continue
+                    scored.append((score, synonym))
+                scored.sort(key=lambda item: (-item[0], item[1]))
+                results = [synonym for _, synonym in scored]
+                if self._options.embedding_threshold <= 0 and unknown:
+                    results.extend(unknown)
+            if self._options.max_synonyms > 0:
+                results = results[: self._options.max_synonyms]
+            details.append((results, used_fallback))
+        return details
 
     def generate_rules(self, targets: Iterable[str], *, avoid_duplicates: bool = True) -> list[tuple[str, str]]:
         seen_sources: set[str] = set()
         rules: list[tuple[str, str]] = []
-        for target in targets:
-            synonyms = self.synonyms_for(target)
+        targets = list(targets)
+        for target, (synonyms, _used_fallback) in zip(targets, self.synonyms_for_details(targets)):
             for synonym in synonyms:
                 if avoid_duplicates and synonym in seen_sources:
                     continue
@@ -139,62 +199,120 @@ class SynonymGenerator:
         return rules
 
     def total_entries(self) -> int:
+        if self._store_lookup is not None:
+            return len(self._store_lookup)
         return len(self._synonyms)
 
     def stats(self) -> dict[str, int]:
-        return dict(self._stats)
+        """Entry count per source, plus ``<source>_load_ms`` for each source
+        loaded (parse time, or the store check when nothing changed)."""
+        stats = dict(self._stats)
+        for stat_key, elapsed in self._load_seconds.items():
+            stats[f"{stat_key}_load_ms"] = int(round(elapsed * 1000.0))
+        return stats
+
+    def _source_synonyms(self, key: str) -> set[str]:
+        if self._store_lookup is not None:
+            return set(self._store_lookup.get(key))
+        return self._synonyms.get(key, set()).copy()
+
+    def _source_specs(self) -> list[_SourceSpec]:
+        sources = self._sources
+        specs: list[_SourceSpec] = []
+        if sources.moby_path:
+            specs.append(("moby", "moby", sources.moby_path, _load_moby_thesaurus, {}))
+        if sources.wordnet_dir:
+            specs.append(("wordnet", "wordnet", sources.wordnet_dir, _load_wordnet, {}))
+        if sources.openthesaurus_path:
+            specs.append(
+                ("openthesaurus", "openthesaurus", sources.openthesaurus_path, _load_openthesaurus, {})
+            )
+        if sources.odenet_path:
+            specs.append(("odenet", "odenet", sources.odenet_path, _load_odenet, {}))
+        if sources.jp_wordnet_path:
+            specs.append(("jp_wordnet", "jp_wordnet", sources.jp_wordnet_path, _load_jp_wordnet, {}))
+        if sources.jp_wordnet_sqlite_path:
+            specs.append(
+                ("jp_wordnet_sqlite", "jp_wordnet", sources.jp_wordnet_sqlite_path, load_synonyms_from_db, {})
+            )
+        if sources.jmdict_path:
+            specs.append(("jmdict", "jmdict", sources.jmdict_path, _load_jmdict, {}))
+        if sources.cc_cedict_path:
+            specs.append(("cc_cedict", "cc_cedict", sources.cc_cedict_path, _load_cc_cedict, {}))
+        if sources.freedict_de_en_path:
+            specs.append(
+                (
+                    "freedict_de_en",
+                    "freedict_de_en",
+                    sources.freedict_de_en_path,
+                    _load_freedict_tei,
+                    {"target_lang": "en"},
+                )
+            )
+        if sources.freedict_en_de_path:
+            specs.append(
+                (
+                    "freedict_en_de",
+                    "freedict_en_de",
+                    sources.freedict_en_de_path,
+                    _load_freedict_tei,
+                    {"target_lang": "de"},
+                )
+            )
+        return specs
 
     def _load_sources(self) -> None:
-        mappings: list[Mapping[str, set[str]]] = []
-        if self._sources.moby_path:
-            source_mapping = _load_moby_thesaurus(self._sources.moby_path)
-            self._stats["moby"] = len(source_mapping)
-            mappings.append(source_mapping)
-        if self._sources.wordnet_dir:
-            source_mapping = _load_wordnet(self._sources.wordnet_dir)
-            self._stats["wordnet"] = len(source_mapping)
-            mappings.append(source_mapping)
-        if self._sources.openthesaurus_path:
-            source_mapping = _load_openthesaurus(self._sources.openthesaurus_path)
-            self._stats["openthesaurus"] = len(source_mapping)
-            mappings.append(source_mapping)
-        if self._sources.odenet_path:
-            source_mapping = _load_odenet(self._sources.odenet_path)
-            self._stats["odenet"] = len(source_mapping)
-            mappings.append(source_mapping)
-        if self._sources.jp_wordnet_path:
-            source_mapping = _load_jp_wordnet(self._sources.jp_wordnet_path)
-            self._stats["jp_wordnet"] = len(source_mapping)
-            mappings.append(source_mapping)
-        if self._sources.jp_wordnet_sqlite_path:
-            source_mapping = load_synonyms_from_db(self._sources.jp_wordnet_sqlite_path)
-            self._stats["jp_wordnet"] += len(source_mapping)
-            mappings.append(source_mapping)
-        if self._sources.jmdict_path:
-            source_mapping = _load_jmdict(self._sources.jmdict_path)
-            self._stats["jmdict"] = len(source_mapping)
-            mappings.append(source_mapping)
-        if self._sources.cc_cedict_path:
-            source_mapping = _load_cc_cedict(self._sources.cc_cedict_path)
-            self._stats["cc_cedict"] = len(source_mapping)
-            mappings.append(source_mapping)
-        if self._sources.freedict_de_en_path:
-            source_mapping = _load_freedict_tei(self._sources.freedict_de_en_path, target_lang="en")
-            self._stats["freedict_de_en"] = len(source_mapping)
-            mappings.append(source_mapping)
-        if self._sources.freedict_en_de_path:
-            source_mapping = _load_freedict_tei(self._sources.freedict_en_de_path, target_lang="de")
-            self._stats["freedict_en_de"] = len(source_mapping)
-            mappings.append(source_mapping)
-        if not mappings:
+        specs = self._source_specs()
+        if self._options.store_path:
+            self._load_store(specs)
+            return
+        if not specs:
             return
-        if self._options.require_consensus and len(mappings) > 1:
-            consensus = _apply_consensus_filter(mappings, min_sources=len(mappings))
+        mappings = self._parsed_mappings(specs)
+        if self._options.require_consensus and len(specs) > 1:
+            consensus = _apply_consensus_filter(mappings, min_sources=len(specs), source_count=len(specs))
             self._merge(consensus)
             return
         for mapping in mappings:
             self._merge(mapping)
 
+    def _parsed_mappings(self, specs: list[_SourceSpec]) -> Iterator[Mapping[str, set[str]]]:
+        # Mappings arrive in spec order, so merging is deterministic however
+        # the workers finish, and each one can be dropped once merged.
+        for (mapping, elapsed), (_source_id, stat_key, *_rest) in zip(
+            _load_source_mappings(specs, workers=self._options.load_workers),
+            specs,
+        ):
+            self._stats[stat_key] += len(mapping)
+            self._load_seconds[stat_key] = self._load_seconds.get(stat_key, 0.0) + elapsed
+            yield mapping
+
+    def _load_store(self, specs: list[_SourceSpec]) -> None:
+        store = SynonymStore(Path(self._options.store_path))
+        self._store = store
+        stale: list[tuple[_SourceSpec, str]] = []
+        for spec in specs:
+            source_id, stat_key, path, _loader, kwargs = spec
+            started = time.perf_counter()
+            fingerprint = source_fingerprint(path, extra=json.dumps(kwargs, sort_keys=True))
+            entries = store.entries(source_id, fingerprint)
+            self._load_seconds[stat_key] = self._load_seconds.get(stat_key, 0.0) + time.perf_counter() - started
+            if entries is None:
+                stale.append((spec, fingerprint))
+            else:
+                self._stats[stat_key] += entries
+        for mapping, (spec, fingerprint) in zip(
+            self._parsed_mappings([spec for spec, _fingerprint in stale]),
+            stale,
+        ):
+            store.store(spec[0], fingerprint, mapping)
+        min_sources = len(specs) if self._options.require_consensus and len(specs) > 1 else 1
+        self._store_lookup = self._store.lookup(
+            [source_id for source_id, *_rest in specs],
+            lower_case=self._options.lower_case,
+            min_sources=min_sources,
+        )
+
     def _merge(self, mapping: Mapping[str, set[str]]) -> None:
         for key, values in mapping.items():
             if self._options.lower_case:
@@ -212,7 +330,11 @@ class SynonymGenerator:
         existing = [path for path in paths if path.exists()]
         if not existing:
             return
-        self._embeddings = EmbeddingIndex(existing, lower_case=self._options.lower_case)
+        self._embeddings = EmbeddingIndex(
+            existing,
+            lower_case=self._options.lower_case,
+            nprobe=self._options.embedding_nprobe or None,
+        )
 
 
 def _load_moby_thesaurus(path: Path) -> dict[str, set[str]]:
@@ -470,11 +592,50 @@ def _load_wordnet_json(paths: Iterable[Path]) -> dict[str, set[str]]:
     return mapping
 
 
+def _load_source(
+    loader: Callable[..., Mapping[str, set[str]]],
+    path: Path,
+    kwargs: dict,
+) -> tuple[Mapping[str, set[str]], float]:
+    started = time.perf_counter()
+    mapping = loader(Path(path), **kwargs)
+    return mapping, time.perf_counter() - started
+
+
+def _load_source_mappings(
+    specs: Sequence[_SourceSpec],
+    *,
+    workers: int = 0,
+) -> Iterator[tuple[Mapping[str, set[str]], float]]:
+    """Parse each source, in a process pool when there is more than one;
+    results come back in ``specs`` order with their parse time."""
+    worker_count = max(1, min(workers or os.cpu_count() or 1, len(specs)))
+    if worker_count == 1:
+        for _source_id, _stat_key, path, loader, kwargs in specs:
+            yield _load_source(loader, path, kwargs)
+        return
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        yield from executor.map(
+            _load_source,
+            [loader for *_head, loader, _kwargs in specs],
+            [path for _source_id, _stat_key, path, *_tail in specs],
+            [kwargs for *_head, kwargs in specs],
+        )
+
+
 def _apply_consensus_filter(
     mappings: Iterable[Mapping[str, set[str]]],
     *,
     min_sources: int,
+    source_count: Optional[int] = None,
 ) -> dict[str, set[str]]:
+    """Synonyms listed for the same head by at least ``min_sources`` of the
+    mappings, counted one mapping at a time.
+
+    With ``source_count`` known, counts that can no longer reach
+    ``min_sources`` are dropped as the mappings stream in, so requiring
+    every source keeps at most the first source's pairs in memory.
+    """
     if min_sources <= 1:
         merged: dict[str, set[str]] = {}
         for mapping in mappings:
@@ -483,11 +644,31 @@ def _apply_consensus_filter(
                 bucket.update(values)
         return merged
     counts: dict[str, dict[str, int]] = {}
-    for mapping in mappings:
+    for seen, mapping in enumerate(mappings, start=1):
+        remaining = None if source_count is None else source_count - seen
+        # A pair first seen now can still reach min_sources only if enough
+        # mappings are left to list it.
+        can_start = remaining is None or remaining + 1 >= min_sources
         for head, synonyms in mapping.items():
-            head_counts = counts.setdefault(head, {})
+            head_counts = counts.get(head)
+            if head_counts is None:
+                if not can_start:
+                    continue
+                head_counts = counts[head] = {}
             for synonym in synonyms:
-                head_counts[synonym] = head_counts.get(synonym, 0) + 1
+                count = head_counts.get(synonym)
+                if count is not None:
+                    head_counts[synonym] = count + 1
+                elif can_start:
+                    head_counts[synonym] = 1
+        needed = 0 if remaining is None else min_sources - remaining
+        if needed > 1:
+            for head in list(counts):
+                head_counts = counts[head]
+                for synonym in [synonym for synonym, count in head_counts.items() if count < needed]:
+                    del head_counts[synonym]
+                if not head_counts:
+                    del counts[head]
     consensus: dict[str, set[str]] = {}
     for head, head_counts in counts.items():
         filtered = {synonym for synonym, count in head_counts.items() if count >= min_sources}
@@ -496,8 +677,26 @@ def _apply_consensus_filter(
     return consensus
 
 
+_SQLITE_BATCH_SIZE = 500
+
+
 class EmbeddingIndex:
-    def __init__(self, path: Path | Sequence[Path], *, lower_case: bool) -> None:
+    """Word vectors for similarity scoring and neighbor search.
+
+    With NumPy installed, text and word2vec files load into an
+    ``EmbeddingMatrix`` and a ``.npy`` matrix (given directly or lying next to
+    a SQLite file) is memory-mapped; otherwise vectors are Python lists and
+    SQLite files are read per word. Neighbor search over a converted matrix
+    uses its IVF index (``nprobe`` lists per query) unless ``exact`` is set.
+    """
+
+    def __init__(
+        self,
+        path: Path | Sequence[Path],
+        *,
+        lower_case: bool,
+        nprobe: Optional[int] = None,
+    ) -> None:
         if isinstance(path, Sequence):
             self._paths = [Path(item) for item in path]
         else:
@@ -507,15 +706,25 @@ class EmbeddingIndex:
         self._vectors: dict[str, list[float]] = {}
         self._norms: dict[str, float] = {}
         self._phrase_cache: dict[str, Optional[list[float]]] = {}
+        self._lookup_cache: dict[str, Optional[list[float]]] = {}
         self._dim: Optional[int] = None
         self._sqlite_conn: Optional[sqlite3.Connection] = None
         self._lsh_indices: Optional[list[int]] = None
+        self._matrix: Optional[EmbeddingMatrix] = None
         self._load()
+        if self._matrix is not None and nprobe:
+            self._matrix.nprobe = max(1, int(nprobe))
 
     def has_vector(self, word: str) -> bool:
+        if self._matrix is not None:
+            return bool(word) and self._matrix.query_vector(word) is not None
         return self._vector_for_term(word) is not None
 
     def similarity(self, word_a: str, word_b: str) -> Optional[float]:
+        if self._matrix is not None:
+            if not word_a or not word_b:
+                return None
+            return self._matrix.similarity(word_a, word_b)
         vec_a = self._vector_for_term(word_a)
         vec_b = self._vector_for_term(word_b)
         if vec_a is None or vec_b is None:
@@ -529,15 +738,68 @@ class EmbeddingIndex:
             dot += vec_a[idx] * vec_b[idx]
         return dot / (norm_a * norm_b)
 
+    def similarities(self, term: str, candidates: Sequence[str]) -> list[Optional[float]]:
+        return self.score_pairs([(term, candidate) for candidate in candidates])
+
+    def score_pairs(self, pairs: Sequence[tuple[str, str]]) -> list[Optional[float]]:
+        """``similarity`` for each pair, scored together: matrix rows are
+        gathered at once and SQLite vectors are fetched in batched ``IN``
+        queries."""
+        pairs = list(pairs)
+        if self._matrix is not None:
+            return self._matrix.score_pairs(pairs)
+        self.prefetch(term for pair in pairs for term in pair)
+        unit: dict[str, Optional[tuple[list[float], float]]] = {}
+        for term in {term for pair in pairs for term in pair}:
+            vec = self._vector_for_term(term)
+            norm = math.sqrt(sum(value * value for value in vec)) if vec is not None else 0.0
+            unit[term] = (vec, norm) if vec is not None and norm > 0.0 else None
+        scores: list[Optional[float]] = []
+        for term_a, term_b in pairs:
+            entry_a, entry_b = unit[term_a], unit[term_b]
+            if entry_a is None or entry_b is None:
+                scores.append(None)
+                continue
+            dot = sum(value_a * value_b for value_a, value_b in zip(entry_a[0], entry_b[0]))
+            scores.append(dot / (entry_a[1] * entry_b[1]))
+        return scores
+
+    def prefetch(self, terms: Iterable[str]) -> None:
+        """Fetch the SQLite vectors of ``terms`` (and of the parts of
+        multi-word terms) in batched queries; a no-op for in-memory vectors."""
+        if self._matrix is not None or not self._sqlite_conn:
+            return
+        keys: dict[str, None] = {}
+        for term in terms:
+            if not term:
+                continue
+            key = term.lower() if self._lower_case else term
+            if key in self._phrase_cache:
+                continue
+            keys[key] = None
+            if " " in key or "-" in key:
+                keys.update((part, None) for part in re.split(r"[\s-]+", key) if part)
+        missing = [key for key in keys if key not in self._lookup_cache]
+        for start in range(0, len(missing), _SQLITE_BATCH_SIZE):
+            batch = missing[start : start + _SQLITE_BATCH_SIZE]
+            found = self._fetch_sqlite_vectors(batch)
+            for key in batch:
+                self._lookup_cache[key] = found.get(key)
+
     def nearest_neighbors(
         self,
         term: str,
         *,
         limit: int = 30,
         min_score: float = 0.0,
+        exact: bool = False,
     ) -> list[tuple[str, float]]:
         if limit <= 0:
             return []
+        if self._matrix is not None:
+            if not term:
+                return []
+            return self._matrix.nearest_neighbors(term, limit=limit, min_score=min_score, exact=exact)
         vec = self._vector_for_term(term)
         if vec is None:
             return []
@@ -548,7 +810,28 @@ class EmbeddingIndex:
             return []
         return self._nearest_neighbors_memory(term_key, vec, limit, min_score)
 
+    def nearest_neighbors_many(
+        self,
+        terms: Sequence[str],
+        *,
+        limit: int = 30,
+        min_score: float = 0.0,
+        exact: bool = False,
+    ) -> list[list[tuple[str, float]]]:
+        """``nearest_neighbors`` for each term; one matrix product per block
+        of terms when matrix-backed."""
+        if self._matrix is not None and limit > 0:
+            return self._matrix.nearest_neighbors_many(
+                [term or "" for term in terms],
+                limit=limit,
+                min_score=min_score,
+                exact=exact,
+            )
+        return [self.nearest_neighbors(term, limit=limit, min_score=min_score) for term in terms]
+
     def supports_neighbors(self) -> bool:
+        if self._matrix is not None:
+            return True
         if self._sqlite_conn:
             return self._lsh_indices is not None
         return True
@@ -560,21 +843,42 @@ class EmbeddingIndex:
             self._load_single(self._paths[0])
             return
         for path in self._paths:
-            if path.suffix.lower() in {".db", ".sqlite", ".sqlite3", ".bin"}:
+            if path.suffix.lower() in {".db", ".sqlite", ".sqlite3", ".bin", MATRIX_SUFFIX}:
                 self._load_single(path)
                 return
+        if numpy_available():
+            self._matrix = load_text_embedding_matrix(self._paths, lower_case=self._lower_case)
+            return
         for path in self._paths:
             self._load_text_vectors(path)
 
     def _load_single(self, path: Path) -> None:
-        if path.suffix.lower() in {".db", ".sqlite", ".sqlite3"}:
+        suffix = path.suffix.lower()
+        if suffix == MATRIX_SUFFIX:
+            self._path = path
+            self._matrix = open_embedding_matrix(path, lower_case=self._lower_case)
+            return
+        if suffix in {".db", ".sqlite", ".sqlite3"}:
             self._path = path
+            matrix_path = path.with_suffix(MATRIX_SUFFIX)
+            if numpy_available() and matrix_path.exists():
+                self._matrix = open_embedding_matrix(matrix_path, lower_case=self._lower_case)
+                if self._matrix is not None:
+                    return
             self._load_sqlite()
             return
-        if path.suffix.lower() == ".bin":
+        if suffix == ".bin":
             self._path = path
+            if numpy_available():
+                self._matrix = load_word2vec_embedding_matrix(path, lower_case=self._lower_case)
+                if self._matrix is not None:
+                    return
             self._load_word2vec_binary()
             return
+        if numpy_available():
+            self._matrix = load_text_embedding_matrix([path], lower_case=self._lower_case)
+            if self._matrix is not None:
+                return
         self._load_text_vectors(path)
 
     def _load_text_vectors(self, path: Path) -> None:
@@ -654,18 +958,40 @@ class EmbeddingIndex:
         return averaged
 
     def _lookup_vector(self, key: str) -> Optional[list[float]]:
-        if key in self._phrase_cache:
-            return self._phrase_cache[key]
+        if key in self._lookup_cache:
+            return self._lookup_cache[key]
         if self._sqlite_conn:
             vec = self._fetch_sqlite_vector(key)
         else:
             vec = self._vectors.get(key)
-        if vec is not None:
-            self._phrase_cache[key] = vec
-        else:
-            self._phrase_cache[key] = None
+        self._lookup_cache[key] = vec
         return vec
 
+    def _fetch_sqlite_vectors(self, keys: Sequence[str]) -> dict[str, list[float]]:
+        if not self._sqlite_conn or not keys:
+            return {}
+        placeholders = ", ".join("?" for _ in keys)
+        column = "word_lc" if self._lower_case else "word"
+        rows = self._sqlite_conn.execute(
+            f"SELECT word, {column}, vector FROM vectors WHERE {column} IN ({placeholders})",
+            list(keys),
+        ).fetchall()
+        found: dict[str, list[float]] = {}
+        exact: set[str] = set()
+        for word, key, blob in rows:
+            if not blob or key in exact:
+                continue
+            # Same preference as _fetch_sqlite_vector: the exact spelling wins.
+            if key in found and word != key:
+                continue
+            dim = self._dim or (len(blob) // 4)
+            if dim <= 0:
+                continue
+            found[key] = list(struct.unpack(f"<{dim}f", blob))
+            if word == key:
+                exact.add(key)
+        return found
+
     def _fetch_sqlite_vector(self, key: str) -> Optional[list[float]]:
         if not self._sqlite_conn:
             return None
@@ -10,6 +10,7 @@ from lexishift_core.rulegen.pairs.en_de import EnDeRulegenConfig, generate_en_de
 from lexishift_core.rulegen.pairs.en_es import EnEsRulegenConfig, generate_en_es_results
 from lexishift_core.rulegen.pairs.es_en import EsEnRulegenConfig, generate_es_en_results
 from lexishift_core.rulegen.pairs.ja_en import JaEnRulegenConfig, generate_ja_en_results
+from lexishift_core.rulegen.resources import RulegenResourceCache
 from lexishift_core.scoring.weighting import GlossDecay
 
 
@@ -25,6 +26,7 @@ class RulegenAdapterRequest:
     jmdict_path: Optional[Path] = None
     freedict_de_en_path: Optional[Path] = None
     word_packages_by_target: Optional[Mapping[str, Mapping[str, object]]] = None
+    resources: Optional[RulegenResourceCache] = None
 
 
 RulegenAdapter = Callable[[RulegenAdapterRequest], Sequence[VocabRule]]
@@ -35,6 +37,7 @@ def _run_ja_en_adapter(request: RulegenAdapterRequest) -> Sequence[VocabRule]:
         raise ValueError("Missing JMDict path for en-ja rule generation.")
     config = JaEnRulegenConfig(
         jmdict_path=request.jmdict_path,
+        jmdict_index=request.resources.jmdict_index(request.jmdict_path) if request.resources else None,
         language_pair=request.language_pair,
         confidence_threshold=request.confidence_threshold,
         include_variants=request.include_variants,
@@ -51,6 +54,7 @@ def _run_en_de_adapter(request: RulegenAdapterRequest) -> Sequence[VocabRule]:
         raise ValueError("Missing FreeDict DE->EN path for en-de rule generation.")
     config = EnDeRulegenConfig(
         freedict_de_en_path=request.freedict_de_en_path,
+        gloss_mapping=_freedict_glosses(request, target_lang="en"),
         language_pair=request.language_pair,
         confidence_threshold=request.confidence_threshold,
         include_variants=request.include_variants,
@@ -66,6 +70,7 @@ def _run_en_es_adapter(request: RulegenAdapterRequest) -> Sequence[VocabRule]:
         raise ValueError("Missing FreeDict ES->EN path for en-es rule generation.")
     config = EnEsRulegenConfig(
         freedict_es_en_path=request.freedict_de_en_path,
+        gloss_mapping=_freedict_glosses(request, target_lang="en"),
         language_pair=request.language_pair,
         confidence_threshold=request.confidence_threshold,
         include_variants=request.include_variants,
@@ -81,6 +86,7 @@ def _run_es_en_adapter(request: RulegenAdapterRequest) -> Sequence[VocabRule]:
         raise ValueError("Missing FreeDict EN->ES path for es-en rule generation.")
     config = EsEnRulegenConfig(
         freedict_en_es_path=request.freedict_de_en_path,
+        gloss_mapping=_freedict_glosses(request, target_lang="es"),
         language_pair=request.language_pair,
         confidence_threshold=request.confidence_threshold,
         allow_multiword_glosses=request.allow_multiword_glosses,
@@ -90,6 +96,12 @@ def _run_es_en_adapter(request: RulegenAdapterRequest) -> Sequence[VocabRule]:
     return [result.rule for result in results]
 
 
+def _freedict_glosses(request: RulegenAdapterRequest, *, target_lang: str) -> Optional[Mapping[str, Sequence[str]]]:
+    if request.resources is None or request.freedict_de_en_path is None:
+        return None
+    return request.resources.freedict_glosses(request.freedict_de_en_path, target_lang=target_lang)
+
+
 _RULEGEN_ADAPTERS: dict[str, RulegenAdapter] = {
     "ja_en": _run_ja_en_adapter,
     "en_de": _run_en_de_adapter,
@@ -63,6 +63,16 @@ class CandidateSource(Protocol):
         ...
 
 
+def prefetch_targets(lookup: object, targets: Iterable[str]) -> list[str]:
+    """Materialize ``targets`` and let a lazy lookup (one with ``prefetch``)
+    fetch them in a single batch before per-target ``get`` calls."""
+    targets = list(targets)
+    prefetch = getattr(lookup, "prefetch", None)
+    if prefetch is not None:
+        prefetch(targets)
+    return targets
+
+
 class CandidateNormalizer(Protocol):
     def normalize(self, candidate: RuleCandidate) -> RuleCandidate:
         ...
@@ -125,7 +135,7 @@ class RuleGenerationPipeline:
         config: RuleGenerationConfig,
     ) -> list[RuleGenerationResult]:
         seen: set[tuple[str, str, str]] = set()
-        results: list[RuleGenerationResult] = []
+        accepted: list[RuleCandidate] = []
         for candidate in self._iter_candidates(targets, config.language_pair):
             if config.dedupe:
                 key = (
@@ -136,8 +146,14 @@ class RuleGenerationPipeline:
                 if key in seen:
                     continue
                 seen.add(key)
-            if not self._accept(candidate):
-                continue
+            if self._accept(candidate):
+                accepted.append(candidate)
+        # Signal providers backed by a store can look up the whole batch at once.
+        prefetch = getattr(self._signal_provider, "prefetch", None)
+        if prefetch is not None and accepted:
+            prefetch(accepted)
+        results: list[RuleGenerationResult] = []
+        for candidate in accepted:
             signals = self._signal_provider.signals(candidate) if self._signal_provider else RuleConfidenceSignals()
             confidence = self._scorer.score(signals)
             if confidence < config.confidence_threshold:
@@ -221,6 +237,18 @@ class SimpleSignalProvider:
     variant_penalty_provider: Optional[Callable[[RuleCandidate], float]] = None
     embedding_provider: Optional[Callable[[RuleCandidate], Optional[float]]] = None
 
+    def prefetch(self, candidates: Sequence[RuleCandidate]) -> None:
+        """Forward the candidate batch to providers that can prefetch."""
+        for provider in (
+            self.frequency_provider,
+            self.pos_match_provider,
+            self.variant_penalty_provider,
+            self.embedding_provider,
+        ):
+            prefetch = getattr(provider, "prefetch", None)
+            if prefetch is not None:
+                prefetch(candidates)
+
     def signals(self, candidate: RuleCandidate) -> RuleConfidenceSignals:
         dict_priority = self.dict_priorities.get(candidate.source_dict, 0.0)
         frequency_weight = self.frequency_provider(candidate) if self.frequency_provider else 0.0
@@ -238,6 +266,33 @@ class SimpleSignalProvider:
         )
 
 
+class EmbeddingScoreProvider:
+    """``embedding_provider`` that scores (source phrase, replacement) pairs
+    through ``scorer.score_pairs`` (e.g. an ``EmbeddingIndex``); ``prefetch``
+    scores a whole candidate batch in one call and the results are cached."""
+
+    def __init__(self, scorer: object) -> None:
+        self._scorer = scorer
+        self._scores: dict[tuple[str, str], Optional[float]] = {}
+
+    def prefetch(self, candidates: Iterable[RuleCandidate]) -> None:
+        pairs = list(
+            dict.fromkeys(
+                pair
+                for pair in ((candidate.source_phrase, candidate.replacement) for candidate in candidates)
+                if pair not in self._scores
+            )
+        )
+        if pairs:
+            self._scores.update(zip(pairs, self._scorer.score_pairs(pairs)))
+
+    def __call__(self, candidate: RuleCandidate) -> Optional[float]:
+        pair = (candidate.source_phrase, candidate.replacement)
+        if pair not in self._scores:
+            self.prefetch([candidate])
+        return self._scores[pair]
+
+
 @dataclass(frozen=True)
 class MappingCandidateSource:
     mapping: Mapping[str, Sequence[str]]
@@ -245,7 +300,7 @@ class MappingCandidateSource:
     source_type: str = "synonym"
 
     def generate(self, targets: Iterable[str], *, language_pair: str) -> Iterable[RuleCandidate]:
-        for target in targets:
+        for target in prefetch_targets(self.mapping, targets):
             for source in self.mapping.get(target, []):
                 yield RuleCandidate(
                     source_phrase=str(source),
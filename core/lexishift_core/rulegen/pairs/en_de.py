@@ -2,9 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Mapping, Optional, Sequence
+from typing import Container, Iterable, Mapping, Optional, Sequence
 
 from lexishift_core.resources.dict_loaders import load_freedict_glosses_ordered
+from lexishift_core.resources.freedict_lookup import (
+    FreedictSqliteLookup,
+    open_freedict_sqlite_lookup,
+)
 from lexishift_core.rulegen.generation import (
     CandidateFilter,
     RuleCandidate,
@@ -13,6 +17,7 @@ from lexishift_core.rulegen.generation import (
     RuleGenerationResult,
     RuleScorer,
     SimpleSignalProvider,
+    prefetch_targets,
 )
 from lexishift_core.rulegen.pairs.ja_en import DEFAULT_STOPWORDS
 from lexishift_core.rulegen.utils import (
@@ -57,10 +62,15 @@ class EnDeRulegenConfig:
 
 
 def build_en_de_pipeline(config: EnDeRulegenConfig) -> RuleGenerationPipeline:
-    mapping = config.gloss_mapping or load_freedict_glosses_ordered(
-        config.freedict_de_en_path,
-        target_lang="en",
-    )
+    base_forms = None
+    mapping = config.gloss_mapping or open_freedict_sqlite_lookup(config.freedict_de_en_path)
+    if mapping is None:
+        mapping = load_freedict_glosses_ordered(
+            config.freedict_de_en_path,
+            target_lang="en",
+        )
+    elif isinstance(mapping, FreedictSqliteLookup):
+        base_forms = mapping.gloss_forms
     source = FreedictCandidateSource(
         mapping=mapping,
         source_dict="freedict_de_en",
@@ -87,7 +97,7 @@ def build_en_de_pipeline(config: EnDeRulegenConfig) -> RuleGenerationPipeline:
         sources=[source],
         normalizers=normalizers,
         expanders=expanders,
-        filters=_build_filters(config, mapping),
+        filters=_build_filters(config, mapping, base_forms=base_forms),
         scorer=RuleScorer(),
         signal_provider=signal_provider,
     )
@@ -128,7 +138,7 @@ class FreedictCandidateSource:
         self._source_type = source_type
 
     def generate(self, targets: Iterable[str], *, language_pair: str) -> Iterable[RuleCandidate]:
-        for target in targets:
+        for target in prefetch_targets(self._mapping, targets):
             sources = list(self._mapping.get(target, []))
             total = len(sources)
             for index, source in enumerate(sources):
@@ -148,6 +158,8 @@ class FreedictCandidateSource:
 def _build_filters(
     config: EnDeRulegenConfig,
     mapping: Mapping[str, Sequence[str]],
+    *,
+    base_forms: Optional[Container[str]] = None,
 ) -> list[CandidateFilter]:
     filters: list[CandidateFilter] = [NonEmptyFilter()]
     if not config.allow_multiword_glosses:
@@ -164,7 +176,8 @@ def _build_filters(
         stopwords = config.stopwords or DEFAULT_STOPWORDS
         filters.append(StopwordFilter(stopwords=stopwords))
     if config.enable_inflection_filter:
-        base_forms = _build_gloss_base_forms(mapping)
+        if base_forms is None:
+            base_forms = _build_gloss_base_forms(mapping)
         filters.append(
             InflectionArtifactFilter(
                 suffixes=config.inflection_suffixes,
@@ -3,9 +3,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 import re
-from typing import Iterable, Mapping, Optional, Sequence
+from typing import Container, Iterable, Mapping, Optional, Sequence
 
 from lexishift_core.resources.dict_loaders import load_freedict_glosses_ordered
+from lexishift_core.resources.freedict_lookup import (
+    FreedictSqliteLookup,
+    open_freedict_sqlite_lookup,
+)
 from lexishift_core.rulegen.generation import (
     CandidateFilter,
     RuleCandidate,
@@ -14,6 +18,7 @@ from lexishift_core.rulegen.generation import (
     RuleGenerationResult,
     RuleScorer,
     SimpleSignalProvider,
+    prefetch_targets,
 )
 from lexishift_core.rulegen.pairs.ja_en import DEFAULT_STOPWORDS
 from lexishift_core.rulegen.utils import (
@@ -83,10 +88,15 @@ class EnEsRulegenConfig:
 
 
 def build_en_es_pipeline(config: EnEsRulegenConfig) -> RuleGenerationPipeline:
-    mapping = config.gloss_mapping or load_freedict_glosses_ordered(
-        config.freedict_es_en_path,
-        target_lang="en",
-    )
+    base_forms = None
+    mapping = config.gloss_mapping or open_freedict_sqlite_lookup(config.freedict_es_en_path)
+    if mapping is None:
+        mapping = load_freedict_glosses_ordered(
+            config.freedict_es_en_path,
+            target_lang="en",
+        )
+    elif isinstance(mapping, FreedictSqliteLookup):
+        base_forms = mapping.gloss_forms
     source = FreedictCandidateSource(
         mapping=mapping,
         source_dict="freedict_es_en",
@@ -118,7 +128,7 @@ def build_en_es_pipeline(config: EnEsRulegenConfig) -> RuleGenerationPipeline:
         sources=[source],
         normalizers=normalizers,
         expanders=expanders,
-        filters=_build_filters(config, mapping),
+        filters=_build_filters(config, mapping, base_forms=base_forms),
         scorer=RuleScorer(),
         signal_provider=signal_provider,
     )
@@ -159,7 +169,7 @@ class FreedictCandidateSource:
         self._source_type = source_type
 
     def generate(self, targets: Iterable[str], *, language_pair: str) -> Iterable[RuleCandidate]:
-        for target in targets:
+        for target in prefetch_targets(self._mapping, targets):
             sources = list(self._mapping.get(target, []))
             total = len(sources)
             for index, source in enumerate(sources):
@@ -179,6 +189,8 @@ class FreedictCandidateSource:
 def _build_filters(
     config: EnEsRulegenConfig,
     mapping: Mapping[str, Sequence[str]],
+    *,
+    base_forms: Optional[Container[str]] = None,
 ) -> list[CandidateFilter]:
     filters: list[CandidateFilter] = [NonEmptyFilter()]
     if not config.allow_multiword_glosses:
@@ -195,7 +207,8 @@ def _build_filters(
         stopwords = config.stopwords or DEFAULT_STOPWORDS
         filters.append(StopwordFilter(stopwords=stopwords))
     if config.enable_inflection_filter:
-        base_forms = _build_gloss_base_forms(mapping)
+        if base_forms is None:
+            base_forms = _build_gloss_base_forms(mapping)
         filters.append(
             InflectionArtifactFilter(
                 suffixes=config.inflection_suffixes,
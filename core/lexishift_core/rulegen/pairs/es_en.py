@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Iterable, Mapping, Optional, Sequence
 
 from lexishift_core.resources.dict_loaders import load_freedict_glosses_ordered
+from lexishift_core.resources.freedict_lookup import open_freedict_sqlite_lookup
 from lexishift_core.rulegen.generation import (
     CandidateFilter,
     RuleCandidate,
@@ -13,6 +14,7 @@ from lexishift_core.rulegen.generation import (
     RuleGenerationResult,
     RuleScorer,
     SimpleSignalProvider,
+    prefetch_targets,
 )
 from lexishift_core.rulegen.utils import (
     BasicStringNormalizer,
@@ -66,10 +68,12 @@ class EsEnRulegenConfig:
 
 
 def build_es_en_pipeline(config: EsEnRulegenConfig) -> RuleGenerationPipeline:
-    mapping = config.gloss_mapping or load_freedict_glosses_ordered(
-        config.freedict_en_es_path,
-        target_lang="es",
-    )
+    mapping = config.gloss_mapping or open_freedict_sqlite_lookup(config.freedict_en_es_path)
+    if mapping is None:
+        mapping = load_freedict_glosses_ordered(
+            config.freedict_en_es_path,
+            target_lang="es",
+        )
     source = FreedictCandidateSource(
         mapping=mapping,
         source_dict="freedict_en_es",
@@ -130,7 +134,7 @@ class FreedictCandidateSource:
         self._source_type = source_type
 
     def generate(self, targets: Iterable[str], *, language_pair: str) -> Iterable[RuleCandidate]:
-        for target in targets:
+        for target in prefetch_targets(self._mapping, targets):
             sources = list(self._mapping.get(target, []))
             total = len(sources)
             for index, source in enumerate(sources):
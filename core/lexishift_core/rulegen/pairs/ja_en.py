@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Iterable, Mapping, Optional, Sequence
+from typing import Callable, Container, Iterable, Mapping, Optional, Sequence
 
 from lexishift_core.lexicon.word_package import (
     merge_script_forms,
@@ -15,6 +15,12 @@ from lexishift_core.resources.dict_loaders import (
     load_jmdict_entry_index_glosses_and_script_forms,
 )
 from lexishift_core.resources.japanese_script import contains_kanji, kana_to_romaji
+from lexishift_core.resources.jmdict_index import (
+    JmdictGlossForms,
+    JmdictIndex,
+    JmdictTermMapping,
+    open_jmdict_index,
+)
 from lexishift_core.frequency import (
     FrequencyLexicon,
     FrequencySourceConfig,
@@ -29,6 +35,7 @@ from lexishift_core.rulegen.generation import (
     RuleGenerationResult,
     RuleScorer,
     SimpleSignalProvider,
+    prefetch_targets,
 )
 from lexishift_core.rulegen.utils import (
     BasicStringNormalizer,
@@ -51,6 +58,7 @@ def _should_expand_english(candidate: RuleCandidate) -> bool:
 @dataclass(frozen=True)
 class JaEnRulegenConfig:
     jmdict_path: Path
+    jmdict_index: Optional[JmdictIndex] = None
     gloss_mapping: Optional[Mapping[str, Sequence[str]]] = None
     script_forms_by_target: Optional[Mapping[str, Mapping[str, str]]] = None
     jmdict_entries_by_term: Optional[Mapping[str, Sequence[JmdictEntryRecord]]] = None
@@ -88,8 +96,21 @@ def build_ja_en_pipeline(config: JaEnRulegenConfig) -> RuleGenerationPipeline:
     word_packages_by_target: Mapping[str, Mapping[str, object]] = (
         config.word_packages_by_target or {}
     )
+    base_forms = None
+    index = None
+    if config.gloss_mapping is None:
+        index = config.jmdict_index or open_jmdict_index(config.jmdict_path)
     if config.gloss_mapping is not None:
         mapping = config.gloss_mapping
+    elif index is not None:
+        # Lazy views over the cached index: only the generated targets are read.
+        cache: dict = {}
+        mapping = JmdictTermMapping(index, part="glosses", cache=cache)
+        if not jmdict_entries_by_term:
+            jmdict_entries_by_term = JmdictTermMapping(index, part="entries", cache=cache)
+        if not script_forms_by_target:
+            script_forms_by_target = JmdictTermMapping(index, part="script_forms", cache=cache)
+        base_forms = JmdictGlossForms(index)
     else:
         discovered_entries, mapping, discovered_forms = load_jmdict_entry_index_glosses_and_script_forms(
             config.jmdict_path
@@ -132,6 +153,9 @@ def build_ja_en_pipeline(config: JaEnRulegenConfig) -> RuleGenerationPipeline:
         def frequency_provider(candidate: RuleCandidate) -> float:
             return base_provider(candidate) * gloss_decay_multiplier(candidate)
 
+        if hasattr(base_provider, "prefetch"):
+            frequency_provider.prefetch = base_provider.prefetch  # type: ignore[attr-defined]
+
     signal_provider = SimpleSignalProvider(
         dict_priorities={"jmdict": config.dict_priority},
         frequency_provider=frequency_provider,
@@ -142,7 +166,7 @@ def build_ja_en_pipeline(config: JaEnRulegenConfig) -> RuleGenerationPipeline:
         sources=[source],
         normalizers=normalizers,
         expanders=expanders,
-        filters=_build_filters(config, mapping),
+        filters=_build_filters(config, mapping, base_forms=base_forms),
         scorer=RuleScorer(),
         signal_provider=signal_provider,
     )
@@ -189,7 +213,7 @@ class JmdictCandidateSource:
         self._word_packages_by_target = word_packages_by_target or {}
 
     def generate(self, targets: Iterable[str], *, language_pair: str) -> Iterable[RuleCandidate]:
-        for target in targets:
+        for target in prefetch_targets(self._entries_by_term, targets):
             package_hint = self._word_packages_by_target.get(target)
             normalized_package = normalize_word_package(
                 package_hint,
@@ -382,6 +406,8 @@ def _normalize_script_forms_map(value: object) -> Optional[dict[str, str]]:
 def _build_filters(
     config: JaEnRulegenConfig,
     mapping: Mapping[str, Sequence[str]],
+    *,
+    base_forms: Optional[Container[str]] = None,
 ) -> list[CandidateFilter]:
     filters: list[CandidateFilter] = [NonEmptyFilter()]
     if not config.allow_multiword_glosses:
@@ -396,7 +422,8 @@ def _build_filters(
         stopwords = config.stopwords or DEFAULT_STOPWORDS
         filters.append(StopwordFilter(stopwords=stopwords))
     if config.enable_inflection_filter:
-        base_forms = _build_gloss_base_forms(mapping)
+        if base_forms is None:
+            base_forms = _build_gloss_base_forms(mapping)
         filters.append(
             InflectionArtifactFilter(
                 suffixes=config.inflection_suffixes,
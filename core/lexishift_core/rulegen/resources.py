@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional, Sequence
+
+from lexishift_core.resources.dict_loaders import load_freedict_glosses_ordered
+from lexishift_core.resources.freedict_lookup import open_freedict_sqlite_lookup
+from lexishift_core.resources.jmdict_index import JmdictIndex, open_jmdict_index
+
+
+class RulegenResourceCache:
+    """Dictionary handles shared by consecutive rule generation runs.
+
+    Entries are keyed by resolved path, mtime and size, so a dictionary that
+    is replaced on disk is reopened. Not thread-safe: SQLite handles stay
+    bound to the thread that opened them.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def jmdict_index(self, path: Path) -> Optional[JmdictIndex]:
+        return self._get(("jmdict",), path, lambda: open_jmdict_index(path))
+
+    def freedict_glosses(self, path: Path, *, target_lang: str) -> Mapping[str, Sequence[str]]:
+        """A lazy SQLite lookup for converted FreeDict files, else the fully
+        parsed TEI mapping."""
+
+        def load() -> Mapping[str, Sequence[str]]:
+            lookup = open_freedict_sqlite_lookup(path)
+            if lookup is not None:
+                return lookup
+            return load_freedict_glosses_ordered(path, target_lang=target_lang)
+
+        return self._get(("freedict", target_lang), path, load)
+
+    def close(self) -> None:
+        for _signature, value in self._entries.values():
+            close = getattr(value, "close", None)
+            if close is not None:
+                close()
+        self._entries.clear()
+
+    def _get(self, kind: tuple, path: Path, loader: Callable[[], Any]) -> Any:
+        path = Path(path)
+        try:
+            stat = path.stat()
+            key = (*kind, str(path.resolve()))
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return loader()
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] == signature:
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        if cached is not None:
+            close = getattr(cached[1], "close", None)
+            if close is not None:
+                close()
+        value = loader()
+        if value is not None:
+            self._entries[key] = (signature, value)
+        return value
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, replace
 import re
-from typing import Callable, Iterable, Mapping, Optional, Sequence
+from typing import Callable, Container, Iterable, Mapping, Optional, Sequence
 
 from lexishift_core.replacement.core import Tokenizer
 from lexishift_core.replacement.inflect import (
@@ -107,7 +107,7 @@ class StopwordFilter:
 @dataclass(frozen=True)
 class InflectionArtifactFilter:
     suffixes: Sequence[str] = ("s", "es", "ed", "ing")
-    base_forms: Optional[set[str]] = None
+    base_forms: Optional[Container[str]] = None
     min_base_length: int = 2
 
     def accept(self, candidate: RuleCandidate) -> bool:
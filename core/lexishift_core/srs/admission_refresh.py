@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from math import floor
@@ -12,7 +13,6 @@ from lexishift_core.srs.scheduler import (
     RATING_EASY,
     RATING_GOOD,
     RATING_HARD,
-    select_active_items,
 )
 from lexishift_core.srs.selector import SelectorCandidate, SelectorConfig, SelectorWeights
 from lexishift_core.srs.signal_queue import SIGNAL_FEEDBACK, SrsSignalEvent
@@ -98,20 +98,30 @@ def compute_feedback_window_stats(
     pair: str,
     window_size: int,
 ) -> FeedbackWindowStats:
+    return feedback_window_stats_from_ratings(
+        (event.rating for event in events if event.event_type == SIGNAL_FEEDBACK and event.pair == pair),
+        pair=pair,
+        window_size=window_size,
+    )
+
+
+def feedback_window_stats_from_ratings(
+    ratings: Iterable[Optional[str]],
+    *,
+    pair: str,
+    window_size: int,
+) -> FeedbackWindowStats:
+    """Window stats over a pair's feedback ratings, oldest first; only the
+    newest ``window_size`` ratings count."""
     requested_size = max(1, int(window_size))
-    feedback_events = [
-        event
-        for event in events
-        if event.event_type == SIGNAL_FEEDBACK and event.pair == pair
-    ]
-    scoped = feedback_events[-requested_size:]
+    scoped = deque(ratings, maxlen=requested_size)
 
     count_again = 0
     count_hard = 0
     count_good = 0
     count_easy = 0
-    for event in scoped:
-        rating = str(event.rating or "").strip().lower()
+    for raw_rating in scoped:
+        rating = str(raw_rating or "").strip().lower()
         if rating == RATING_AGAIN:
             count_again += 1
         elif rating == RATING_HARD:
@@ -147,9 +157,10 @@ def plan_admission_refresh(
     store: SrsStore,
     settings: SrsSettings,
     pair: str,
-    events: Iterable[SrsSignalEvent],
+    events: Iterable[SrsSignalEvent] = (),
     policy: Optional[AdmissionRefreshPolicy] = None,
     now: Optional[datetime] = None,
+    feedback_window: Optional[FeedbackWindowStats] = None,
 ) -> AdmissionRefreshDecision:
     policy = policy or AdmissionRefreshPolicy()
     now = now or now_utc()
@@ -161,8 +172,7 @@ def plan_admission_refresh(
         policy.max_new_items_override,
         fallback=settings.max_new_items_per_day,
     )
-    due_items = select_active_items(
-        store.items,
+    due_items = store.select_due(
         now=now,
         max_active=max_active_items,
         allowed_pairs=[pair],
@@ -173,7 +183,8 @@ def plan_admission_refresh(
     capacity_budget = max(0, max_active_items - due_count)
     base_budget = min(max_new_items, capacity_budget)
 
-    feedback_stats = compute_feedback_window_stats(
+    # Callers holding incremental signal stats pass the window directly.
+    feedback_stats = feedback_window or compute_feedback_window_stats(
         events,
         pair=pair,
         window_size=policy.feedback_window_size,
@@ -226,9 +237,10 @@ def apply_admission_refresh(
     settings: SrsSettings,
     pair: str,
     candidates: Sequence[SelectorCandidate],
-    events: Iterable[SrsSignalEvent],
+    events: Iterable[SrsSignalEvent] = (),
     policy: Optional[AdmissionRefreshPolicy] = None,
     now: Optional[datetime] = None,
+    feedback_window: Optional[FeedbackWindowStats] = None,
 ) -> tuple[SrsStore, AdmissionRefreshResult]:
     policy = policy or AdmissionRefreshPolicy()
     decision = plan_admission_refresh(
@@ -238,6 +250,7 @@ def apply_admission_refresh(
         events=events,
         policy=policy,
         now=now,
+        feedback_window=feedback_window,
     )
     if decision.admission_budget <= 0:
         return store, AdmissionRefreshResult(
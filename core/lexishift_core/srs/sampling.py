@@ -62,11 +62,8 @@ def sample_store_items(
     elif requested_count != parsed_count:
         notes.append(f"sample_count clamped to {requested_count} (max {MAX_SAMPLE_COUNT}).")
 
-    candidates = [
-        item
-        for item in store.items
-        if item.language_pair == normalized_pair and str(item.lemma or "").strip()
-    ]
+    pair_items = store.items_for_pair(normalized_pair)
+    candidates = [item for item in pair_items if str(item.lemma or "").strip()]
     requested = min(requested_count, len(candidates))
     weights = _build_weights(candidates, now=now, strategy=effective_strategy)
     sampled = _weighted_sample_without_replacement(
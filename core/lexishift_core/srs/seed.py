@@ -3,10 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 import json
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Container, Optional, Sequence
 
 from lexishift_core.lexicon.word_package import build_word_package
 from lexishift_core.resources.dict_loaders import load_jmdict_lemmas
+from lexishift_core.resources.jmdict_index import JmdictLemmaSet, open_jmdict_index
 from lexishift_core.frequency.sqlite_store import SqliteFrequencyConfig, SqliteFrequencyStore
 from lexishift_core.srs.admission_policy import (
     AdmissionPosWeights,
@@ -266,9 +267,14 @@ def seed_to_selector_candidates(seeds: Sequence[SeedWord]) -> list[SelectorCandi
     return candidates
 
 
-def _load_jmdict_lemmas(path: Optional[Path]) -> Optional[set[str]]:
+def _load_jmdict_lemmas(path: Optional[Path]) -> Optional[Container[str]]:
     if not path:
         return None
+    # Seed rows are checked one lemma at a time; the cached index answers
+    # membership without loading every JMdict form into memory.
+    index = open_jmdict_index(path)
+    if index is not None:
+        return JmdictLemmaSet(index)
     return load_jmdict_lemmas(path)
 
 
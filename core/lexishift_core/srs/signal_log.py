@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+import json
+import os
+from pathlib import Path
+import re
+from typing import Any, Iterable, Iterator, Mapping, Optional
+
+from lexishift_core.persistence.file_lock import exclusive_file_lock
+
+SIGNAL_LOG_SUFFIX = ".jsonl"
+SIGNAL_LOG_AGGREGATES_VERSION = 1
+DEFAULT_MAX_SEGMENT_BYTES = 1 << 20
+DEFAULT_KEEP_SEGMENTS = 3
+DEFAULT_MAX_SEGMENTS = 16
+DEFAULT_FEEDBACK_TAIL = 1000
+
+_READ_BLOCK_BYTES = 64 * 1024
+
+
+def is_signal_log_path(path: str | Path) -> bool:
+    return Path(path).suffix.lower() == SIGNAL_LOG_SUFFIX
+
+
+def signal_log_segment_path(path: Path, seq: int) -> Path:
+    return path.with_name(f"{path.stem}.{seq:06d}{path.suffix}")
+
+
+def signal_log_aggregates_path(path: Path) -> Path:
+    return path.with_name(f"{path.stem}.aggregates.json")
+
+
+def signal_log_stats_path(path: Path) -> Path:
+    return path.with_name(f"{path.stem}.stats.json")
+
+
+def signal_log_stats_lemmas_path(path: Path) -> Path:
+    return path.with_name(f"{path.stem}.stats.lemmas")
+
+
+def signal_log_archived_segment_path(path: Path, seq: int) -> Path:
+    return path.with_name(f"{path.stem}.{seq:06d}.archived{path.suffix}")
+
+
+def signal_log_lock_path(path: Path) -> Path:
+    return path.with_name(f"{path.stem}.lock")
+
+
+def signal_log_segments(path: Path) -> list[tuple[int, Path]]:
+    """Rotated, not yet compacted segments as ``(seq, path)``, oldest first."""
+    segments = _segment_files(Path(path))
+    if segments:
+        compacted_through = SignalLogAggregates.load(path).compacted_through
+        segments = [(seq, segment) for seq, segment in segments if seq > compacted_through]
+    return segments
+
+
+def signal_log_segment_files(path: Path) -> list[tuple[int, Path]]:
+    """Every live-named segment file on disk, including ones a crash left
+    behind after they were compacted."""
+    return _segment_files(Path(path))
+
+
+def signal_log_archived_segments(path: Path) -> list[tuple[int, Path]]:
+    """Compacted segments as ``(seq, path)``, oldest first."""
+    path = Path(path)
+    archived = _segment_files(path, archived=True)
+    leftovers = _segment_files(path)
+    if leftovers:
+        compacted_through = SignalLogAggregates.load(path).compacted_through
+        archived.extend((seq, segment) for seq, segment in leftovers if seq <= compacted_through)
+        archived.sort()
+    return archived
+
+
+def _segment_files(path: Path, *, archived: bool = False) -> list[tuple[int, Path]]:
+    if not path.parent.exists():
+        return []
+    marker = r"\.archived" if archived else ""
+    pattern = re.compile(rf"^{re.escape(path.stem)}\.(\d+){marker}{re.escape(path.suffix)}$")
+    segments: list[tuple[int, Path]] = []
+    for candidate in path.parent.iterdir():
+        match = pattern.match(candidate.name)
+        if match:
+            segments.append((int(match.group(1)), candidate))
+    segments.sort()
+    return segments
+
+
+def append_signal_log_records(
+    path: Path,
+    records: Iterable[Mapping[str, Any]],
+    *,
+    fsync: bool = True,
+    max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+    max_segments: int = DEFAULT_MAX_SEGMENTS,
+) -> None:
+    """Append records as JSON lines with one write and (optionally) one fsync.
+
+    A torn trailing line left by a crash is terminated first so it cannot
+    swallow the next record. The active file rotates into a numbered segment
+    once it reaches ``max_segment_bytes``; when more than ``max_segments``
+    segments pile up (nobody compacted in the background) they are compacted
+    inline.
+
+    Appends take no lock: a write racing a rotation in another process lands
+    at the end of the segment just rotated out, so it is kept, though it may
+    sort before records appended to the fresh active file. Rotation and
+    compaction hold the log's lock file.
+    """
+    path = Path(path)
+    data = "".join(
+        json.dumps(dict(record), ensure_ascii=False, sort_keys=True, separators=(",", ":")) + "\n"
+        for record in records
+    ).encode("utf-8")
+    if not data:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("ab+") as handle:
+        size = handle.seek(0, os.SEEK_END)
+        if size:
+            handle.seek(size - 1)
+            if handle.read(1) != b"\n":
+                data = b"\n" + data
+        handle.write(data)
+        handle.flush()
+        if fsync:
+            os.fsync(handle.fileno())
+        size = handle.tell()
+    if size >= max(1, int(max_segment_bytes)):
+        with signal_log_lock(path):
+            # Another process may have rotated the file since the write.
+            if _file_size(path) >= max(1, int(max_segment_bytes)):
+                _rotate(path)
+            if len(signal_log_segments(path)) > max(1, int(max_segments)):
+                _compact(path, keep_segments=DEFAULT_KEEP_SEGMENTS)
+
+
+def rotate_signal_log(path: Path) -> Optional[Path]:
+    path = Path(path)
+    with signal_log_lock(path):
+        return _rotate(path)
+
+
+def _rotate(path: Path) -> Optional[Path]:
+    if _file_size(path) == 0:
+        return None
+    segments = signal_log_segments(path)
+    last_seq = segments[-1][0] if segments else SignalLogAggregates.load(path).compacted_through
+    target = signal_log_segment_path(path, last_seq + 1)
+    os.replace(path, target)
+    return target
+
+
+def iter_signal_log_records(path: Path, *, archived: bool = False) -> Iterator[dict[str, Any]]:
+    """Live (uncompacted) records, oldest first, preceded by the compacted
+    ones when ``archived`` is set."""
+    path = Path(path)
+    if archived:
+        for _seq, segment in signal_log_archived_segments(path):
+            yield from _iter_file_records(segment)
+    for _seq, segment in signal_log_segments(path):
+        yield from _iter_file_records(segment)
+    yield from _iter_file_records(path)
+
+
+def iter_signal_log_records_reversed(path: Path, *, archived: bool = False) -> Iterator[dict[str, Any]]:
+    """Live (uncompacted) records, newest first, read backwards block by
+    block, followed by the compacted ones when ``archived`` is set."""
+    path = Path(path)
+    yield from _iter_file_records_reversed(path)
+    for _seq, segment in reversed(signal_log_segments(path)):
+        yield from _iter_file_records_reversed(segment)
+    if archived:
+        yield from iter_archived_signal_log_records_reversed(path)
+
+
+def iter_archived_signal_log_records_reversed(path: Path) -> Iterator[dict[str, Any]]:
+    for _seq, segment in reversed(signal_log_archived_segments(Path(path))):
+        yield from _iter_file_records_reversed(segment)
+
+
+def signal_log_needs_compaction(path: Path, *, keep_segments: int = DEFAULT_KEEP_SEGMENTS) -> bool:
+    keep = max(0, int(keep_segments))
+    # Cheap directory check first; aggregates are only read past the limit.
+    if len(_segment_files(Path(path))) <= keep:
+        return False
+    return len(signal_log_segments(Path(path))) > keep
+
+
+def compact_signal_log(path: Path, *, keep_segments: int = DEFAULT_KEEP_SEGMENTS) -> int:
+    """Fold all but the newest ``keep_segments`` segments into the per-pair
+    aggregates file and archive them. Returns the number of records folded.
+
+    Summaries and tail reads then skip the archived segments; only full
+    history loads read them. The aggregates file records the last folded
+    segment, so a crash between saving it and archiving the segments never
+    counts a segment twice.
+    """
+    path = Path(path)
+    with signal_log_lock(path):
+        return _compact(path, keep_segments=keep_segments)
+
+
+def _compact(path: Path, *, keep_segments: int) -> int:
+    aggregates = SignalLogAggregates.load(path)
+    segments = []
+    for seq, segment in _segment_files(path):
+        if seq <= aggregates.compacted_through:
+            # Left behind by a crash after the aggregates were saved.
+            os.replace(segment, signal_log_archived_segment_path(path, seq))
+        else:
+            segments.append((seq, segment))
+    fold = segments[: max(0, len(segments) - max(0, int(keep_segments)))]
+    if not fold:
+        return 0
+    folded = 0
+    for seq, segment in fold:
+        for record in _iter_file_records(segment):
+            aggregates.add(record)
+            folded += 1
+        aggregates.compacted_through = seq
+    aggregates.save(path)
+    for seq, segment in fold:
+        os.replace(segment, signal_log_archived_segment_path(path, seq))
+    return folded
+
+
+def reset_signal_log(path: Path) -> None:
+    path = Path(path)
+    with signal_log_lock(path):
+        for _seq, segment in _segment_files(path) + _segment_files(path, archived=True):
+            segment.unlink(missing_ok=True)
+        path.unlink(missing_ok=True)
+        signal_log_aggregates_path(path).unlink(missing_ok=True)
+        signal_log_stats_path(path).unlink(missing_ok=True)
+        signal_log_stats_lemmas_path(path).unlink(missing_ok=True)
+
+
+@contextmanager
+def signal_log_lock(path: Path) -> Iterator[None]:
+    """Serialize rotation, compaction and stats updates across processes.
+    Not reentrant."""
+    with exclusive_file_lock(signal_log_lock_path(path)):
+        yield
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+class SignalLogAggregates:
+    """Per-pair totals for compacted log segments.
+
+    Holds event counts by type, the set of lemmas seen and the newest
+    timestamp per pair, so summaries stay complete without reading archived
+    segments. The lemma sets are exact: they grow with the number of distinct
+    lemmas a pair has seen (its vocabulary), not with the number of events.
+    """
+
+    def __init__(self) -> None:
+        self.compacted_through = 0
+        self.pairs: dict[str, dict[str, Any]] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> "SignalLogAggregates":
+        aggregates = cls()
+        try:
+            data = json.loads(signal_log_aggregates_path(Path(path)).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return aggregates
+        if not isinstance(data, Mapping):
+            return aggregates
+        aggregates.compacted_through = int(data.get("compacted_through", 0) or 0)
+        pairs = data.get("pairs")
+        if isinstance(pairs, Mapping):
+            for pair, entry in pairs.items():
+                if not isinstance(entry, Mapping):
+                    continue
+                aggregates.pairs[str(pair)] = {
+                    "event_count": int(entry.get("event_count", 0) or 0),
+                    "event_types": {str(k): int(v) for k, v in dict(entry.get("event_types") or {}).items()},
+                    "lemmas": set(entry.get("lemmas") or ()),
+                    "last_event_at": str(entry.get("last_event_at") or ""),
+                }
+        return aggregates
+
+    def save(self, path: Path) -> None:
+        target = signal_log_aggregates_path(Path(path))
+        payload = {
+            "version": SIGNAL_LOG_AGGREGATES_VERSION,
+            "compacted_through": self.compacted_through,
+            "pairs": {
+                pair: {
+                    "event_count": entry["event_count"],
+                    "event_types": entry["event_types"],
+                    "lemmas": sorted(entry["lemmas"]),
+                    "last_event_at": entry["last_event_at"],
+                }
+                for pair, entry in sorted(self.pairs.items())
+            },
+        }
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, target)
+
+    def add(self, record: Mapping[str, Any]) -> None:
+        pair = str(record.get("pair", ""))
+        entry = self.pairs.get(pair)
+        if entry is None:
+            entry = self.pairs[pair] = {
+                "event_count": 0,
+                "event_types": {},
+                "lemmas": set(),
+                "last_event_at": "",
+            }
+        event_type = str(record.get("event_type", ""))
+        entry["event_count"] += 1
+        entry["event_types"][event_type] = entry["event_types"].get(event_type, 0) + 1
+        entry["lemmas"].add(str(record.get("lemma", "")))
+        ts = str(record.get("ts") or "")
+        if ts > entry["last_event_at"]:
+            entry["last_event_at"] = ts
+
+
+def _iter_file_records(path: Path) -> Iterator[dict[str, Any]]:
+    try:
+        handle = path.open("rb")
+    except OSError:
+        return
+    with handle:
+        for line in handle:
+            record = _parse_line(line)
+            if record is not None:
+                yield record
+
+
+def _iter_file_records_reversed(path: Path) -> Iterator[dict[str, Any]]:
+    try:
+        handle = path.open("rb")
+    except OSError:
+        return
+    with handle:
+        position = handle.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            step = min(_READ_BLOCK_BYTES, position)
+            position -= step
+            handle.seek(position)
+            lines = (handle.read(step) + remainder).split(b"\n")
+            # The first piece may be the tail of a line that starts in the
+            # previous block; keep it until that block has been read.
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                record = _parse_line(line)
+                if record is not None:
+                    yield record
+        record = _parse_line(remainder)
+        if record is not None:
+            yield record
+
+
+def _parse_line(line: bytes) -> Optional[dict[str, Any]]:
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        record = json.loads(line.decode("utf-8"))
+    except ValueError:
+        # Torn write from a crash; the rest of the log is still usable.
+        return None
+    return record if isinstance(record, dict) else None
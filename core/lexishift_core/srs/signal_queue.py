@@ -3,8 +3,16 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 import json
 from pathlib import Path
-from typing import Mapping, Optional, Sequence
-
+from typing import Iterable, Iterator, Mapping, Optional, Sequence
+
+from lexishift_core.srs.signal_log import (
+    SignalLogAggregates,
+    append_signal_log_records,
+    is_signal_log_path,
+    iter_signal_log_records,
+    iter_signal_log_records_reversed,
+    reset_signal_log,
+)
 from lexishift_core.srs.source import normalize_source_type
 from lexishift_core.srs.time import now_utc
 
@@ -30,7 +38,7 @@ def _normalize_event_type(value: object) -> str:
     return "unknown"
 
 
-def _event_from_dict(data: Mapping[str, object]) -> Optional[SrsSignalEvent]:
+def event_from_dict(data: Mapping[str, object]) -> Optional[SrsSignalEvent]:
     pair = str(data.get("pair", "")).strip()
     lemma = str(data.get("lemma", "")).strip()
     if not pair or not lemma:
@@ -49,7 +57,7 @@ def _event_from_dict(data: Mapping[str, object]) -> Optional[SrsSignalEvent]:
     )
 
 
-def _event_to_dict(event: SrsSignalEvent) -> dict[str, object]:
+def event_to_dict(event: SrsSignalEvent) -> dict[str, object]:
     payload: dict[str, object] = {
         "event_type": _normalize_event_type(event.event_type),
         "pair": event.pair,
@@ -63,62 +71,160 @@ def _event_to_dict(event: SrsSignalEvent) -> dict[str, object]:
     return payload
 
 
-def load_signal_events(path: Path) -> tuple[SrsSignalEvent, ...]:
+def load_signal_events(
+    path: Path,
+    *,
+    pair: Optional[str] = None,
+    event_type: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> tuple[SrsSignalEvent, ...]:
+    """Events oldest first, optionally filtered by pair/type and limited to the
+    newest ``limit`` matches.
+
+    ``.jsonl`` paths are append-only signal logs. An unlimited load returns
+    every event, archived segments included; a limited load reads backwards
+    from the tail and stops once it has enough. Other paths hold the legacy
+    JSON document.
+    """
+    if is_signal_log_path(path):
+        return _load_log_events(Path(path), pair=pair, event_type=event_type, limit=limit)
+    events = _filter_events(_load_json_events(path), pair=pair, event_type=event_type)
+    if limit is not None:
+        events = events[-max(0, int(limit)) :] if limit > 0 else []
+    return tuple(events)
+
+
+def _load_json_events(path: Path) -> list[SrsSignalEvent]:
     if not path.exists():
-        return tuple()
+        return []
     try:
         data = json.loads(path.read_text(encoding="utf-8"))
     except Exception:  # noqa: BLE001
-        return tuple()
+        return []
     if not isinstance(data, Mapping):
-        return tuple()
+        return []
     raw_events = data.get("events")
     if not isinstance(raw_events, Sequence):
-        return tuple()
-    parsed: list[SrsSignalEvent] = []
-    for entry in raw_events:
+        return []
+    return list(_events_from_records(raw_events))
+
+
+def _events_from_records(records: Iterable[object]) -> Iterator[SrsSignalEvent]:
+    for entry in records:
         if not isinstance(entry, Mapping):
             continue
-        event = _event_from_dict(entry)
-        if event is None:
-            continue
-        parsed.append(event)
-    return tuple(parsed)
+        event = event_from_dict(entry)
+        if event is not None:
+            yield event
+
+
+def _filter_events(
+    events: Iterable[SrsSignalEvent],
+    *,
+    pair: Optional[str],
+    event_type: Optional[str],
+) -> list[SrsSignalEvent]:
+    return [
+        event
+        for event in events
+        if (not pair or event.pair == pair) and (not event_type or event.event_type == event_type)
+    ]
+
+
+def _load_log_events(
+    path: Path,
+    *,
+    pair: Optional[str],
+    event_type: Optional[str],
+    limit: Optional[int],
+) -> tuple[SrsSignalEvent, ...]:
+    if limit is None:
+        records = iter_signal_log_records(path, archived=True)
+        return tuple(_filter_events(_events_from_records(records), pair=pair, event_type=event_type))
+    wanted = max(0, int(limit))
+    newest_first: list[SrsSignalEvent] = []
+    if wanted:
+        for event in _events_from_records(iter_signal_log_records_reversed(path, archived=True)):
+            if (pair and event.pair != pair) or (event_type and event.event_type != event_type):
+                continue
+            newest_first.append(event)
+            if len(newest_first) >= wanted:
+                break
+    return tuple(reversed(newest_first))
 
 
 def save_signal_events(path: Path, events: Sequence[SrsSignalEvent], *, max_events: int = 5000) -> None:
+    if is_signal_log_path(path):
+        reset_signal_log(path)
+        append_signal_log_records(path, [event_to_dict(event) for event in events])
+        return
     bounded = list(events)[-max(1, int(max_events)) :]
     payload = {
         "version": 1,
-        "events": [_event_to_dict(event) for event in bounded],
+        "events": [event_to_dict(event) for event in bounded],
     }
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
 
 
 def append_signal_event(path: Path, event: SrsSignalEvent, *, max_events: int = 5000) -> None:
+    append_signal_events(path, (event,), max_events=max_events)
+
+
+def append_signal_events(path: Path, events: Sequence[SrsSignalEvent], *, max_events: int = 5000) -> None:
+    if not events:
+        return
+    if is_signal_log_path(path):
+        # One buffered write (and fsync) for the whole batch; max_events does
+        # not apply because old segments are compacted instead of dropped.
+        append_signal_log_records(path, [event_to_dict(event) for event in events])
+        return
     existing = list(load_signal_events(path))
-    existing.append(event)
+    existing.extend(events)
     save_signal_events(path, existing, max_events=max_events)
 
 
 def summarize_signal_events(path: Path, *, pair: Optional[str] = None) -> dict[str, object]:
-    events = load_signal_events(path)
-    scoped = [
-        event for event in events if not pair or event.pair == pair
-    ]
     event_types: dict[str, int] = {}
-    unique_lemmas = set()
+    unique_lemmas: set[str] = set()
     last_event_at = ""
-    for event in scoped:
+    event_count = 0
+    if is_signal_log_path(path):
+        aggregates = SignalLogAggregates.load(Path(path))
+        for entry_pair, entry in aggregates.pairs.items():
+            if pair and entry_pair != pair:
+                continue
+            event_count += entry["event_count"]
+            for key, count in entry["event_types"].items():
+                event_types[key] = event_types.get(key, 0) + count
+            unique_lemmas.update(entry["lemmas"])
+            last_event_at = max(last_event_at, entry["last_event_at"])
+        events: Iterable[SrsSignalEvent] = _events_from_records(iter_signal_log_records(Path(path)))
+    else:
+        events = _load_json_events(path)
+    for event in events:
+        if pair and event.pair != pair:
+            continue
+        event_count += 1
         event_types[event.event_type] = event_types.get(event.event_type, 0) + 1
         unique_lemmas.add(event.lemma)
         if event.ts and event.ts > last_event_at:
             last_event_at = event.ts
     return {
         "pair": pair or "all",
-        "event_count": len(scoped),
+        "event_count": event_count,
         "event_types": event_types,
         "unique_lemmas": len(unique_lemmas),
         "last_event_at": last_event_at or None,
     }
+
+
+def import_legacy_signal_queue(json_path: Path, log_path: Path) -> int:
+    """Copy a legacy JSON signal queue into a new signal log, keeping the old
+    file as ``.bak``. Does nothing once the log exists."""
+    if not json_path.exists() or log_path.exists():
+        return 0
+    events = _load_json_events(json_path)
+    append_signal_log_records(log_path, [event_to_dict(event) for event in events])
+    json_path.replace(json_path.with_name(json_path.name + ".bak"))
+    return len(events)
@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+from collections import deque
+import json
+import os
+from pathlib import Path
+from typing import Any, Mapping, Optional, Sequence
+
+from lexishift_core.srs.admission_refresh import (
+    FeedbackWindowStats,
+    compute_feedback_window_stats,
+    feedback_window_stats_from_ratings,
+)
+from lexishift_core.srs.signal_log import (
+    DEFAULT_FEEDBACK_TAIL,
+    SignalLogAggregates,
+    is_signal_log_path,
+    iter_archived_signal_log_records_reversed,
+    signal_log_aggregates_path,
+    signal_log_lock,
+    signal_log_segment_files,
+    signal_log_stats_lemmas_path,
+    signal_log_stats_path,
+)
+from lexishift_core.srs.signal_queue import (
+    SIGNAL_FEEDBACK,
+    SrsSignalEvent,
+    append_signal_events,
+    event_from_dict,
+    load_signal_events,
+    summarize_signal_events,
+)
+
+SIGNAL_STATS_VERSION = 2
+_HEAD_BYTES = 96
+
+
+class SignalStats:
+    """Running per-pair signal totals for one signal log.
+
+    Per pair it keeps event counts by type, the unique lemma count, the
+    newest timestamp and a ring buffer of the last ``window`` feedback
+    ratings, plus a cursor (last folded segment, byte offset and leading
+    bytes of the active file) so only records appended since the last update
+    are parsed. Unique counts are exact, so results equal
+    ``summarize_signal_events``; the lemma sets behind them live in an
+    append-only journal that is only read when new records are folded.
+    """
+
+    def __init__(self, *, window: int = DEFAULT_FEEDBACK_TAIL) -> None:
+        self.window = max(1, int(window))
+        self.through_seq = 0
+        self.offset = 0
+        self.active_head: Optional[str] = None
+        self.aggregates_sig: Optional[list[int]] = None
+        self.pairs: dict[str, dict[str, Any]] = {}
+        self.unique_lemmas = 0
+        self.lemmas_size = 0
+        self._log_path: Optional[Path] = None
+        self._lemmas: Optional[dict[str, set[str]]] = None
+        self._new_lemmas: list[tuple[str, str]] = []
+
+    @classmethod
+    def load(cls, log_path: Path, *, window: int = DEFAULT_FEEDBACK_TAIL) -> Optional["SignalStats"]:
+        try:
+            data = json.loads(signal_log_stats_path(log_path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, Mapping) or data.get("version") != SIGNAL_STATS_VERSION:
+            return None
+        if int(data.get("window", 0) or 0) != max(1, int(window)):
+            return None
+        stats = cls(window=window)
+        stats.lemmas_size = int(data.get("lemmas_size", 0) or 0)
+        if _file_size(signal_log_stats_lemmas_path(log_path)) < stats.lemmas_size:
+            return None
+        stats._log_path = log_path
+        stats.through_seq = int(data.get("through_seq", 0) or 0)
+        stats.offset = int(data.get("offset", 0) or 0)
+        stats.active_head = data.get("active_head")
+        stats.aggregates_sig = data.get("aggregates_sig")
+        stats.unique_lemmas = int(data.get("unique_lemmas", 0) or 0)
+        for pair, entry in dict(data.get("pairs") or {}).items():
+            stats.pairs[str(pair)] = {
+                "event_count": int(entry.get("event_count", 0)),
+                "event_types": {str(k): int(v) for k, v in dict(entry.get("event_types") or {}).items()},
+                "unique_lemmas": int(entry.get("unique_lemmas", 0)),
+                "last_event_at": str(entry.get("last_event_at") or ""),
+                "ratings": deque(entry.get("ratings") or (), maxlen=stats.window),
+            }
+        return stats
+
+    def save(self, log_path: Path) -> None:
+        target = signal_log_stats_path(log_path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        self._save_new_lemmas(log_path)
+        payload = {
+            "version": SIGNAL_STATS_VERSION,
+            "window": self.window,
+            "through_seq": self.through_seq,
+            "offset": self.offset,
+            "active_head": self.active_head,
+            "aggregates_sig": self.aggregates_sig,
+            "unique_lemmas": self.unique_lemmas,
+            "lemmas_size": self.lemmas_size,
+            "pairs": {
+                pair: {
+                    "event_count": entry["event_count"],
+                    "event_types": entry["event_types"],
+                    "unique_lemmas": entry["unique_lemmas"],
+                    "last_event_at": entry["last_event_at"],
+                    "ratings": list(entry["ratings"]),
+                }
+                for pair, entry in sorted(self.pairs.items())
+            },
+        }
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, target)
+
+    def add(self, event: SrsSignalEvent) -> None:
+        entry = self._entry(event.pair)
+        entry["event_count"] += 1
+        entry["event_types"][event.event_type] = entry["event_types"].get(event.event_type, 0) + 1
+        self._add_lemma(event.pair, event.lemma)
+        if event.ts and event.ts > entry["last_event_at"]:
+            entry["last_event_at"] = event.ts
+        if event.event_type == SIGNAL_FEEDBACK:
+            entry["ratings"].append(event.rating or "")
+
+    def summary(self, pair: Optional[str] = None) -> dict[str, object]:
+        """Same payload as ``summarize_signal_events``."""
+        if pair:
+            entries = [self.pairs[pair]] if pair in self.pairs else []
+            unique_lemmas = entries[0]["unique_lemmas"] if entries else 0
+        else:
+            entries = list(self.pairs.values())
+            unique_lemmas = self.unique_lemmas
+        event_types: dict[str, int] = {}
+        for entry in entries:
+            for key, count in entry["event_types"].items():
+                event_types[key] = event_types.get(key, 0) + count
+        last_event_at = max((entry["last_event_at"] for entry in entries), default="")
+        return {
+            "pair": pair or "all",
+            "event_count": sum(entry["event_count"] for entry in entries),
+            "event_types": event_types,
+            "unique_lemmas": unique_lemmas,
+            "last_event_at": last_event_at or None,
+        }
+
+    def feedback_window(self, pair: str, window_size: int) -> Optional[FeedbackWindowStats]:
+        """Window stats from the ring buffer, or ``None`` when the window is
+        larger than the buffer."""
+        if max(1, int(window_size)) > self.window:
+            return None
+        entry = self.pairs.get(pair)
+        return feedback_window_stats_from_ratings(
+            entry["ratings"] if entry else (),
+            pair=pair,
+            window_size=window_size,
+        )
+
+    def _entry(self, pair: str) -> dict[str, Any]:
+        entry = self.pairs.get(pair)
+        if entry is None:
+            entry = self.pairs[pair] = {
+                "event_count": 0,
+                "event_types": {},
+                "unique_lemmas": 0,
+                "last_event_at": "",
+                "ratings": deque(maxlen=self.window),
+            }
+        return entry
+
+    def _add_lemma(self, pair: str, lemma: str) -> None:
+        lemmas = self._lemma_sets()
+        pair_lemmas = lemmas.setdefault(pair, set())
+        if lemma in pair_lemmas:
+            return
+        if not any(lemma in others for others in lemmas.values()):
+            self.unique_lemmas += 1
+        pair_lemmas.add(lemma)
+        self._entry(pair)["unique_lemmas"] += 1
+        self._new_lemmas.append((pair, lemma))
+
+    def _lemma_sets(self) -> dict[str, set[str]]:
+        if self._lemmas is None:
+            self._lemmas = {}
+            data = b""
+            if self._log_path is not None and self.lemmas_size:
+                with signal_log_stats_lemmas_path(self._log_path).open("rb") as handle:
+                    data = handle.read(self.lemmas_size)
+            for line in data.splitlines():
+                pair, lemma = json.loads(line.decode("utf-8"))
+                self._lemmas.setdefault(pair, set()).add(lemma)
+        return self._lemmas
+
+    def _save_new_lemmas(self, log_path: Path) -> None:
+        if not self._new_lemmas and _file_size(signal_log_stats_lemmas_path(log_path)) == self.lemmas_size:
+            return
+        data = b"".join(
+            json.dumps([pair, lemma], ensure_ascii=False).encode("utf-8") + b"\n" for pair, lemma in self._new_lemmas
+        )
+        with signal_log_stats_lemmas_path(log_path).open("a+b") as handle:
+            # Bytes past the recorded size were left by a save that never
+            # wrote its stats file.
+            handle.truncate(self.lemmas_size)
+            handle.write(data)
+        self.lemmas_size += len(data)
+        self._new_lemmas = []
+
+
+def update_signal_stats(log_path: Path, *, window: int = DEFAULT_FEEDBACK_TAIL) -> SignalStats:
+    """Load the stats for ``log_path`` and fold in records appended since the
+    last call, saving them when anything changed.
+
+    Rebuilds from the compaction aggregates plus live segments when the
+    cursor can no longer be followed (stats missing, log reset, or segments
+    compacted before the stats saw them). Runs under the signal log lock.
+    """
+    log_path = Path(log_path)
+    with signal_log_lock(log_path):
+        stats = SignalStats.load(log_path, window=window)
+        if stats is None:
+            stats = _rebuild(log_path, window=window)
+        else:
+            cursor = (stats.through_seq, stats.offset, stats.active_head, stats.aggregates_sig)
+            if not _catch_up(stats, log_path):
+                stats = _rebuild(log_path, window=window)
+            elif (stats.through_seq, stats.offset, stats.active_head, stats.aggregates_sig) == cursor:
+                return stats
+        stats.save(log_path)
+    return stats
+
+
+def record_signal_events(path: Path, events: Sequence[SrsSignalEvent]) -> None:
+    """Append ``events`` to the signal queue at ``path`` and, for signal
+    logs, fold them into the running stats so reads find them current."""
+    append_signal_events(path, events)
+    if events and is_signal_log_path(path):
+        update_signal_stats(path)
+
+
+def summarize_signal_stats(path: Path, *, pair: Optional[str] = None) -> dict[str, object]:
+    if not is_signal_log_path(path):
+        return summarize_signal_events(path, pair=pair)
+    return update_signal_stats(path).summary(pair)
+
+
+def load_feedback_window_stats(path: Path, *, pair: str, window_size: int) -> FeedbackWindowStats:
+    if is_signal_log_path(path):
+        window = update_signal_stats(path).feedback_window(pair, window_size)
+        if window is not None:
+            return window
+    events = load_signal_events(path, pair=pair, event_type=SIGNAL_FEEDBACK, limit=max(1, int(window_size)))
+    return compute_feedback_window_stats(events, pair=pair, window_size=window_size)
+
+
+def _rebuild(log_path: Path, *, window: int) -> SignalStats:
+    # Starts with an empty lemma journal, which the first save rewrites.
+    stats = SignalStats(window=window)
+    aggregates = SignalLogAggregates.load(log_path)
+    for pair, entry in aggregates.pairs.items():
+        target = stats._entry(pair)
+        target["event_count"] = entry["event_count"]
+        target["event_types"] = dict(entry["event_types"])
+        target["last_event_at"] = entry["last_event_at"]
+        for lemma in sorted(entry["lemmas"]):
+            stats._add_lemma(pair, lemma)
+    _fill_ratings_from_archive(stats, log_path, aggregates)
+    stats.through_seq = aggregates.compacted_through
+    stats.aggregates_sig = _file_signature(signal_log_aggregates_path(log_path))
+    _catch_up(stats, log_path)
+    return stats
+
+
+def _fill_ratings_from_archive(stats: SignalStats, log_path: Path, aggregates: SignalLogAggregates) -> None:
+    # Read archived segments backwards only until every pair's ring buffer
+    # is as full as its compacted feedback allows.
+    wanted = {
+        pair: min(stats.window, entry["event_types"].get(SIGNAL_FEEDBACK, 0))
+        for pair, entry in aggregates.pairs.items()
+    }
+    tails: dict[str, list[str]] = {pair: [] for pair, count in wanted.items() if count}
+    pending = set(tails)
+    if pending:
+        for record in iter_archived_signal_log_records_reversed(log_path):
+            pair = str(record.get("pair", ""))
+            if pair not in pending or record.get("event_type") != SIGNAL_FEEDBACK:
+                continue
+            tails[pair].append(str(record.get("rating") or "").strip())
+            if len(tails[pair]) >= wanted[pair]:
+                pending.discard(pair)
+                if not pending:
+                    break
+    for pair, ratings in tails.items():
+        stats._entry(pair)["ratings"].extend(reversed(ratings))
+
+
+def _catch_up(stats: SignalStats, log_path: Path) -> bool:
+    aggregates_sig = _file_signature(signal_log_aggregates_path(log_path))
+    if aggregates_sig != stats.aggregates_sig:
+        # Segments were compacted since the last read; make sure none of
+        # them was deleted before being folded here.
+        if SignalLogAggregates.load(log_path).compacted_through > stats.through_seq:
+            return False
+        stats.aggregates_sig = aggregates_sig
+    segments = [(seq, path) for seq, path in signal_log_segment_files(log_path) if seq > stats.through_seq]
+    try:
+        active_size = log_path.stat().st_size
+    except OSError:
+        active_size = None
+    if segments:
+        first_seq, first_path = segments[0]
+        if first_seq != stats.through_seq + 1:
+            return False
+        if stats.offset and _file_head(first_path, stats.offset) != stats.active_head:
+            return False
+        for index, (seq, segment) in enumerate(segments):
+            _fold_file(stats, segment, stats.offset if index == 0 else 0, complete_only=False)
+            stats.through_seq = seq
+            stats.offset = 0
+    elif stats.offset and (active_size is None or _file_head(log_path, stats.offset) != stats.active_head):
+        # The file we were reading was rotated and compacted away (inodes
+        # can be reused, so files are told apart by their first bytes).
+        return False
+    if active_size is None:
+        stats.active_head = None
+        return True
+    if active_size < stats.offset:
+        return False
+    stats.offset = _fold_file(stats, log_path, stats.offset, complete_only=True)
+    stats.active_head = _file_head(log_path, stats.offset) if stats.offset else None
+    return True
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _file_signature(path: Path) -> Optional[list[int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _file_head(path: Path, folded_bytes: int) -> Optional[str]:
+    try:
+        with path.open("rb") as handle:
+            return handle.read(min(_HEAD_BYTES, folded_bytes)).hex()
+    except OSError:
+        return None
+
+
+def _fold_file(stats: SignalStats, path: Path, offset: int, *, complete_only: bool) -> int:
+    try:
+        handle = path.open("rb")
+    except OSError:
+        return offset
+    with handle:
+        handle.seek(offset)
+        data = handle.read()
+    if complete_only:
+        # A line still being written by another process is left for later.
+        data = data[: data.rfind(b"\n") + 1]
+    for line in data.split(b"\n"):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line.decode("utf-8"))
+        except ValueError:
+            continue
+        event = event_from_dict(record) if isinstance(record, Mapping) else None
+        if event is not None:
+            stats.add(event)
+    return offset + len(data)
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sqlite3
+from typing import Any, Iterable, Optional, Sequence
+
+from lexishift_core.srs.store import (
+    SrsHistoryEntry,
+    SrsItem,
+    SrsStore,
+    load_srs_store,
+    srs_store_to_dict,
+)
+
+SRS_SQLITE_SCHEMA_VERSION = 1
+
+_ITEM_COLUMNS = (
+    "item_id",
+    "lemma",
+    "language_pair",
+    "source_type",
+    "confidence",
+    "stability",
+    "difficulty",
+    "last_seen",
+    "next_due",
+    "exposures",
+    "word_package",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    item_id TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    lemma TEXT NOT NULL,
+    language_pair TEXT NOT NULL,
+    source_type TEXT NOT NULL,
+    confidence REAL,
+    stability REAL,
+    difficulty REAL,
+    last_seen TEXT,
+    next_due TEXT,
+    exposures INTEGER NOT NULL DEFAULT 0,
+    word_package TEXT
+);
+CREATE INDEX IF NOT EXISTS items_pair_due ON items (language_pair, next_due);
+CREATE INDEX IF NOT EXISTS items_seq ON items (seq);
+CREATE TABLE IF NOT EXISTS history (
+    item_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    ts TEXT NOT NULL,
+    rating TEXT NOT NULL,
+    PRIMARY KEY (item_id, position)
+) WITHOUT ROWID;
+"""
+
+_UPSERT_ITEM = f"""
+INSERT INTO items (seq, {", ".join(_ITEM_COLUMNS)})
+VALUES ((SELECT COALESCE(MAX(seq), -1) + 1 FROM items), {", ".join("?" for _ in _ITEM_COLUMNS)})
+ON CONFLICT (item_id) DO UPDATE SET
+{", ".join(f"{column} = excluded.{column}" for column in _ITEM_COLUMNS[1:])}
+"""
+
+
+class SqliteSrsStore:
+    """SRS store persisted in SQLite (WAL mode).
+
+    Items keep their ``SrsStore`` order through a ``seq`` column; history
+    rows are keyed by ``(item_id, position)`` so a signal that appends one
+    rating writes one history row plus one item row.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._conn = sqlite3.connect(str(self._path))
+        self._conn.execute("PRAGMA journal_mode=WAL;")
+        self._conn.execute("PRAGMA synchronous=NORMAL;")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?);",
+                (str(SRS_SQLITE_SCHEMA_VERSION),),
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "SqliteSrsStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def version(self) -> int:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'store_version';").fetchone()
+        return int(row[0]) if row else 1
+
+    def load(self) -> SrsStore:
+        rows = self._conn.execute(
+            f"SELECT {', '.join(_ITEM_COLUMNS)} FROM items ORDER BY seq;"
+        ).fetchall()
+        history = self._load_history()
+        items = tuple(_item_from_row(row, history.get(row[0], ())) for row in rows)
+        return SrsStore(items=items, version=self.version)
+
+    def get_item(self, item_id: str) -> Optional[SrsItem]:
+        row = self._conn.execute(
+            f"SELECT {', '.join(_ITEM_COLUMNS)} FROM items WHERE item_id = ?;",
+            (item_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return _item_from_row(row, self._item_history(item_id))
+
+    def items_for_pair(self, pair: str) -> tuple[SrsItem, ...]:
+        rows = self._conn.execute(
+            f"SELECT {', '.join(_ITEM_COLUMNS)} FROM items WHERE language_pair = ? ORDER BY seq;",
+            (pair,),
+        ).fetchall()
+        history = self._load_history(pair=pair)
+        return tuple(_item_from_row(row, history.get(row[0], ())) for row in rows)
+
+    def count_for_pair(self, pair: str) -> int:
+        row = self._conn.execute(
+            "SELECT COUNT(*) FROM items WHERE language_pair = ?;",
+            (pair,),
+        ).fetchone()
+        return int(row[0])
+
+    def upsert_item(self, item: SrsItem) -> None:
+        with self._conn:
+            self._write_item(item)
+
+    def upsert_items(self, items: Iterable[SrsItem]) -> None:
+        with self._conn:
+            for item in items:
+                self._write_item(item)
+
+    def replace_all(self, store: SrsStore) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM history;")
+            self._conn.execute("DELETE FROM items;")
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO items (seq, {', '.join(_ITEM_COLUMNS)}) "
+                f"VALUES (?, {', '.join('?' for _ in _ITEM_COLUMNS)});",
+                ((seq, *_item_to_row(item)) for seq, item in enumerate(store.items)),
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO history (item_id, position, ts, rating) VALUES (?, ?, ?, ?);",
+                (
+                    (item.item_id, position, entry.ts, entry.rating)
+                    for item in store.items
+                    for position, entry in enumerate(item.history)
+                ),
+            )
+            self._set_version(store.version)
+
+    def to_dict(self) -> dict[str, Any]:
+        return srs_store_to_dict(self.load())
+
+    def export_json(self, path: str | Path) -> None:
+        payload = json.dumps(self.to_dict(), indent=2, sort_keys=True)
+        Path(path).write_text(payload, encoding="utf-8")
+
+    def _write_item(self, item: SrsItem) -> None:
+        self._conn.execute(_UPSERT_ITEM, _item_to_row(item))
+        stored = self._item_history(item.item_id)
+        keep = 0
+        for old, new in zip(stored, item.history):
+            if old != new:
+                break
+            keep += 1
+        if keep < len(stored):
+            self._conn.execute(
+                "DELETE FROM history WHERE item_id = ? AND position >= ?;",
+                (item.item_id, keep),
+            )
+        self._conn.executemany(
+            "INSERT INTO history (item_id, position, ts, rating) VALUES (?, ?, ?, ?);",
+            (
+                (item.item_id, position, entry.ts, entry.rating)
+                for position, entry in enumerate(item.history[keep:], start=keep)
+            ),
+        )
+
+    def _set_version(self, version: int) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('store_version', ?);",
+            (str(version),),
+        )
+
+    def _item_history(self, item_id: str) -> tuple[SrsHistoryEntry, ...]:
+        rows = self._conn.execute(
+            "SELECT ts, rating FROM history WHERE item_id = ? ORDER BY position;",
+            (item_id,),
+        ).fetchall()
+        return tuple(SrsHistoryEntry(ts=ts, rating=rating) for ts, rating in rows)
+
+    def _load_history(self, *, pair: Optional[str] = None) -> dict[str, tuple[SrsHistoryEntry, ...]]:
+        if pair is None:
+            rows = self._conn.execute(
+                "SELECT item_id, ts, rating FROM history ORDER BY item_id, position;"
+            )
+        else:
+            rows = self._conn.execute(
+                "SELECT history.item_id, history.ts, history.rating FROM history "
+                "JOIN items ON items.item_id = history.item_id "
+                "WHERE items.language_pair = ? ORDER BY history.item_id, history.position;",
+                (pair,),
+            )
+        grouped: dict[str, list[SrsHistoryEntry]] = {}
+        for item_id, ts, rating in rows:
+            grouped.setdefault(item_id, []).append(SrsHistoryEntry(ts=ts, rating=rating))
+        return {item_id: tuple(entries) for item_id, entries in grouped.items()}
+
+
+def load_sqlite_srs_store(path: str | Path) -> SrsStore:
+    with SqliteSrsStore(path) as db:
+        return db.load()
+
+
+def save_sqlite_srs_store(store: SrsStore, path: str | Path) -> None:
+    with SqliteSrsStore(path) as db:
+        db.replace_all(store)
+
+
+def migrate_json_srs_store(
+    json_path: str | Path,
+    db_path: str | Path,
+    *,
+    overwrite: bool = False,
+) -> int:
+    """Copy a JSON SRS store into a SQLite store; returns the item count.
+
+    The JSON file is left in place. An existing database is only replaced
+    when ``overwrite`` is set.
+    """
+    target = Path(db_path)
+    if target.exists() and not overwrite:
+        raise FileExistsError(target)
+    store = load_srs_store(json_path)
+    save_sqlite_srs_store(store, target)
+    return len(store.items)
+
+
+def export_sqlite_srs_store_json(db_path: str | Path, json_path: str | Path) -> None:
+    with SqliteSrsStore(db_path) as db:
+        db.export_json(json_path)
+
+
+def _item_to_row(item: SrsItem) -> Sequence[Any]:
+    word_package = json.dumps(dict(item.word_package), sort_keys=True) if item.word_package else None
+    return (
+        item.item_id,
+        item.lemma,
+        item.language_pair,
+        item.source_type,
+        item.confidence,
+        item.stability,
+        item.difficulty,
+        item.last_seen,
+        item.next_due,
+        item.exposures,
+        word_package,
+    )
+
+
+def _item_from_row(row: Sequence[Any], history: Sequence[SrsHistoryEntry]) -> SrsItem:
+    (
+        item_id,
+        lemma,
+        language_pair,
+        source_type,
+        confidence,
+        stability,
+        difficulty,
+        last_seen,
+        next_due,
+        exposures,
+        word_package,
+    ) = row
+    return SrsItem(
+        item_id=item_id,
+        lemma=lemma,
+        language_pair=language_pair,
+        source_type=source_type,
+        confidence=confidence,
+        stability=stability,
+        difficulty=difficulty,
+        last_seen=last_seen,
+        next_due=next_due,
+        exposures=int(exposures),
+        history=tuple(history),
+        word_package=json.loads(word_package) if word_package else None,
+    )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import datetime
 import json
 from pathlib import Path
 from typing import Any, Mapping, Optional, Sequence
@@ -10,6 +11,8 @@ from lexishift_core.lexicon.word_package import (
     resolve_language_tag_from_pair,
 )
 
+SRS_SQLITE_SUFFIXES = (".sqlite", ".sqlite3", ".db")
+
 
 @dataclass(frozen=True)
 class SrsSync:
@@ -58,9 +61,57 @@ class SrsItem:
 
 @dataclass(frozen=True)
 class SrsStore:
+    """Immutable SRS store.
+
+    The query and update methods scan ``items``; ``IndexedSrsStore``
+    overrides them with indexes. Updates return a new store; ``in_place``
+    lets a caller that owns an indexed store skip the copy and is ignored
+    here.
+    """
+
     items: Sequence[SrsItem] = field(default_factory=tuple)
     version: int = 1
 
+    def get(self, item_id: str) -> Optional[SrsItem]:
+        for item in self.items:
+            if item.item_id == item_id:
+                return item
+        return None
+
+    def items_for_pair(self, pair: str) -> tuple[SrsItem, ...]:
+        return tuple(item for item in self.items if item.language_pair == pair)
+
+    def count_for_pair(self, pair: str) -> int:
+        return sum(1 for item in self.items if item.language_pair == pair)
+
+    def select_due(
+        self,
+        *,
+        now: Optional[datetime] = None,
+        max_active: int = 40,
+        allowed_pairs: Optional[Sequence[str]] = None,
+    ) -> list[SrsItem]:
+        from lexishift_core.srs.scheduler import select_active_items
+
+        return select_active_items(self.items, now=now, max_active=max_active, allowed_pairs=allowed_pairs)
+
+    def upsert(self, item: SrsItem, *, in_place: bool = False) -> "SrsStore":
+        """Return a store with ``item`` replacing the one with its id in place,
+        or appended."""
+        items = list(self.items)
+        for idx, existing in enumerate(items):
+            if existing.item_id == item.item_id:
+                items[idx] = item
+                return SrsStore(items=tuple(items), version=self.version)
+        items.append(item)
+        return SrsStore(items=tuple(items), version=self.version)
+
+    def remove(self, item_id: str, *, in_place: bool = False) -> "SrsStore":
+        return SrsStore(
+            items=tuple(item for item in self.items if item.item_id != item_id),
+            version=self.version,
+        )
+
 
 @dataclass(frozen=True)
 class PracticeGateState:
@@ -194,11 +245,20 @@ def save_srs_settings(settings: SrsSettings, path: str | Path) -> None:
 
 
 def load_srs_store(path: str | Path) -> SrsStore:
+    if is_sqlite_store_path(path):
+        from lexishift_core.srs.sqlite_store import load_sqlite_srs_store
+
+        return load_sqlite_srs_store(path)
     payload = Path(path).read_text(encoding="utf-8")
     return srs_store_from_dict(json.loads(payload))
 
 
 def save_srs_store(store: SrsStore, path: str | Path) -> None:
+    if is_sqlite_store_path(path):
+        from lexishift_core.srs.sqlite_store import save_sqlite_srs_store
+
+        save_sqlite_srs_store(store, path)
+        return
     payload = json.dumps(srs_store_to_dict(store), indent=2, sort_keys=True)
     Path(path).write_text(payload, encoding="utf-8")
 
@@ -214,3 +274,7 @@ def srs_bundle_from_dict(data: Mapping[str, Any]) -> tuple[SrsSettings, SrsStore
     settings = srs_settings_from_dict(data.get("settings", {}))
     store = srs_store_from_dict(data.get("items", {}))
     return settings, store
+
+
+def is_sqlite_store_path(path: str | Path) -> bool:
+    return Path(path).suffix.lower() in SRS_SQLITE_SUFFIXES
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from datetime import datetime
+from heapq import merge
+from itertools import islice
+from typing import Iterable, Optional, Sequence
+
+from lexishift_core.srs.store import SrsItem, SrsStore
+from lexishift_core.srs.time import now_utc, parse_ts
+
+_UNSCHEDULED = float("-inf")
+
+
+class IndexedSrsStore(SrsStore):
+    """SRS store with lookup indexes.
+
+    A drop-in ``SrsStore``: an item-id map, per-pair buckets and a per-pair
+    due-date index ordered by ``(next_due, insertion order)`` back ``get``,
+    ``items_for_pair``, ``count_for_pair`` and ``select_due``. ``items`` keeps
+    insertion order, and replacing an item keeps its position.
+
+    ``upsert`` and ``remove`` are copy-on-write like on ``SrsStore``: they
+    copy the indexes (not the items), O(n), and leave this store unchanged.
+    With ``in_place=True`` they update this store's indexes directly (a
+    bisect plus a list insert or delete per due index) and return it;
+    only pass it for a store nobody else holds (one the caller just built),
+    never for a cached or shared one.
+    """
+
+    def __init__(self, items: Iterable[SrsItem] = (), *, version: int = 1) -> None:
+        self._init_indexes(version)
+        for item in items:
+            # Plain stores resolve duplicate ids to the first match.
+            if item.item_id not in self._items:
+                self._put(item)
+
+    @classmethod
+    def from_store(cls, store: SrsStore) -> "IndexedSrsStore":
+        if isinstance(store, IndexedSrsStore):
+            return store
+        return cls(store.items, version=store.version)
+
+    def to_store(self) -> SrsStore:
+        return SrsStore(items=self.items, version=self.version)
+
+    @property
+    def items(self) -> tuple[SrsItem, ...]:
+        if self._snapshot is None:
+            object.__setattr__(self, "_snapshot", tuple(self._items.values()))
+        return self._snapshot
+
+    @property
+    def pairs(self) -> tuple[str, ...]:
+        return tuple(self._pairs)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, item_id: str) -> Optional[SrsItem]:
+        return self._items.get(item_id)
+
+    def items_for_pair(self, pair: str) -> tuple[SrsItem, ...]:
+        return tuple(self._pairs.get(pair, {}).values())
+
+    def count_for_pair(self, pair: str) -> int:
+        return len(self._pairs.get(pair, ()))
+
+    def upsert(self, item: SrsItem, *, in_place: bool = False) -> "IndexedSrsStore":
+        if in_place:
+            self._put(item)
+            return self
+        existing = self._items.get(item.item_id)
+        updated = self._copy(
+            pairs={item.language_pair} | ({existing.language_pair} if existing else set()),
+            new_ids=existing is None,
+        )
+        updated._put(item)
+        return updated
+
+    def remove(self, item_id: str, *, in_place: bool = False) -> "IndexedSrsStore":
+        item = self._items.get(item_id)
+        if item is None:
+            return self
+        updated = self if in_place else self._copy(pairs={item.language_pair}, new_ids=True)
+        del updated._items[item_id]
+        updated._unindex_due(item, updated._seqs.pop(item_id))
+        updated._unindex_pair(item)
+        object.__setattr__(updated, "_snapshot", None)
+        return updated
+
+    def select_due(
+        self,
+        *,
+        now: Optional[datetime] = None,
+        max_active: int = 40,
+        allowed_pairs: Optional[Sequence[str]] = None,
+    ) -> list[SrsItem]:
+        """Same result as ``select_active_items`` over ``items``, reading only
+        the due prefix of the allowed pairs."""
+        now = now or now_utc()
+        limit = now.timestamp()
+        pairs = set(allowed_pairs or []) or self._pairs.keys()
+        indexes = [self._due[pair] for pair in pairs if pair in self._due]
+        selected: list[SrsItem] = []
+        for key, _seq, item_id in islice(merge(*indexes), max(0, max_active)):
+            if key > limit:
+                break
+            selected.append(self._items[item_id])
+        return selected
+
+    def _init_indexes(self, version: int) -> None:
+        # The dataclass is frozen; indexes are only written while a store
+        # is being built, before it is returned.
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "_items", {})
+        object.__setattr__(self, "_seqs", {})
+        object.__setattr__(self, "_next_seq", 0)
+        object.__setattr__(self, "_pairs", {})
+        object.__setattr__(self, "_due", {})
+        object.__setattr__(self, "_snapshot", None)
+
+    def _copy(self, *, pairs: set[str], new_ids: bool) -> "IndexedSrsStore":
+        updated = IndexedSrsStore.__new__(IndexedSrsStore)
+        updated._init_indexes(self.version)
+        object.__setattr__(updated, "_items", self._items.copy())
+        # Sequence numbers never change for a kept id, so replacing an item
+        # can share them.
+        object.__setattr__(updated, "_seqs", self._seqs.copy() if new_ids else self._seqs)
+        object.__setattr__(updated, "_next_seq", self._next_seq)
+        object.__setattr__(updated, "_pairs", self._pairs.copy())
+        object.__setattr__(updated, "_due", self._due.copy())
+        # Only the touched pairs' buckets are copied; the rest stay shared.
+        for pair in pairs:
+            if pair in self._pairs:
+                updated._pairs[pair] = self._pairs[pair].copy()
+                updated._due[pair] = self._due[pair].copy()
+        return updated
+
+    def _put(self, item: SrsItem) -> None:
+        item_id = item.item_id
+        existing = self._items.get(item_id)
+        if existing is None:
+            seq = self._next_seq
+            object.__setattr__(self, "_next_seq", seq + 1)
+            self._seqs[item_id] = seq
+        else:
+            seq = self._seqs[item_id]
+            self._unindex_due(existing, seq)
+            if existing.language_pair != item.language_pair:
+                self._unindex_pair(existing)
+        self._items[item_id] = item
+        self._pairs.setdefault(item.language_pair, {})[item_id] = item
+        insort(self._due.setdefault(item.language_pair, []), (_due_key(item), seq, item_id))
+        object.__setattr__(self, "_snapshot", None)
+
+    def _unindex_due(self, item: SrsItem, seq: int) -> None:
+        due = self._due[item.language_pair]
+        entry = (_due_key(item), seq, item.item_id)
+        position = bisect_left(due, entry)
+        if position < len(due) and due[position] == entry:
+            del due[position]
+
+    def _unindex_pair(self, item: SrsItem) -> None:
+        bucket = self._pairs[item.language_pair]
+        bucket.pop(item.item_id, None)
+        if not bucket:
+            del self._pairs[item.language_pair]
+            del self._due[item.language_pair]
+
+
+def _due_key(item: SrsItem) -> float:
+    # Unscheduled or unparseable dates sort first, like ``select_active_items``.
+    next_due = parse_ts(item.next_due)
+    return next_due.timestamp() if next_due is not None else _UNSCHEDULED
@@ -19,21 +19,13 @@ def build_item_id(language_pair: str, lemma: str) -> str:
 
 
 def find_item(store: SrsStore, *, language_pair: str, lemma: str) -> Optional[SrsItem]:
-    item_id = build_item_id(language_pair, lemma)
-    for item in store.items:
-        if item.item_id == item_id:
-            return item
-    return None
+    return store.get(build_item_id(language_pair, lemma))
 
 
-def upsert_item(store: SrsStore, item: SrsItem) -> SrsStore:
-    items = list(store.items)
-    for idx, existing in enumerate(items):
-        if existing.item_id == item.item_id:
-            items[idx] = item
-            return SrsStore(items=tuple(items), version=store.version)
-    items.append(item)
-    return SrsStore(items=tuple(items), version=store.version)
+def upsert_item(store: SrsStore, item: SrsItem, *, in_place: bool = False) -> SrsStore:
+    """Return ``store`` with ``item`` upserted; see ``SrsStore.upsert`` for
+    ``in_place``."""
+    return store.upsert(item, in_place=in_place)
 
 
 def record_exposure(
@@ -45,6 +37,7 @@ def record_exposure(
     create_if_missing: bool = False,
     source_type: str = SOURCE_UNKNOWN,
     word_package: Optional[Mapping[str, object]] = None,
+    in_place: bool = False,
 ) -> SrsStore:
     now = now or now_utc()
     source_type = normalize_source_type(source_type)
@@ -73,7 +66,7 @@ def record_exposure(
         exposures=item.exposures + 1,
         last_seen=format_ts(now),
     )
-    return upsert_item(store, updated)
+    return upsert_item(store, updated, in_place=in_place)
 
 
 def record_feedback(
@@ -87,6 +80,7 @@ def record_feedback(
     source_type: str = SOURCE_UNKNOWN,
     increment_exposures: bool = True,
     word_package: Optional[Mapping[str, object]] = None,
+    in_place: bool = False,
 ) -> SrsStore:
     now = now or now_utc()
     source_type = normalize_source_type(source_type)
@@ -113,7 +107,7 @@ def record_feedback(
     updated = apply_feedback(item, rating, now=now)
     if increment_exposures:
         updated = replace(updated, exposures=updated.exposures + 1)
-    return upsert_item(store, updated)
+    return upsert_item(store, updated, in_place=in_place)
 
 
 def append_history(
@@ -126,6 +120,7 @@ def append_history(
     create_if_missing: bool = False,
     source_type: str = SOURCE_UNKNOWN,
     word_package: Optional[Mapping[str, object]] = None,
+    in_place: bool = False,
 ) -> SrsStore:
     now = now or now_utc()
     source_type = normalize_source_type(source_type)
@@ -153,7 +148,7 @@ def append_history(
         SrsHistoryEntry(ts=format_ts(now), rating=rating),
     )
     updated = replace(item, history=history)
-    return upsert_item(store, updated)
+    return upsert_item(store, updated, in_place=in_place)
 
 
 def _resolve_word_package(
@@ -139,6 +139,12 @@ class TestExtensionStructure(unittest.TestCase):
         missing = [str(path.relative_to(PROJECT_ROOT)) for path in required if not path.exists()]
         self.assertEqual(missing, [])
 
+    def test_background_keeps_a_persistent_native_port(self) -> None:
+        source = (EXT_ROOT / "background.js").read_text(encoding="utf-8")
+        self.assertIn("chrome.runtime.connectNative(HOST_NAME)", source)
+        # The one-shot fallback cannot stream job progress, so it must not request async jobs.
+        self.assertIn("async: _async", source)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,7 +11,17 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from lexishift_core.frequency.sqlite_store import SqliteFrequencyConfig, SqliteFrequencyStore  # noqa: E402
+from lexishift_core.frequency.providers import (  # noqa: E402
+    SqliteFrequencyProviderConfig,
+    build_sqlite_frequency_provider,
+)
+from lexishift_core.frequency.sqlite_store import LruCache, SqliteFrequencyConfig, SqliteFrequencyStore  # noqa: E402
+from lexishift_core.rulegen.generation import (  # noqa: E402
+    MappingCandidateSource,
+    RuleGenerationConfig,
+    RuleGenerationPipeline,
+    SimpleSignalProvider,
+)
 
 
 class TestSqliteFrequencyStore(unittest.TestCase):
@@ -122,6 +132,90 @@ class TestSqliteFrequencyStore(unittest.TestCase):
             lemmas = [row["lemma"] for row in rows]
             self.assertEqual(lemmas, ["rank_1", "rank_2"])
 
+    def test_get_values_batches_lookups_and_resolves_schema_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "freq.sqlite"
+            conn = sqlite3.connect(db_path)
+            conn.execute("CREATE TABLE frequency (Lemma TEXT, core_rank REAL, freq REAL)")
+            conn.executemany(
+                "INSERT INTO frequency (Lemma, core_rank, freq) VALUES (?, ?, ?)",
+                [(f"w{idx}", float(idx + 1), float(1000 - idx)) for idx in range(700)]
+                + [("blank", 701.0, None), ("w1", 702.0, 1.0)],
+            )
+            conn.commit()
+            conn.close()
+
+            store = SqliteFrequencyStore(SqliteFrequencyConfig(path=db_path, table="frequency"))
+            statements: list[str] = []
+            store._conn.set_trace_callback(statements.append)
+            try:
+                lemmas = [f"w{idx}" for idx in range(700)] + ["blank", "missing", "w0"]
+                values = store.get_values(lemmas, "pmw")
+                self.assertEqual(len([sql for sql in statements if sql.startswith("PRAGMA")]), 1)
+                self.assertEqual(len([sql for sql in statements if sql.startswith("SELECT")]), 2)
+                self.assertEqual(values["w0"], 1000.0)
+                self.assertEqual(values["w1"], 999.0)
+                self.assertIsNone(values["blank"])
+                self.assertIsNone(values["missing"])
+                statements.clear()
+                self.assertEqual(store.get_value("w5", "pmw"), 995.0)
+                self.assertEqual(statements, [])
+            finally:
+                store.close()
+
+    def test_provider_prefetches_candidate_batch(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "freq.sqlite"
+            conn = sqlite3.connect(db_path)
+            conn.execute("CREATE TABLE frequency (lemma TEXT, pmw REAL)")
+            conn.executemany(
+                "INSERT INTO frequency (lemma, pmw) VALUES (?, ?)",
+                [("large", 100.0), ("huge", 10.0), ("very", 50.0)],
+            )
+            conn.commit()
+            conn.close()
+
+            frequency_fn = build_sqlite_frequency_provider(
+                SqliteFrequencyProviderConfig(sqlite=SqliteFrequencyConfig(path=db_path), cache_size=8)
+            )
+            provider = frequency_fn._lexishift_provider
+            statements: list[str] = []
+            provider._store._conn.set_trace_callback(statements.append)
+            try:
+                pipeline = RuleGenerationPipeline(
+                    sources=[
+                        MappingCandidateSource(
+                            {"big": ["Large", "huge", "very large"], "small": ["tiny"]},
+                            source_dict="test",
+                        )
+                    ],
+                    signal_provider=SimpleSignalProvider(frequency_provider=frequency_fn),
+                )
+                results = pipeline.generate_results(
+                    ["big", "small"],
+                    config=RuleGenerationConfig(language_pair="en-en"),
+                )
+                self.assertEqual(len(results), 4)
+                self.assertEqual(len([sql for sql in statements if sql.startswith("SELECT")]), 1)
+                self.assertEqual(provider.weight("LARGE"), 1.0)
+                self.assertEqual(provider.weight("tiny"), 0.0)
+                self.assertEqual(len([sql for sql in statements if sql.startswith("SELECT")]), 1)
+            finally:
+                provider.close()
+
+
+class TestLruCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self) -> None:
+        cache: LruCache[str, int] = LruCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+
 
 if __name__ == "__main__":
     unittest.main()
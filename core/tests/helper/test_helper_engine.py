@@ -16,12 +16,14 @@ if PROJECT_ROOT not in sys.path:
 from lexishift_core.helper.engine import (  # noqa: E402
     apply_exposure,
     apply_feedback,
+    export_srs_store_json,
     get_srs_runtime_diagnostics,
     RulegenJobConfig,
     SrsRefreshJobConfig,
     SetInitializationJobConfig,
     SetPlanningJobConfig,
     initialize_srs_set,
+    migrate_srs_store_to_sqlite,
     plan_srs_set,
     refresh_srs_set,
     reset_srs_data,
@@ -180,6 +182,7 @@ class TestHelperEngineRulegenPreview(unittest.TestCase):
                 "stats": {"target_count": 0, "rule_count": 0, "source_count": 0},
             },
             target_count=0,
+            regenerated_count=None,
         )
 
     def test_preview_mode_does_not_persist_any_files_when_missing(self) -> None:
@@ -350,6 +353,7 @@ class TestHelperEnginePairGeneralization(unittest.TestCase):
                 "stats": {"target_count": 0, "rule_count": 0, "source_count": 0},
             },
             target_count=0,
+            regenerated_count=None,
         )
 
     def test_run_rulegen_allows_en_de_without_jmdict(self) -> None:
@@ -747,6 +751,7 @@ class TestHelperEngineInitializeSrsSet(unittest.TestCase):
                 rules=tuple(),
                 snapshot={"stats": {"target_count": 0, "rule_count": 0}},
                 target_count=0,
+                regenerated_count=None,
             )
 
             with patch(
@@ -1245,7 +1250,7 @@ class TestHelperEngineFeedbackCycle(unittest.TestCase):
                     ],
                     "stats": {"target_count": 2, "rule_count": 2, "source_count": 2},
                 }
-                return store, SimpleNamespace(rules=rules, snapshot=snapshot, target_count=2)
+                return store, SimpleNamespace(rules=rules, snapshot=snapshot, target_count=2, regenerated_count=None)
 
             with patch(
                 "lexishift_core.helper.engine.build_seed_candidates",
@@ -1332,5 +1337,41 @@ class TestHelperEngineExposureOnly(unittest.TestCase):
             self.assertTrue(all(event.rating is None for event in exposure_events))
 
 
+class TestHelperEngineSqliteStore(unittest.TestCase):
+    def test_signals_write_to_migrated_sqlite_store(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = build_helper_paths(Path(tmp))
+            save_srs_store(
+                SrsStore(
+                    items=(
+                        SrsItem(item_id="en-ja:alpha", lemma="alpha", language_pair="en-ja", source_type="initial_set"),
+                        SrsItem(item_id="en-ja:beta", lemma="beta", language_pair="en-ja", source_type="initial_set"),
+                    )
+                ),
+                paths.srs_store_path,
+            )
+            result = migrate_srs_store_to_sqlite(paths)
+            self.assertEqual(result["items"], 2)
+            db_path = paths.srs_store_db_path_for("default")
+            self.assertEqual(paths.srs_store_path_for("default"), db_path)
+            json_before = paths.srs_store_path.read_text(encoding="utf-8")
+
+            apply_feedback(paths, pair="en-ja", lemma="alpha", rating="good", source_type="extension")
+            apply_exposure(paths, pair="en-ja", lemma="gamma", source_type="extension")
+
+            self.assertEqual(paths.srs_store_path.read_text(encoding="utf-8"), json_before)
+            stored = load_srs_store(db_path)
+            self.assertEqual([item.lemma for item in stored.items], ["alpha", "beta", "gamma"])
+            self.assertEqual(len(stored.items[0].history), 1)
+            self.assertEqual(stored.items[2].exposures, 1)
+            events = load_signal_events(paths.srs_signal_queue_path)
+            self.assertEqual(len(events), 2)
+
+            result = export_srs_store_json(paths)
+            self.assertEqual(result["json_path"], str(paths.srs_store_path))
+            exported = load_srs_store(paths.srs_store_path)
+            self.assertEqual(exported.items, stored.items)
+
+
 if __name__ == "__main__":
     unittest.main()
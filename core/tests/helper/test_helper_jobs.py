@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core.helper.jobs import (  # noqa: E402
+    JOB_CANCELLED,
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_RUNNING,
+    HelperJobQueue,
+)
+
+
+class TestHelperJobQueue(unittest.TestCase):
+    def setUp(self) -> None:
+        self.events: list[tuple[str, str]] = []
+        self.queue = HelperJobQueue(on_event=lambda job: self.events.append((job["job_id"], job["state"])))
+
+    def tearDown(self) -> None:
+        self.queue.close(timeout=5)
+
+    def test_jobs_report_results_and_failures(self) -> None:
+        ok = self.queue.submit("trigger_rulegen", lambda _progress: {"rules": 3}, profile_id="default")
+        bad = self.queue.submit("srs_refresh", lambda _progress: 1 / 0, profile_id="default")
+
+        done = self.queue.wait(ok["job_id"], timeout=5)
+        self.assertEqual(done["state"], JOB_COMPLETED)
+        self.assertEqual(done["result"], {"rules": 3})
+        failed = self.queue.wait(bad["job_id"], timeout=5)
+        self.assertEqual(failed["state"], JOB_FAILED)
+        self.assertIn("division", failed["error"])
+        self.assertEqual(
+            [state for job_id, state in self.events if job_id == ok["job_id"]],
+            ["queued", "running", "completed"],
+        )
+
+    def test_profile_lock_serializes_jobs_and_cancel_drops_queued(self) -> None:
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocked(_progress) -> str:
+            started.set()
+            release.wait(5)
+            return "first"
+
+        first = self.queue.submit("trigger_rulegen", blocked, profile_id="p1")
+        second = self.queue.submit("srs_refresh", lambda _progress: "second", profile_id="p1")
+        self.assertTrue(started.wait(5))
+        self.assertTrue(self.queue.profile_busy("p1"))
+        self.assertFalse(self.queue.profile_busy("p2"))
+
+        self.assertEqual(self.queue.status(second["job_id"])["queue_position"], 1)
+        self.assertEqual(self.queue.cancel(second["job_id"])["state"], JOB_CANCELLED)
+        running = self.queue.cancel(first["job_id"])
+        self.assertEqual(running["state"], JOB_RUNNING)
+        self.assertTrue(running["cancel_requested"])
+
+        # A synchronous writer for the same profile waits for the running job.
+        acquired = threading.Event()
+
+        def writer() -> None:
+            with self.queue.profile_lock("p1"):
+                acquired.set()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        self.assertFalse(acquired.wait(0.05))
+        release.set()
+        thread.join(5)
+        self.assertTrue(acquired.is_set())
+        self.assertEqual(self.queue.wait(first["job_id"], timeout=5)["result"], "first")
+        self.assertFalse(self.queue.profile_busy("p1"))
+
+    def test_running_job_reports_progress_and_stops_at_checkpoint(self) -> None:
+        progress_events: list[dict] = []
+        self.queue = HelperJobQueue(on_event=lambda job: progress_events.append(job))
+        release = threading.Event()
+        started = threading.Event()
+        steps: list[int] = []
+
+        def work(progress_fn) -> str:
+            for done in range(4):
+                progress_fn(done, 3)
+                if done == 1:
+                    started.set()
+                    release.wait(5)
+                steps.append(done)
+            return "finished"
+
+        job = self.queue.submit("trigger_rulegen", work, profile_id="p1")
+        self.assertTrue(started.wait(5))
+        self.assertEqual(self.queue.status(job["job_id"])["progress"], {"done": 1, "total": 3})
+        self.queue.cancel(job["job_id"])
+        release.set()
+
+        done = self.queue.wait(job["job_id"], timeout=5)
+        self.assertEqual(done["state"], JOB_CANCELLED)
+        self.assertIsNone(done["result"])
+        self.assertEqual(steps, [0, 1])
+        self.assertEqual(
+            [event["progress"] for event in progress_events if event["state"] == JOB_RUNNING and event["progress"]],
+            [{"done": 0, "total": 3}, {"done": 1, "total": 3}],
+        )
+
+    def test_unknown_job_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            self.queue.status("job-missing")
+
+
+    def test_profile_lock_with_lock_path_waits_for_other_processes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            lock_path = Path(tmp) / "p1" / "srs_store.lock"
+            queue = HelperJobQueue(lock_path_fn=lambda _profile_id: lock_path)
+            holder = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-c",
+                    "import sys\n"
+                    "from lexishift_core.persistence.file_lock import exclusive_file_lock\n"
+                    f"with exclusive_file_lock({str(lock_path)!r}):\n"
+                    "    print('locked', flush=True)\n"
+                    "    sys.stdin.readline()\n",
+                ],
+                cwd=PROJECT_ROOT,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            try:
+                self.assertEqual(holder.stdout.readline().strip(), "locked")
+                acquired = threading.Event()
+
+                def writer() -> None:
+                    with queue.profile_lock("p1"):
+                        # Nested holders in this process reuse the file lock.
+                        with queue.profile_lock("p1"):
+                            acquired.set()
+
+                thread = threading.Thread(target=writer)
+                thread.start()
+                self.assertFalse(acquired.wait(0.2))
+                holder.stdin.write("\n")
+                holder.stdin.flush()
+                thread.join(5)
+                self.assertTrue(acquired.is_set())
+            finally:
+                holder.stdin.close()
+                holder.wait(5)
+                holder.stdout.close()
+            queue.close(timeout=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
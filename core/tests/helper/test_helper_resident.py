@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core.helper.engine import apply_exposure, apply_feedback, get_srs_runtime_diagnostics  # noqa: E402
+from lexishift_core.helper.paths import build_helper_paths  # noqa: E402
+from lexishift_core.helper.resident import HelperEngine  # noqa: E402
+from lexishift_core.srs import SrsItem, SrsStore, load_srs_store, save_srs_store  # noqa: E402
+
+
+def _seed_store(path: Path) -> None:
+    save_srs_store(
+        SrsStore(
+            items=(
+                SrsItem(item_id="en-ja:alpha", lemma="alpha", language_pair="en-ja", source_type="initial_set"),
+            )
+        ),
+        path,
+    )
+
+
+class TestHelperEngineResidentState(unittest.TestCase):
+    def test_repeated_signals_reuse_cached_store(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = HelperEngine(build_helper_paths(Path(tmp)))
+            paths = engine.paths
+            _seed_store(paths.srs_store_path)
+
+            with engine.track("record_feedback"):
+                apply_feedback(paths, pair="en-ja", lemma="alpha", rating="good", state=engine.state)
+            for _ in range(3):
+                with engine.track("record_exposure"):
+                    apply_exposure(paths, pair="en-ja", lemma="beta", state=engine.state)
+
+            stats = engine.latency_stats()
+            self.assertEqual(stats["requests"]["record_feedback"]["cold"]["count"], 1)
+            self.assertEqual(stats["requests"]["record_exposure"]["warm"]["count"], 3)
+            self.assertEqual(stats["requests"]["record_exposure"]["cold"]["count"], 0)
+            self.assertEqual(stats["cache"]["misses"], 1)
+
+            cached = engine.state.load_store(paths.srs_store_path)
+            self.assertEqual(cached, load_srs_store(paths.srs_store_path))
+            self.assertEqual(cached.items[1].exposures, 3)
+
+    def test_external_writes_invalidate_cached_store(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = HelperEngine(build_helper_paths(Path(tmp)))
+            paths = engine.paths
+            _seed_store(paths.srs_store_path)
+            apply_exposure(paths, pair="en-ja", lemma="alpha", state=engine.state)
+
+            # Another process rewrites the store (e.g. the GUI resetting progress).
+            save_srs_store(SrsStore(), paths.srs_store_path)
+            diagnostics = get_srs_runtime_diagnostics(paths, pair="en-ja", state=engine.state)
+            self.assertEqual(diagnostics["store_items_total"], 0)
+
+            apply_exposure(paths, pair="en-ja", lemma="gamma", state=engine.state)
+            stored = load_srs_store(paths.srs_store_path)
+            self.assertEqual([item.lemma for item in stored.items], ["gamma"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import os
+import sqlite3
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from dataclasses import replace
 from types import SimpleNamespace
 from unittest.mock import patch
 
@@ -17,9 +19,35 @@ from lexishift_core.helper.rulegen import (  # noqa: E402
     SetInitializationConfig,
     initialize_store_from_frequency_list_with_report,
     run_rulegen_for_pair,
+    write_rulegen_outputs,
 )
 from lexishift_core.helper.paths import build_helper_paths  # noqa: E402
+from lexishift_core.persistence.compiled_ruleset import load_compiled_ruleset, ruleset_content_key  # noqa: E402
+from lexishift_core.replacement.core import VocabRule  # noqa: E402
 from lexishift_core.srs import SrsItem, SrsStore  # noqa: E402
+from lexishift_core.srs.store_ops import upsert_item  # noqa: E402
+
+
+def _write_freedict_db(path: Path, rows: tuple[tuple[str, str, int], ...]) -> None:
+    path.unlink(missing_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE entries ("
+        "headword TEXT NOT NULL, headword_lc TEXT NOT NULL, "
+        "translation TEXT NOT NULL, translation_lc TEXT NOT NULL, "
+        "rank INTEGER NOT NULL, pos TEXT, entry_ord INTEGER NOT NULL, gloss_ord INTEGER NOT NULL, "
+        "PRIMARY KEY (headword_lc, translation_lc))"
+    )
+    conn.executemany(
+        "INSERT INTO entries VALUES (?, ?, ?, ?, ?, NULL, 0, 0)",
+        ((headword, headword.lower(), translation, translation.lower(), rank) for headword, translation, rank in rows),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _de_item(lemma: str) -> SrsItem:
+    return SrsItem(item_id=f"en-de:{lemma}", lemma=lemma, language_pair="en-de", source_type="initial_set")
 
 
 class TestHelperRulegenInitialization(unittest.TestCase):
@@ -282,5 +310,102 @@ class TestHelperRulegenInitialization(unittest.TestCase):
         self.assertEqual(request.word_packages_by_target["所"]["reading"], "ところ")
 
 
+
+class TestHelperRulegenIncremental(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.paths = build_helper_paths(self.root / "data")
+        self.freedict = self.root / "deu-eng.sqlite"
+        self.rows = (("Hund", "dog", 0), ("Hund", "hound", 1), ("Katze", "cat", 0), ("Haus", "house", 0))
+        _write_freedict_db(self.freedict, self.rows)
+        self.cache_path = self.paths.rulegen_cache_path("en-de")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _run(self, store: SrsStore, **kwargs):
+        _store, output = run_rulegen_for_pair(
+            paths=self.paths,
+            pair="en-de",
+            store=store,
+            settings=None,
+            freedict_de_en_path=self.freedict,
+            rulegen_config=RulegenConfig(language_pair="en-de"),
+            initialize_if_empty=False,
+            persist_store=False,
+            **kwargs,
+        )
+        return output
+
+    def _assert_incremental(self, store: SrsStore, regenerated: int, **kwargs) -> None:
+        cached = self._run(store, rule_cache_path=self.cache_path, **kwargs)
+        self.assertEqual(cached.regenerated_count, regenerated)
+        self.assertEqual(list(cached.rules), list(self._run(store).rules))
+        self.assertEqual(cached.snapshot["targets"], self._run(store).snapshot["targets"])
+
+    def test_only_new_or_changed_targets_are_regenerated(self) -> None:
+        store = SrsStore(items=(_de_item("Hund"), _de_item("Katze")))
+        self._assert_incremental(store, 2)
+        self._assert_incremental(store, 0)
+
+        store = upsert_item(store, _de_item("Haus"))
+        self._assert_incremental(store, 1)
+
+        package = {"version": 1, "language_tag": "de", "surface": "Katze", "source": {"provider": "manual"}}
+        store = upsert_item(store, replace(_de_item("Katze"), word_package=package))
+        self._assert_incremental(store, 1)
+
+        store = SrsStore(items=tuple(item for item in store.items if item.lemma != "Hund"))
+        self._assert_incremental(store, 0)
+        self._assert_incremental(store, 2, full_rebuild=True)
+
+    def test_dictionary_change_invalidates_cache(self) -> None:
+        store = SrsStore(items=(_de_item("Hund"), _de_item("Katze")))
+        self._assert_incremental(store, 2)
+        _write_freedict_db(self.freedict, self.rows + (("Katze", "kitty", 2),))
+        os.utime(self.freedict, ns=(1, 1))
+        self._assert_incremental(store, 2)
+
+    def test_progress_counts_targets_and_can_stop_the_run(self) -> None:
+        store = SrsStore(items=(_de_item("Hund"), _de_item("Katze"), _de_item("Haus")))
+        self._run(SrsStore(items=(_de_item("Hund"),)), rule_cache_path=self.cache_path)
+        reported: list[tuple[int, int]] = []
+        with patch("lexishift_core.helper.rulegen.RULEGEN_PROGRESS_CHUNK", 1):
+            output = self._run(
+                store,
+                rule_cache_path=self.cache_path,
+                progress_fn=lambda done, total: reported.append((done, total)),
+            )
+        self.assertEqual(reported, [(1, 3), (2, 3), (3, 3)])
+        self.assertEqual(list(output.rules), list(self._run(store).rules))
+
+        def stop(done: int, _total: int) -> None:
+            if done:
+                raise InterruptedError
+
+        cache_before = self.cache_path.read_bytes()
+        with patch("lexishift_core.helper.rulegen.RULEGEN_PROGRESS_CHUNK", 1):
+            with self.assertRaises(InterruptedError):
+                self._run(store, rule_cache_path=self.cache_path, full_rebuild=True, progress_fn=stop)
+        self.assertEqual(self.cache_path.read_bytes(), cache_before)
+
+
+class TestHelperRulegenOutputs(unittest.TestCase):
+    def test_writes_compiled_artifact_next_to_ruleset(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = build_helper_paths(Path(tmpdir))
+            write_rulegen_outputs(
+                paths=paths,
+                pair="en-de",
+                rules=(VocabRule("dog", "Hund"),),
+                snapshot={},
+            )
+            key = ruleset_content_key(paths.ruleset_path("en-de").read_bytes())
+            pool = load_compiled_ruleset(paths.compiled_ruleset_path("en-de"), key=key)
+            self.assertIsNotNone(pool)
+            self.assertEqual([rule.replacement for rule in pool.rules], ["Hund"])
+
+
 if __name__ == "__main__":
     unittest.main()
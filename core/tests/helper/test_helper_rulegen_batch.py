@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core.helper.engine import RulegenJobConfig, run_rulegen_batch, run_rulegen_job  # noqa: E402
+from lexishift_core.helper.paths import build_helper_paths  # noqa: E402
+from lexishift_core.srs import SrsItem, SrsStore, load_srs_store, save_srs_store  # noqa: E402
+
+_ROWS = (
+    ("Hund", "dog", 0),
+    ("Hund", "hound", 1),
+    ("Katze", "cat", 0),
+    ("Haus", "house", 0),
+)
+
+
+def _write_freedict_db(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE entries ("
+        "headword TEXT NOT NULL, headword_lc TEXT NOT NULL, "
+        "translation TEXT NOT NULL, translation_lc TEXT NOT NULL, "
+        "rank INTEGER NOT NULL, pos TEXT, entry_ord INTEGER NOT NULL, gloss_ord INTEGER NOT NULL, "
+        "PRIMARY KEY (headword_lc, translation_lc))"
+    )
+    conn.executemany(
+        "INSERT INTO entries VALUES (?, ?, ?, ?, ?, NULL, 0, 0)",
+        ((headword, headword.lower(), translation, translation.lower(), rank) for headword, translation, rank in _ROWS),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _seed(paths, profile_id: str, lemmas: tuple[str, ...]) -> None:
+    items = tuple(
+        SrsItem(item_id=f"en-de:{lemma}", lemma=lemma, language_pair="en-de", source_type="initial_set")
+        for lemma in lemmas
+    )
+    save_srs_store(SrsStore(items=items), paths.srs_store_path_for(profile_id))
+
+
+def _config(profile_id: str, pair: str, freedict: Path) -> RulegenJobConfig:
+    return RulegenJobConfig(pair=pair, profile_id=profile_id, freedict_de_en_path=freedict, initialize_if_empty=False)
+
+
+class TestRulegenBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.freedict = self.root / "deu-eng.sqlite"
+        _write_freedict_db(self.freedict)
+        self.paths = build_helper_paths(self.root / "data")
+        _seed(self.paths, "default", ("Hund", "Katze"))
+        _seed(self.paths, "work", ("Haus", "Hund"))
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _rules(self, pair: str, profile_id: str) -> list:
+        return json.loads(self.paths.ruleset_path(pair, profile_id=profile_id).read_text(encoding="utf-8"))["rules"]
+
+    def test_parallel_batch_matches_sequential_jobs(self) -> None:
+        jobs = [
+            _config("default", "en-de", self.freedict),
+            _config("work", "en-de", self.freedict),
+            _config("default", "en-es", self.freedict),
+            _config("broken", "en-de", self.root / "missing.sqlite"),
+            _config("work", "en-de", self.freedict),
+        ]
+        payload = run_rulegen_batch(self.paths, configs=jobs, workers=2)
+
+        self.assertEqual(payload["workers"], 2)
+        self.assertEqual([entry["ok"] for entry in payload["jobs"]], [True, True, True, False, False])
+        self.assertEqual((payload["ok"], payload["failed"]), (3, 2))
+        self.assertIn("Duplicate rulegen job", payload["jobs"][4]["error"])
+        for entry in payload["jobs"][:4]:
+            self.assertGreaterEqual(entry["elapsed_ms"], 0.0)
+        self.assertGreater(payload["jobs"][1]["result"]["rules"], 0)
+        batch_rules = {key: self._rules(*key) for key in (("en-de", "default"), ("en-de", "work"))}
+        work_store = load_srs_store(self.paths.srs_store_path_for("work"))
+        self.assertEqual({item.lemma for item in work_store.items}, {"Haus", "Hund"})
+
+        for profile_id in ("default", "work"):
+            run_rulegen_job(self.paths, config=_config(profile_id, "en-de", self.freedict))
+            self.assertEqual(self._rules("en-de", profile_id), batch_rules[("en-de", profile_id)])
+
+    def test_inline_batch_reuses_open_dictionaries(self) -> None:
+        jobs = [_config("default", "en-de", self.freedict), _config("work", "en-de", self.freedict)]
+        payload = run_rulegen_batch(self.paths, configs=jobs, workers=1)
+        self.assertEqual([entry["dictionaries_opened"] for entry in payload["jobs"]], [1, 0])
+        self.assertFalse(list(self.paths.ruleset_path("en-de", profile_id="work").parent.glob("*.tmp")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core.helper.engine import apply_signals_batch, migrate_srs_store_to_sqlite  # noqa: E402
+from lexishift_core.helper.paths import build_helper_paths  # noqa: E402
+from lexishift_core.helper.use_cases.signals import apply_signals_batch as apply_signals_batch_use_case  # noqa: E402
+from lexishift_core.srs import SrsItem, SrsStore, load_srs_store, save_srs_store  # noqa: E402
+from lexishift_core.srs.signal_queue import load_signal_events  # noqa: E402
+from lexishift_core.srs.store_index import IndexedSrsStore  # noqa: E402
+from lexishift_core.srs.store_ops import record_exposure, record_feedback  # noqa: E402
+from lexishift_core.srs.time import parse_ts  # noqa: E402
+
+_SEED = SrsStore(
+    items=(
+        SrsItem(item_id="en-ja:alpha", lemma="alpha", language_pair="en-ja", source_type="initial_set"),
+        SrsItem(item_id="en-de:haus", lemma="haus", language_pair="en-de", source_type="initial_set"),
+    )
+)
+
+_EVENTS = [
+    {"event_type": "exposure", "pair": "en-ja", "lemma": "beta", "ts": "2026-01-01T10:00:00Z"},
+    {"event_type": "feedback", "pair": "en-ja", "lemma": "alpha", "rating": "good", "ts": "2026-01-01T10:00:05Z"},
+    {"event_type": "feedback", "pair": "en-ja", "lemma": "alpha", "rating": "bogus"},
+    {"event_type": "exposure", "pair": "en-de", "lemma": "haus", "ts": "2026-01-01T10:00:07Z"},
+    {"event_type": "exposure", "pair": "", "lemma": "missing"},
+    {"event_type": "feedback", "pair": "en-ja", "lemma": "beta", "rating": "again", "ts": "2026-01-01T10:01:00Z"},
+    {"event_type": "exposure", "pair": "en-ja", "lemma": "alpha", "ts": "2026-01-01T10:02:00Z"},
+]
+
+
+def _apply_one_by_one(store: SrsStore) -> SrsStore:
+    for event in _EVENTS:
+        if not event["pair"] or event.get("rating") == "bogus":
+            continue
+        now = parse_ts(event["ts"])
+        if event["event_type"] == "feedback":
+            store = record_feedback(
+                store,
+                language_pair=event["pair"],
+                lemma=event["lemma"],
+                rating=event["rating"],
+                now=now,
+                create_if_missing=True,
+                source_type="extension",
+            )
+        else:
+            store = record_exposure(
+                store,
+                language_pair=event["pair"],
+                lemma=event["lemma"],
+                now=now,
+                create_if_missing=True,
+                source_type="extension",
+            )
+    return store
+
+
+class TestApplySignalsBatch(unittest.TestCase):
+    def test_batch_matches_sequential_application(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = build_helper_paths(Path(tmp))
+            save_srs_store(_SEED, paths.srs_store_path)
+
+            payload = apply_signals_batch(paths, events=_EVENTS)
+
+            self.assertEqual(payload["applied"], 5)
+            self.assertEqual(payload["rejected"], 2)
+            self.assertEqual(
+                [result["ok"] for result in payload["results"]],
+                [True, True, False, True, False, True, True],
+            )
+            self.assertIn("Unknown rating", payload["results"][2]["error"])
+            self.assertEqual(load_srs_store(paths.srs_store_path), _apply_one_by_one(_SEED))
+            queued = load_signal_events(paths.srs_signal_queue_path_for("default"))
+            self.assertEqual([event.lemma for event in queued], ["beta", "alpha", "haus", "beta", "alpha"])
+
+    def test_batch_on_sqlite_store_upserts_touched_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = build_helper_paths(Path(tmp))
+            save_srs_store(_SEED, paths.srs_store_path)
+            migrate_srs_store_to_sqlite(paths)
+
+            apply_signals_batch(paths, events=_EVENTS)
+
+            stored = load_srs_store(paths.srs_store_path_for("default"))
+            expected = {item.item_id: item for item in _apply_one_by_one(_SEED).items}
+            self.assertEqual({item.item_id: item for item in stored.items}, expected)
+
+    def test_large_batch_updates_in_place_without_touching_loaded_store(self) -> None:
+        loaded = IndexedSrsStore(
+            SrsItem(item_id=f"en-ja:w{index}", lemma=f"w{index}", language_pair="en-ja", source_type="initial_set")
+            for index in range(50_000)
+        )
+        events = [
+            {"event_type": "feedback", "pair": "en-ja", "lemma": f"w{index * 7 % 60_000}", "rating": "good"}
+            for index in range(5_000)
+        ]
+        saved: list[SrsStore] = []
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = build_helper_paths(Path(tmp))
+            started = time.perf_counter()
+            payload = apply_signals_batch_use_case(
+                paths,
+                events=events,
+                resolve_profile_id_fn=lambda _paths, profile_id: profile_id,
+                ensure_store_fn=lambda _paths, profile_id: loaded,
+                save_store_fn=lambda store, _path: saved.append(store),
+            )
+            elapsed = time.perf_counter() - started
+
+        self.assertEqual(payload["applied"], 5_000)
+        # About 30s with a store copy per event; in place it is around a second.
+        self.assertLess(elapsed, 10.0)
+        self.assertEqual(len(loaded.items), 50_000)
+        self.assertEqual(loaded.get("en-ja:w0").history, ())
+        self.assertEqual(len(saved[0].items), 50_000 + sum(1 for index in range(5_000) if index * 7 % 60_000 >= 50_000))
+        self.assertEqual(len(saved[0].items[0].history), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
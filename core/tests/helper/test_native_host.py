@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+CORE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+REPO_ROOT = os.path.dirname(CORE_ROOT)
+HOST_SCRIPT = os.path.join(REPO_ROOT, "scripts", "helper", "lexishift_native_host.py")
+if CORE_ROOT not in sys.path:
+    sys.path.insert(0, CORE_ROOT)
+
+from lexishift_core.helper.paths import build_helper_paths  # noqa: E402
+from lexishift_core.srs import SrsItem, SrsStore, save_srs_store  # noqa: E402
+from lexishift_core.srs.signal_log import (  # noqa: E402
+    append_signal_log_records,
+    signal_log_needs_compaction,
+    signal_log_segments,
+)
+
+
+def _frame(message: dict) -> bytes:
+    data = json.dumps(message).encode("utf-8")
+    return struct.pack("<I", len(data)) + data
+
+
+def _read_frames(data: bytes) -> list[dict]:
+    frames = []
+    offset = 0
+    while offset < len(data):
+        (length,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        frames.append(json.loads(data[offset : offset + length].decode("utf-8")))
+        offset += length
+    return frames
+
+
+class TestNativeHost(unittest.TestCase):
+    def test_response_is_first_frame_when_signals_trigger_compaction(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            paths = build_helper_paths(root)
+            log_path = paths.srs_signal_queue_path_for("default")
+            record = {"event_type": "exposure", "pair": "en-ja", "lemma": "w", "source_type": "extension"}
+            for _ in range(5):
+                append_signal_log_records(log_path, [record] * 20, fsync=False, max_segment_bytes=512)
+            self.assertGreater(len(signal_log_segments(log_path)), 3)
+
+            request = {
+                "id": "req-1",
+                "type": "record_exposure",
+                "version": 1,
+                "payload": {"pair": "en-ja", "lemma": "猫"},
+            }
+            env = dict(os.environ, LEXISHIFT_DATA_DIR=str(root))
+            completed = subprocess.run(
+                [sys.executable, HOST_SCRIPT],
+                input=_frame(request),
+                capture_output=True,
+                env=env,
+                timeout=60,
+                check=True,
+            )
+
+            frames = _read_frames(completed.stdout)
+            self.assertEqual(frames[0]["id"], "req-1")
+            self.assertTrue(frames[0]["ok"])
+            self.assertEqual([frame for frame in frames[1:] if frame.get("type") == "job_progress"], [])
+            self.assertFalse(signal_log_needs_compaction(log_path))
+
+    def test_one_connection_serves_repeat_requests_from_the_resident_engine(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            paths = build_helper_paths(root)
+            save_srs_store(
+                SrsStore(
+                    items=(
+                        SrsItem(item_id="en-ja:alpha", lemma="alpha", language_pair="en-ja", source_type="initial_set"),
+                    )
+                ),
+                paths.srs_store_path,
+            )
+            requests = [
+                {
+                    "id": f"req-{index}",
+                    "type": "record_exposure",
+                    "version": 1,
+                    "payload": {"pair": "en-ja", "lemma": "alpha"},
+                }
+                for index in range(3)
+            ]
+            requests.append({"id": "status", "type": "status", "version": 1, "payload": {}})
+            env = dict(os.environ, LEXISHIFT_DATA_DIR=str(root))
+            # A persistent connectNative port: one host process, many frames.
+            completed = subprocess.run(
+                [sys.executable, HOST_SCRIPT],
+                input=b"".join(_frame(request) for request in requests),
+                capture_output=True,
+                env=env,
+                timeout=60,
+                check=True,
+            )
+
+            frames = _read_frames(completed.stdout)
+            self.assertEqual([frame["id"] for frame in frames], ["req-0", "req-1", "req-2", "status"])
+            latency = frames[-1]["data"]["latency"]
+            self.assertEqual(latency["requests"]["record_exposure"]["cold"]["count"], 1)
+            self.assertEqual(latency["requests"]["record_exposure"]["warm"]["count"], 2)
+            self.assertEqual(latency["cache"]["hits"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core import (  # noqa: E402
+    CompiledPhraseTrie,
+    InflectionSettings,
+    InflectionSpec,
+    Replacer,
+    RuleMetadata,
+    VocabRule,
+    VocabSettings,
+    build_vocab_pool_from_dataset,
+    load_compiled_vocab_pool,
+)
+from lexishift_core.persistence import compiled_ruleset  # noqa: E402
+from lexishift_core.persistence.compiled_ruleset import compiled_ruleset_path  # noqa: E402
+from lexishift_core.persistence.storage import (  # noqa: E402
+    VocabDataset,
+    load_vocab_dataset,
+    save_vocab_dataset,
+)
+
+_TEXT = "She walks home at twilight; the twilights were long and he walked on."
+
+
+def _dataset(*, inflections: bool = True) -> VocabDataset:
+    return VocabDataset(
+        rules=(
+            VocabRule("twilight", "gloaming", tags=("poetic",), metadata=RuleMetadata(label="time")),
+            VocabRule("walk", "stroll", priority=1, created_at="2024-01-01T00:00:00Z"),
+            VocabRule("walk home", "wander back", priority=2),
+            VocabRule("long", "lengthy", enabled=False),
+        ),
+        settings=VocabSettings(inflections=InflectionSettings(enabled=inflections, spec=InflectionSpec())),
+    )
+
+
+class CompiledRulesetTests(unittest.TestCase):
+    def test_cold_then_warm_load_matches_json_build(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "ruleset.json"
+            save_vocab_dataset(_dataset(), path)
+            expected_pool = build_vocab_pool_from_dataset(load_vocab_dataset(path))
+            expected = Replacer(expected_pool).replace_text(_TEXT, with_stats=True)
+
+            cold = load_compiled_vocab_pool(path)
+            self.assertTrue(compiled_ruleset_path(path).exists())
+            with mock.patch.object(compiled_ruleset, "build_vocab_pool_from_dataset") as rebuild:
+                warm = load_compiled_vocab_pool(path)
+                rebuild.assert_not_called()
+
+            self.assertIsInstance(warm.trie, CompiledPhraseTrie)
+            self.assertEqual(warm.rules, expected_pool.rules)
+            self.assertEqual(Replacer(cold).replace_text(_TEXT, with_stats=True), expected)
+            self.assertEqual(Replacer(warm).replace_text(_TEXT, with_stats=True), expected)
+
+    def test_artifact_invalidated_when_source_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "ruleset.json"
+            save_vocab_dataset(_dataset(), path)
+            load_compiled_vocab_pool(path)
+            save_vocab_dataset(_dataset(inflections=False), path)
+            pool = load_compiled_vocab_pool(path)
+            self.assertEqual(Replacer(pool).replace_text("he walked"), "he walked")
+            self.assertEqual(len(pool.rules), 4)
+
+    def test_corrupt_artifact_falls_back_to_json(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "ruleset.json"
+            save_vocab_dataset(_dataset(), path)
+            load_compiled_vocab_pool(path)
+            artifact = compiled_ruleset_path(path)
+            artifact.write_bytes(artifact.read_bytes()[:-7])
+            pool = load_compiled_vocab_pool(path)
+            self.assertEqual(Replacer(pool).replace_text("twilight"), "gloaming")
+
+    def test_save_after_in_place_edits(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "ruleset.json"
+            save_vocab_dataset(_dataset(inflections=False), path)
+            pool = load_compiled_vocab_pool(path, write_artifact=False)
+            _ = pool.trie
+            pool.remove_rule(pool.rules[0])
+            artifact = Path(tmpdir) / "edited.compiled"
+            compiled_ruleset.save_compiled_ruleset(pool, artifact, key="k" * 64)
+            loaded = compiled_ruleset.load_compiled_ruleset(artifact, key="k" * 64)
+            self.assertEqual(loaded.rules, pool.rules)
+            self.assertEqual(Replacer(loaded).replace_text("twilight walk"), "twilight stroll")
+
+    def test_rules_are_stored_as_columns(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "ruleset.json"
+            save_vocab_dataset(_dataset(), path)
+            pool = load_compiled_vocab_pool(path)
+            data = compiled_ruleset_path(path).read_bytes()
+            # Each string is interned once however many expanded rules use it.
+            self.assertGreater(sum(rule.replacement == "gloaming" for rule in pool.rules), 1)
+            self.assertEqual(data.count(b"gloaming"), 1)
+            self.assertEqual(data.count(b'"label"'), 1)
+            self.assertEqual(list(Path(tmpdir).glob("*.tmp")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
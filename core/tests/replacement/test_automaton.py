@@ -0,0 +1,86 @@
+import os
+import random
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core import (  # noqa: E402
+    MATCHER_AHO_CORASICK,
+    ReplacementMode,
+    Replacer,
+    VocabPool,
+    VocabRule,
+    compile_pipeline,
+)
+
+_WORDS = ("a", "b", "c", "d", "sky", "dusk", "Blue", "the")
+
+
+def _random_rules(rng: random.Random, count: int) -> list[VocabRule]:
+    rules = []
+    for idx in range(count):
+        length = rng.randint(1, 4)
+        phrase = " ".join(rng.choice(_WORDS) for _ in range(length))
+        rules.append(VocabRule(phrase, f"r{idx}", priority=rng.randint(-2, 3)))
+    return rules
+
+
+def _random_text(rng: random.Random, length: int) -> str:
+    parts = []
+    for _ in range(length):
+        parts.append(rng.choice(_WORDS))
+        parts.append(rng.choice((" ", " ", " ", "  ", ", ", "-", ".\n")))
+    return "".join(parts)
+
+
+class PhraseAutomatonTests(unittest.TestCase):
+    def test_phrase_replacement(self) -> None:
+        pool = VocabPool.from_mapping({"twilight": "gloaming", "stunned into silence": "overawed"})
+        replacer = Replacer(pool, matcher=MATCHER_AHO_CORASICK)
+        result = replacer.replace_text("At twilight, she was stunned into silence.")
+        self.assertEqual(result, "At gloaming, she was overawed.")
+
+    def test_phrases_do_not_span_punctuation(self) -> None:
+        pool = VocabPool.from_mapping({"blue sky": "azure"})
+        replacer = Replacer(pool, matcher=MATCHER_AHO_CORASICK)
+        self.assertEqual(replacer.replace_text("blue, sky blue sky"), "blue, sky azure")
+
+    def test_unknown_matcher_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            Replacer(VocabPool(), matcher="nope")
+
+    def test_automaton_refreshes_after_add_rule(self) -> None:
+        pool = VocabPool.from_mapping({"sky": "heaven"})
+        replacer = Replacer(pool, matcher=MATCHER_AHO_CORASICK)
+        self.assertEqual(replacer.replace_text("dusk sky"), "dusk heaven")
+        pool.add_rule(VocabRule("dusk sky", "gloaming", priority=1))
+        self.assertEqual(replacer.replace_text("dusk sky"), "gloaming")
+
+    def test_matches_trie_walk_on_random_corpora(self) -> None:
+        rng = random.Random(11)
+        for _ in range(40):
+            pool = VocabPool(_random_rules(rng, rng.randint(1, 50)))
+            walk = Replacer(pool)
+            single_pass = Replacer(pool, matcher=MATCHER_AHO_CORASICK)
+            for _ in range(5):
+                text = _random_text(rng, rng.randint(0, 80))
+                self.assertEqual(
+                    walk.replace_text(text, with_stats=True),
+                    single_pass.replace_text(text, with_stats=True),
+                )
+
+    def test_compile_pipeline_selects_matcher(self) -> None:
+        pool = VocabPool.from_mapping({"twilight": "gloaming"})
+        pipeline = compile_pipeline(pool, synonyms={"dusk": "twilight"}, matcher=MATCHER_AHO_CORASICK)
+        self.assertEqual(pipeline.exact.matcher, MATCHER_AHO_CORASICK)
+        self.assertEqual(
+            pipeline.replace_text("dusk and twilight", mode=ReplacementMode.MEANING),
+            "gloaming and gloaming",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
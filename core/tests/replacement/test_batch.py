@@ -0,0 +1,81 @@
+import os
+import random
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core import (  # noqa: E402
+    MATCHER_AHO_CORASICK,
+    ParallelReplacer,
+    ReplacementMode,
+    Replacer,
+    VocabPool,
+    VocabRule,
+    compile_pipeline,
+)
+
+_WORDS = ("a", "b", "sky", "Dusk", "don't", "the", "café")
+
+
+def _random_texts(rng: random.Random, count: int) -> list[str]:
+    texts = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(0, 8)):
+            parts.append(rng.choice(_WORDS))
+            parts.append(rng.choice((" ", "  ", ", ", "'", "!")))
+        texts.append("".join(parts))
+    return texts
+
+
+def _random_pool(rng: random.Random) -> VocabPool:
+    rules = []
+    for idx in range(rng.randint(1, 15)):
+        phrase = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 3)))
+        rules.append(VocabRule(phrase, f"r{idx}", priority=rng.randint(0, 2)))
+    return VocabPool(rules)
+
+
+class ReplaceManyTests(unittest.TestCase):
+    def test_batch_matches_sequential_calls(self) -> None:
+        rng = random.Random(5)
+        for _ in range(30):
+            replacer = Replacer(_random_pool(rng))
+            texts = _random_texts(rng, rng.randint(0, 20))
+            self.assertEqual(
+                replacer.replace_many(texts, with_stats=True),
+                [replacer.replace_text(text, with_stats=True) for text in texts],
+            )
+            self.assertEqual(replacer.replace_many(texts), [replacer.replace_text(text) for text in texts])
+
+    def test_phrases_do_not_span_texts(self) -> None:
+        replacer = Replacer(VocabPool.from_mapping({"blue sky": "azure"}))
+        self.assertEqual(replacer.replace_many(["blue", "sky", "blue sky"]), ["blue", "sky", "azure"])
+
+    def test_separator_in_input_falls_back(self) -> None:
+        replacer = Replacer(VocabPool.from_mapping({"sky": "heaven"}))
+        texts = ["sky\x00sky", "the sky"]
+        self.assertEqual(replacer.replace_many(texts), ["heaven\x00heaven", "the heaven"])
+
+    def test_pipeline_replace_many_uses_mode(self) -> None:
+        pipeline = compile_pipeline(VocabPool.from_mapping({"twilight": "gloaming"}), synonyms={"dusk": "twilight"})
+        self.assertEqual(
+            pipeline.replace_many(["at dusk", "twilight"], mode=ReplacementMode.MEANING),
+            ["at gloaming", "gloaming"],
+        )
+
+    def test_process_pool_matches_sequential(self) -> None:
+        rng = random.Random(9)
+        replacer = Replacer(_random_pool(rng), matcher=MATCHER_AHO_CORASICK)
+        texts = _random_texts(rng, 200)
+        expected = replacer.replace_many(texts, with_stats=True)
+        with ParallelReplacer(replacer, workers=2, chunk_size=32) as parallel:
+            self.assertEqual(parallel.replace_many(texts, with_stats=True), expected)
+            self.assertEqual(parallel.replace_many(texts), [result.text for result in expected])
+
+
+if __name__ == "__main__":
+    unittest.main()
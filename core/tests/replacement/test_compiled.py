@@ -0,0 +1,96 @@
+import os
+import random
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core import (  # noqa: E402
+    TRIE_BACKEND_COMPACT,
+    CompiledPhraseTrie,
+    Replacer,
+    VocabPool,
+    VocabRule,
+    compile_pipeline,
+)
+
+_WORDS = ("the", "quiet", "sky", "at", "twilight", "stunned", "into", "silence", "dark", "blue")
+
+
+def _random_rules(rng: random.Random, count: int) -> list[VocabRule]:
+    rules = []
+    for idx in range(count):
+        length = rng.randint(1, 3)
+        phrase = " ".join(rng.choice(_WORDS) for _ in range(length))
+        rules.append(VocabRule(phrase, f"r{idx}", priority=rng.randint(0, 3)))
+    return rules
+
+
+def _random_text(rng: random.Random, length: int) -> str:
+    parts = []
+    for _ in range(length):
+        word = rng.choice(_WORDS)
+        if rng.random() < 0.2:
+            word = word.title()
+        parts.append(word)
+        parts.append(rng.choice((" ", " ", " ", ", ", ". ")))
+    return "".join(parts)
+
+
+class CompiledPhraseTrieTests(unittest.TestCase):
+    def test_phrase_replacement(self) -> None:
+        pool = VocabPool.from_mapping(
+            {"twilight": "gloaming", "stunned into silence": "overawed"},
+            trie_backend=TRIE_BACKEND_COMPACT,
+        )
+        self.assertIsInstance(pool.trie, CompiledPhraseTrie)
+        result = Replacer(pool).replace_text("At twilight, she was stunned into silence.")
+        self.assertEqual(result, "At gloaming, she was overawed.")
+
+    def test_priority_ties_keep_first_rule(self) -> None:
+        rules = [
+            VocabRule("blue sky", "first"),
+            VocabRule("blue sky", "second"),
+            VocabRule("blue sky", "third", priority=-1),
+        ]
+        pool = VocabPool(rules, trie_backend=TRIE_BACKEND_COMPACT)
+        self.assertEqual(Replacer(pool).replace_text("blue sky"), "first")
+
+    def test_disabled_rules_are_skipped(self) -> None:
+        rules = [VocabRule("sky", "heaven", enabled=False)]
+        pool = VocabPool(rules, trie_backend=TRIE_BACKEND_COMPACT)
+        self.assertEqual(Replacer(pool).replace_text("the sky"), "the sky")
+        self.assertEqual(pool.trie.node_count, 1)
+
+    def test_unknown_backend_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            VocabPool([], trie_backend="nope")
+
+    def test_matches_dict_trie_on_random_corpora(self) -> None:
+        rng = random.Random(7)
+        for _ in range(25):
+            rules = _random_rules(rng, rng.randint(1, 40))
+            dict_replacer = Replacer(VocabPool(rules))
+            compact_replacer = Replacer(VocabPool(rules, trie_backend=TRIE_BACKEND_COMPACT))
+            for _ in range(5):
+                text = _random_text(rng, rng.randint(0, 60))
+                self.assertEqual(
+                    dict_replacer.replace_text(text, with_stats=True),
+                    compact_replacer.replace_text(text, with_stats=True),
+                )
+
+    def test_compile_pipeline_selects_backend(self) -> None:
+        pool = VocabPool.from_mapping({"twilight": "gloaming"})
+        pipeline = compile_pipeline(
+            pool,
+            synonyms={"dusk": "twilight"},
+            trie_backend=TRIE_BACKEND_COMPACT,
+        )
+        self.assertIsNotNone(pipeline.meaning)
+        self.assertEqual(pipeline.replace_text("at twilight"), "at gloaming")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import os
+import random
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core import (  # noqa: E402
+    TRIE_BACKEND_COMPACT,
+    Normalizer,
+    PhraseTrieNode,
+    Replacer,
+    VocabPool,
+    VocabRule,
+)
+
+_WORDS = ("a", "b", "c", "sky", "dusk")
+
+
+class _CountingNormalizer(Normalizer):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def normalize_word(self, word: str) -> str:
+        self.calls += 1
+        return word.lower()
+
+
+def _random_rule(rng: random.Random, idx: int) -> VocabRule:
+    phrase = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 3)))
+    return VocabRule(phrase, f"r{idx}", priority=rng.randint(0, 2), enabled=rng.random() > 0.2)
+
+
+def _trie_snapshot(node: PhraseTrieNode) -> tuple:
+    children = tuple(sorted((token, _trie_snapshot(child)) for token, child in node.children.items()))
+    return (node.best_rule, children)
+
+
+class IncrementalPoolTests(unittest.TestCase):
+    def test_random_edits_match_full_rebuild(self) -> None:
+        rng = random.Random(21)
+        for backend in (None, TRIE_BACKEND_COMPACT):
+            for _ in range(20):
+                kwargs = {"trie_backend": backend} if backend else {}
+                pool = VocabPool([_random_rule(rng, idx) for idx in range(10)], **kwargs)
+                _ = pool.trie
+                for step in range(30):
+                    action = rng.random()
+                    if action < 0.4 or not pool.rules:
+                        pool.add_rule(_random_rule(rng, 100 + step))
+                    elif action < 0.7:
+                        pool.remove_rule(rng.choice(pool.rules))
+                    else:
+                        target = rng.choice(pool.rules)
+                        pool.set_rule_enabled(target, not target.enabled)
+                    rebuilt = VocabPool(pool.rules, **kwargs)
+                    text = " ".join(rng.choice(_WORDS) for _ in range(20))
+                    self.assertEqual(
+                        Replacer(pool).replace_text(text, with_stats=True),
+                        Replacer(rebuilt).replace_text(text, with_stats=True),
+                    )
+                    if backend is None:
+                        self.assertEqual(_trie_snapshot(pool.trie.root), _trie_snapshot(rebuilt.trie.root))
+
+    def test_removal_restores_next_best_rule(self) -> None:
+        first = VocabRule("blue sky", "first")
+        second = VocabRule("blue sky", "second")
+        boosted = VocabRule("blue sky", "boosted", priority=2)
+        pool = VocabPool([first, second, boosted])
+        replacer = Replacer(pool)
+        self.assertEqual(replacer.replace_text("blue sky"), "boosted")
+        pool.remove_rule(boosted)
+        self.assertEqual(replacer.replace_text("blue sky"), "first")
+        disabled = pool.set_rule_enabled(first, False)
+        self.assertEqual(replacer.replace_text("blue sky"), "second")
+        pool.set_rule_enabled(disabled, True)
+        self.assertEqual(replacer.replace_text("blue sky"), "first")
+
+    def test_removing_last_rule_prunes_nodes(self) -> None:
+        rule = VocabRule("stunned into silence", "overawed")
+        pool = VocabPool([rule])
+        _ = pool.trie
+        pool.remove_rule(rule)
+        self.assertEqual(pool.trie.root.children, {})
+
+    def test_edits_only_tokenize_changed_rules(self) -> None:
+        counting = _CountingNormalizer()
+        pool = VocabPool([VocabRule(f"word{idx}", "x") for idx in range(50)], normalizer=counting)
+        _ = pool.trie
+        counting.calls = 0
+        pool.add_rule(VocabRule("new phrase", "y"))
+        pool.set_rule_enabled(pool.rules[3], False)
+        pool.remove_rule(pool.rules[5])
+        _ = pool.trie
+        self.assertEqual(counting.calls, 2)
+        pool.compile()
+        self.assertEqual(counting.calls, 2)
+
+    def test_compact_trie_is_patched_when_the_phrase_path_exists(self) -> None:
+        low = VocabRule("blue sky", "low")
+        high = VocabRule("blue sky", "high", priority=3)
+        pool = VocabPool([low, VocabRule("dusk", "gloaming")], trie_backend=TRIE_BACKEND_COMPACT)
+        trie = pool.trie
+        replacer = Replacer(pool)
+        pool.add_rule(high)
+        self.assertIs(pool.trie, trie)
+        self.assertEqual(replacer.replace_text("blue sky at dusk"), "high at gloaming")
+        pool.remove_rule(high)
+        pool.set_rule_enabled(pool.rules[1], False)
+        self.assertIs(pool.trie, trie)
+        self.assertEqual(replacer.replace_text("blue sky at dusk"), "low at dusk")
+        pool.add_rule(VocabRule("at dusk", "late"))
+        self.assertIsNot(pool.trie, trie)
+        self.assertEqual(replacer.replace_text("blue sky at dusk"), "low late")
+
+    def test_token_cache_tracks_live_rules(self) -> None:
+        pool = VocabPool([VocabRule(f"word{idx}", "x") for idx in range(20)])
+        _ = pool.trie
+        for rule in list(pool.rules[:15]):
+            pool.remove_rule(rule)
+        self.assertEqual(len(pool._token_cache), 5)
+        pool.remove_rule(VocabRule("word17", "x"))
+        self.assertEqual([rule.source_phrase for rule in pool.rules], ["word15", "word16", "word18", "word19"])
+        with self.assertRaises(ValueError):
+            pool.remove_rule(VocabRule("missing", "x"))
+
+
+if __name__ == "__main__":
+    unittest.main()
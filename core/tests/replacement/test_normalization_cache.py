@@ -0,0 +1,73 @@
+import os
+import pickle
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core import (  # noqa: E402
+    CachedNormalizer,
+    Normalizer,
+    ReplacementMode,
+    Replacer,
+    SynonymNormalizer,
+    VocabPool,
+    compile_pipeline,
+)
+
+
+class _CountingNormalizer(Normalizer):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def normalize_word(self, word: str) -> str:
+        self.calls += 1
+        return word.lower()
+
+
+class NormalizationCacheTests(unittest.TestCase):
+    def test_each_surface_form_is_normalized_once_per_call(self) -> None:
+        counting = _CountingNormalizer()
+        pool = VocabPool.from_mapping({"blue sky": "azure"}, normalizer=counting)
+        _ = pool.trie
+        counting.calls = 0
+        result = Replacer(pool).replace_text("blue sky, blue sky, Blue sky blue")
+        self.assertEqual(result, "azure, azure, Azure blue")
+        self.assertEqual(counting.calls, 3)
+
+    def test_cached_normalizer_counts_hits(self) -> None:
+        cached = CachedNormalizer(SynonymNormalizer({"dusk": "twilight"}), max_entries=2)
+        self.assertEqual(cached.normalize_word("Dusk"), "twilight")
+        self.assertEqual(cached.normalize_word("Dusk"), "twilight")
+        cached.normalize_word("a")
+        cached.normalize_word("b")
+        stats = cached.cache_stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 3, 2))
+        self.assertAlmostEqual(stats.hit_rate, 0.25)
+
+    def test_cached_normalizer_pickles_without_cache(self) -> None:
+        cached = CachedNormalizer(Normalizer(), max_entries=8)
+        cached.normalize_word("Sky")
+        restored = pickle.loads(pickle.dumps(cached))
+        self.assertEqual(restored.normalize_word("Sky"), "sky")
+        self.assertEqual(restored.cache_stats().misses, 1)
+
+    def test_pipeline_wraps_meaning_normalizer(self) -> None:
+        pipeline = compile_pipeline(
+            VocabPool.from_mapping({"twilight": "gloaming"}),
+            synonyms={"dusk": "twilight"},
+            normalization_cache_size=128,
+        )
+        self.assertIsNotNone(pipeline.meaning)
+        normalizer = pipeline.meaning.pool.normalizer
+        self.assertIsInstance(normalizer, CachedNormalizer)
+        self.assertIsInstance(normalizer.inner, SynonymNormalizer)
+        for _ in range(3):
+            self.assertEqual(pipeline.replace_text("at dusk", mode=ReplacementMode.MEANING), "at gloaming")
+        self.assertGreater(normalizer.cache_stats().hits, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
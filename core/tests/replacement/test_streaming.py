@@ -0,0 +1,97 @@
+import io
+import os
+import random
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core import (  # noqa: E402
+    ReplacementMode,
+    Replacer,
+    StreamingReplacer,
+    VocabPool,
+    VocabRule,
+    compile_pipeline,
+)
+
+_WORDS = ("a", "b", "c", "don't", "Sky", "dusk", "café", "the")
+
+
+def _random_text(rng: random.Random, length: int) -> str:
+    parts = []
+    for _ in range(length):
+        parts.append(rng.choice(_WORDS))
+        parts.append(rng.choice((" ", " ", "  ", ", ", "-", ".\n", "\t")))
+    return "".join(parts)
+
+
+def _random_chunks(rng: random.Random, text: str) -> list[str]:
+    chunks = []
+    cursor = 0
+    while cursor < len(text):
+        size = rng.randint(1, 12)
+        chunks.append(text[cursor : cursor + size])
+        cursor += size
+    return chunks
+
+
+class StreamingReplacerTests(unittest.TestCase):
+    def test_stream_matches_whole_text_replacement(self) -> None:
+        rng = random.Random(3)
+        for _ in range(30):
+            rules = []
+            for idx in range(rng.randint(1, 20)):
+                phrase = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 3)))
+                rules.append(VocabRule(phrase, f"r{idx}", priority=rng.randint(0, 2)))
+            pool = VocabPool(rules)
+            text = _random_text(rng, rng.randint(0, 60))
+            expected = Replacer(pool).replace_text(text, with_stats=True)
+
+            pieces = list(StreamingReplacer(pool).replace_stream(_random_chunks(rng, text)))
+            self.assertEqual("".join(piece.text for piece in pieces), expected.text)
+            self.assertEqual([m for piece in pieces for m in piece.matches], expected.matches)
+
+    def test_output_is_emitted_before_stream_ends(self) -> None:
+        pool = VocabPool.from_mapping({"stunned into silence": "overawed"})
+        streamer = StreamingReplacer(pool)
+        first = streamer.feed("she was stunned into silence and then ")
+        self.assertEqual(first.text, "she was overawed ")
+        self.assertEqual(len(first.matches), 1)
+        self.assertEqual(first.matches[0].start_word_index, 2)
+        rest = streamer.flush()
+        self.assertEqual(rest.text, "and then ")
+
+    def test_lookahead_is_bounded_without_whitespace(self) -> None:
+        pool = VocabPool.from_mapping({"dusk sky": "gloaming", "don't": "do not"})
+        text = "日本語-dusk-sky,don't;" * 400
+        streamer = StreamingReplacer(pool)
+        pieces = []
+        for idx in range(0, len(text), 5):
+            pieces.append(streamer.feed(text[idx : idx + 5]).text)
+            self.assertLess(len(streamer._pending), 40)
+        pieces.append(streamer.flush().text)
+        self.assertEqual("".join(pieces), Replacer(pool).replace_text(text))
+
+    def test_contraction_split_across_chunks(self) -> None:
+        pool = VocabPool.from_mapping({"don't": "do not"})
+        pieces = StreamingReplacer(pool).replace_stream(["I don", "'", "t-know"])
+        self.assertEqual("".join(piece.text for piece in pieces), "I do not-know")
+
+    def test_file_like_source(self) -> None:
+        pool = VocabPool.from_mapping({"twilight": "gloaming"})
+        source = io.StringIO("At twilight, at twilight.\n" * 50)
+        output = "".join(piece.text for piece in StreamingReplacer(pool).replace_stream(source, chunk_size=7))
+        self.assertEqual(output, "At gloaming, at gloaming.\n" * 50)
+
+    def test_pipeline_replace_stream_uses_mode(self) -> None:
+        pool = VocabPool.from_mapping({"twilight": "gloaming"})
+        pipeline = compile_pipeline(pool, synonyms={"dusk": "twilight"})
+        pieces = pipeline.replace_stream(["at du", "sk today"], mode=ReplacementMode.MEANING)
+        self.assertEqual("".join(piece.text for piece in pieces), "at gloaming today")
+
+
+if __name__ == "__main__":
+    unittest.main()
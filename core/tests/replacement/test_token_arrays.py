@@ -0,0 +1,68 @@
+import os
+import random
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core import (  # noqa: E402
+    TOKENIZE_MODE_ARRAYS,
+    Replacer,
+    Tokenizer,
+    VocabPool,
+    VocabRule,
+)
+
+_KIND_NAMES = {1: "word", 2: "space", 3: "punct"}
+_PIECES = ("sky", "Blue", "don't", "café", "ÉTÉ", " ", "  ", "\n", ",", "--", "é", "'", "42")
+
+
+def _random_text(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(_PIECES) for _ in range(length))
+
+
+class TokenArraysTests(unittest.TestCase):
+    def test_arrays_match_token_dataclasses(self) -> None:
+        rng = random.Random(1)
+        tokenizer = Tokenizer()
+        for _ in range(100):
+            text = _random_text(rng, rng.randint(0, 30))
+            arrays = tokenizer.tokenize_arrays(text)
+            self.assertEqual(arrays.kinds.typecode, "b")
+            flattened = [
+                (text[start:end], _KIND_NAMES[kind])
+                for kind, start, end in zip(arrays.kinds, arrays.starts, arrays.ends)
+            ]
+            self.assertEqual(flattened, [(token.text, token.kind) for token in tokenizer.tokenize(text)])
+
+    def test_arrays_mode_output_is_identical(self) -> None:
+        rng = random.Random(2)
+        words = ("sky", "blue", "don't", "42")
+        for _ in range(40):
+            rules = [
+                VocabRule(
+                    " ".join(rng.choice(words) for _ in range(rng.randint(1, 2))),
+                    f"R{idx}",
+                    case_policy=rng.choice(("match", "upper", "as-is")),
+                )
+                for idx in range(rng.randint(1, 8))
+            ]
+            pool = VocabPool(rules)
+            token_path = Replacer(pool)
+            array_path = Replacer(pool, tokenize_mode=TOKENIZE_MODE_ARRAYS)
+            texts = [_random_text(rng, rng.randint(0, 40)) for _ in range(5)]
+            for text in texts:
+                self.assertEqual(
+                    array_path.replace_text(text, with_stats=True),
+                    token_path.replace_text(text, with_stats=True),
+                )
+            self.assertEqual(
+                array_path.replace_many(texts, with_stats=True),
+                token_path.replace_many(texts, with_stats=True),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core.resources.embedding_ann import (  # noqa: E402
+    build_ivf_index,
+    embedding_ann_path,
+    open_ivf_index,
+)
+from lexishift_core.resources.embedding_matrix import (  # noqa: E402
+    load_text_embedding_matrix,
+    numpy_available,
+)
+from lexishift_core.resources.synonyms import (  # noqa: E402
+    EmbeddingIndex,
+    SynonymGenerator,
+    SynonymOptions,
+    SynonymSources,
+)
+
+_DIM = 6
+
+
+def _write_text(path: Path, count: int) -> None:
+    rng = random.Random(11)
+    lines = [f"{count} {_DIM}"]
+    for idx in range(count):
+        lines.append(" ".join([f"w{idx}", *(repr(rng.gauss(0.0, 1.0)) for _ in range(_DIM))]))
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+@unittest.skipUnless(numpy_available(), "NumPy is not installed")
+class TestIvfIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        _write_text(self.root / "vectors.vec", 300)
+        self.matrix_path = self.root / "vectors.npy"
+        matrix = load_text_embedding_matrix([self.root / "vectors.vec"], lower_case=False)
+        matrix.save(self.matrix_path)
+        self.ivf = build_ivf_index(matrix.rows, list_count=12, iterations=5)
+        self.ivf.save(embedding_ann_path(self.matrix_path))
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_lists_partition_every_row(self) -> None:
+        loaded = open_ivf_index(embedding_ann_path(self.matrix_path), row_count=300, dim=_DIM)
+        self.assertEqual(loaded.list_count, 12)
+        self.assertEqual(sorted(loaded.row_ids.tolist()), list(range(300)))
+        self.assertEqual(int(loaded.offsets[-1]), 300)
+        self.assertIsNone(open_ivf_index(embedding_ann_path(self.matrix_path), row_count=299, dim=_DIM))
+
+    def test_nprobe_trades_recall_for_work(self) -> None:
+        terms = [f"w{idx}" for idx in range(0, 300, 15)]
+        exact = EmbeddingIndex(self.matrix_path, lower_case=False).nearest_neighbors_many(
+            terms, limit=10, min_score=-1.0, exact=True
+        )
+        full = EmbeddingIndex(self.matrix_path, lower_case=False, nprobe=12)
+        self.assertEqual(
+            [[word for word, _score in hits] for hits in full.nearest_neighbors_many(terms, limit=10, min_score=-1.0)],
+            [[word for word, _score in hits] for hits in exact],
+        )
+
+        narrow = EmbeddingIndex(self.matrix_path, lower_case=False, nprobe=2)
+        approx = narrow.nearest_neighbors_many(terms, limit=10, min_score=-1.0)
+        self.assertEqual(approx[0], narrow.nearest_neighbors(terms[0], limit=10, min_score=-1.0))
+        for term, hits, truth in zip(terms, approx, exact):
+            self.assertNotIn(term, [word for word, _score in hits])
+            self.assertTrue(hits)
+            # Approximate hits are real neighbors, in exact-score order.
+            scores = [score for _word, score in hits]
+            self.assertEqual(scores, sorted(scores, reverse=True))
+            self.assertLessEqual(scores[0], truth[0][1] + 1e-6)
+
+    def test_synonym_fallback_uses_ivf(self) -> None:
+        options = SynonymOptions(
+            use_embeddings=True,
+            embedding_paths=(self.matrix_path,),
+            lower_case=False,
+            max_synonyms=5,
+            embedding_nprobe=12,
+        )
+        generator = SynonymGenerator(SynonymSources(), options=options)
+        self.assertTrue(generator.embeddings_support_neighbors())
+        synonyms, used_fallback = generator.synonyms_for_detail("w3")
+        self.assertTrue(used_fallback)
+        expected = EmbeddingIndex(self.matrix_path, lower_case=False).nearest_neighbors(
+            "w3", limit=5, min_score=0.0, exact=True
+        )
+        self.assertEqual(synonyms, [word for word, _score in expected])
+
+
+if __name__ == "__main__":
+    unittest.main()
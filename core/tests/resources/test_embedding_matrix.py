@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import math
+import os
+import random
+import sqlite3
+import struct
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core.resources.embedding_matrix import (  # noqa: E402
+    load_sqlite_embedding_matrix,
+    numpy_available,
+)
+from lexishift_core.resources.synonyms import EmbeddingIndex  # noqa: E402
+
+_DIM = 8
+
+
+def _vectors(count: int) -> dict[str, list[float]]:
+    rng = random.Random(5)
+    return {f"w{idx}": [rng.uniform(-1.0, 1.0) for _ in range(_DIM)] for idx in range(count)}
+
+
+def _cosine(vec_a: list[float], vec_b: list[float]) -> float:
+    dot = sum(a * b for a, b in zip(vec_a, vec_b))
+    return dot / (math.sqrt(sum(a * a for a in vec_a)) * math.sqrt(sum(b * b for b in vec_b)))
+
+
+def _write_text(path: Path, vectors: dict[str, list[float]]) -> None:
+    lines = [f"{len(vectors)} {_DIM}"]
+    lines += [" ".join([word, *(repr(value) for value in values)]) for word, values in vectors.items()]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+@unittest.skipUnless(numpy_available(), "NumPy is not installed")
+class TestEmbeddingMatrix(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.vectors = _vectors(40)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_text_index_matches_exact_cosine(self) -> None:
+        path = self.root / "vectors.vec"
+        _write_text(path, self.vectors)
+        index = EmbeddingIndex(path, lower_case=True)
+
+        self.assertAlmostEqual(index.similarity("W1", "w2"), _cosine(self.vectors["w1"], self.vectors["w2"]), places=5)
+        self.assertIsNone(index.similarity("w1", "missing"))
+        averaged = [(a + b) / 2 for a, b in zip(self.vectors["w3"], self.vectors["w4"])]
+        self.assertAlmostEqual(index.similarity("w3-w4", "w5"), _cosine(averaged, self.vectors["w5"]), places=5)
+
+        expected = sorted(
+            ((word, _cosine(self.vectors["w0"], values)) for word, values in self.vectors.items() if word != "w0"),
+            key=lambda item: -item[1],
+        )[:5]
+        neighbors = index.nearest_neighbors("w0", limit=5, min_score=-1.0)
+        self.assertEqual([word for word, _score in neighbors], [word for word, _score in expected])
+        for (_word, score), (_expected_word, expected_score) in zip(neighbors, expected):
+            self.assertAlmostEqual(score, expected_score, places=5)
+        positive = index.nearest_neighbors("w0", limit=100, min_score=0.0)
+        positive_count = sum(
+            1 for word, values in self.vectors.items() if word != "w0" and _cosine(self.vectors["w0"], values) >= 0.0
+        )
+        self.assertEqual(len(positive), positive_count)
+
+        terms = ["w0", "w7", "nope", "w3 w4"]
+        batched = index.nearest_neighbors_many(terms, limit=4, min_score=-1.0)
+        self.assertEqual([len(neighbors) for neighbors in batched], [4, 4, 0, 4])
+        for term, neighbors in zip(terms, batched):
+            single = index.nearest_neighbors(term, limit=4, min_score=-1.0)
+            self.assertEqual([word for word, _score in neighbors], [word for word, _score in single])
+            for (_word, score), (_single_word, single_score) in zip(neighbors, single):
+                self.assertAlmostEqual(score, single_score, places=5)
+
+    def test_sqlite_sibling_matrix_is_memory_mapped(self) -> None:
+        db_path = self.root / "vectors.sqlite"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        conn.execute("CREATE TABLE vectors (word TEXT PRIMARY KEY, word_lc TEXT NOT NULL, vector BLOB NOT NULL)")
+        conn.execute("INSERT INTO meta VALUES ('dim', ?)", (str(_DIM),))
+        rows = [("Apple", self.vectors["w1"]), ("apple", self.vectors["w2"]), ("pear", self.vectors["w3"])]
+        conn.executemany(
+            "INSERT INTO vectors VALUES (?, ?, ?)",
+            ((word, word.lower(), struct.pack(f"<{_DIM}f", *values)) for word, values in rows),
+        )
+        conn.commit()
+        conn.close()
+        load_sqlite_embedding_matrix(db_path, lower_case=False).save(db_path.with_suffix(".npy"))
+
+        index = EmbeddingIndex(db_path, lower_case=True)
+        self.assertTrue(index.supports_neighbors())
+        self.assertEqual(type(index._matrix.rows).__name__, "memmap")
+        self.assertAlmostEqual(index.similarity("APPLE", "pear"), _cosine(self.vectors["w2"], self.vectors["w3"]), places=5)
+        self.assertEqual([word for word, _score in index.nearest_neighbors("pear", limit=5, min_score=-1.0)], ["apple"])
+
+        cased = EmbeddingIndex(db_path.with_suffix(".npy"), lower_case=False)
+        self.assertAlmostEqual(cased.similarity("Apple", "pear"), _cosine(self.vectors["w1"], self.vectors["w3"]), places=5)
+        self.assertEqual(len(cased.nearest_neighbors("pear", limit=5, min_score=-1.0)), 2)
+
+    def test_word2vec_binary_input(self) -> None:
+        path = self.root / "vectors.bin"
+        with path.open("wb") as handle:
+            handle.write(f"{len(self.vectors)} {_DIM}\n".encode("utf-8"))
+            for word, values in self.vectors.items():
+                handle.write(word.encode("utf-8") + b" " + struct.pack(f"<{_DIM}f", *values) + b"\n")
+        index = EmbeddingIndex(path, lower_case=False)
+        self.assertAlmostEqual(index.similarity("w8", "w9"), _cosine(self.vectors["w8"], self.vectors["w9"]), places=5)
+        self.assertEqual(len(index.nearest_neighbors("w8", limit=100, min_score=-1.0)), len(self.vectors) - 1)
+
+    def test_falls_back_when_matrix_loader_fails(self) -> None:
+        path = self.root / "vectors.bin"
+        with path.open("wb") as handle:
+            handle.write(f"{len(self.vectors)} {_DIM}\n".encode("utf-8"))
+            for word, values in self.vectors.items():
+                handle.write(word.encode("utf-8") + b" " + struct.pack(f"<{_DIM}f", *values) + b"\n")
+        with mock.patch("lexishift_core.resources.synonyms.load_word2vec_embedding_matrix", return_value=None):
+            index = EmbeddingIndex(path, lower_case=False)
+        self.assertIsNone(index._matrix)
+        self.assertAlmostEqual(index.similarity("w8", "w9"), _cosine(self.vectors["w8"], self.vectors["w9"]), places=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import os
+import random
+import sqlite3
+import struct
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core.resources.embedding_matrix import load_sqlite_embedding_matrix, numpy_available  # noqa: E402
+from lexishift_core.resources.synonyms import (  # noqa: E402
+    EmbeddingIndex,
+    SynonymGenerator,
+    SynonymOptions,
+    SynonymSources,
+)
+from lexishift_core.rulegen.generation import (  # noqa: E402
+    EmbeddingScoreProvider,
+    MappingCandidateSource,
+    RuleGenerationConfig,
+    RuleGenerationPipeline,
+    SimpleSignalProvider,
+)
+
+_DIM = 4
+_WORDS = ("big", "large", "huge", "Vast", "small", "tiny", "little", "quick", "fast", "rapid")
+
+
+def _write_vectors_db(path: Path) -> None:
+    rng = random.Random(3)
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    conn.execute("CREATE TABLE vectors (word TEXT PRIMARY KEY, word_lc TEXT NOT NULL, vector BLOB NOT NULL)")
+    conn.execute("INSERT INTO meta VALUES ('dim', ?)", (str(_DIM),))
+    conn.executemany(
+        "INSERT INTO vectors VALUES (?, ?, ?)",
+        (
+            (word, word.lower(), struct.pack(f"<{_DIM}f", *(rng.uniform(-1.0, 1.0) for _ in range(_DIM))))
+            for word in _WORDS
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+class _CountingScorer:
+    def __init__(self, index: EmbeddingIndex) -> None:
+        self.index = index
+        self.calls = 0
+
+    def score_pairs(self, pairs):
+        self.calls += 1
+        return self.index.score_pairs(pairs)
+
+
+class TestBatchedEmbeddingScores(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.db_path = self.root / "vectors.sqlite"
+        _write_vectors_db(self.db_path)
+        self.moby_path = self.root / "moby.txt"
+        self.moby_path.write_text(
+            "big,large,huge,vast,enormous\nsmall,tiny,little\nquick,fast,rapid,nippy\n",
+            encoding="utf-8",
+        )
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_sqlite_pairs_are_fetched_in_one_query(self) -> None:
+        index = EmbeddingIndex(self.db_path, lower_case=True)
+        statements: list[str] = []
+        index._sqlite_conn.set_trace_callback(statements.append)
+        pairs = [("big", "large"), ("big", "vast"), ("small", "tiny-little"), ("quick", "nippy"), ("fast", "rapid")]
+        scores = index.score_pairs(pairs)
+        self.assertEqual(len([sql for sql in statements if sql.startswith("SELECT")]), 1)
+        self.assertIsNone(scores[3])
+
+        reference = EmbeddingIndex(self.db_path, lower_case=True)
+        for (term_a, term_b), score in zip(pairs, scores):
+            expected = reference.similarity(term_a, term_b)
+            if expected is None:
+                self.assertIsNone(score)
+            else:
+                self.assertAlmostEqual(score, expected, places=9)
+        self.assertEqual(index.similarities("big", ["large", "vast"]), scores[:2])
+
+    def test_batched_synonyms_match_single_lookups(self) -> None:
+        for threshold in (0.0, 0.2):
+            options = SynonymOptions(
+                use_embeddings=True,
+                embedding_paths=(self.db_path,),
+                embedding_threshold=threshold,
+            )
+            generator = SynonymGenerator(SynonymSources(moby_path=self.moby_path), options=options)
+            words = ["big", "small", "quick", "Huge", "unknown"]
+            single = [
+                SynonymGenerator(SynonymSources(moby_path=self.moby_path), options=options).synonyms_for_detail(word)
+                for word in words
+            ]
+            self.assertEqual(generator.synonyms_for_details(words), single)
+
+    @unittest.skipUnless(numpy_available(), "NumPy is not installed")
+    def test_matrix_pairs_match_sqlite_pairs(self) -> None:
+        pairs = [("big", "large"), ("Big", "VAST"), ("small", "tiny little"), ("quick", "nippy")]
+        sqlite_scores = EmbeddingIndex(self.db_path, lower_case=True).score_pairs(pairs)
+        load_sqlite_embedding_matrix(self.db_path, lower_case=False).save(self.db_path.with_suffix(".npy"))
+        matrix_scores = EmbeddingIndex(self.db_path, lower_case=True).score_pairs(pairs)
+        for expected, score in zip(sqlite_scores, matrix_scores):
+            if expected is None:
+                self.assertIsNone(score)
+            else:
+                self.assertAlmostEqual(score, expected, places=5)
+
+    def test_pipeline_scores_candidates_in_one_batch(self) -> None:
+        scorer = _CountingScorer(EmbeddingIndex(self.db_path, lower_case=True))
+        provider = EmbeddingScoreProvider(scorer)
+        pipeline = RuleGenerationPipeline(
+            sources=[MappingCandidateSource({"big": ["large", "huge"], "small": ["tiny"]}, source_dict="test")],
+            signal_provider=SimpleSignalProvider(embedding_provider=provider),
+        )
+        results = pipeline.generate_results(["big", "small"], config=RuleGenerationConfig(language_pair="en-en"))
+        self.assertEqual(len(results), 3)
+        self.assertEqual(scorer.calls, 1)
+        self.assertAlmostEqual(
+            provider(results[0].candidate),
+            scorer.index.similarity("large", "big"),
+            places=9,
+        )
+        self.assertEqual(scorer.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
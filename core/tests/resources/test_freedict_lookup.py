@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core.resources.dict_loaders import load_freedict_sqlite_glosses_ordered  # noqa: E402
+from lexishift_core.resources.freedict_lookup import open_freedict_sqlite_lookup  # noqa: E402
+from lexishift_core.rulegen.pairs.en_de import EnDeRulegenConfig, generate_en_de_results  # noqa: E402
+
+_ROWS = (
+    ("Hund", "dogs", 1),
+    ("Hund", "hound", 0),
+    ("Köter", "dog", 0),
+    ("Katze", "cat", 0),
+    ("Katze", "puss", 1),
+)
+
+
+def _write_freedict_db(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE entries ("
+        "headword TEXT NOT NULL, headword_lc TEXT NOT NULL, "
+        "translation TEXT NOT NULL, translation_lc TEXT NOT NULL, "
+        "rank INTEGER NOT NULL, pos TEXT, entry_ord INTEGER NOT NULL, gloss_ord INTEGER NOT NULL, "
+        "PRIMARY KEY (headword_lc, translation_lc))"
+    )
+    conn.executemany(
+        "INSERT INTO entries VALUES (?, ?, ?, ?, ?, NULL, 0, 0)",
+        ((headword, headword.lower(), translation, translation.lower(), rank) for headword, translation, rank in _ROWS),
+    )
+    conn.commit()
+    conn.close()
+
+
+class TestFreedictSqliteLookup(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "deu-eng.sqlite"
+        _write_freedict_db(self.path)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_lookup_matches_full_load(self) -> None:
+        full = load_freedict_sqlite_glosses_ordered(self.path)
+        with open_freedict_sqlite_lookup(self.path) as lookup:
+            lookup.prefetch(["Hund", "Katze", "Maus"])
+            self.assertEqual(lookup["Hund"], full["Hund"])
+            self.assertEqual(lookup.get("Katze"), ["cat", "puss"])
+            self.assertNotIn("Maus", lookup)
+            self.assertEqual(dict(lookup), full)
+            self.assertIn("dog", lookup.gloss_forms)
+            self.assertNotIn("dogs ", lookup.gloss_forms)
+
+    def test_non_sqlite_paths_have_no_lookup(self) -> None:
+        tei = Path(self._tmp.name) / "deu-eng.tei"
+        tei.write_text("<TEI/>", encoding="utf-8")
+        self.assertIsNone(open_freedict_sqlite_lookup(tei))
+        self.assertIsNone(open_freedict_sqlite_lookup(Path(self._tmp.name) / "missing.sqlite"))
+
+    def test_lazy_rulegen_matches_materialized_mapping(self) -> None:
+        targets = ("Hund", "Katze")
+        lazy = generate_en_de_results(targets, config=EnDeRulegenConfig(freedict_de_en_path=self.path))
+        eager = generate_en_de_results(
+            targets,
+            config=EnDeRulegenConfig(
+                freedict_de_en_path=self.path,
+                gloss_mapping=load_freedict_sqlite_glosses_ordered(self.path),
+            ),
+        )
+        self.assertEqual([result.rule for result in lazy], [result.rule for result in eager])
+        # "dogs" is dropped as an inflection of "dog", a gloss of another headword.
+        self.assertNotIn("dogs", [result.rule.source_phrase for result in lazy])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core.resources.dict_loaders import (  # noqa: E402
+    load_jmdict_entry_index_glosses_and_script_forms,
+    load_jmdict_lemmas,
+)
+from lexishift_core.resources.jmdict_index import (  # noqa: E402
+    JmdictGlossForms,
+    JmdictLemmaSet,
+    JmdictTermMapping,
+    jmdict_index_path,
+    open_jmdict_index,
+)
+
+_JMDICT = (
+    "<JMdict>"
+    "<entry>"
+    "<k_ele><keb>猫</keb></k_ele>"
+    "<r_ele><reb>ねこ</reb></r_ele>"
+    "<sense><gloss xml:lang='eng'>cat</gloss><gloss xml:lang='eng'>kitty</gloss></sense>"
+    "</entry>"
+    "<entry>"
+    "<k_ele><keb>所</keb><keb>処</keb></k_ele>"
+    "<r_ele><reb>ところ</reb></r_ele>"
+    "<sense><gloss xml:lang='eng'>place</gloss></sense>"
+    "</entry>"
+    "<entry>"
+    "<r_ele><reb>ねこ</reb></r_ele>"
+    "<sense><gloss xml:lang='eng'>tiger (slang)</gloss><gloss xml:lang='ger'>Tiger</gloss></sense>"
+    "</entry>"
+    "<entry>"
+    "<k_ele><keb>犬</keb></k_ele>"
+    "<r_ele><reb>いぬ</reb></r_ele>"
+    "<sense><gloss xml:lang='ger'>Hund</gloss></sense>"
+    "</entry>"
+    "</JMdict>"
+)
+
+
+class TestJmdictIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "JMdict_e"
+        self.path.write_text(_JMDICT, encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_target_lookup_matches_full_xml_load(self) -> None:
+        full = load_jmdict_entry_index_glosses_and_script_forms(self.path)
+        targets = ["猫", "ねこ", "処", "犬", "missing"]
+        indexed = load_jmdict_entry_index_glosses_and_script_forms(self.path, targets=targets)
+
+        self.assertTrue(jmdict_index_path(self.path).exists())
+        for expected, actual in zip(full, indexed):
+            self.assertEqual({term: expected[term] for term in targets if term in expected}, actual)
+        self.assertEqual(indexed[1]["ねこ"], ["cat", "kitty", "tiger (slang)"])
+
+    def test_lemmas_include_entries_without_allowed_glosses(self) -> None:
+        lemmas = load_jmdict_lemmas(self.path, targets=["犬", "いぬ", "猫", "missing"])
+        self.assertEqual(lemmas, {"犬", "いぬ", "猫"})
+        self.assertEqual(lemmas, load_jmdict_lemmas(self.path) & {"犬", "いぬ", "猫", "missing"})
+
+        with open_jmdict_index(self.path) as index:
+            kanji_only = JmdictLemmaSet(index, include_kana=False)
+            self.assertIn("犬", kanji_only)
+            self.assertNotIn("いぬ", kanji_only)
+
+    def test_lazy_views_and_gloss_forms(self) -> None:
+        with open_jmdict_index(self.path) as index:
+            cache: dict = {}
+            glosses = JmdictTermMapping(index, part="glosses", cache=cache)
+            forms = JmdictTermMapping(index, part="script_forms", cache=cache)
+            glosses.prefetch(["所", "犬"])
+            self.assertEqual(glosses["所"], ["place"])
+            self.assertEqual(forms["処"]["kana"], "ところ")
+            self.assertNotIn("犬", glosses)
+            self.assertIsNone(glosses.get("犬"))
+            self.assertEqual(len(glosses), 5)
+
+            gloss_forms = JmdictGlossForms(index)
+            self.assertIn("tiger (slang)", gloss_forms)
+            self.assertNotIn("hund", gloss_forms)
+            self.assertEqual(len(gloss_forms), 4)
+
+    def test_index_rebuilds_when_source_changes(self) -> None:
+        with open_jmdict_index(self.path) as index:
+            first_key = index.source_key()
+        self.path.write_text(_JMDICT.replace("place", "spot"), encoding="utf-8")
+        with open_jmdict_index(self.path) as index:
+            self.assertNotEqual(index.source_key(), first_key)
+            entries, mapping, _forms = index.lookup(["所"])
+        self.assertEqual(mapping["所"], ["spot"])
+        self.assertEqual(entries["所"][0].kanji_forms, ("所", "処"))
+
+    def test_missing_source_has_no_index(self) -> None:
+        self.assertIsNone(open_jmdict_index(Path(self._tmp.name) / "absent"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core.resources.synonyms import (  # noqa: E402
+    SynonymGenerator,
+    SynonymOptions,
+    SynonymSources,
+    _apply_consensus_filter,
+)
+
+_WORDNET = (
+    "00001 00 a 03 big 0 large 0 great 0 000 | of considerable size\n"
+    "00002 00 a 02 small 0 little 0 000 | limited in size\n"
+    "00003 00 a 02 quick 0 rapid 0 000 | fast\n"
+)
+
+
+class TestParallelSourceLoading(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        moby_path = root / "moby.txt"
+        moby_path.write_text("big,large,huge\nsmall,tiny,little\nquick,fast,rapid\n", encoding="utf-8")
+        wordnet_dir = root / "wordnet"
+        wordnet_dir.mkdir()
+        (wordnet_dir / "data.adj").write_text(_WORDNET, encoding="utf-8")
+        openthesaurus_path = root / "openthesaurus.txt"
+        openthesaurus_path.write_text("big;large;great\nsmall;little\nquick;rapid;swift\n", encoding="utf-8")
+        self.sources = SynonymSources(
+            moby_path=moby_path,
+            wordnet_dir=wordnet_dir,
+            openthesaurus_path=openthesaurus_path,
+        )
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_pool_matches_serial_loading(self) -> None:
+        words = ["big", "small", "quick", "great", "swift"]
+        for consensus in (False, True):
+            serial = SynonymGenerator(
+                self.sources,
+                options=SynonymOptions(require_consensus=consensus, load_workers=1),
+            )
+            pooled = SynonymGenerator(
+                self.sources,
+                options=SynonymOptions(require_consensus=consensus, load_workers=3),
+            )
+            with self.subTest(consensus=consensus):
+                self.assertEqual(pooled.synonyms_for_details(words), serial.synonyms_for_details(words))
+                self.assertEqual(pooled.total_entries(), serial.total_entries())
+        stats = pooled.stats()
+        self.assertEqual(stats["moby"], 3)
+        for key in ("moby", "wordnet", "openthesaurus"):
+            self.assertIn(f"{key}_load_ms", stats)
+        self.assertNotIn("odenet_load_ms", stats)
+        self.assertEqual(sorted(serial.synonyms_for("quick")), ["rapid"])
+
+    def test_streaming_consensus_matches_full_count(self) -> None:
+        mappings = [
+            {"a": {"b", "c", "d"}, "x": {"y"}, "only": {"one"}},
+            {"a": {"b", "c"}, "x": {"y", "z"}, "late": {"z"}},
+            {"a": {"b", "d"}, "x": {"z"}, "late": {"z"}},
+        ]
+        for min_sources in (1, 2, 3):
+            with self.subTest(min_sources=min_sources):
+                self.assertEqual(
+                    _apply_consensus_filter(iter(mappings), min_sources=min_sources, source_count=len(mappings)),
+                    _apply_consensus_filter(mappings, min_sources=min_sources),
+                )
+        self.assertEqual(
+            _apply_consensus_filter(iter(mappings), min_sources=3, source_count=3),
+            {"a": {"b"}},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
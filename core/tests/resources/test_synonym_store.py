@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core.resources.synonym_store import SynonymStore  # noqa: E402
+from lexishift_core.resources.synonyms import SynonymGenerator, SynonymOptions, SynonymSources  # noqa: E402
+
+_MOBY = "Big,large,huge,Vast\nbig,great\nsmall,tiny,little\nquick,fast,rapid\n"
+# Classic WordNet data lines: offset, lex file, pos, word count (hex), then word/lex-id pairs.
+_WORDNET = (
+    "00001 00 a 03 big 0 large 0 great 0 000 | of considerable size\n"
+    "00002 00 a 02 small 0 little 0 000 | limited in size\n"
+    "00003 00 a 01 lonely 0 000 | alone\n"
+    "00004 00 a 02 quick 0 rapid 0 000 | fast\n"
+)
+
+
+def _entry_counts(generator: SynonymGenerator) -> dict[str, int]:
+    return {key: value for key, value in generator.stats().items() if not key.endswith("_load_ms")}
+
+
+class TestSynonymStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.moby_path = self.root / "moby.txt"
+        self.moby_path.write_text(_MOBY, encoding="utf-8")
+        self.wordnet_dir = self.root / "wordnet"
+        self.wordnet_dir.mkdir()
+        (self.wordnet_dir / "data.adj").write_text(_WORDNET, encoding="utf-8")
+        self.sources = SynonymSources(moby_path=self.moby_path, wordnet_dir=self.wordnet_dir)
+        self.store_path = self.root / "cache" / "synonym_store.sqlite"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_store_lookups_match_in_memory_merge(self) -> None:
+        words = ["big", "BIG", "Big", "small", "quick", "lonely", "huge", "missing"]
+        for lower_case in (True, False):
+            for consensus in (False, True):
+                options = SynonymOptions(lower_case=lower_case, require_consensus=consensus, max_synonyms=0)
+                eager = SynonymGenerator(self.sources, options=options)
+                stored = SynonymGenerator(
+                    self.sources,
+                    options=SynonymOptions(
+                        lower_case=lower_case,
+                        require_consensus=consensus,
+                        max_synonyms=0,
+                        store_path=self.store_path,
+                    ),
+                )
+                with self.subTest(lower_case=lower_case, consensus=consensus):
+                    self.assertEqual(stored.synonyms_for_details(words), eager.synonyms_for_details(words))
+                    self.assertEqual(stored.total_entries(), eager.total_entries())
+                    self.assertEqual(_entry_counts(stored), _entry_counts(eager))
+                stored.close()
+
+    def test_sources_are_parsed_once_per_file_version(self) -> None:
+        calls: list[str] = []
+
+        def loader() -> dict[str, set[str]]:
+            calls.append("moby")
+            return {"big": {"large"}}
+
+        store = SynonymStore(self.store_path)
+        self.assertEqual(store.ensure("moby", self.moby_path, loader), 1)
+        self.assertEqual(store.ensure("moby", self.moby_path, loader), 1)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(store.ensure("moby", self.moby_path, loader, extra="other options"), 1)
+        self.assertEqual(len(calls), 2)
+        store.close()
+
+        generator = SynonymGenerator(self.sources, options=SynonymOptions(store_path=self.store_path))
+        self.assertIn("large", generator.synonyms_for("big"))
+        generator.close()
+        self.moby_path.write_text("big,massive\n", encoding="utf-8")
+        os.utime(self.moby_path, ns=(1, 1))
+        generator = SynonymGenerator(self.sources, options=SynonymOptions(store_path=self.store_path))
+        self.assertEqual(generator.stats()["moby"], 1)
+        self.assertIn("massive", generator.synonyms_for("big"))
+        self.assertNotIn("huge", generator.synonyms_for("big"))
+        generator.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -95,7 +95,12 @@ def _stub_run_rulegen_for_pair(*, store, pair, **_kwargs):
             "source_count": len(rules),
         },
     }
-    return store, SimpleNamespace(rules=rules, snapshot=snapshot, target_count=len(pair_lemmas))
+    return store, SimpleNamespace(
+        rules=rules,
+        snapshot=snapshot,
+        target_count=len(pair_lemmas),
+        regenerated_count=None,
+    )
 
 
 class TestSrsFeedbackSimulation(unittest.TestCase):
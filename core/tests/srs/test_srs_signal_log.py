@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from dataclasses import replace
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core.helper.paths import build_helper_paths  # noqa: E402
+from lexishift_core.srs.admission_refresh import compute_feedback_window_stats  # noqa: E402
+from lexishift_core.srs.signal_log import (  # noqa: E402
+    append_signal_log_records,
+    compact_signal_log,
+    signal_log_archived_segments,
+    signal_log_needs_compaction,
+    signal_log_segments,
+)
+from lexishift_core.srs.signal_queue import (  # noqa: E402
+    SIGNAL_EXPOSURE,
+    SIGNAL_FEEDBACK,
+    SrsSignalEvent,
+    event_to_dict,
+    append_signal_events,
+    import_legacy_signal_queue,
+    load_signal_events,
+    save_signal_events,
+    summarize_signal_events,
+)
+
+_RATINGS = ("again", "hard", "good", "easy", "good")
+
+
+def _events(count: int) -> list[SrsSignalEvent]:
+    events = []
+    for index in range(count):
+        pair = "en-ja" if index % 3 else "en-de"
+        if index % 2:
+            events.append(
+                SrsSignalEvent(
+                    event_type=SIGNAL_FEEDBACK,
+                    pair=pair,
+                    lemma=f"w{index % 17}",
+                    source_type="extension",
+                    rating=_RATINGS[index % len(_RATINGS)],
+                    ts=f"2026-01-01T00:{index // 60:02d}:{index % 60:02d}+00:00",
+                )
+            )
+        else:
+            events.append(
+                SrsSignalEvent(
+                    event_type=SIGNAL_EXPOSURE,
+                    pair=pair,
+                    lemma=f"w{index % 11}",
+                    source_type="extension",
+                    ts=f"2026-01-01T00:{index // 60:02d}:{index % 60:02d}+00:00",
+                )
+            )
+    return events
+
+
+class TestSrsSignalLog(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.log = self.root / "srs_signal_log.jsonl"
+        self.legacy = self.root / "srs_signal_queue.json"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write_both(self, events: list[SrsSignalEvent]) -> None:
+        save_signal_events(self.legacy, events, max_events=len(events))
+        for start in range(0, len(events), 7):
+            append_signal_log_records(
+                self.log,
+                [event_to_dict(event) for event in events[start : start + 7]],
+                fsync=False,
+                max_segment_bytes=2048,
+            )
+
+    def test_log_matches_legacy_queue_across_rotation_and_compaction(self) -> None:
+        events = _events(300)
+        self._write_both(events)
+        self.assertGreater(len(signal_log_segments(self.log)), 3)
+
+        def check() -> None:
+            self.assertEqual(load_signal_events(self.log, limit=25), load_signal_events(self.legacy)[-25:])
+            for pair in ("en-ja", "en-de", None):
+                self.assertEqual(summarize_signal_events(self.log, pair=pair), summarize_signal_events(self.legacy, pair=pair))
+            for window in (5, 40, 200):
+                window_events = load_signal_events(self.log, pair="en-ja", event_type=SIGNAL_FEEDBACK, limit=window)
+                self.assertEqual(
+                    compute_feedback_window_stats(window_events, pair="en-ja", window_size=window),
+                    compute_feedback_window_stats(load_signal_events(self.legacy), pair="en-ja", window_size=window),
+                )
+
+        check()
+        self.assertEqual(load_signal_events(self.log), load_signal_events(self.legacy))
+        self.assertTrue(signal_log_needs_compaction(self.log))
+        self.assertGreater(compact_signal_log(self.log, keep_segments=1), 0)
+        self.assertFalse(signal_log_needs_compaction(self.log, keep_segments=1))
+        check()
+        self.assertTrue(signal_log_archived_segments(self.log))
+        self.assertEqual(load_signal_events(self.log), load_signal_events(self.legacy))
+        for pair in ("en-ja", None):
+            self.assertEqual(
+                load_signal_events(self.log, pair=pair, event_type=SIGNAL_FEEDBACK),
+                load_signal_events(self.legacy, pair=pair, event_type=SIGNAL_FEEDBACK),
+            )
+
+    def test_torn_trailing_line_is_skipped_and_terminated(self) -> None:
+        append_signal_events(self.log, _events(2))
+        with self.log.open("ab") as handle:
+            handle.write(b'{"event_type":"feedback","pa')
+        append_signal_events(self.log, _events(1))
+        self.assertEqual(len(load_signal_events(self.log)), 3)
+        self.assertEqual(len(load_signal_events(self.log, limit=10)), 3)
+
+    def test_legacy_queue_is_imported_once(self) -> None:
+        save_signal_events(self.legacy, _events(4))
+        self.assertEqual(import_legacy_signal_queue(self.legacy, self.log), 4)
+        self.assertFalse(self.legacy.exists())
+        self.assertEqual(len(json.loads(self.legacy.with_name(self.legacy.name + ".bak").read_text())["events"]), 4)
+        self.assertEqual(len(load_signal_events(self.log)), 4)
+
+    def test_legacy_queue_is_imported_at_helper_setup(self) -> None:
+        paths = build_helper_paths(self.root)
+        legacy = paths.srs_signal_queue_json_path_for("default")
+        save_signal_events(legacy, _events(3))
+        log_path = paths.srs_signal_queue_path_for("default")
+        self.assertFalse(log_path.exists())
+        build_helper_paths(self.root)
+        self.assertEqual(len(load_signal_events(log_path)), 3)
+
+    def test_concurrent_writers_keep_every_record(self) -> None:
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=_append_worker, args=(str(self.log), seed)) for seed in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertTrue(all(worker.exitcode == 0 for worker in workers))
+        self.assertEqual(len(load_signal_events(self.log)), 4 * 60)
+
+
+def _append_worker(log_path: str, seed: int) -> None:
+    for event in _events(60):
+        append_signal_log_records(
+            Path(log_path),
+            [event_to_dict(replace(event, lemma=f"{event.lemma}-{seed}"))],
+            fsync=False,
+            max_segment_bytes=512,
+            max_segments=2,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
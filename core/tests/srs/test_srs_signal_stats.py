@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core.srs.admission_refresh import compute_feedback_window_stats  # noqa: E402
+from lexishift_core.srs.signal_log import (  # noqa: E402
+    append_signal_log_records,
+    compact_signal_log,
+    signal_log_stats_lemmas_path,
+    signal_log_stats_path,
+)
+from lexishift_core.srs.signal_queue import (  # noqa: E402
+    SIGNAL_EXPOSURE,
+    SIGNAL_FEEDBACK,
+    SrsSignalEvent,
+    event_to_dict,
+    summarize_signal_events,
+)
+from lexishift_core.srs.signal_stats import (  # noqa: E402
+    SignalStats,
+    load_feedback_window_stats,
+    record_signal_events,
+    summarize_signal_stats,
+    update_signal_stats,
+)
+
+_RATINGS = ("again", "hard", "good", "easy", "good", "bogus")
+
+
+def _event(index: int) -> SrsSignalEvent:
+    pair = ("en-ja", "en-de", "en-es")[index % 3]
+    ts = f"2026-02-01T{index // 3600:02d}:{index // 60 % 60:02d}:{index % 60:02d}+00:00"
+    if index % 4 == 1:
+        return SrsSignalEvent(
+            event_type=SIGNAL_FEEDBACK,
+            pair=pair,
+            lemma=f"w{index % 23}",
+            source_type="extension",
+            rating=_RATINGS[index % len(_RATINGS)],
+            ts=ts,
+        )
+    return SrsSignalEvent(event_type=SIGNAL_EXPOSURE, pair=pair, lemma=f"w{index % 29}", source_type="extension", ts=ts)
+
+
+class TestSrsSignalStats(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.log = Path(self._tmp.name) / "srs_signal_log.jsonl"
+        self.history: list[SrsSignalEvent] = []
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _append(self, count: int) -> None:
+        start = len(self.history)
+        events = [_event(index) for index in range(start, start + count)]
+        self.history.extend(events)
+        append_signal_log_records(self.log, [event_to_dict(event) for event in events], fsync=False, max_segment_bytes=4096)
+
+    def _assert_matches_scan(self) -> None:
+        for pair in ("en-ja", "en-de", "en-es", "en-fr", None):
+            expected = summarize_signal_events(self.log, pair=pair)
+            self.assertEqual(summarize_signal_stats(self.log, pair=pair), expected)
+            if pair is None:
+                self.assertEqual(expected["event_count"], len(self.history))
+                continue
+            for window in (1, 7, 100, 5000):
+                self.assertEqual(
+                    load_feedback_window_stats(self.log, pair=pair, window_size=window),
+                    compute_feedback_window_stats(self.history, pair=pair, window_size=window),
+                )
+
+    def test_incremental_stats_match_full_scan(self) -> None:
+        for chunk in (5, 40, 1, 120, 33):
+            self._append(chunk)
+            self._assert_matches_scan()
+        stats = update_signal_stats(self.log)
+        self.assertGreater(stats.through_seq, 0)
+
+        # Compacting after the stats caught up keeps the cursor valid.
+        compact_signal_log(self.log, keep_segments=1)
+        self._append(60)
+        self._assert_matches_scan()
+
+    def test_stats_rebuild_when_segments_were_compacted_unseen(self) -> None:
+        self._append(80)
+        update_signal_stats(self.log)
+        self._append(400)
+        compact_signal_log(self.log, keep_segments=0)
+        self._assert_matches_scan()
+
+    def test_partial_trailing_line_waits_for_completion(self) -> None:
+        self._append(10)
+        with self.log.open("ab") as handle:
+            handle.write(b'{"event_type":"exposure","lemma":"x"')
+        self._assert_matches_scan()
+        self._append(3)
+        self._assert_matches_scan()
+
+    def test_appends_update_stats_without_lemma_sets_in_the_read_file(self) -> None:
+        for chunk in (7, 30, 1):
+            events = [_event(index) for index in range(len(self.history), len(self.history) + chunk)]
+            self.history.extend(events)
+            record_signal_events(self.log, events)
+        stats = SignalStats.load(self.log)
+        self.assertIsNotNone(stats)
+        for pair in ("en-ja", "en-de", None):
+            self.assertEqual(stats.summary(pair), summarize_signal_events(self.log, pair=pair))
+        self.assertNotIn("w1", signal_log_stats_path(self.log).read_text(encoding="utf-8"))
+        self.assertIsNone(stats._lemmas)
+
+        # A journal tail left by an interrupted save is dropped on the next one.
+        with signal_log_stats_lemmas_path(self.log).open("ab") as handle:
+            handle.write(b'["en-ja", "ghost"]\n')
+        self._append(12)
+        self._assert_matches_scan()
+        self.assertNotIn(b"ghost", signal_log_stats_lemmas_path(self.log).read_bytes())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core.srs import (  # noqa: E402
+    SrsHistoryEntry,
+    SrsItem,
+    SrsStore,
+    load_srs_store,
+    save_srs_store,
+    srs_store_to_dict,
+)
+from lexishift_core.srs.sqlite_store import (  # noqa: E402
+    SqliteSrsStore,
+    export_sqlite_srs_store_json,
+    migrate_json_srs_store,
+)
+
+
+def _store() -> SrsStore:
+    return SrsStore(
+        items=(
+            SrsItem(
+                item_id="en-ja:alpha",
+                lemma="alpha",
+                language_pair="en-ja",
+                source_type="initial_set",
+                confidence=0.8,
+                stability=2.5,
+                difficulty=0.4,
+                next_due="2026-02-20T00:00:00Z",
+                exposures=3,
+                history=(
+                    SrsHistoryEntry(ts="2026-01-30T00:00:00Z", rating="good"),
+                    SrsHistoryEntry(ts="2026-01-31T00:00:00Z", rating="hard"),
+                ),
+                word_package={"version": 1, "language_tag": "ja", "surface": "alpha"},
+            ),
+            SrsItem(item_id="en-de:beta", lemma="beta", language_pair="en-de", source_type="extension"),
+            SrsItem(item_id="en-ja:gamma", lemma="gamma", language_pair="en-ja", source_type="extension"),
+        ),
+        version=2,
+    )
+
+
+class SqliteSrsStoreTests(unittest.TestCase):
+    def test_save_and_load_round_trip_through_dispatch(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "srs_store.sqlite3"
+            save_srs_store(_store(), path)
+            self.assertEqual(load_srs_store(path), _store())
+            with SqliteSrsStore(path) as db:
+                journal_mode = db._conn.execute("PRAGMA journal_mode;").fetchone()[0]
+                self.assertEqual(journal_mode, "wal")
+                self.assertEqual(db.count_for_pair("en-ja"), 2)
+                self.assertEqual([item.lemma for item in db.items_for_pair("en-ja")], ["alpha", "gamma"])
+
+    def test_upsert_appends_history_and_keeps_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "srs_store.sqlite3"
+            with SqliteSrsStore(path) as db:
+                db.replace_all(_store())
+                alpha = db.get_item("en-ja:alpha")
+                history = tuple(alpha.history) + (SrsHistoryEntry(ts="2026-02-01T00:00:00Z", rating="easy"),)
+                db.upsert_item(SrsItem(**{**alpha.__dict__, "history": history, "exposures": 4}))
+                db.upsert_item(SrsItem(item_id="en-ja:delta", lemma="delta", language_pair="en-ja", source_type="x"))
+                rewritten = (SrsHistoryEntry(ts="2026-02-02T00:00:00Z", rating="again"),)
+                beta = db.get_item("en-de:beta")
+                db.upsert_item(SrsItem(**{**beta.__dict__, "history": rewritten}))
+                loaded = db.load()
+            self.assertEqual([item.lemma for item in loaded.items], ["alpha", "beta", "gamma", "delta"])
+            self.assertEqual(loaded.items[0].exposures, 4)
+            self.assertEqual([entry.rating for entry in loaded.items[0].history], ["good", "hard", "easy"])
+            self.assertEqual(loaded.items[1].history, rewritten)
+
+    def test_migrate_and_export_keep_json_shape(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            json_path = Path(tmpdir) / "srs_store.json"
+            db_path = Path(tmpdir) / "srs_store.sqlite3"
+            export_path = Path(tmpdir) / "export.json"
+            save_srs_store(_store(), json_path)
+            self.assertEqual(migrate_json_srs_store(json_path, db_path), 3)
+            with self.assertRaises(FileExistsError):
+                migrate_json_srs_store(json_path, db_path)
+            export_sqlite_srs_store_json(db_path, export_path)
+            exported = json.loads(export_path.read_text(encoding="utf-8"))
+            self.assertEqual(exported, srs_store_to_dict(load_srs_store(json_path)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import os
+import random
+import sys
+import unittest
+from datetime import datetime, timedelta, timezone
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from lexishift_core.helper.use_cases.set_planning import count_items_for_pair  # noqa: E402
+from lexishift_core.srs import SrsItem, SrsStore, srs_store_to_dict  # noqa: E402
+from lexishift_core.srs.sampling import sample_store_items  # noqa: E402
+from lexishift_core.srs.scheduler import select_active_items  # noqa: E402
+from lexishift_core.srs.store_index import IndexedSrsStore  # noqa: E402
+from lexishift_core.srs.store_ops import find_item, record_exposure, record_feedback  # noqa: E402
+from lexishift_core.srs.time import format_ts  # noqa: E402
+
+_PAIRS = ("en-ja", "en-de", "de-en")
+_NOW = datetime(2026, 2, 3, 12, 0, tzinfo=timezone.utc)
+
+
+def _random_store(rng: random.Random, count: int) -> SrsStore:
+    items = []
+    for idx in range(count):
+        pair = rng.choice(_PAIRS)
+        offset = rng.choice([None, -3, -1, 0, 1, 5])
+        next_due = None if offset is None else format_ts(_NOW + timedelta(days=offset))
+        items.append(
+            SrsItem(
+                item_id=f"{pair}:w{idx}",
+                lemma=f"w{idx}",
+                language_pair=pair,
+                source_type="frequency_list",
+                next_due=next_due,
+            )
+        )
+    return SrsStore(items=tuple(items))
+
+
+class IndexedSrsStoreTests(unittest.TestCase):
+    def test_signal_sequence_matches_plain_store(self) -> None:
+        rng = random.Random(5)
+        plain = _random_store(rng, 60)
+        indexed = IndexedSrsStore.from_store(plain)
+        for step in range(200):
+            pair = rng.choice(_PAIRS)
+            lemma = f"w{rng.randint(0, 80)}"
+            now = _NOW + timedelta(hours=step)
+            if rng.random() < 0.5:
+                kwargs = dict(language_pair=pair, lemma=lemma, now=now, create_if_missing=True)
+                plain = record_exposure(plain, **kwargs)
+                indexed = record_exposure(indexed, **kwargs)
+            else:
+                kwargs = dict(
+                    language_pair=pair,
+                    lemma=lemma,
+                    rating=rng.choice(["again", "hard", "good", "easy"]),
+                    now=now,
+                    create_if_missing=True,
+                )
+                plain = record_feedback(plain, **kwargs)
+                indexed = record_feedback(indexed, **kwargs)
+        self.assertIsInstance(indexed, IndexedSrsStore)
+        self.assertEqual(srs_store_to_dict(indexed), srs_store_to_dict(plain))
+        later = _NOW + timedelta(days=3)
+        for allowed in (None, ["en-ja"], ["en-de", "de-en"]):
+            self.assertEqual(
+                indexed.select_due(now=later, max_active=25, allowed_pairs=allowed),
+                select_active_items(plain.items, now=later, max_active=25, allowed_pairs=allowed),
+            )
+        for pair in _PAIRS:
+            self.assertEqual(count_items_for_pair(indexed, pair), count_items_for_pair(plain, pair))
+            self.assertEqual(
+                sample_store_items(indexed, pair=pair, sample_count=10, seed=3, now=later),
+                sample_store_items(plain, pair=pair, sample_count=10, seed=3, now=later),
+            )
+
+    def test_lookup_and_remove(self) -> None:
+        indexed = IndexedSrsStore.from_store(_random_store(random.Random(1), 10))
+        first = indexed.items[0]
+        self.assertIs(find_item(indexed, language_pair=first.language_pair, lemma=first.lemma), first)
+        removed = indexed.remove(first.item_id)
+        self.assertIsNone(removed.get(first.item_id))
+        self.assertEqual(len(removed), 9)
+        self.assertEqual(removed.to_store().items, removed.items)
+
+    def test_updates_leave_the_original_store_unchanged(self) -> None:
+        plain = _random_store(random.Random(2), 30)
+        indexed = IndexedSrsStore.from_store(plain)
+        self.assertIsInstance(indexed, SrsStore)
+        first = indexed.items[0]
+        later = _NOW + timedelta(days=3)
+        due_before = indexed.select_due(now=later, max_active=50)
+
+        def update(store: SrsStore) -> SrsStore:
+            store = record_feedback(store, language_pair=first.language_pair, lemma=first.lemma, rating="easy", now=_NOW)
+            store = record_exposure(store, language_pair="en-ja", lemma="new", now=_NOW, create_if_missing=True)
+            return store.remove(plain.items[1].item_id)
+
+        updated = update(indexed)
+        self.assertEqual(srs_store_to_dict(updated), srs_store_to_dict(update(plain)))
+        self.assertEqual(indexed.items, plain.items)
+        self.assertIs(indexed.get(first.item_id), first)
+        for pair in _PAIRS:
+            self.assertEqual(indexed.count_for_pair(pair), plain.count_for_pair(pair))
+        self.assertEqual(indexed.select_due(now=later, max_active=50), due_before)
+
+
+    def test_in_place_updates_match_copies_without_copying(self) -> None:
+        plain = _random_store(random.Random(3), 40)
+        owned = IndexedSrsStore.from_store(plain)
+        copied = IndexedSrsStore.from_store(plain)
+        rng = random.Random(4)
+        for step in range(120):
+            kwargs = dict(
+                language_pair=rng.choice(_PAIRS),
+                lemma=f"w{rng.randint(0, 60)}",
+                rating=rng.choice(["again", "hard", "good", "easy"]),
+                now=_NOW + timedelta(hours=step),
+                create_if_missing=True,
+            )
+            self.assertIs(record_feedback(owned, in_place=True, **kwargs), owned)
+            copied = record_feedback(copied, **kwargs)
+            plain = record_feedback(plain, in_place=True, **kwargs)
+        removed_id = plain.items[0].item_id
+        self.assertIs(owned.remove(removed_id, in_place=True), owned)
+        copied = copied.remove(removed_id)
+        plain = plain.remove(removed_id, in_place=True)
+
+        self.assertEqual(srs_store_to_dict(owned), srs_store_to_dict(copied))
+        self.assertEqual(srs_store_to_dict(owned), srs_store_to_dict(plain))
+        later = _NOW + timedelta(days=3)
+        self.assertEqual(owned.select_due(now=later, max_active=30), copied.select_due(now=later, max_active=30))
+        for pair in _PAIRS:
+            self.assertEqual(owned.items_for_pair(pair), plain.items_for_pair(pair))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,18 +8,47 @@ import sys
 import time
 from array import array
 from pathlib import Path
+from typing import Optional
 
 CORE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "core"))
 if CORE_ROOT not in sys.path:
     sys.path.insert(0, CORE_ROOT)
 
+from lexishift_core.resources.embedding_ann import build_ivf_index, embedding_ann_path
+from lexishift_core.resources.embedding_matrix import (
+    MATRIX_SUFFIX,
+    embedding_vocab_path,
+    load_sqlite_embedding_matrix,
+    load_text_embedding_matrix,
+    load_word2vec_embedding_matrix,
+    numpy_available,
+)
 from lexishift_core.resources.synonyms import _read_binary_vector, _read_binary_word
 
+_SQLITE_SUFFIXES = {".db", ".sqlite", ".sqlite3"}
+
 
 def _parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Convert embeddings to SQLite for fast lookup.")
-    parser.add_argument("--input", required=True, help="Path to .vec/.txt/.bin embeddings file.")
-    parser.add_argument("--output", required=True, help="Path to output .db/.sqlite file.")
+    parser = argparse.ArgumentParser(
+        description=(
+            "Convert embeddings to SQLite for fast lookup, or to a float32 .npy matrix "
+            "(plus .vocab) that is memory-mapped when NumPy is installed."
+        )
+    )
+    parser.add_argument("--input", required=True, help="Path to .vec/.txt/.bin/.db/.sqlite embeddings file.")
+    parser.add_argument("--output", required=True, help="Path to output .db/.sqlite or .npy file.")
+    parser.add_argument(
+        "--matrix",
+        action="store_true",
+        help="Also write a .npy matrix next to the SQLite output; EmbeddingIndex prefers it.",
+    )
+    parser.add_argument(
+        "--ivf-lists",
+        type=int,
+        default=0,
+        help="Inverted lists in the matrix's IVF neighbor index (0: about 4*sqrt(rows)).",
+    )
+    parser.add_argument("--no-ivf", action="store_true", help="Do not build an IVF index for the matrix.")
     parser.add_argument("--lowercase-words", action="store_true", help="Store words lowercased.")
     parser.add_argument("--lsh-bits", type=int, default=16, help="Number of LSH bits to store (0 to disable).")
     parser.add_argument("--lsh-seed", type=int, default=1337, help="Random seed for LSH bit selection.")
@@ -255,6 +284,38 @@ def _lsh_signature(values: list[float], indices: list[int]) -> int:
     return sig
 
 
+def _write_matrix(
+    input_path: Path,
+    output_path: Path,
+    *,
+    lowercase_words: bool,
+    ivf_lists: Optional[int],
+) -> bool:
+    suffix = input_path.suffix.lower()
+    start = time.time()
+    if suffix in _SQLITE_SUFFIXES:
+        matrix = load_sqlite_embedding_matrix(input_path, lower_case=False)
+    elif suffix == ".bin":
+        matrix = load_word2vec_embedding_matrix(input_path, lower_case=lowercase_words)
+    else:
+        matrix = load_text_embedding_matrix([input_path], lower_case=lowercase_words)
+    if matrix is None:
+        print(f"No vectors read from {input_path}")
+        return False
+    matrix.save(output_path)
+    elapsed = time.time() - start
+    print(f"Saved {len(matrix)} x {matrix.dim} float32 matrix: {output_path} ({elapsed:.1f}s)")
+    if ivf_lists is None or not len(matrix):
+        return True
+    start = time.time()
+    index = build_ivf_index(matrix.rows, list_count=ivf_lists or None)
+    ann_path = embedding_ann_path(output_path)
+    index.save(ann_path)
+    elapsed = time.time() - start
+    print(f"Saved IVF index with {index.list_count} lists: {ann_path} ({elapsed:.1f}s)")
+    return True
+
+
 def main() -> int:
     args = _parse_args()
     input_path = Path(args.input)
@@ -262,14 +323,38 @@ def main() -> int:
     if not input_path.exists():
         print(f"Input file not found: {input_path}")
         return 1
-    if output_path.exists() and not args.overwrite:
-        print(f"Output already exists: {output_path}")
+    matrix_output = output_path.suffix.lower() == MATRIX_SUFFIX
+    if (matrix_output or args.matrix) and not numpy_available():
+        print("Writing a .npy matrix requires NumPy (pip install numpy).")
+        return 1
+    if not matrix_output and input_path.suffix.lower() in _SQLITE_SUFFIXES:
+        print("SQLite input can only be converted to a .npy matrix.")
+        return 1
+    outputs = [output_path]
+    if matrix_output:
+        outputs += [embedding_vocab_path(output_path), embedding_ann_path(output_path)]
+    elif args.matrix:
+        sibling = output_path.with_suffix(MATRIX_SUFFIX)
+        outputs += [sibling, embedding_vocab_path(sibling), embedding_ann_path(sibling)]
+    existing = [path for path in outputs if path.exists()]
+    if existing and not args.overwrite:
+        print(f"Output already exists: {existing[0]}")
         print("Re-run with --overwrite to replace it.")
         return 1
-    if output_path.exists() and args.overwrite:
-        output_path.unlink()
+    for path in existing:
+        path.unlink()
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    ivf_lists = None if args.no_ivf else max(0, args.ivf_lists)
+    if matrix_output:
+        # Non-lowercased SQLite words keep their case; the index folds them at load time.
+        written = _write_matrix(
+            input_path,
+            output_path,
+            lowercase_words=args.lowercase_words,
+            ivf_lists=ivf_lists,
+        )
+        return 0 if written else 1
     conn = _init_db(output_path)
     if input_path.suffix.lower() == ".bin":
         _convert_binary(
@@ -295,6 +380,10 @@ def main() -> int:
         )
     conn.close()
     print(f"Saved SQLite embeddings: {output_path}")
+    if args.matrix:
+        sibling = output_path.with_suffix(MATRIX_SUFFIX)
+        if not _write_matrix(output_path, sibling, lowercase_words=False, ivf_lists=ivf_lists):
+            return 1
     return 0
 
 
@@ -0,0 +1,87 @@
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+CORE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "core"))
+if CORE_ROOT not in sys.path:
+    sys.path.insert(0, CORE_ROOT)
+
+from lexishift_core.resources.embedding_ann import build_ivf_index
+from lexishift_core.resources.embedding_matrix import (
+    EmbeddingMatrix,
+    numpy_available,
+    open_embedding_matrix,
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark IVF neighbor search against exact search.")
+    parser.add_argument("--matrix", help="Converted .npy matrix (default: synthetic clustered vectors).")
+    parser.add_argument("--rows", type=int, default=200_000, help="Synthetic vocabulary size.")
+    parser.add_argument("--dim", type=int, default=300, help="Synthetic vector size.")
+    parser.add_argument("--queries", type=int, default=200, help="Query words sampled from the vocabulary.")
+    parser.add_argument("--k", type=int, default=30, help="Neighbors per query (recall@k).")
+    parser.add_argument("--lists", type=int, default=0, help="IVF lists when building here (0: auto).")
+    parser.add_argument("--nprobe", default="1,4,8,16,32,64", help="Comma-separated nprobe values.")
+    parser.add_argument("--seed", type=int, default=17)
+    return parser.parse_args()
+
+
+def _synthetic(args: argparse.Namespace, np) -> EmbeddingMatrix:
+    # Vectors around a few thousand topic centres, like real embedding spaces.
+    rng = np.random.default_rng(args.seed)
+    centres = rng.standard_normal((max(1, args.rows // 100), args.dim)).astype(np.float32)
+    rows = centres[rng.integers(0, centres.shape[0], size=args.rows)]
+    rows += 1.5 * rng.standard_normal((args.rows, args.dim)).astype(np.float32)
+    norms = np.linalg.norm(rows, axis=1)
+    rows /= norms[:, None]
+    return EmbeddingMatrix([f"w{idx}" for idx in range(args.rows)], rows, norms, lower_case=False)
+
+
+def _timed(matrix: EmbeddingMatrix, terms: list[str], *, k: int, exact: bool) -> tuple[list, float]:
+    start = time.perf_counter()
+    results = matrix.nearest_neighbors_many(terms, limit=k, min_score=-1.0, exact=exact)
+    return results, time.perf_counter() - start
+
+
+def main() -> int:
+    if not numpy_available():
+        print("This benchmark requires NumPy.")
+        return 1
+    import numpy as np
+
+    args = _parse_args()
+    if args.matrix:
+        matrix = open_embedding_matrix(Path(args.matrix), lower_case=False)
+        if matrix is None:
+            print(f"Could not open matrix: {args.matrix}")
+            return 1
+    else:
+        matrix = _synthetic(args, np)
+    if matrix.ann is None or args.lists:
+        start = time.perf_counter()
+        matrix.ann = build_ivf_index(matrix.rows, list_count=args.lists or None)
+        print(f"Built IVF index ({matrix.ann.list_count} lists) in {time.perf_counter() - start:.2f}s")
+    rng = np.random.default_rng(args.seed + 1)
+    sample = rng.choice(len(matrix), size=min(args.queries, len(matrix)), replace=False)
+    terms = [matrix.words[idx] for idx in sample.tolist()]
+    print(f"Rows: {len(matrix)}  dim: {matrix.dim}  queries: {len(terms)}  k: {args.k}")
+
+    truth, elapsed = _timed(matrix, terms, k=args.k, exact=True)
+    print(f"[exact] {len(terms) / elapsed:.1f} QPS")
+    for nprobe in [int(part) for part in args.nprobe.split(",") if part.strip()]:
+        matrix.nprobe = nprobe
+        found, elapsed = _timed(matrix, terms, k=args.k, exact=False)
+        hits = sum(
+            len({word for word, _score in approx} & {word for word, _score in exact})
+            for approx, exact in zip(found, truth)
+        )
+        total = sum(len(exact) for exact in truth) or 1
+        print(f"[nprobe={nprobe}] recall@{args.k}={hits / total:.3f}  {len(terms) / elapsed:.1f} QPS")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+import argparse
+import json
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+CORE_ROOT = REPO_ROOT / "core"
+HOST_SCRIPT = REPO_ROOT / "scripts" / "helper" / "lexishift_native_host.py"
+if str(CORE_ROOT) not in sys.path:
+    sys.path.insert(0, str(CORE_ROOT))
+
+from lexishift_core.helper.paths import build_helper_paths
+from lexishift_core.srs import SrsItem, SrsStore, save_srs_store
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark one-shot native hosts (a process per request) against one persistent host."
+    )
+    parser.add_argument("--items", type=int, default=20_000, help="Items in the seeded SRS store.")
+    parser.add_argument("--requests", type=int, default=50, help="record_exposure requests to send.")
+    return parser.parse_args()
+
+
+def _frame(message: dict) -> bytes:
+    data = json.dumps(message).encode("utf-8")
+    return struct.pack("<I", len(data)) + data
+
+
+def _read_frame(stream) -> dict:
+    (length,) = struct.unpack("<I", stream.read(4))
+    return json.loads(stream.read(length).decode("utf-8"))
+
+
+def _request(index: int) -> dict:
+    return {
+        "id": f"req-{index}",
+        "type": "record_exposure",
+        "version": 1,
+        "payload": {"pair": "en-ja", "lemma": f"w{index}"},
+    }
+
+
+def _one_shot(env: dict, count: int) -> float:
+    start = time.perf_counter()
+    for index in range(count):
+        subprocess.run(
+            [sys.executable, str(HOST_SCRIPT)],
+            input=_frame(_request(index)),
+            capture_output=True,
+            env=env,
+            check=True,
+        )
+    return time.perf_counter() - start
+
+
+def _persistent(env: dict, count: int) -> tuple[float, dict]:
+    host = subprocess.Popen(
+        [sys.executable, str(HOST_SCRIPT)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        env=env,
+    )
+    start = time.perf_counter()
+    for index in range(count):
+        host.stdin.write(_frame(_request(index)))
+        host.stdin.flush()
+        _read_frame(host.stdout)
+    elapsed = time.perf_counter() - start
+    host.stdin.write(_frame({"id": "status", "type": "status", "version": 1, "payload": {}}))
+    host.stdin.flush()
+    latency = _read_frame(host.stdout)["data"]["latency"]
+    host.stdin.close()
+    host.wait()
+    return elapsed, latency
+
+
+def main() -> int:
+    args = _parse_args()
+    items = tuple(
+        SrsItem(item_id=f"en-ja:s{idx}", lemma=f"s{idx}", language_pair="en-ja", source_type="initial_set")
+        for idx in range(args.items)
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = build_helper_paths(Path(tmp))
+        env = dict(os.environ, LEXISHIFT_DATA_DIR=tmp)
+        print(f"Items: {args.items}  requests: {args.requests}")
+
+        save_srs_store(SrsStore(items=items), paths.srs_store_path)
+        elapsed = _one_shot(env, args.requests)
+        print(f"[one-shot] {elapsed:.3f}s ({elapsed / args.requests * 1000:.1f} ms/request)")
+
+        save_srs_store(SrsStore(items=items), paths.srs_store_path)
+        elapsed, latency = _persistent(env, args.requests)
+        print(f"[persistent] {elapsed:.3f}s ({elapsed / args.requests * 1000:.1f} ms/request)")
+        phases = latency["requests"]["record_exposure"]
+        print(f"  cold: {phases['cold']}  warm: {phases['warm']}")
+        print(f"  cache: {latency['cache']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
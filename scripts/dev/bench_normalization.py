@@ -0,0 +1,82 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+CORE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "core"))
+if CORE_ROOT not in sys.path:
+    sys.path.insert(0, CORE_ROOT)
+
+from lexishift_core.replacement.core import CachedNormalizer, Normalizer, Replacer, VocabPool, VocabRule
+from lexishift_core.replacement.pipeline import build_meaning_pool
+
+
+class _CountingNormalizer(Normalizer):
+    def __init__(self, inner: Normalizer) -> None:
+        self.inner = inner
+        self.calls = 0
+
+    def normalize_word(self, word: str) -> str:
+        self.calls += 1
+        return self.inner.normalize_word(word)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark meaning-mode normalization caching.")
+    parser.add_argument("--rules", type=int, default=20_000, help="Number of synthetic rules.")
+    parser.add_argument("--synonyms", type=int, default=200_000, help="Entries in the synonym map.")
+    parser.add_argument("--vocab", type=int, default=50_000, help="Distinct surface forms in the text.")
+    parser.add_argument("--messages", type=int, default=5_000, help="Short texts per run.")
+    parser.add_argument("--cache-size", type=int, default=65_536, help="CachedNormalizer max entries.")
+    parser.add_argument("--seed", type=int, default=17)
+    return parser.parse_args()
+
+
+def _build(args: argparse.Namespace) -> tuple[VocabPool, dict[str, str], list[str]]:
+    rng = random.Random(args.seed)
+    vocab = [f"Word{idx}" for idx in range(args.vocab)]
+    rules = [VocabRule(rng.choice(vocab).lower(), f"r{idx}") for idx in range(args.rules)]
+    synonyms = {f"syn{idx}": rng.choice(vocab).lower() for idx in range(args.synonyms)}
+    surface = vocab + list(synonyms)[: args.vocab]
+    # Zipf-ish reuse so repeated forms dominate, as in real pages and chats.
+    weights = [1.0 / (rank + 1) for rank in range(len(surface))]
+    words = rng.choices(surface, weights=weights, k=12 * args.messages)
+    messages = [" ".join(words[idx : idx + 12]) for idx in range(0, len(words), 12)]
+    return VocabPool(rules), synonyms, messages
+
+
+def _run(label: str, pool: VocabPool, messages: list[str]) -> None:
+    _ = pool.trie
+    normalizer = pool.normalizer
+    counting = _CountingNormalizer(normalizer)
+    replacer = Replacer(pool.clone(normalizer=counting))
+    replacer.pool.compile()
+    counting.calls = 0
+    start = time.perf_counter()
+    replacer.replace_many(messages)
+    elapsed = time.perf_counter() - start
+    words = sum(len(message.split()) for message in messages)
+    print(f"[{label}] {len(messages)} messages in {elapsed:.3f}s")
+    print(f"  normalize calls: {counting.calls} for {words} words")
+    if isinstance(normalizer, CachedNormalizer):
+        stats = normalizer.cache_stats()
+        print(
+            f"  cache: hits={stats.hits} misses={stats.misses} "
+            f"size={stats.size}/{stats.max_entries} hit_rate={stats.hit_rate:.1%}"
+        )
+
+
+def main() -> int:
+    args = _parse_args()
+    base_pool, synonyms, messages = _build(args)
+    plain = build_meaning_pool(base_pool, synonyms=synonyms)
+    cached = build_meaning_pool(base_pool, synonyms=synonyms, normalization_cache_size=args.cache_size)
+    print(f"Rules: {args.rules}  synonyms: {args.synonyms}  messages: {args.messages}")
+    _run("uncached", plain, messages)
+    _run("cached", cached, messages)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,89 @@
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+CORE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "core"))
+if CORE_ROOT not in sys.path:
+    sys.path.insert(0, CORE_ROOT)
+
+from lexishift_core.replacement.core import (
+    TRIE_BACKEND_COMPACT,
+    TRIE_BACKEND_DICT,
+    Replacer,
+    VocabPool,
+    VocabRule,
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare dict and compact phrase trie backends.")
+    parser.add_argument("--rules", type=int, default=100_000, help="Number of synthetic rules.")
+    parser.add_argument("--vocab", type=int, default=20_000, help="Distinct words in the synthetic vocabulary.")
+    parser.add_argument("--max-phrase", type=int, default=3, help="Longest synthetic phrase in words.")
+    parser.add_argument("--text-words", type=int, default=200_000, help="Words in the benchmark text.")
+    parser.add_argument("--seed", type=int, default=13)
+    return parser.parse_args()
+
+
+def _build_corpus(args: argparse.Namespace) -> tuple[list[VocabRule], str]:
+    rng = random.Random(args.seed)
+    vocab = [f"w{idx}" for idx in range(args.vocab)]
+    rules = []
+    for idx in range(args.rules):
+        length = rng.randint(1, args.max_phrase)
+        phrase = " ".join(rng.choice(vocab) for _ in range(length))
+        rules.append(VocabRule(phrase, f"r{idx}", priority=rng.randint(0, 2)))
+    text = " ".join(rng.choice(vocab) for _ in range(args.text_words))
+    return rules, text
+
+
+def _rss_kb() -> int | None:
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as handle:
+            resident_pages = int(handle.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def _run_backend(backend: str, rules: list[VocabRule], text: str) -> None:
+    gc.collect()
+    rss_before = _rss_kb()
+    tracemalloc.start()
+    pool = VocabPool(rules, trie_backend=backend)
+    start = time.perf_counter()
+    pool.compile()
+    build_elapsed = time.perf_counter() - start
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = _rss_kb()
+
+    replacer = Replacer(pool)
+    start = time.perf_counter()
+    result = replacer.replace_text(text, with_stats=True)
+    match_elapsed = time.perf_counter() - start
+
+    matches = len(result.matches)
+    rss = "n/a" if rss_before is None or rss_after is None else f"{(rss_after - rss_before) / 1024:.1f} MB"
+    print(f"[{backend}]")
+    print(f"  build: {build_elapsed:.3f}s")
+    print(f"  retained (tracemalloc): {retained / (1024 * 1024):.1f} MB")
+    print(f"  rss delta: {rss}")
+    print(f"  matches: {matches} in {match_elapsed:.3f}s ({matches / max(match_elapsed, 1e-9):,.0f} matches/s)")
+
+
+def main() -> int:
+    args = _parse_args()
+    rules, text = _build_corpus(args)
+    print(f"Rules: {len(rules)}  text words: {args.text_words}")
+    for backend in (TRIE_BACKEND_DICT, TRIE_BACKEND_COMPACT):
+        _run_backend(backend, rules, text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
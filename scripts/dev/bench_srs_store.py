@@ -0,0 +1,88 @@
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+CORE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "core"))
+if CORE_ROOT not in sys.path:
+    sys.path.insert(0, CORE_ROOT)
+
+from lexishift_core.helper.use_cases.set_planning import count_items_for_pair
+from lexishift_core.srs import SrsItem, SrsStore
+from lexishift_core.srs.sampling import sample_store_items
+from lexishift_core.srs.store_index import IndexedSrsStore
+from lexishift_core.srs.store_ops import record_feedback
+from lexishift_core.srs.time import format_ts
+
+PAIRS = ("en-ja", "en-de", "de-en", "en-es", "en-fr")
+RATINGS = ("again", "hard", "good", "easy")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark plain vs indexed SRS store operations.")
+    parser.add_argument("--items", type=int, default=100_000, help="Items spread across pairs.")
+    parser.add_argument("--signals", type=int, default=500, help="Feedback signals to record.")
+    parser.add_argument("--seed", type=int, default=11)
+    return parser.parse_args()
+
+
+def _build_store(count: int, rng: random.Random, now: datetime) -> SrsStore:
+    items = []
+    for idx in range(count):
+        pair = PAIRS[idx % len(PAIRS)]
+        next_due = format_ts(now + timedelta(days=rng.randint(-10, 30)))
+        items.append(
+            SrsItem(
+                item_id=f"{pair}:w{idx}",
+                lemma=f"w{idx}",
+                language_pair=pair,
+                source_type="frequency_list",
+                next_due=next_due,
+            )
+        )
+    return SrsStore(items=tuple(items))
+
+
+def _time(label: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    print(f"  {label}: {time.perf_counter() - start:.3f}s")
+
+
+def _run(label: str, store, signals: list[tuple[str, str, str]], now: datetime, *, in_place: bool = False) -> None:
+    print(f"[{label}]")
+
+    def record() -> None:
+        nonlocal store
+        for pair, lemma, rating in signals:
+            store = record_feedback(store, language_pair=pair, lemma=lemma, rating=rating, now=now, in_place=in_place)
+
+    _time(f"{len(signals)} record_feedback", record)
+    _time("select_due(en-ja)", lambda: store.select_due(now=now, allowed_pairs=["en-ja"]))
+    _time("sample_store_items(en-ja)", lambda: sample_store_items(store, pair="en-ja", sample_count=50, seed=1))
+    _time("count_items_for_pair x100", lambda: [count_items_for_pair(store, "en-ja") for _ in range(100)])
+
+
+def main() -> int:
+    args = _parse_args()
+    rng = random.Random(args.seed)
+    now = datetime(2026, 2, 3, 12, 0, tzinfo=timezone.utc)
+    store = _build_store(args.items, rng, now)
+    signals = []
+    for _ in range(args.signals):
+        idx = rng.randrange(args.items)
+        signals.append((PAIRS[idx % len(PAIRS)], f"w{idx}", rng.choice(RATINGS)))
+    print(f"Items: {args.items}  pairs: {len(PAIRS)}  signals: {args.signals}")
+    start = time.perf_counter()
+    indexed = IndexedSrsStore.from_store(store)
+    print(f"Index build: {time.perf_counter() - start:.3f}s")
+    _run("plain", store, signals, now)
+    _run("indexed", indexed, signals, now)
+    _run("indexed, in place", IndexedSrsStore.from_store(store), signals, now, in_place=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -18,11 +18,16 @@ from lexishift_core.helper.engine import (
     SetPlanningJobConfig,
     apply_exposure,
     apply_feedback,
+    apply_signals_batch,
+    compact_signal_queue,
+    export_srs_store_json,
     initialize_srs_set,
     load_snapshot,
+    migrate_srs_store_to_sqlite,
     plan_srs_set,
     refresh_srs_set,
     reset_srs_data,
+    run_rulegen_batch,
     run_rulegen_job,
 )
 from lexishift_core.helper.profiles import get_profile_rulesets_snapshot, get_profiles_snapshot
@@ -137,6 +142,7 @@ def cmd_run_rulegen(args: argparse.Namespace) -> int:
                 sample_count=args.sample_count,
                 sample_strategy=args.sample_strategy,
                 sample_seed=args.sample_seed,
+                full_rebuild=args.full_rebuild,
             ),
         )
         _print_json(payload)
@@ -146,6 +152,54 @@ def cmd_run_rulegen(args: argparse.Namespace) -> int:
         return 1
 
 
+def _parse_rulegen_batch_jobs(args: argparse.Namespace) -> list[tuple[str, str]]:
+    jobs: list[tuple[str, str]] = []
+    for spec in args.job or []:
+        profile_id, sep, pair = spec.rpartition(":")
+        if not sep or not pair:
+            raise ValueError(f"Invalid job '{spec}'; expected PROFILE:PAIR.")
+        jobs.append((profile_id or "default", pair))
+    profiles = [value.strip() for value in (args.profiles or "").split(",") if value.strip()]
+    pairs = [value.strip() for value in (args.pairs or "").split(",") if value.strip()]
+    jobs.extend((profile_id, pair) for profile_id in profiles or (["default"] if pairs else []) for pair in pairs)
+    if not jobs:
+        raise ValueError("No rulegen jobs given; use --job PROFILE:PAIR or --profiles/--pairs.")
+    return jobs
+
+
+def cmd_run_rulegen_batch(args: argparse.Namespace) -> int:
+    paths = build_helper_paths()
+    try:
+        configs = []
+        for profile_id, pair in _parse_rulegen_batch_jobs(args):
+            jmdict_path, freedict_de_en_path, set_source_db = _resolve_pair_resource_paths(
+                paths,
+                pair=pair,
+                jmdict_arg=args.jmdict,
+                freedict_de_en_arg=None,
+                set_source_db_arg=None,
+            )
+            configs.append(
+                RulegenJobConfig(
+                    pair=pair,
+                    jmdict_path=jmdict_path,
+                    freedict_de_en_path=freedict_de_en_path,
+                    profile_id=profile_id,
+                    set_source_db=set_source_db,
+                    confidence_threshold=args.confidence_threshold,
+                    initialize_if_empty=not args.no_initialize_if_empty,
+                    persist_store=not args.no_persist_store,
+                    full_rebuild=args.full_rebuild,
+                )
+            )
+        payload = run_rulegen_batch(paths, configs=configs, workers=args.workers)
+    except Exception as exc:  # noqa: BLE001
+        print(str(exc), file=sys.stderr)
+        return 1
+    _print_json(payload)
+    return 0 if not payload["failed"] else 1
+
+
 def cmd_init_srs_set(args: argparse.Namespace) -> int:
     paths = build_helper_paths()
     jmdict_path, freedict_de_en_path, set_source_db = _resolve_pair_resource_paths(
@@ -235,6 +289,7 @@ def cmd_refresh_srs_set(args: argparse.Namespace) -> int:
                 max_new_items=args.max_new_items,
                 persist_store=not args.no_persist_store,
                 trigger=args.trigger,
+                full_rebuild=args.full_rebuild,
             ),
         )
         _print_json(payload)
@@ -271,6 +326,28 @@ def cmd_record_exposure(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_record_signals_batch(args: argparse.Namespace) -> int:
+    paths = build_helper_paths()
+    raw = sys.stdin.read() if args.events == "-" else Path(args.events).read_text(encoding="utf-8")
+    parsed = json.loads(raw)
+    events = parsed.get("events") if isinstance(parsed, dict) else parsed
+    if not isinstance(events, list):
+        raise ValueError("Events file must hold a list or an object with an events list.")
+    payload = apply_signals_batch(
+        paths,
+        events=events,
+        profile_id=args.profile_id or "default",
+    )
+    _print_json(payload)
+    return 0
+
+
+def cmd_compact_signals(args: argparse.Namespace) -> int:
+    paths = build_helper_paths()
+    _print_json(compact_signal_queue(paths, profile_id=args.profile_id or "default"))
+    return 0
+
+
 def cmd_reset_srs(args: argparse.Namespace) -> int:
     paths = build_helper_paths()
     payload = reset_srs_data(paths, pair=args.pair, profile_id=args.profile_id or "default")
@@ -278,6 +355,28 @@ def cmd_reset_srs(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_migrate_srs_store(args: argparse.Namespace) -> int:
+    paths = build_helper_paths()
+    payload = migrate_srs_store_to_sqlite(
+        paths,
+        profile_id=args.profile_id or "default",
+        overwrite=args.overwrite,
+    )
+    _print_json(payload)
+    return 0
+
+
+def cmd_export_srs_store(args: argparse.Namespace) -> int:
+    paths = build_helper_paths()
+    payload = export_srs_store_json(
+        paths,
+        profile_id=args.profile_id or "default",
+        output_path=Path(args.output) if args.output else None,
+    )
+    _print_json(payload)
+    return 0
+
+
 def cmd_profiles_get(args: argparse.Namespace) -> int:
     paths = build_helper_paths()
     payload = get_profiles_snapshot(paths)
@@ -321,6 +420,7 @@ def build_parser() -> argparse.ArgumentParser:
     run.add_argument("--no-persist-store", action="store_true", help="Do not write changes to srs_store.json")
     run.add_argument("--no-persist-outputs", action="store_true", help="Do not write ruleset/snapshot JSON files")
     run.add_argument("--no-status-update", action="store_true", help="Do not update helper status file")
+    run.add_argument("--full-rebuild", action="store_true", help="Regenerate every target, ignoring the rule cache")
     run.add_argument("--confidence-threshold", type=float, default=0.0)
     run.add_argument("--snapshot-targets", type=int, default=50)
     run.add_argument("--snapshot-sources", type=int, default=6)
@@ -333,6 +433,18 @@ def build_parser() -> argparse.ArgumentParser:
     run.add_argument("--sample-seed", type=int, help="Optional RNG seed for deterministic sampling.")
     run.set_defaults(func=cmd_run_rulegen)
 
+    run_batch = sub.add_parser("run_rulegen_batch", help="Run rulegen for many (profile, pair) jobs in parallel")
+    run_batch.add_argument("--job", action="append", help="PROFILE:PAIR job (repeatable), e.g. default:en-ja")
+    run_batch.add_argument("--profiles", help="Comma-separated profile ids, combined with every --pairs entry")
+    run_batch.add_argument("--pairs", help="Comma-separated language pairs, e.g. en-ja,en-de,en-es")
+    run_batch.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    run_batch.add_argument("--jmdict", help="Path to JMdict_e folder for en-ja jobs")
+    run_batch.add_argument("--no-initialize-if-empty", action="store_true", help="Skip S initialization when store is empty")
+    run_batch.add_argument("--no-persist-store", action="store_true", help="Do not write changes to the SRS stores")
+    run_batch.add_argument("--confidence-threshold", type=float, default=0.0)
+    run_batch.add_argument("--full-rebuild", action="store_true", help="Regenerate every target, ignoring the rule cache")
+    run_batch.set_defaults(func=cmd_run_rulegen_batch)
+
     init_s = sub.add_parser("init_srs_set", help="Initialize S for a language pair")
     init_s.add_argument("--pair", default="en-ja")
     init_s.add_argument("--profile-id", help="Profile id (default: default)")
@@ -376,6 +488,7 @@ def build_parser() -> argparse.ArgumentParser:
     refresh_s.add_argument("--max-new-items", type=int, help="Override max new items/day for refresh planning.")
     refresh_s.add_argument("--no-persist-store", action="store_true", help="Do not write changes to srs_store.json")
     refresh_s.add_argument("--trigger", default="cli")
+    refresh_s.add_argument("--full-rebuild", action="store_true", help="Regenerate rules for every target, ignoring the rule cache")
     refresh_s.set_defaults(func=cmd_refresh_srs_set)
 
     feedback = sub.add_parser("record_feedback", help="Record SRS feedback")
@@ -393,11 +506,30 @@ def build_parser() -> argparse.ArgumentParser:
     exposure.add_argument("--source-type", default="extension")
     exposure.set_defaults(func=cmd_record_exposure)
 
+    batch = sub.add_parser("record_signals_batch", help="Record many feedback/exposure events at once")
+    batch.add_argument("events", help="JSON file with a list of events (or {\"events\": [...]}); '-' reads stdin.")
+    batch.add_argument("--profile-id", help="Profile id (default: default)")
+    batch.set_defaults(func=cmd_record_signals_batch)
+
+    compact = sub.add_parser("compact_signals", help="Fold old signal log segments into per-pair aggregates")
+    compact.add_argument("--profile-id", help="Profile id (default: default)")
+    compact.set_defaults(func=cmd_compact_signals)
+
     reset = sub.add_parser("reset_srs", help="Reset SRS progress")
     reset.add_argument("--pair", help="Language pair to reset (omit to reset all).")
     reset.add_argument("--profile-id", help="Profile id (default: default)")
     reset.set_defaults(func=cmd_reset_srs)
 
+    migrate = sub.add_parser("migrate_srs_store", help="Copy srs_store.json into a SQLite store")
+    migrate.add_argument("--profile-id", help="Profile id (default: default)")
+    migrate.add_argument("--overwrite", action="store_true", help="Replace an existing SQLite store")
+    migrate.set_defaults(func=cmd_migrate_srs_store)
+
+    export_store = sub.add_parser("export_srs_store", help="Write a SQLite SRS store out as srs_store.json")
+    export_store.add_argument("--profile-id", help="Profile id (default: default)")
+    export_store.add_argument("--output", help="Output path (default: the profile's srs_store.json)")
+    export_store.set_defaults(func=cmd_export_srs_store)
+
     profiles_get = sub.add_parser("profiles_get", help="Show helper profile snapshot from settings.json")
     profiles_get.set_defaults(func=cmd_profiles_get)
 
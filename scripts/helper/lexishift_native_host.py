@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+from contextlib import contextmanager
 import json
 from pathlib import Path
 import struct
 import sys
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -33,6 +35,8 @@ from lexishift_core.helper.engine import (
     SetPlanningJobConfig,
     apply_exposure,
     apply_feedback,
+    apply_signals_batch,
+    compact_signal_queue,
     initialize_srs_set,
     load_ruleset,
     load_snapshot,
@@ -41,10 +45,13 @@ from lexishift_core.helper.engine import (
     reset_srs_data,
     run_rulegen_job,
 )
+from lexishift_core.helper.jobs import HelperJobQueue
+from lexishift_core.helper.paths import build_helper_paths
 from lexishift_core.helper.profiles import get_profile_rulesets_snapshot, get_profiles_snapshot
 from lexishift_core.helper.os import open_path
-from lexishift_core.helper.paths import build_helper_paths
+from lexishift_core.helper.resident import HelperEngine
 from lexishift_core.helper.status import load_status
+from lexishift_core.srs.signal_log import signal_log_needs_compaction
 from lexishift_core.helper.lp_capabilities import (
     default_freedict_de_en_path,
     default_frequency_db_path,
@@ -55,6 +62,14 @@ from lexishift_core.helper.lp_capabilities import (
 PROTOCOL_VERSION = 1
 HELPER_VERSION = "0.1.0"
 
+# Long commands that may run on the job queue when the payload sets "async".
+JOB_MESSAGE_TYPES = {"trigger_rulegen", "srs_initialize", "srs_refresh"}
+SIGNAL_MESSAGE_TYPES = {"record_feedback", "record_exposure", "record_signals_batch"}
+# Commands that write a profile's store; these never interleave per profile.
+PROFILE_WRITE_TYPES = JOB_MESSAGE_TYPES | SIGNAL_MESSAGE_TYPES | {"srs_reset"}
+
+_WRITE_LOCK = threading.Lock()
+
 
 def _read_message() -> Optional[dict]:
     raw_length = sys.stdin.buffer.read(4)
@@ -73,9 +88,44 @@ def _read_message() -> Optional[dict]:
 
 def _write_message(payload: dict) -> None:
     data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
-    sys.stdout.buffer.write(struct.pack("<I", len(data)))
-    sys.stdout.buffer.write(data)
-    sys.stdout.buffer.flush()
+    with _WRITE_LOCK:
+        sys.stdout.buffer.write(struct.pack("<I", len(data)))
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+
+
+class _JobEventChannel:
+    """Writes ``job_progress`` frames to stdout.
+
+    Frames raised while a request is being answered (a job queued by that
+    request, or progress from the worker thread) are held until its response
+    is written, so a response is always the first frame after its request;
+    one-shot ``sendNativeMessage`` callers take the first frame as the reply.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._held: Optional[list[dict]] = None
+
+    def write(self, job: dict) -> None:
+        message = {"type": "job_progress", "ok": True, "data": job, "error": None}
+        with self._lock:
+            if self._held is not None:
+                self._held.append(message)
+                return
+            _write_message(message)
+
+    @contextmanager
+    def holding(self) -> Iterator[None]:
+        with self._lock:
+            self._held = []
+        try:
+            yield
+        finally:
+            with self._lock:
+                held, self._held = self._held or [], None
+                for message in held:
+                    _write_message(message)
 
 
 def _error_response(request_id: str, message: str, code: str = "invalid_request") -> dict:
@@ -142,8 +192,15 @@ def _validate_request(request: Dict[str, Any]) -> tuple[str, str, dict]:
     return request_id, msg_type, payload
 
 
-def _handle_request(msg_type: str, payload: dict) -> dict:
-    paths = build_helper_paths()
+def _handle_request(
+    engine: HelperEngine,
+    msg_type: str,
+    payload: dict,
+    *,
+    progress_fn: Optional[Callable[[int, int], None]] = None,
+) -> dict:
+    paths = engine.paths
+    state = engine.state
     profile_id = _optional_profile_id(payload)
     if msg_type == "hello":
         return {"helper_version": HELPER_VERSION, "protocol_version": PROTOCOL_VERSION}
@@ -152,16 +209,22 @@ def _handle_request(msg_type: str, payload: dict) -> dict:
         status = load_status(paths.srs_status_path_for(resolved_profile_id))
         payload = status.__dict__
         payload["profile_id"] = resolved_profile_id
+        payload["latency"] = engine.latency_stats()
         return payload
     if msg_type == "get_snapshot":
         pair = str(payload.get("pair", "en-ja"))
-        return load_snapshot(paths, pair=pair, profile_id=profile_id or "default")
+        return load_snapshot(paths, pair=pair, profile_id=profile_id or "default", state=state)
     if msg_type == "get_ruleset":
         pair = str(payload.get("pair", "en-ja"))
-        return load_ruleset(paths, pair=pair, profile_id=profile_id or "default")
+        return load_ruleset(paths, pair=pair, profile_id=profile_id or "default", state=state)
     if msg_type == "srs_diagnostics":
         pair = str(payload.get("pair", "en-ja"))
-        return get_srs_runtime_diagnostics(paths, pair=pair, profile_id=profile_id or "default")
+        return get_srs_runtime_diagnostics(
+            paths,
+            pair=pair,
+            profile_id=profile_id or "default",
+            state=state,
+        )
     if msg_type == "record_feedback":
         apply_feedback(
             paths,
@@ -170,6 +233,7 @@ def _handle_request(msg_type: str, payload: dict) -> dict:
             rating=str(payload.get("rating", "")),
             source_type=str(payload.get("source_type", "extension")),
             profile_id=profile_id or "default",
+            state=state,
         )
         return {"ok": True}
     if msg_type == "record_exposure":
@@ -179,8 +243,19 @@ def _handle_request(msg_type: str, payload: dict) -> dict:
             lemma=str(payload.get("lemma", "")),
             source_type=str(payload.get("source_type", "extension")),
             profile_id=profile_id or "default",
+            state=state,
         )
         return {"ok": True}
+    if msg_type == "record_signals_batch":
+        events = payload.get("events")
+        if not isinstance(events, list):
+            raise ValueError("events must be a list.")
+        return apply_signals_batch(
+            paths,
+            events=events,
+            profile_id=profile_id or "default",
+            state=state,
+        )
     if msg_type == "trigger_rulegen":
         pair = str(payload.get("pair", "en-ja")).strip() or "en-ja"
         jmdict_path, freedict_de_en_path, set_source_db = _resolve_pair_resource_paths(
@@ -207,8 +282,9 @@ def _handle_request(msg_type: str, payload: dict) -> dict:
             sample_count=_optional_int(payload, "sample_count"),
             sample_strategy=str(payload.get("sample_strategy", "")).strip() or None,
             sample_seed=_optional_int(payload, "sample_seed"),
+            full_rebuild=bool(payload.get("full_rebuild", False)),
         )
-        return run_rulegen_job(paths, config=config)
+        return run_rulegen_job(paths, config=config, state=state, progress_fn=progress_fn)
     if msg_type == "srs_initialize":
         pair = str(payload.get("pair", "en-ja")).strip() or "en-ja"
         jmdict_path, freedict_de_en_path, set_source_db = _resolve_pair_resource_paths(
@@ -236,6 +312,8 @@ def _handle_request(msg_type: str, payload: dict) -> dict:
                 profile_context=payload.get("profile_context") if isinstance(payload.get("profile_context"), dict) else None,
                 trigger=str(payload.get("trigger", "manual")),
             ),
+            state=state,
+            progress_fn=progress_fn,
         )
     if msg_type == "srs_plan_set":
         pair = str(payload.get("pair", "en-ja"))
@@ -256,6 +334,7 @@ def _handle_request(msg_type: str, payload: dict) -> dict:
                 profile_context=payload.get("profile_context") if isinstance(payload.get("profile_context"), dict) else None,
                 trigger=str(payload.get("trigger", "manual")),
             ),
+            state=state,
         )
     if msg_type == "srs_refresh":
         pair = str(payload.get("pair", "en-ja")).strip() or "en-ja"
@@ -283,8 +362,21 @@ def _handle_request(msg_type: str, payload: dict) -> dict:
                 profile_context=payload.get("profile_context")
                 if isinstance(payload.get("profile_context"), dict)
                 else None,
+                full_rebuild=bool(payload.get("full_rebuild", False)),
             ),
+            state=state,
+            progress_fn=progress_fn,
         )
+    if msg_type == "job_status":
+        job_id = str(payload.get("job_id", "")).strip()
+        if not job_id:
+            return {"jobs": engine.jobs.list_jobs()}
+        return engine.jobs.status(job_id)
+    if msg_type == "job_cancel":
+        job_id = str(payload.get("job_id", "")).strip()
+        if not job_id:
+            raise ValueError("Missing job_id.")
+        return engine.jobs.cancel(job_id)
     if msg_type == "srs_reset":
         pair = str(payload.get("pair", "")).strip() or None
         return reset_srs_data(paths, pair=pair, profile_id=profile_id or "default")
@@ -298,19 +390,66 @@ def _handle_request(msg_type: str, payload: dict) -> dict:
     raise ValueError(f"Unknown command: {msg_type}")
 
 
+def _dispatch_request(engine: HelperEngine, msg_type: str, payload: dict) -> dict:
+    def run(progress_fn: Optional[Callable[[int, int], None]] = None) -> dict:
+        with engine.track(msg_type):
+            return _handle_request(engine, msg_type, payload, progress_fn=progress_fn)
+
+    if msg_type not in PROFILE_WRITE_TYPES:
+        return run()
+    profile_id = engine.paths.normalize_profile_id(_optional_profile_id(payload) or "default")
+    if msg_type in JOB_MESSAGE_TYPES and payload.get("async"):
+        return {"job": engine.jobs.submit(msg_type, run, profile_id=profile_id)}
+    if msg_type in SIGNAL_MESSAGE_TYPES and engine.jobs.profile_busy(profile_id):
+        # Queue behind the running job instead of stalling the read loop. The
+        # inline response (per-event results for batches) becomes the job's result.
+        return {"ok": True, "queued": True, "job": engine.jobs.submit(msg_type, run, profile_id=profile_id)}
+    with engine.jobs.profile_lock(profile_id):
+        return run()
+
+
+def _compact_signals_after_response(engine: HelperEngine, msg_type: str, payload: dict) -> None:
+    # Runs inline once the response is out: a one-shot host may be stopped
+    # right after replying, and compaction is safe to interrupt.
+    if msg_type not in SIGNAL_MESSAGE_TYPES:
+        return
+    profile_id = engine.paths.normalize_profile_id(_optional_profile_id(payload) or "default")
+    if engine.jobs.profile_busy(profile_id):
+        return
+    if not signal_log_needs_compaction(engine.paths.srs_signal_queue_path_for(profile_id)):
+        return
+    try:
+        with engine.jobs.profile_lock(profile_id):
+            compact_signal_queue(engine.paths, profile_id=profile_id)
+    except Exception:  # noqa: BLE001
+        # The next signal retries; the log stays readable meanwhile.
+        pass
+
+
 def main() -> int:
+    events = _JobEventChannel()
+    paths = build_helper_paths()
+    # The file lock matters under one-shot sendNativeMessage, where every
+    # request runs in a host of its own.
+    jobs = HelperJobQueue(on_event=events.write, lock_path_fn=paths.srs_store_lock_path_for)
+    engine = HelperEngine(paths, jobs=jobs)
     while True:
         request = _read_message()
         if request is None:
+            engine.jobs.close()
             return 0
-        try:
-            request_id, msg_type, payload = _validate_request(request)
-            data = _handle_request(msg_type, payload)
-            response = {"id": request_id, "ok": True, "data": data, "error": None}
-        except Exception as exc:  # noqa: BLE001
-            request_id = str(request.get("id", "")) if isinstance(request, dict) else ""
-            response = _error_response(request_id, str(exc))
-        _write_message(response)
+        msg_type, payload = "", {}
+        with events.holding():
+            try:
+                request_id, msg_type, payload = _validate_request(request)
+                data = _dispatch_request(engine, msg_type, payload)
+                response = {"id": request_id, "ok": True, "data": data, "error": None}
+            except Exception as exc:  # noqa: BLE001
+                request_id = str(request.get("id", "")) if isinstance(request, dict) else ""
+                response = _error_response(request_id, str(exc))
+            _write_message(response)
+        if response["ok"]:
+            _compact_signals_after_response(engine, msg_type, payload)
 
 
 if __name__ == "__main__":